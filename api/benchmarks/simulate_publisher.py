@@ -0,0 +1,116 @@
+"""Benchmark command publishing while simulating a transfer-heavy protocol.
+
+Every APIv2 pipette and module call goes through `commands.publisher.publish`.
+When nothing would see the message, because no broker subscriber, INFO log
+or command timing is active, the publisher skips building it. This times
+the simulation of a protocol made of many small transfers in three ways:
+
+- ``opentrons_simulate``: `opentrons.simulate.simulate`, as run by the
+  ``opentrons_simulate`` command. Its runlog subscribes to the broker, so
+  every message is built.
+- ``fast path``: the same simulation with no subscriber, so publishing
+  is skipped.
+- ``no fast path``: the same simulation with no subscriber, but with the
+  publisher made to build every message anyway, as it did before the
+  fast path existed.
+
+The difference between the last two is what the fast path saves.
+
+This is not part of the test suite. Run it with `make -C api benchmarks`
+or `python benchmarks/simulate_publisher.py --rounds 10 --repeat 5`.
+"""
+import argparse
+import io
+from statistics import median
+from time import perf_counter
+from typing import Callable, List
+
+from mock import patch
+
+from opentrons import simulate
+from opentrons.protocols import parse
+from opentrons.protocols.execution import execute
+
+PROTOCOL = """\
+metadata = {{"apiLevel": "2.13"}}
+
+
+def run(ctx):
+    tip_rack = ctx.load_labware("opentrons_96_tiprack_20ul", 1)
+    source = ctx.load_labware("corning_96_wellplate_360ul_flat", 2)
+    dest = ctx.load_labware("corning_96_wellplate_360ul_flat", 3)
+    pipette = ctx.load_instrument("p20_single_gen2", "right", tip_racks=[tip_rack])
+
+    pipette.pick_up_tip()
+    for _ in range({rounds}):
+        pipette.transfer(10, source.wells(), dest.wells(), new_tip="never")
+    pipette.drop_tip()
+"""
+
+
+def _simulate_with_runlog(protocol_text: str) -> None:
+    simulate.simulate(io.StringIO(protocol_text), "transfers.py")
+
+
+def _simulate_unobserved(protocol_text: str) -> None:
+    protocol = parse.parse(protocol_text, "transfers.py")
+    context = simulate.get_protocol_api(protocol.api_level)
+    try:
+        execute.run_protocol(protocol, context)
+    finally:
+        context.cleanup()
+
+
+def _simulate_unobserved_without_fast_path(protocol_text: str) -> None:
+    with patch("opentrons.commands.publisher._is_observed", return_value=True):
+        _simulate_unobserved(protocol_text)
+
+
+def _time(run: Callable[[str], None], protocol_text: str, repeat: int) -> float:
+    durations: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run(protocol_text)
+        durations.append(perf_counter() - start)
+    return median(durations)
+
+
+def main() -> None:
+    """Time each way of simulating the protocol and print the medians."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=10,
+        help="How many times to transfer from every well of one plate to another.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="How many times to time each run."
+    )
+    args = parser.parse_args()
+    protocol_text = PROTOCOL.format(rounds=args.rounds)
+
+    # warm up imports and labware definition caches
+    _simulate_unobserved(PROTOCOL.format(rounds=1))
+
+    runs = {
+        "opentrons_simulate": _simulate_with_runlog,
+        "fast path": _simulate_unobserved,
+        "no fast path": _simulate_unobserved_without_fast_path,
+    }
+    results = {
+        name: _time(run, protocol_text, args.repeat) for name, run in runs.items()
+    }
+
+    print(f"{args.rounds * 96} transfers, median of {args.repeat} runs:")
+    for name, duration in results.items():
+        print(f"  {name:>18}: {duration:7.3f} s")
+    saved = results["no fast path"] - results["fast path"]
+    print(
+        f"  the fast path saves {saved:.3f} s "
+        f"({saved / results['no fast path']:.1%}) when nothing is subscribed"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Benchmark tip selection over protocols that use dozens of tip racks.
+
+`TipView.get_next_tip` runs before every automatic tip pickup during
+analysis. This replays the pickups of a protocol that uses up every tip in
+each of many tip racks, for 1, 8 and 96 channel pipettes, and reports how
+long the selector takes in a clean rack compared to a nearly used one.
+If the selector's cost is flat, the first and last columns are about equal.
+
+This is not part of the test suite. Run it with `make -C api benchmarks`
+or `python benchmarks/tip_state.py --racks 40`.
+"""
+import argparse
+from statistics import median
+from time import perf_counter
+from typing import Dict, List
+
+from opentrons_shared_data.labware.labware_definition import (
+    LabwareDefinition,
+    Parameters as LabwareParameters,
+)
+
+from opentrons.protocol_engine import actions, commands
+from opentrons.protocol_engine.state.tips import TipStore, TipView
+from opentrons.protocol_engine.types import DeckPoint, FlowRates
+from opentrons.protocol_engine.resources.pipette_data_provider import (
+    LoadedStaticPipetteData,
+)
+
+_ORDERING = [[f"{row}{column}" for row in "ABCDEFGH"] for column in range(1, 13)]
+
+
+def _load_tip_rack(subject: TipStore, labware_id: str) -> None:
+    subject.handle_action(
+        actions.UpdateCommandAction(
+            command=commands.LoadLabware.construct(  # type: ignore[call-arg]
+                result=commands.LoadLabwareResult.construct(
+                    labwareId=labware_id,
+                    definition=LabwareDefinition.construct(  # type: ignore[call-arg]
+                        ordering=_ORDERING,
+                        parameters=LabwareParameters.construct(isTiprack=True),  # type: ignore[call-arg]
+                    ),
+                )
+            )
+        )
+    )
+
+
+def _add_pipette(subject: TipStore, pipette_id: str, channels: int) -> None:
+    subject.handle_action(
+        actions.AddPipetteConfigAction(
+            pipette_id=pipette_id,
+            serial_number=f"{pipette_id}-serial",
+            config=LoadedStaticPipetteData(
+                channels=channels,
+                max_volume=15,
+                min_volume=3,
+                model="gen a",
+                display_name="display name",
+                flow_rates=FlowRates(
+                    default_aspirate={},
+                    default_dispense={},
+                    default_blow_out={},
+                ),
+                return_tip_scale=0,
+                nominal_tip_overlap={},
+                nozzle_offset_z=1.23,
+                home_position=4.56,
+            ),
+        )
+    )
+
+
+def _pick_up_tip(
+    subject: TipStore, pipette_id: str, labware_id: str, well_name: str
+) -> None:
+    subject.handle_action(
+        actions.UpdateCommandAction(
+            command=commands.PickUpTip.construct(  # type: ignore[call-arg]
+                params=commands.PickUpTipParams.construct(
+                    pipetteId=pipette_id,
+                    labwareId=labware_id,
+                    wellName=well_name,
+                ),
+                result=commands.PickUpTipResult.construct(
+                    position=DeckPoint(x=0, y=0, z=0), tipLength=1.23
+                ),
+            )
+        )
+    )
+
+
+def run(channels: int, rack_count: int) -> None:
+    """Use up `rack_count` tip racks with a pipette and print the selector's cost."""
+    subject = TipStore()
+    view = TipView(subject.state)
+    _add_pipette(subject, "pipette-id", channels)
+    durations_by_pickup: Dict[int, List[float]] = {}
+
+    start = perf_counter()
+    for rack_index in range(rack_count):
+        labware_id = f"tip-rack-{rack_index}"
+        _load_tip_rack(subject, labware_id)
+        pickup_index = 0
+
+        while True:
+            lookup_start = perf_counter()
+            well_name = view.get_next_tip(
+                labware_id=labware_id, num_tips=channels, starting_tip_name=None
+            )
+            durations_by_pickup.setdefault(pickup_index, []).append(
+                perf_counter() - lookup_start
+            )
+            if well_name is None:
+                break
+            _pick_up_tip(subject, "pipette-id", labware_id, well_name)
+            pickup_index += 1
+    total = perf_counter() - start
+
+    first = median(durations_by_pickup[0])
+    last_pickup = max(durations_by_pickup)
+    last = median(durations_by_pickup[last_pickup - 1]) if last_pickup else first
+    empty = median(durations_by_pickup[last_pickup])
+
+    print(
+        f"{channels:>2} channels, {rack_count} racks: "
+        f"{total * 1e3:8.2f} ms total, get_next_tip median "
+        f"{first * 1e6:6.2f} us in a clean rack, "
+        f"{last * 1e6:6.2f} us for the last tip, "
+        f"{empty * 1e6:6.2f} us in a used rack"
+    )
+
+
+def main() -> None:
+    """Run the benchmark for each pipette channel count."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--racks", type=int, default=40, help="Number of tip racks to use up."
+    )
+    args = parser.parse_args()
+
+    for channels in (1, 8, 96):
+        run(channels=channels, rack_count=args.racks)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,12 @@
 import functools
 import inspect
+import logging
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Optional, TypeVar, cast
+from typing import Any, Callable, Iterator, Mapping, Optional, TypeVar, cast
 from uuid import uuid4
 
 from opentrons.broker import Broker
+from opentrons.util.command_timing import get_command_timing
 
 from .types import (
     COMMAND as COMMAND_TOPIC,
@@ -40,7 +42,10 @@ FuncT = TypeVar("FuncT", bound=Callable[..., Any])
 
 
 def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
-    """Publish messages before and after the decorated function has run."""
+    """Publish messages before and after the decorated function has run.
+
+    If nothing would see the messages, the message payload is never created.
+    """
 
     def _decorator(func: FuncT) -> FuncT:
         @functools.wraps(func)
@@ -63,6 +68,9 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
                 broker, Broker
             ), "Only methods of CommandPublisher classes should be decorated."
 
+            if not _is_observed(broker):
+                return func(*args, **kwargs)
+
             func_sig = _inspect_signature(func)
             bound_func_args = func_sig.bind(*args, **kwargs)
             bound_func_args.apply_defaults()
@@ -106,11 +114,16 @@ def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
     If an `error` is raised in the `with` block, it will be published in the "after"
     message and re-raised.
     """
+    if not _is_observed(broker):
+        yield
+        return
+
     message_id = str(uuid4())
     _do_publish(broker=broker, message_id=message_id, command=command, when="before")
 
     try:
-        yield
+        with get_command_timing().command(command["name"]):
+            yield
     except Exception as error:
         _do_publish(
             broker=broker,
@@ -124,6 +137,25 @@ def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
         _do_publish(broker=broker, message_id=message_id, command=command, when="after")
 
 
+def _is_observed(broker: Broker) -> bool:
+    """Whether a broker subscriber, the broker's log, or command timing needs messages."""
+    return (
+        broker.has_subscribers(COMMAND_TOPIC)
+        or broker.logger.isEnabledFor(logging.INFO)
+        or get_command_timing().enabled
+    )
+
+
+class _PayloadText:
+    """A command payload's log text, rendered only if the log line is emitted."""
+
+    def __init__(self, payload: Mapping[str, Any]) -> None:
+        self._payload = payload
+
+    def __str__(self) -> str:
+        return ", ".join(f"{k}: {v}" for k, v in self._payload.items() if k != "text")
+
+
 @functools.lru_cache(maxsize=None)
 def _inspect_signature(func: Callable[..., Any]) -> inspect.Signature:
     """Inspect function signatures, memoized because it is called very often."""
@@ -149,7 +181,6 @@ def _do_publish(
     }
 
     if when == "before":
-        payload_str = ", ".join(f"{k}: {v}" for k, v in payload.items() if k != "text")
-        broker.logger.info(f"{name}: {payload_str}")
+        broker.logger.info("%s: %s", name, _PayloadText(payload))
 
     broker.publish(topic=COMMAND_TOPIC, message=message)
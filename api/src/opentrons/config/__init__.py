@@ -166,6 +166,17 @@ CONFIG_ELEMENTS = (
             " Usage not recommended."
         ),
     ),
+    ConfigElement(
+        "labware_standard_definitions_bundle",
+        "Standard Labware Definitions Bundle",
+        Path("labware") / "v2" / "standard_definitions.bundle",
+        ConfigElementType.FILE,
+        (
+            "An optional single-file bundle of the standard labware definitions,"
+            " for faster loading. Written by"
+            " `python -m opentrons.protocols.labware_catalog`."
+        ),
+    ),
     ConfigElement(
         "feature_flags_file",
         "Feature Flags",
@@ -106,6 +106,9 @@ DEFAULT_STABILIZE_DELAY = 0.1
 
 DEFAULT_COMMAND_RETRIES = 3
 
+DEFAULT_MAX_STREAMED_MOVES = 8
+"""Moves to queue in Smoothieware's planner while streaming before waiting"""
+
 MICROSTEPPING_GCODES = {
     "B": {
         "ENABLE": GCODE.MICROSTEPPING_B_ENABLE,
@@ -50,6 +50,7 @@ from opentrons.drivers.smoothie_drivers.constants import (
     SMOOTHIE_BOOT_TIMEOUT,
     DEFAULT_STABILIZE_DELAY,
     DEFAULT_COMMAND_RETRIES,
+    DEFAULT_MAX_STREAMED_MOVES,
     MICROSTEPPING_GCODES,
     GCODE_ROUNDING_PRECISION,
 )
@@ -70,11 +71,12 @@ from opentrons.drivers.asyncio.communication import (
     ErrorResponse,
 )
 from opentrons.drivers.types import MoveSplits
+from opentrons.util.command_timing import TimingPhase, timed
 from opentrons.drivers.utils import AxisMoveTimestamp, ParseError, string_to_hex
 from opentrons.drivers.rpi_drivers.gpio_simulator import SimulatingGPIOCharDev
 from opentrons.drivers.rpi_drivers.dev_types import GPIODriverLike
 from opentrons.system import smoothie_update
-from .types import AxisCurrentSettings
+from .types import AxisCurrentSettings, MoveStream
 
 
 log = logging.getLogger(__name__)
@@ -201,6 +203,8 @@ class SmoothieDriver:
         self._move_split_config: MoveSplits = {}
         #: Cache of currently configured splits from callers
         self._axes_moved_at = AxisMoveTimestamp(AXES)
+        #: Moves being streamed, if inside streaming_moves()
+        self._stream: Optional[MoveStream] = None
 
     @property
     def gpio_chardev(self) -> GPIODriverLike:
@@ -816,7 +820,25 @@ class SmoothieDriver:
         )
         await self.update_homed_flags()
 
-    # Potential place for command optimization (buffering, flushing, etc)
+    async def _wait_for_streamed_moves(self) -> None:
+        """Block until every move queued while streaming is done."""
+        stream = self._stream
+        if stream is None or not stream.queued_moves:
+            return
+        stream.queued_moves = 0
+        # M400 is only acked once the planner is empty
+        await self._send_command(
+            _command_builder().add_gcode(gcode=GCODE.WAIT),
+            ack_timeout=DEFAULT_EXECUTE_TIMEOUT,
+            streamed=True,
+        )
+
+    def _forget_streamed_moves(self) -> None:
+        """Drop the stream's state after Smoothieware has flushed its planner."""
+        if self._stream is not None:
+            self._stream.queued_moves = 0
+            self._stream.current_command = None
+
     async def _send_command(
         self,
         command: CommandBuilder,
@@ -824,6 +846,7 @@ class SmoothieDriver:
         suppress_error_msg: bool = False,
         ack_timeout: float = DEFAULT_ACK_TIMEOUT,
         suppress_home_after_error: bool = False,
+        streamed: bool = False,
     ) -> str:
         """
         Submit a GCODE command to the robot, followed by M400 to block until
@@ -859,14 +882,24 @@ class SmoothieDriver:
             like home, it should be long enough to allow the command to
             complete in the worst case. If this is None, the timeout will
             be infinite. This is almost certainly not what you want.
+        :param streamed: Only wait for the command to be acked, not for it
+            to be done, and don't wait for moves already streamed. Only for
+            moves sent inside `streaming_moves`.
         """
         if self.simulating:
             return ""
+        if self._stream is not None and not streamed:
+            # Anything but another streamed move may depend on the
+            # position or currents, so let the queued moves finish first.
+            await self._wait_for_streamed_moves()
+            self._stream.current_command = None
         try:
             return await self._send_command_unsynchronized(
-                command, ack_timeout, timeout
+                command, ack_timeout, timeout, wait=not streamed
             )
         except SmoothieError as se:
+            # Smoothieware flushes its planner on errors and alarms
+            self._forget_streamed_moves()
             # XXX: This is a reentrancy error because another command could
             # swoop in here. We're already resetting though and errors (should
             # be) rare so it's probably fine, but the actual solution to this
@@ -875,8 +908,10 @@ class SmoothieDriver:
             error_axis = se.ret_code.strip()[-1]
             if not suppress_error_msg:
                 log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
+            # errors from moves queued earlier may only show up when
+            # waiting for them, after any streamed command
             if (
-                GCODE.MOVE in command or GCODE.PROBE in command
+                GCODE.MOVE in command or GCODE.PROBE in command or streamed
             ) and not suppress_home_after_error:
                 if error_axis not in "XYZABC":
                     error_axis = AXES
@@ -884,8 +919,13 @@ class SmoothieDriver:
                 await self.home(error_axis)
             raise SmoothieError(se.ret_code, str(command))
 
+    @timed(TimingPhase.DRIVER_IO)
     async def _send_command_unsynchronized(
-        self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
+        self,
+        command: CommandBuilder,
+        ack_timeout: float,
+        execute_timeout: float,
+        wait: bool = True,
     ) -> str:
         assert self._connection, "There is no connection."
         command_result = ""
@@ -893,6 +933,8 @@ class SmoothieDriver:
             command_result = await self._connection.send_command(
                 command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
             )
+            if not wait:
+                return command_result
             wait_command = CommandBuilder(
                 terminator=SMOOTHIE_COMMAND_TERMINATOR
             ).add_gcode(gcode=GCODE.WAIT)
@@ -1194,6 +1236,36 @@ class SmoothieDriver:
     # ----------- END Private functions ----------- #
 
     # ----------- Public interface ---------------- #
+    @contextlib.asynccontextmanager
+    async def streaming_moves(
+        self, max_queued_moves: int = DEFAULT_MAX_STREAMED_MOVES
+    ) -> AsyncIterator[None]:
+        """
+        Stream the moves made inside this context to Smoothieware.
+
+        Normally every command is followed by an M400, so each move comes
+        to a full stop before the next is sent. Inside this context, gantry
+        moves are only waited for until Smoothieware acks them, so they
+        queue up in its planner and run one into the next. Up to
+        `max_queued_moves` moves are queued before waiting for them all.
+
+        Any other command, like a plunger move, a home or a position read,
+        first waits for the queued moves to finish, as does leaving the
+        context. Nesting is allowed, and only the outermost context counts.
+
+        :param max_queued_moves: How many moves to queue before waiting.
+        """
+        if self.simulating or self._stream is not None:
+            yield
+            return
+
+        self._stream = MoveStream(max_queued_moves=max_queued_moves)
+        try:
+            yield
+            await self._wait_for_streamed_moves()
+        finally:
+            self._stream = None
+
     async def move(  # noqa: C901
         self,
         target: Dict[str, float],
@@ -1322,6 +1394,19 @@ class SmoothieDriver:
         primary_command_string = create_coords_list(moving_target)
         backlash_command_string = create_coords_list(backlash_target)
 
+        # Split moves change speed and current, and plunger moves are
+        # dwelled right after, so neither is ever streamed.
+        stream = self._stream
+        if stream is not None and (split_target or set("BC") & set(target)):
+            stream = None
+        if stream is not None:
+            # Axes that moved earlier in the stream may still be moving, so
+            # keep them at active current until the stream is done.
+            stream.active_axes.update(moving_axes)
+            non_moving_axes = [
+                ax for ax in non_moving_axes if ax not in stream.active_axes
+            ]
+
         self.dwell_axes("".join(non_moving_axes))
         self.activate_axes("".join(moving_axes))
 
@@ -1372,8 +1457,12 @@ class SmoothieDriver:
         if split_command_string or (checked_speed != self._combined_speed):
             command.add_builder(builder=self._build_speed_command(checked_speed))
 
-        # introduce the standard currents
-        command.add_builder(builder=self._generate_current_command())
+        # introduce the standard currents, unless they were already sent in
+        # this stream: current changes take effect as soon as they are read
+        # and end with a dwell, which would stall the planner.
+        current_command = self._generate_current_command()
+        if stream is None or str(current_command) != stream.current_command:
+            command.add_builder(builder=current_command)
 
         # move to target position, including any added backlash to B/C axes
         command.add_gcode(GCODE.MOVE).add_builder(builder=primary_command_string)
@@ -1404,7 +1493,10 @@ class SmoothieDriver:
             # TODO (hmg) a movement's timeout should be calculated by
             # how long the movement is expected to take.
             await _do_split()
-            await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            if stream is None:
+                await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            else:
+                await self._send_streamed_move(stream, command, str(current_command))
         finally:
             # dwell pipette motors because they get hot
             plunger_axis_moved = "".join(set("BC") & set(target.keys()))
@@ -1415,6 +1507,18 @@ class SmoothieDriver:
 
         self._update_position(target)
 
+    async def _send_streamed_move(
+        self, stream: MoveStream, command: CommandBuilder, current_command: str
+    ) -> None:
+        if current_command != stream.current_command:
+            # the new currents must not apply to the moves still queued
+            await self._wait_for_streamed_moves()
+            stream.current_command = current_command
+        await self._send_command(command, streamed=True)
+        stream.queued_moves += 1
+        if stream.queued_moves >= stream.max_queued_moves:
+            await self._wait_for_streamed_moves()
+
     async def home(
         self, axis: str = AXES, disabled: str = DISABLE_AXES
     ) -> Dict[str, float]:
@@ -1839,6 +1943,7 @@ class SmoothieDriver:
     async def hard_halt(self) -> None:
         log.debug(f"Halting Smoothie (simulating: {self.simulating}")
         self._is_hard_halting.set()
+        self._forget_streamed_moves()
         if self.simulating:
             pass
         else:
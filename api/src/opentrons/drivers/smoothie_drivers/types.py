@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Dict, cast
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Set, cast
 
 from opentrons.config.types import AxisDict
 
@@ -14,3 +14,16 @@ class AxisCurrentSettings:
     def __init__(self, val: AxisDict) -> None:
         self.now = cast(AxisSettingType, val.copy())
         self.saved = cast(AxisSettingType, val.copy())
+
+
+@dataclass
+class MoveStream:
+    """Moves sent to Smoothieware without waiting for them to finish."""
+
+    max_queued_moves: int
+    #: Moves sent since the planner was last known to be empty
+    queued_moves: int = 0
+    #: Axes moved during the stream, which are kept at active current
+    active_axes: Set[str] = field(default_factory=set)
+    #: The last current command sent in the stream, if it is still in effect
+    current_command: Optional[str] = None
@@ -27,6 +27,7 @@ from opentrons.protocols.api_support.types import APIVersion
 from opentrons.hardware_control import API as OT2API, ThreadManager, HardwareControlAPI
 from opentrons.hardware_control.types import MachineType
 
+from .util.command_timing import get_command_timing
 from .util.entrypoint_util import labware_from_paths, datafiles_from_paths
 
 if TYPE_CHECKING:
@@ -209,6 +210,16 @@ def get_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         "files. It is usually a better idea to use this than -D because "
         "there is less possibility of accidentally including something.",
     )
+    parser.add_argument(
+        "--timing-trace",
+        metavar="TRACE_FILE",
+        default=None,
+        help="Record how long each command spends queued, updating state, "
+        "calling the hardware, planning motion, and talking to the motor "
+        "controllers, and write it to TRACE_FILE as a Chrome trace. "
+        "Open it in chrome://tracing or https://ui.perfetto.dev. "
+        "This is an experimental feature.",
+    )
     parser.add_argument(
         "protocol",
         metavar="PROTOCOL",
@@ -400,14 +411,20 @@ def main() -> int:
     else:
         log_level = "warning"
     machine = cast(Optional[MachineType], args.machine)
+    if args.timing_trace:
+        get_command_timing().enable(trace=True)
     # Try to migrate containers from database to v2 format
-    execute(
-        args.protocol,
-        args.protocol.name,
-        log_level=log_level,
-        emit_runlog=printer,
-        machine=machine,
-    )
+    try:
+        execute(
+            args.protocol,
+            args.protocol.name,
+            log_level=log_level,
+            emit_runlog=printer,
+            machine=machine,
+        )
+    finally:
+        if args.timing_trace:
+            get_command_timing().write_chrome_trace(args.timing_trace)
     return 0
 
 
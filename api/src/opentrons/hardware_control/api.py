@@ -24,6 +24,7 @@ from opentrons import types as top_types
 from opentrons.config import robot_configs
 from opentrons.config.types import RobotConfig, OT3Config
 from opentrons.drivers.rpi_drivers.types import USBPort
+from opentrons.util.command_timing import TimingPhase, timed
 
 from .util import use_or_initialize_loop, check_motion_bounds
 from .instruments.ot2.pipette import (
@@ -573,6 +574,7 @@ class API(
         await self.current_position(mount=mount, refresh=True)
         await self._do_plunger_home(mount=mount, acquire_lock=True)
 
+    @timed(TimingPhase.HARDWARE)
     @ExecutionManagerProvider.wait_for_running
     async def home(self, axes: Optional[List[Axis]] = None) -> None:
         """Home the entire robot and initialize current position."""
@@ -671,6 +673,7 @@ class API(
         )
 
     # TODO(mc, 2022-05-13): return resulting gantry position
+    @timed(TimingPhase.HARDWARE)
     async def move_to(
         self,
         mount: top_types.Mount,
@@ -697,6 +700,29 @@ class API(
         await self._cache_and_maybe_retract_mount(mount)
         await self._move(target_position, speed=speed, max_speeds=max_speeds)
 
+    async def move_through(
+        self,
+        mount: top_types.Mount,
+        moves: Sequence[Tuple[top_types.Point, Optional[CriticalPoint]]],
+        speed: Optional[float] = None,
+        max_speeds: Optional[Dict[Axis, float]] = None,
+    ) -> None:
+        """
+        Move the critical point of the specified mount through each of
+        `moves`, a position and critical point as for :py:meth:`move_to`,
+        without stopping in between where possible.
+        """
+        async with self._backend.streaming_moves():
+            for position, critical_point in moves:
+                await self.move_to(
+                    mount,
+                    position,
+                    speed=speed,
+                    critical_point=critical_point,
+                    max_speeds=max_speeds,
+                )
+
+    @timed(TimingPhase.HARDWARE)
     async def move_rel(
         self,
         mount: top_types.Mount,
@@ -885,6 +911,7 @@ class API(
         pass
 
     # Pipette action API
+    @timed(TimingPhase.HARDWARE)
     async def prepare_for_aspirate(
         self, mount: top_types.Mount, rate: float = 1.0
     ) -> None:
@@ -907,6 +934,7 @@ class API(
             )
             instrument.ready_to_aspirate = True
 
+    @timed(TimingPhase.HARDWARE)
     async def aspirate(
         self,
         mount: top_types.Mount,
@@ -940,6 +968,7 @@ class API(
         else:
             aspirate_spec.instr.add_current_volume(aspirate_spec.volume)
 
+    @timed(TimingPhase.HARDWARE)
     async def dispense(
         self,
         mount: top_types.Mount,
@@ -975,6 +1004,7 @@ class API(
         else:
             dispense_spec.instr.remove_current_volume(dispense_spec.volume)
 
+    @timed(TimingPhase.HARDWARE)
     async def blow_out(
         self, mount: top_types.Mount, volume: Optional[float] = None
     ) -> None:
@@ -1003,6 +1033,7 @@ class API(
             blowout_spec.instr.set_current_volume(0)
             blowout_spec.instr.ready_to_aspirate = False
 
+    @timed(TimingPhase.HARDWARE)
     async def pick_up_tip(
         self,
         mount: top_types.Mount,
@@ -1049,6 +1080,7 @@ class API(
         if prep_after:
             await self.prepare_for_aspirate(mount)
 
+    @timed(TimingPhase.HARDWARE)
     async def drop_tip(self, mount: top_types.Mount, home_after: bool = True) -> None:
         """Drop tip at the current location."""
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 import asyncio
-from contextlib import contextmanager, AsyncExitStack
+from contextlib import asynccontextmanager, contextmanager, AsyncExitStack
 import logging
 from typing import (
+    AsyncIterator,
     Callable,
     Iterator,
     Any,
@@ -160,6 +161,11 @@ class Controller:
                 target_position, home_flagged_axes=home_flagged_axes, speed=speed
             )
 
+    @asynccontextmanager
+    async def streaming_moves(self) -> AsyncIterator[None]:
+        async with self._smoothie_driver.streaming_moves():
+            yield
+
     async def home(self, axes: Optional[List[str]] = None) -> Dict[str, float]:
         if axes:
             args: Tuple[Any, ...] = ("".join(axes),)
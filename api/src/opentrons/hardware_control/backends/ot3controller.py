@@ -26,6 +26,7 @@ from typing import (
 )
 from opentrons.config.types import OT3Config, GantryLoad
 from opentrons.config import ot3_pipette_config, gripper_config, feature_flags as ff
+from opentrons.util.command_timing import TimingPhase, timed
 from .ot3utils import (
     UpdateProgress,
     axis_convert,
@@ -62,7 +63,10 @@ from opentrons_hardware.drivers.binary_usb import (
     SerialUsbDriver,
     build_rear_panel_driver,
 )
-from opentrons_hardware.hardware_control.move_group_runner import MoveGroupRunner
+from opentrons_hardware.hardware_control.move_group_runner import (
+    MoveGroupPipeline,
+    MoveGroupRunner,
+)
 from opentrons_hardware.hardware_control.motion_planning import (
     Move,
     Coordinates,
@@ -499,6 +503,7 @@ class OT3Controller:
             )
 
     @requires_update
+    @timed(TimingPhase.DRIVER_IO)
     async def move(
         self,
         origin: Coordinates[OT3Axis, float],
@@ -524,6 +529,35 @@ class OT3Controller:
         positions = await runner.run(can_messenger=self._messenger)
         self._handle_motor_status_response(positions)
 
+    @requires_update
+    @timed(TimingPhase.DRIVER_IO)
+    async def move_through(
+        self,
+        segments: Sequence[Tuple[Coordinates[OT3Axis, float], List[Move[OT3Axis]]]],
+        stop_condition: MoveStopCondition = MoveStopCondition.none,
+    ) -> None:
+        """Make a series of moves, each starting as soon as the last completes.
+
+        Each move group is sent to the nodes while the one before it runs.
+
+        Args:
+            segments: The starting point and the moves of each segment.
+            stop_condition: The stop condition.
+
+        Returns:
+            None
+        """
+        move_groups = [
+            create_move_group(origin, moves, self._motor_nodes(), stop_condition)[0]
+            for origin, moves in segments
+        ]
+        pipeline = MoveGroupPipeline(
+            move_groups=move_groups,
+            ignore_stalls=True if not ff.stall_detection_enabled() else False,
+        )
+        positions = await pipeline.run(can_messenger=self._messenger)
+        self._handle_motor_status_response(positions)
+
     def _build_home_pipettes_runner(
         self,
         axes: Sequence[OT3Axis],
@@ -606,6 +640,7 @@ class OT3Controller:
         return None
 
     @requires_update
+    @timed(TimingPhase.DRIVER_IO)
     async def home(
         self, axes: Sequence[OT3Axis], gantry_load: GantryLoad
     ) -> OT3AxisMap[float]:
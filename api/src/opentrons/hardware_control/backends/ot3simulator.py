@@ -299,6 +299,26 @@ class OT3Simulator:
         self._position.update(final_positions)
         self._encoder_position.update(final_positions)
 
+    @ensure_yield
+    async def move_through(
+        self,
+        segments: Sequence[Tuple[Coordinates[OT3Axis, float], List[Move[OT3Axis]]]],
+        stop_condition: MoveStopCondition = MoveStopCondition.none,
+    ) -> None:
+        """Make a series of moves.
+
+        Args:
+            segments: The starting point and the moves of each segment.
+            stop_condition: The stop condition.
+
+        Returns:
+            None
+        """
+        for origin, moves in segments:
+            _, final_positions = create_move_group(origin, moves, self._present_nodes)
+            self._position.update(final_positions)
+            self._encoder_position.update(final_positions)
+
     @ensure_yield
     async def home(
         self, axes: Sequence[OT3Axis], gantry_load: GantryLoad
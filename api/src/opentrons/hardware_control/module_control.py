@@ -1,7 +1,7 @@
 from __future__ import annotations
 import logging
 import re
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 from glob import glob
 
 from opentrons.config import IS_ROBOT, IS_LINUX
@@ -16,6 +16,7 @@ from opentrons.hardware_control.modules.module_calibration import (
 )
 from opentrons.hardware_control.modules.types import ModuleType
 from opentrons.types import Point
+from .poller import PollMetrics, PollScheduler
 from .types import AionotifyEvent, BoardRevision, OT3Mount
 from . import modules
 
@@ -43,6 +44,7 @@ class AttachedModulesControl:
         self._available_modules: List[modules.AbstractModule] = []
         self._api = api
         self._usb = usb
+        self._poll_scheduler = PollScheduler()
 
     @classmethod
     async def build(
@@ -72,6 +74,11 @@ class AttachedModulesControl:
     def available_modules(self) -> List[modules.AbstractModule]:
         return self._available_modules
 
+    @property
+    def poll_metrics(self) -> Dict[str, PollMetrics]:
+        """Poll latency and jitter of each attached module, by port."""
+        return self._poll_scheduler.metrics
+
     async def build_module(
         self,
         port: str,
@@ -87,6 +94,7 @@ class AttachedModulesControl:
             hw_control_loop=self._api.loop,
             execution_manager=self._api._execution_manager,
             sim_model=sim_model,
+            poll_scheduler=self._poll_scheduler,
         )
 
     async def unregister_modules(
@@ -11,7 +11,7 @@ from opentrons.drivers.heater_shaker.abstract import AbstractHeaterShakerDriver
 from opentrons.drivers.heater_shaker.simulator import SimulatingDriver
 from opentrons.drivers.types import Temperature, RPM, HeaterShakerLabwareLatchStatus
 from opentrons.hardware_control.execution_manager import ExecutionManager
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import Reader, Poller, PollScheduler
 from opentrons.hardware_control.modules import mod_abc, update
 from opentrons.hardware_control.modules.types import (
     ModuleType,
@@ -31,6 +31,9 @@ POLL_PERIOD = 1.0
 # module simulation in PAPIv2 needs to be seriously rethought
 SIMULATING_POLL_PERIOD = POLL_PERIOD / 20.0
 
+# How often to poll on real hardware while nothing is changing.
+IDLE_POLL_PERIOD = 5.0
+
 DFU_PID = "df11"
 
 
@@ -49,6 +52,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         poll_interval_seconds: Optional[float] = None,
         simulating: bool = False,
         sim_model: Optional[str] = None,
+        poll_scheduler: Optional[PollScheduler] = None,
     ) -> "HeaterShaker":
         """
         Build a HeaterShaker
@@ -62,6 +66,7 @@ class HeaterShaker(mod_abc.AbstractModule):
             simulating: whether to build a simulating driver
             loop: Loop
             sim_model: The model name used by simulator
+            poll_scheduler: A scheduler to share with other modules' pollers.
 
         Returns:
             HeaterShaker instance
@@ -70,12 +75,22 @@ class HeaterShaker(mod_abc.AbstractModule):
         if not simulating:
             driver = await HeaterShakerDriver.create(port=port, loop=hw_control_loop)
             poll_interval_seconds = poll_interval_seconds or POLL_PERIOD
+            idle_interval_seconds: Optional[float] = max(
+                poll_interval_seconds, IDLE_POLL_PERIOD
+            )
         else:
             driver = SimulatingDriver()
             poll_interval_seconds = poll_interval_seconds or SIMULATING_POLL_PERIOD
+            idle_interval_seconds = None
 
         reader = HeaterShakerReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=idle_interval_seconds,
+            scheduler=poll_scheduler,
+            name=port,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -397,6 +412,15 @@ class HeaterShakerReader(Reader):
     def on_error(self, exception: Exception) -> None:
         self._set_error(exception)
 
+    def is_active(self) -> bool:
+        return HeaterShaker._get_temperature_status(self.temperature) in {
+            TemperatureStatus.HEATING,
+            TemperatureStatus.COOLING,
+        } or HeaterShaker._get_speed_status(self.rpm) in {
+            SpeedStatus.ACCELERATING,
+            SpeedStatus.DECELERATING,
+        }
+
     async def read_temperature(self) -> None:
         self.temperature = await self._driver.get_temperature()
 
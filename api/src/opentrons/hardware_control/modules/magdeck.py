@@ -8,6 +8,7 @@ from opentrons.drivers.mag_deck import (
 )
 from opentrons.drivers.rpi_drivers.types import USBPort
 from ..execution_manager import ExecutionManager
+from ..poller import PollScheduler
 from . import update, mod_abc, types
 
 log = logging.getLogger(__name__)
@@ -53,6 +54,7 @@ class MagDeck(mod_abc.AbstractModule):
         poll_interval_seconds: Optional[float] = None,
         simulating: bool = False,
         sim_model: Optional[str] = None,
+        poll_scheduler: Optional[PollScheduler] = None,
     ) -> "MagDeck":
         """Factory function."""
         driver: AbstractMagDeckDriver
@@ -9,6 +9,7 @@ from opentrons.config import IS_ROBOT, ROBOT_FIRMWARE_DIR
 from opentrons.drivers.rpi_drivers.types import USBPort
 
 from ..execution_manager import ExecutionManager
+from ..poller import PollScheduler
 from .types import BundledFirmware, UploadFunction, LiveData, ModuleType
 
 mod_log = logging.getLogger(__name__)
@@ -32,6 +33,7 @@ class AbstractModule(abc.ABC):
         poll_interval_seconds: Optional[float] = None,
         simulating: bool = False,
         sim_model: Optional[str] = None,
+        poll_scheduler: Optional[PollScheduler] = None,
     ) -> "AbstractModule":
         """Modules should always be created using this factory.
 
@@ -5,7 +5,7 @@ import logging
 from typing import Mapping, Optional
 
 from opentrons.hardware_control.modules.types import TemperatureStatus
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import Reader, Poller, PollScheduler
 from typing_extensions import Final
 from opentrons.drivers.types import Temperature
 from opentrons.drivers.temp_deck import (
@@ -21,6 +21,8 @@ log = logging.getLogger(__name__)
 
 TEMP_POLL_INTERVAL_SECS = 1.0
 SIM_TEMP_POLL_INTERVAL_SECS = TEMP_POLL_INTERVAL_SECS / 20.0
+# How often to poll on real hardware while nothing is changing.
+TEMP_IDLE_POLL_INTERVAL_SECS = 5.0
 
 
 class TempDeck(mod_abc.AbstractModule):
@@ -39,6 +41,7 @@ class TempDeck(mod_abc.AbstractModule):
         poll_interval_seconds: Optional[float] = None,
         simulating: bool = False,
         sim_model: Optional[str] = None,
+        poll_scheduler: Optional[PollScheduler] = None,
     ) -> "TempDeck":
         """
         Build a TempDeck
@@ -51,6 +54,7 @@ class TempDeck(mod_abc.AbstractModule):
             poll_interval_seconds: Poll interval override.
             simulating: whether to build a simulating driver
             sim_model: The model name used by simulator
+            poll_scheduler: A scheduler to share with other modules' pollers.
 
         Returns:
             Tempdeck instance
@@ -59,12 +63,22 @@ class TempDeck(mod_abc.AbstractModule):
         if not simulating:
             driver = await TempDeckDriver.create(port=port, loop=hw_control_loop)
             poll_interval_seconds = poll_interval_seconds or TEMP_POLL_INTERVAL_SECS
+            idle_interval_seconds: Optional[float] = max(
+                poll_interval_seconds, TEMP_IDLE_POLL_INTERVAL_SECS
+            )
         else:
             driver = SimulatingDriver(sim_model=sim_model)
             poll_interval_seconds = poll_interval_seconds or SIM_TEMP_POLL_INTERVAL_SECS
+            idle_interval_seconds = None
 
         reader = TempDeckReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=idle_interval_seconds,
+            scheduler=poll_scheduler,
+            name=port,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -281,3 +295,10 @@ class TempDeckReader(Reader):
     async def read(self) -> None:
         """Read the module's current and target temperatures."""
         self.temperature = await self._driver.get_temperature()
+
+    def is_active(self) -> bool:
+        """Whether the module is heating or cooling toward its target."""
+        return TempDeck._get_status(self.temperature) in {
+            TemperatureStatus.HEATING,
+            TemperatureStatus.COOLING,
+        }
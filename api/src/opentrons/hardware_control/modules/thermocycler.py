@@ -8,7 +8,7 @@ from opentrons.drivers.types import ThermocyclerLidStatus, Temperature, PlateTem
 from opentrons.hardware_control.modules.lid_temp_status import LidTemperatureStatus
 from opentrons.hardware_control.modules.plate_temp_status import PlateTemperatureStatus
 from opentrons.hardware_control.modules.types import TemperatureStatus
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import Reader, Poller, PollScheduler
 
 from ..execution_manager import ExecutionManager
 from . import types, update, mod_abc
@@ -24,6 +24,8 @@ log = logging.getLogger(__name__)
 
 POLLING_FREQUENCY_SEC = 1.0
 SIM_POLLING_FREQUENCY_SEC = POLLING_FREQUENCY_SEC / 50.0
+# How often to poll on real hardware while nothing is changing.
+IDLE_POLLING_FREQUENCY_SEC = 5.0
 
 V1_MODULE_STRING = "thermocyclerModuleV1"
 V2_MODULE_STRING = "thermocyclerModuleV2"
@@ -63,6 +65,7 @@ class Thermocycler(mod_abc.AbstractModule):
         poll_interval_seconds: Optional[float] = None,
         simulating: bool = False,
         sim_model: Optional[str] = None,
+        poll_scheduler: Optional[PollScheduler] = None,
     ) -> "Thermocycler":
         """
         Build and connect to a Thermocycler
@@ -76,6 +79,7 @@ class Thermocycler(mod_abc.AbstractModule):
             simulating: whether to build a simulating driver
             loop: Loop
             sim_model: The model name used by simulator
+            poll_scheduler: A scheduler to share with other modules' pollers.
 
         Returns:
             Thermocycler instance.
@@ -86,12 +90,22 @@ class Thermocycler(mod_abc.AbstractModule):
                 port=port, loop=hw_control_loop
             )
             poll_interval_seconds = poll_interval_seconds or POLLING_FREQUENCY_SEC
+            idle_interval_seconds: Optional[float] = max(
+                poll_interval_seconds, IDLE_POLLING_FREQUENCY_SEC
+            )
         else:
             driver = SimulatingDriver(model=sim_model)
             poll_interval_seconds = poll_interval_seconds or SIM_POLLING_FREQUENCY_SEC
+            idle_interval_seconds = None
 
         reader = ThermocyclerReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(
+            reader=reader,
+            interval=poll_interval_seconds,
+            idle_interval=idle_interval_seconds,
+            scheduler=poll_scheduler,
+            name=port,
+        )
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -635,6 +649,14 @@ class ThermocyclerReader(Reader):
     def lid_temperature_status(self) -> TemperatureStatus:
         return self._lid_temperature_status.status
 
+    def is_active(self) -> bool:
+        """Whether the block or lid is heating or cooling toward its target."""
+        changing = {TemperatureStatus.HEATING, TemperatureStatus.COOLING}
+        return (
+            self.block_temperature_status in changing
+            or self.lid_temperature_status in changing
+        )
+
     def on_error(self, exception: Exception) -> None:
         if self._handle_error is not None:
             self._handle_error(exception)
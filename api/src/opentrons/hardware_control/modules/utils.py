@@ -5,6 +5,7 @@ from typing import Dict, Optional, Type
 from opentrons.drivers.rpi_drivers.types import USBPort
 
 from ..execution_manager import ExecutionManager
+from ..poller import PollScheduler
 
 from .types import ModuleType
 from .mod_abc import AbstractModule
@@ -42,6 +43,7 @@ async def build(
     hw_control_loop: asyncio.AbstractEventLoop,
     execution_manager: ExecutionManager,
     sim_model: Optional[str] = None,
+    poll_scheduler: Optional[PollScheduler] = None,
 ) -> AbstractModule:
     return await _MODULE_CLS_BY_TYPE[type].build(
         port=port,
@@ -50,4 +52,5 @@ async def build(
         hw_control_loop=hw_control_loop,
         execution_manager=execution_manager,
         sim_model=sim_model,
+        poll_scheduler=poll_scheduler,
     )
@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 from functools import partial, lru_cache
+from math import sqrt
 from dataclasses import replace
 import logging
 from collections import OrderedDict
@@ -39,6 +40,7 @@ from opentrons.config.types import (
     LiquidProbeSettings,
 )
 from opentrons.drivers.rpi_drivers.types import USBPort
+from opentrons.util.command_timing import TimingPhase, timed
 from opentrons_hardware.hardware_control.motion_planning import (
     Move,
     MoveManager,
@@ -929,6 +931,7 @@ class OT3API(
             z=cur_pos[OT3Axis.by_mount(realmount)],
         )
 
+    @timed(TimingPhase.HARDWARE)
     async def move_to(
         self,
         mount: Union[top_types.Mount, OT3Mount],
@@ -941,19 +944,7 @@ class OT3API(
         """Move the critical point of the specified mount to a location
         relative to the deck, at the specified speed."""
         realmount = OT3Mount.from_mount(mount)
-        axes_moving = [OT3Axis.X, OT3Axis.Y, OT3Axis.by_mount(mount)]
-
-        # Cache current position from backend
-        if not self._current_position:
-            await self.refresh_positions()
-
-        if not self._backend.check_encoder_status(axes_moving):
-            # a moving axis has not been homed before, homing robot now
-            await self.home()
-        elif not self._backend.check_motor_status(axes_moving):
-            raise MustHomeError(
-                f"Inaccurate motor position for {str(realmount)}, please home motors."
-            )
+        await self._home_or_check_motors_for_move(realmount)
 
         target_position = target_position_from_absolute(
             realmount,
@@ -979,6 +970,59 @@ class OT3API(
             expect_stalls=_expect_stalls,
         )
 
+    async def move_through(
+        self,
+        mount: Union[top_types.Mount, OT3Mount],
+        moves: Sequence[Tuple[top_types.Point, Optional[CriticalPoint]]],
+        speed: Optional[float] = None,
+        max_speeds: Union[None, Dict[Axis, float], OT3AxisMap[float]] = None,
+    ) -> None:
+        """Move the critical point of the specified mount through each of
+        `moves`, a position and critical point as for :py:meth:`move_to`.
+
+        Every move is planned up front, and each is sent to the motor
+        controllers while the one before it runs."""
+        realmount = OT3Mount.from_mount(mount)
+        await self._home_or_check_motors_for_move(realmount)
+
+        target_positions = [
+            target_position_from_absolute(
+                realmount,
+                position,
+                partial(self.critical_point_for, cp_override=critical_point),
+                top_types.Point(*self._config.left_mount_offset),
+                top_types.Point(*self._config.right_mount_offset),
+                top_types.Point(*self._config.gripper_mount_offset),
+            )
+            for position, critical_point in moves
+        ]
+        if max_speeds:
+            checked_max: Optional[OT3AxisMap[float]] = {
+                OT3Axis.from_axis(k): v for k, v in max_speeds.items()
+            }
+        else:
+            checked_max = None
+
+        await self._cache_and_maybe_retract_mount(realmount)
+        await self._move_gripper_to_idle_position(realmount)
+        await self._move_through(target_positions, speed=speed, max_speeds=checked_max)
+
+    async def _home_or_check_motors_for_move(self, mount: OT3Mount) -> None:
+        axes_moving = [OT3Axis.X, OT3Axis.Y, OT3Axis.by_mount(mount)]
+
+        # Cache current position from backend
+        if not self._current_position:
+            await self.refresh_positions()
+
+        if not self._backend.check_encoder_status(axes_moving):
+            # a moving axis has not been homed before, homing robot now
+            await self.home()
+        elif not self._backend.check_motor_status(axes_moving):
+            raise MustHomeError(
+                f"Inaccurate motor position for {str(mount)}, please home motors."
+            )
+
+    @timed(TimingPhase.HARDWARE)
     async def move_rel(
         self,
         mount: Union[top_types.Mount, OT3Mount],
@@ -1061,15 +1105,30 @@ class OT3API(
                 # allows for safer gantry movement at minimum force
                 await self.grip(force_newtons=IDLE_STATE_GRIP_FORCE)
 
+    @timed(TimingPhase.MOTION_PLANNING)
     def _build_moves(
         self,
         origin: Dict[OT3Axis, float],
         target: Dict[OT3Axis, float],
         speed: Optional[float] = None,
+        max_speeds: Optional[OT3AxisMap[float]] = None,
     ) -> List[List[Move[OT3Axis]]]:
-        """Build move with Move Manager with machine positions."""
+        """Build move with Move Manager with machine positions.
+
+        If `max_speeds` is given, the move's speed is lowered as needed so
+        that no axis moves faster than its maximum.
+        """
         # TODO: (2022-02-10) Use actual max speed for MoveTarget
         checked_speed = speed or 400
+        if max_speeds:
+            deltas = {ax: pos - origin.get(ax, pos) for ax, pos in target.items()}
+            distance = sqrt(sum(delta**2 for delta in deltas.values()))
+            for ax, axis_max in max_speeds.items():
+                axis_distance = abs(deltas.get(ax, 0))
+                if axis_distance:
+                    checked_speed = min(
+                        checked_speed, axis_max * distance / axis_distance
+                    )
         move_target = MoveTarget.build(position=target, max_speed=checked_speed)
         _, moves = self._move_manager.plan_motion(
             origin=origin, target_list=[move_target]
@@ -1103,7 +1162,7 @@ class OT3API(
 
         origin = await self._backend.update_position()
         try:
-            moves = self._build_moves(origin, machine_pos, speed)
+            moves = self._build_moves(origin, machine_pos, speed, max_speeds)
         except ZeroLengthMoveError as zero_length_error:
             self._log.info(f"{str(zero_length_error)}, ignoring")
             return
@@ -1130,6 +1189,56 @@ class OT3API(
                 await self._cache_current_position()
                 await self._cache_encoder_position()
 
+    @ExecutionManagerProvider.wait_for_running
+    async def _move_through(
+        self,
+        target_positions: Sequence["OrderedDict[OT3Axis, float]"],
+        speed: Optional[float] = None,
+        max_speeds: Optional[OT3AxisMap[float]] = None,
+    ) -> None:
+        """Worker function to apply a series of robot motions.
+
+        Each segment is planned from where the one before it ends, rather
+        than from a position read back after it, so that they can all be
+        handed to the backend at once.
+        """
+        bounds = self._backend.axis_bounds
+        origin = await self._backend.update_position()
+        segments = []
+        for target_position in target_positions:
+            machine_pos = machine_from_deck(
+                target_position,
+                self._robot_calibration.deck_calibration.attitude,
+                self._robot_calibration.carriage_offset,
+            )
+            to_check = {
+                ax: machine_pos[ax]
+                for ax in target_position.keys()
+                if ax in OT3Axis.gantry_axes()
+            }
+            check_motion_bounds(to_check, target_position, bounds, MotionChecks.NONE)
+            try:
+                moves = self._build_moves(origin, machine_pos, speed, max_speeds)
+            except ZeroLengthMoveError as zero_length_error:
+                self._log.info(f"{str(zero_length_error)}, ignoring")
+                continue
+            segments.append((origin, moves[0]))
+            origin = {**origin, **machine_pos}
+
+        if not segments:
+            return
+        self._log.info(f"move through: {target_positions} requiring {segments}")
+        async with self._motion_lock:
+            try:
+                await self._backend.move_through(segments)
+            except Exception:
+                self._log.exception("Move failed")
+                self._current_position.clear()
+                raise
+            else:
+                await self._cache_current_position()
+                await self._cache_encoder_position()
+
     async def _home_axis(self, axis: OT3Axis) -> None:
         """
         Perform home; base on axis motor/encoder statuses, shorten homing time
@@ -1215,6 +1324,7 @@ class OT3API(
                     await self._cache_current_position()
                     await self._cache_encoder_position()
 
+    @timed(TimingPhase.HARDWARE)
     @ExecutionManagerProvider.wait_for_running
     async def home(
         self, axes: Optional[Union[List[Axis], List[OT3Axis]]] = None
@@ -1428,6 +1538,7 @@ class OT3API(
         )
 
     # Pipette action API
+    @timed(TimingPhase.HARDWARE)
     async def prepare_for_aspirate(
         self, mount: Union[top_types.Mount, OT3Mount], rate: float = 1.0
     ) -> None:
@@ -1441,6 +1552,7 @@ class OT3API(
             await self._move_to_plunger_bottom(checked_mount, rate)
             instrument.ready_to_aspirate = True
 
+    @timed(TimingPhase.HARDWARE)
     async def aspirate(
         self,
         mount: Union[top_types.Mount, OT3Mount],
@@ -1478,6 +1590,7 @@ class OT3API(
         else:
             aspirate_spec.instr.add_current_volume(aspirate_spec.volume)
 
+    @timed(TimingPhase.HARDWARE)
     async def dispense(
         self,
         mount: Union[top_types.Mount, OT3Mount],
@@ -1514,6 +1627,7 @@ class OT3API(
         else:
             dispense_spec.instr.remove_current_volume(dispense_spec.volume)
 
+    @timed(TimingPhase.HARDWARE)
     async def blow_out(
         self,
         mount: Union[top_types.Mount, OT3Mount],
@@ -1611,6 +1725,7 @@ class OT3API(
                 "home",
             )
 
+    @timed(TimingPhase.HARDWARE)
     async def pick_up_tip(
         self,
         mount: Union[top_types.Mount, OT3Mount],
@@ -1661,6 +1776,7 @@ class OT3API(
         )
         instrument.working_volume = tip_volume
 
+    @timed(TimingPhase.HARDWARE)
     async def drop_tip(
         self, mount: Union[top_types.Mount, OT3Mount], home_after: bool = False
     ) -> None:
@@ -1,12 +1,17 @@
 import asyncio
 import contextlib
 import logging
+import math
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, List, Optional
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, List, Optional
 
 
 log = logging.getLogger(__name__)
 
+# Slack for floating point error when rounding a time up to an interval boundary.
+_ALIGNMENT_TOLERANCE = 1e-9
+
 
 class Reader(ABC):
     @abstractmethod
@@ -16,38 +21,218 @@ class Reader(ABC):
     def on_error(self, exception: Exception) -> None:
         """Handle an error from calling `read`."""
 
+    def is_active(self) -> bool:
+        """Whether the last read shows the source moving toward a target.
+
+        While a reader is active, its poller reads at its fast `interval`.
+        Otherwise, it backs off to its `idle_interval`.
+        """
+        return False
+
+
+@dataclass
+class PollMetrics:
+    """Timing statistics for a poller's reads.
+
+    Latency is how long each read took. Jitter is how late each read
+    started, compared to when it was scheduled. All times are in seconds.
+    """
+
+    poll_count: int = 0
+    last_latency: float = 0.0
+    mean_latency: float = 0.0
+    max_latency: float = 0.0
+    last_jitter: float = 0.0
+    mean_jitter: float = 0.0
+    max_jitter: float = 0.0
+
+    def record(self, latency: float, jitter: float) -> None:
+        """Add a completed read to the statistics."""
+        self.poll_count += 1
+        self.last_latency = latency
+        self.mean_latency += (latency - self.mean_latency) / self.poll_count
+        self.max_latency = max(self.max_latency, latency)
+        self.last_jitter = jitter
+        self.mean_jitter += (jitter - self.mean_jitter) / self.poll_count
+        self.max_jitter = max(self.max_jitter, jitter)
+
+
+@dataclass
+class _Schedule:
+    due: float
+    last_scheduled: Optional[float] = None
+
+
+def _align(time: float, interval: float) -> float:
+    """Round a loop time up to the next multiple of `interval`.
+
+    Pollers with the same (or evenly dividing) intervals land on the same
+    boundaries, so a single wakeup of the scheduler serves all of them.
+    """
+    return math.ceil(time / interval - _ALIGNMENT_TOLERANCE) * interval
+
+
+class PollScheduler:
+    """Run many pollers' reads from a single task.
+
+    Reads are scheduled on boundaries of each poller's current interval,
+    so modules polling at the same rate are read on the same event loop wakeup.
+    Reads of different pollers run concurrently, so a slow module
+    doesn't delay the others.
+    """
+
+    def __init__(self) -> None:
+        self._schedules: Dict["Poller", _Schedule] = {}
+        self._reads: Dict["Poller", "asyncio.Task[None]"] = {}
+        self._wakeup: Optional["asyncio.Future[None]"] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def metrics(self) -> Dict[str, PollMetrics]:
+        """Timing statistics of each scheduled poller, by name."""
+        return {poller.name: poller.metrics for poller in self._schedules}
+
+    def add(self, poller: "Poller") -> None:
+        """Start polling, with a first read as soon as possible."""
+        assert poller not in self._schedules, "Poller already scheduled"
+        loop = asyncio.get_running_loop()
+        self._schedules[poller] = _Schedule(due=loop.time())
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self._wake()
+
+    async def remove(self, poller: "Poller") -> None:
+        """Stop polling, cancelling any read in progress."""
+        self._schedules.pop(poller, None)
+        tasks = [self._reads.pop(poller)] if poller in self._reads else []
+
+        if not self._schedules and self._task is not None:
+            tasks.append(self._task)
+            self._task = None
+            self._wakeup = None
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def reschedule(self, poller: "Poller") -> None:
+        """Bring a poller's next read forward if its interval has shortened."""
+        schedule = self._schedules.get(poller)
+        if schedule is None or schedule.last_scheduled is None:
+            return
+
+        due = self._next_due(poller, schedule.last_scheduled)
+        if due < schedule.due:
+            schedule.due = due
+            self._wake()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+
+    def _next_due(self, poller: "Poller", last_scheduled: float) -> float:
+        interval = poller.current_interval
+        now = asyncio.get_running_loop().time()
+        return _align(max(now, last_scheduled + interval), interval)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            now = loop.time()
+            next_due: Optional[float] = None
+
+            for poller, schedule in self._schedules.items():
+                if poller in self._reads:
+                    continue
+                if schedule.due <= now:
+                    self._reads[poller] = asyncio.create_task(
+                        self._read(poller, schedule.due)
+                    )
+                elif next_due is None or schedule.due < next_due:
+                    next_due = schedule.due
+
+            wakeup = self._wakeup = loop.create_future()
+            timer = loop.call_at(next_due, self._wake) if next_due is not None else None
+            try:
+                await wakeup
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+    async def _read(self, poller: "Poller", scheduled: float) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        await poller._poll_once()
+
+        poller.metrics.record(latency=loop.time() - started, jitter=started - scheduled)
+        self._reads.pop(poller, None)
+
+        schedule = self._schedules.get(poller)
+        if schedule is not None:
+            schedule.last_scheduled = scheduled
+            schedule.due = self._next_due(poller, scheduled)
+            self._wake()
+
 
 class Poller:
     """A poller to call a given reader on an interval.
 
     Args:
         reader: An interface to read data.
-        interval: The poll interval, in seconds.
+        interval: The poll interval, in seconds, while the reader is active
+            or someone is waiting for a poll.
+        idle_interval: The poll interval, in seconds, otherwise.
+            Defaults to `interval`.
+        scheduler: The scheduler to run reads from, to share with other pollers.
+            Defaults to a scheduler of this poller's own.
+        name: A name for this poller in the scheduler's metrics.
     """
 
     interval: float
+    idle_interval: float
+    name: str
+    metrics: PollMetrics
 
-    def __init__(self, reader: Reader, interval: float) -> None:
+    def __init__(
+        self,
+        reader: Reader,
+        interval: float,
+        idle_interval: Optional[float] = None,
+        scheduler: Optional[PollScheduler] = None,
+        name: Optional[str] = None,
+    ) -> None:
         self.interval = interval
+        self.idle_interval = idle_interval if idle_interval is not None else interval
+        self.name = name or type(reader).__name__
+        self.metrics = PollMetrics()
         self._reader = reader
+        self._scheduler = scheduler or PollScheduler()
         self._read_lock: Optional["asyncio.Lock"] = None
         self._poll_waiters: List["asyncio.Future[None]"] = []
-        self._poll_forever_task: Optional["asyncio.Task[None]"] = None
+        self._started = False
+
+    @property
+    def current_interval(self) -> float:
+        """The poll interval, in seconds, given the reader's last known state."""
+        if self._poll_waiters or self._reader.is_active():
+            return self.interval
+        return self.idle_interval
 
     async def start(self) -> None:
-        assert self._poll_forever_task is None, "Poller already started"
-        self._poll_forever_task = asyncio.create_task(self._poll_forever())
+        assert not self._started, "Poller already started"
+        self._started = True
+        self._scheduler.add(self)
         await self.wait_next_poll()
 
     async def stop(self) -> None:
         """Stop polling."""
-        task = self._poll_forever_task
-
-        assert task is not None, "Poller never started"
+        assert self._started, "Poller never started"
 
         async with self._use_read_lock():
-            task.cancel()
-            await asyncio.gather(task, return_exceptions=True)
+            await self._scheduler.remove(self)
 
     async def wait_next_poll(self) -> None:
         """Wait for the next poll to complete.
@@ -58,6 +243,7 @@ class Poller:
         """
         poll_future = asyncio.get_running_loop().create_future()
         self._poll_waiters.append(poll_future)
+        self._scheduler.reschedule(self)
         await poll_future
 
     @contextlib.asynccontextmanager
@@ -67,12 +253,6 @@ class Poller:
         async with self._read_lock:
             yield
 
-    async def _poll_forever(self) -> None:
-        """Polling loop."""
-        while True:
-            await self._poll_once()
-            await asyncio.sleep(self.interval)
-
     async def _poll_once(self) -> None:
         """Trigger a single read, notifying listeners of success or error."""
         previous_waiters = self._poll_waiters
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from typing_extensions import Protocol
 
 from opentrons.types import Mount, Point
@@ -158,6 +158,22 @@ class MotionController(Protocol):
         """
         ...
 
+    async def move_through(
+        self,
+        mount: Mount,
+        moves: Sequence[Tuple[Point, Optional[CriticalPoint]]],
+        speed: Optional[float] = None,
+        max_speeds: Optional[Dict[Axis, float]] = None,
+    ) -> None:
+        """Move the critical point of the specified mount through a series of
+        locations, each a position and optional critical point as for
+        :py:meth:`move_to`.
+
+        Where the motion controller supports it, the moves are streamed to it
+        so that the gantry does not come to a stop between them.
+        """
+        ...
+
     async def move_rel(
         self,
         mount: Mount,
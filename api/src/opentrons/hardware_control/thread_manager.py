@@ -8,8 +8,10 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    Dict,
     Generic,
     Optional,
+    Tuple,
     TypeVar,
     cast,
     Sequence,
@@ -46,6 +48,33 @@ async def call_coroutine_threadsafe(
     return await wrapped
 
 
+def _get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _bridge_coroutine_function(
+    loop: asyncio.AbstractEventLoop, coro_func: WrappedCoro
+) -> WrappedCoro:
+    """Wrap an async function so it always runs in `loop`.
+
+    Callers already running in `loop` await the function directly, rather
+    than through the thread-safe hand-off that other callers need.
+    """
+
+    @functools.wraps(coro_func)
+    async def wrapper(
+        *args: Sequence[Any], **kwargs: Mapping[str, Any]
+    ) -> WrappedReturn:
+        if _get_running_loop() is loop:
+            return await coro_func(*args, **kwargs)
+        return await call_coroutine_threadsafe(loop, coro_func, *args, **kwargs)
+
+    return cast(WrappedCoro, wrapper)
+
+
 WrappedObj = TypeVar("WrappedObj", bound=AsyncioConfigurable, covariant=True)
 
 
@@ -55,6 +84,10 @@ class CallBridger(Generic[WrappedObj]):
     ) -> None:
         self.wrapped_obj = wrapped_obj
         self._loop = loop
+        # The attributes of the managed object that were callable when last
+        # retrieved, by name: the function and object they were bound to, and
+        # the wrapper to return for them, or None to return them as they are.
+        self._callables: Dict[str, Tuple[Any, Any, Optional[Callable[..., Any]]]] = {}
 
     def __getattribute__(self, attr_name: str) -> Any:
         # Almost every attribute retrieved from us will be for people actually
@@ -67,24 +100,33 @@ class CallBridger(Generic[WrappedObj]):
             # Maybe this actually was for us? Let’s find it
             return object.__getattribute__(self, attr_name)
 
+        # Methods are bound anew on every access, so compare the functions
+        # they're bound to, to reuse what we worked out last time.
+        callables = object.__getattribute__(self, "_callables")
+        func = getattr(attr, "__func__", attr)
+        bound_to = getattr(attr, "__self__", None)
+        cached = callables.get(attr_name)
+        if cached is not None and cached[0] is func and cached[1] is bound_to:
+            return cached[2] or attr
+
         if asyncio.iscoroutinefunction(attr):
             # Return coroutine result of async function
             # executed in managed thread to calling thread
-
-            @functools.wraps(attr)
-            async def wrapper(
-                *args: Sequence[Any], **kwargs: Mapping[str, Any]
-            ) -> WrappedReturn:
-                return await call_coroutine_threadsafe(loop, attr, *args, **kwargs)
-
+            wrapper = _bridge_coroutine_function(loop, attr)
+            callables[attr_name] = (func, bound_to, wrapper)
             return wrapper
 
         elif asyncio.iscoroutine(attr):
             # Return awaitable coroutine properties run in managed thread/loop
+            if _get_running_loop() is loop:
+                return attr
             fut = asyncio.run_coroutine_threadsafe(attr, loop)
             wrapped = asyncio.wrap_future(fut)
             return wrapped
 
+        elif callable(attr):
+            callables[attr_name] = (func, bound_to, None)
+
         return attr
 
 
@@ -4,6 +4,7 @@ from typing_extensions import Final
 
 from opentrons.types import Point
 from opentrons.hardware_control.types import CriticalPoint
+from opentrons.util.command_timing import TimingPhase, timed
 
 from .types import Waypoint, MoveType
 from .errors import DestinationOutOfBoundsError, ArcOutOfBoundsError
@@ -13,6 +14,7 @@ DEFAULT_IN_LABWARE_ARC_Z_MARGIN: Final[float] = 5.0
 MINIMUM_Z_MARGIN: Final[float] = 1.0
 
 
+@timed(TimingPhase.MOTION_PLANNING)
 def get_waypoints(
     origin: Point,
     dest: Point,
@@ -13,7 +13,11 @@ from opentrons.hardware_control import (
     SynchronousAdapter,
 )
 from opentrons.protocol_engine import ProtocolEngine
-from opentrons.protocol_engine.clients import SyncClient, ChildThreadTransport
+from opentrons.protocol_engine.clients import (
+    SyncClient,
+    ChildThreadTransport,
+    SimulatingTransport,
+)
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocols.api_support.definitions import MAX_SUPPORTED_VERSION
 
@@ -69,7 +73,9 @@ def create_protocol_context(
         equipment_broker: A message broker for equipment load event publishing.
         use_simulating_core: For pre-ProtocolEngine API versions,
             use a simulating protocol core that will skip _most_ calls
-            to the `hardware_api`.
+            to the `hardware_api`. For ProtocolEngine API versions,
+            use a transport that executes commands without waiting
+            for the engine's command queue.
         extra_labware: Extra labware definitions to include in
             labware definition lookup paths.
         bundled_labware: Do not use in new code. Leftover from
@@ -109,8 +115,10 @@ def create_protocol_context(
                 "ProtocolEngine PAPI core is enabled, but no ProtocolEngine given."
             )
 
-        engine_client_transport = ChildThreadTransport(
-            engine=protocol_engine, loop=protocol_engine_loop
+        engine_client_transport = (
+            SimulatingTransport(engine=protocol_engine, loop=protocol_engine_loop)
+            if use_simulating_core
+            else ChildThreadTransport(engine=protocol_engine, loop=protocol_engine_loop)
         )
         engine_client = SyncClient(transport=engine_client_transport)
         core = ProtocolCore(
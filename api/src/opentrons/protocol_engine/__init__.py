@@ -16,7 +16,15 @@ from .commands import (
     CommandType,
     CommandIntent,
 )
-from .state import State, StateView, StateSummary, CommandSlice, CurrentCommand, Config
+from .state import (
+    State,
+    StateView,
+    StateSummary,
+    CommandSlice,
+    CommandUpdateSlice,
+    CurrentCommand,
+    Config,
+)
 from .plugins import AbstractPlugin
 
 from .types import (
@@ -68,6 +76,7 @@ __all__ = [
     "State",
     "StateView",
     "CommandSlice",
+    "CommandUpdateSlice",
     "CurrentCommand",
     # public value interfaces and models
     "LabwareOffset",
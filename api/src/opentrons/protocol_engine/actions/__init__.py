@@ -14,6 +14,7 @@ from .actions import (
     FinishAction,
     HardwareStoppedAction,
     QueueCommandAction,
+    QueueCommandsAction,
     UpdateCommandAction,
     FailCommandAction,
     AddLabwareOffsetAction,
@@ -40,6 +41,7 @@ __all__ = [
     "FinishAction",
     "HardwareStoppedAction",
     "QueueCommandAction",
+    "QueueCommandsAction",
     "UpdateCommandAction",
     "FailCommandAction",
     "AddLabwareOffsetAction",
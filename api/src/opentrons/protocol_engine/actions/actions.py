@@ -6,7 +6,7 @@ reactions in objects that subscribe to the pipeline, like the StateStore.
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Union
+from typing import Optional, Sequence, Union
 
 from opentrons.protocols.models import LabwareDefinition
 from opentrons.hardware_control.types import DoorState
@@ -97,6 +97,13 @@ class QueueCommandAction:
     request_hash: Optional[str]
 
 
+@dataclass(frozen=True)
+class QueueCommandsAction:
+    """Add several command requests to the queue at once, in order."""
+
+    actions: Sequence[QueueCommandAction]
+
+
 @dataclass(frozen=True)
 class UpdateCommandAction:
     """Update a given command."""
@@ -188,6 +195,7 @@ Action = Union[
     HardwareStoppedAction,
     DoorChangeAction,
     QueueCommandAction,
+    QueueCommandsAction,
     UpdateCommandAction,
     FailCommandAction,
     AddLabwareOffsetAction,
@@ -1,5 +1,14 @@
 """ProtocolEngine clients."""
 from .sync_client import SyncClient
-from .transports import AbstractSyncTransport, ChildThreadTransport
+from .transports import (
+    AbstractSyncTransport,
+    ChildThreadTransport,
+    SimulatingTransport,
+)
 
-__all__ = ["SyncClient", "AbstractSyncTransport", "ChildThreadTransport"]
+__all__ = [
+    "SyncClient",
+    "AbstractSyncTransport",
+    "ChildThreadTransport",
+    "SimulatingTransport",
+]
@@ -10,7 +10,7 @@ from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 from ..protocol_engine import ProtocolEngine
 from ..errors import ProtocolEngineError
 from ..state import StateView
-from ..commands import CommandCreate, CommandResult
+from ..commands import Command, CommandCreate, CommandResult
 
 
 class AbstractSyncTransport(ABC):
@@ -99,7 +99,7 @@ class ChildThreadTransport(AbstractSyncTransport):
     def execute_command(self, request: CommandCreate) -> CommandResult:
         """Execute a command synchronously on the main thread."""
         command = run_coroutine_threadsafe(
-            self._engine.add_and_execute_command(request=request),
+            self._add_and_execute_command(request=request),
             loop=self._loop,
         ).result()
 
@@ -122,6 +122,9 @@ class ChildThreadTransport(AbstractSyncTransport):
 
         return command.result
 
+    async def _add_and_execute_command(self, request: CommandCreate) -> Command:
+        return await self._engine.add_and_execute_command(request=request)
+
     def call_method(self, method_name: str, **kwargs: Any) -> Any:
         """Execute a ProtocolEngine method, returning the result."""
         return run_coroutine_threadsafe(
@@ -133,3 +136,16 @@ class ChildThreadTransport(AbstractSyncTransport):
         method = getattr(self._engine, method_name)
         assert callable(method), f"{method_name} is not a method of ProtocolEngine"
         return method(**kwargs)
+
+
+class SimulatingTransport(ChildThreadTransport):
+    """A ChildThreadTransport for a ProtocolEngine that's controlling simulated hardware.
+
+    Simulated commands finish almost as soon as they start, so most of the time
+    spent on each one is overhead. To cut some of it, commands are executed
+    right away by the task that receives them from the protocol's thread,
+    rather than waiting for the engine's queue worker to pick them up.
+    """
+
+    async def _add_and_execute_command(self, request: CommandCreate) -> Command:
+        return await self._engine.add_and_execute_command_now(request=request)
@@ -1,13 +1,15 @@
 """Command side-effect execution logic container."""
 import asyncio
 from logging import getLogger
+from time import perf_counter
 from typing import Optional
 
 from opentrons.hardware_control import HardwareControlAPI
+from opentrons.util.command_timing import TimingPhase, get_command_timing
 
 from ..state import StateStore
 from ..resources import ModelUtils
-from ..commands import CommandStatus
+from ..commands import Command, CommandStatus
 from ..actions import ActionDispatcher, UpdateCommandAction, FailCommandAction
 from ..errors import ProtocolEngineError, RunStoppedError, UnexpectedProtocolError
 from .equipment import EquipmentHandler
@@ -67,6 +69,11 @@ class CommandExecutor:
                 command itself will be looked up from state.
         """
         command = self._state_store.commands.get(command_id=command_id)
+
+        with get_command_timing().command(command.commandType):
+            await self._execute(command)
+
+    async def _execute(self, command: Command) -> None:
         command_impl = command._ImplementationCls(
             state_view=self._state_store,
             hardware_api=self._hardware_api,
@@ -90,6 +97,16 @@ class CommandExecutor:
 
         self._action_dispatcher.dispatch(UpdateCommandAction(command=running_command))
 
+        timing = get_command_timing()
+        if timing.enabled:
+            queued_duration = (started_at - command.createdAt).total_seconds()
+            timing.record(
+                TimingPhase.QUEUE,
+                command.commandType,
+                start=perf_counter() - queued_duration,
+                duration=queued_duration,
+            )
+
         try:
             log.debug(
                 f"Executing {command.id}, {command.commandType}, {command.params}"
@@ -109,7 +126,7 @@ class CommandExecutor:
             self._action_dispatcher.dispatch(
                 FailCommandAction(
                     error=error,
-                    command_id=command_id,
+                    command_id=command.id,
                     error_id=self._model_utils.generate_id(),
                     failed_at=self._model_utils.get_timestamp(),
                 )
@@ -124,13 +124,13 @@ class HardwareGantryMover(GantryMover):
 
         hw_mount = self._state_view.pipettes.get_mount(pipette_id).to_hw_mount()
 
-        for waypoint in waypoints:
-            await self._hardware_api.move_to(
-                mount=hw_mount,
-                abs_position=waypoint.position,
-                critical_point=waypoint.critical_point,
-                speed=speed,
-            )
+        await self._hardware_api.move_through(
+            mount=hw_mount,
+            moves=[
+                (waypoint.position, waypoint.critical_point) for waypoint in waypoints
+            ],
+            speed=speed,
+        )
 
         return waypoints[-1].position
 
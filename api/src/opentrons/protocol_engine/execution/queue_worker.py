@@ -3,7 +3,7 @@ import asyncio
 from logging import getLogger
 from typing import Optional
 
-from ..state import StateStore
+from ..state import StateSlice, StateStore
 from ..errors import RunStoppedError
 from .command_executor import CommandExecutor
 
@@ -51,6 +51,18 @@ class QueueWorker:
         if self._worker_task:
             self._worker_task.cancel()
 
+    async def execute_now(self, command_id: str) -> None:
+        """Execute a queued command in the calling task, ahead of the worker.
+
+        The command must be next in line to execute, and no other command
+        may be running. Otherwise, the worker could also pick up this command,
+        or run another one at the same time.
+
+        Unlike commands executed by the worker, this command will not
+        be interrupted by `cancel`.
+        """
+        await self._command_executor.execute(command_id=command_id)
+
     async def join(self) -> None:
         """Wait for the worker to finish, propagating any errors."""
         worker_task = self._worker_task
@@ -70,7 +82,8 @@ class QueueWorker:
         while True:
             try:
                 command_id = await self._state_store.wait_for(
-                    condition=self._state_store.commands.get_next_to_execute
+                    condition=self._state_store.commands.get_next_to_execute,
+                    slices=[StateSlice.COMMANDS],
                 )
             except RunStoppedError:
                 # There are no more commands that we should execute, either because the run has
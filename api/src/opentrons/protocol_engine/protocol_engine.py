@@ -1,5 +1,5 @@
 """ProtocolEngine class definition."""
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
 from opentrons.protocols.models import LabwareDefinition
 from opentrons.hardware_control import HardwareControlAPI
@@ -15,6 +15,7 @@ from .types import (
     ModuleModel,
     Liquid,
     HexColor,
+    EngineStatus,
 )
 from .execution import (
     QueueWorker,
@@ -22,7 +23,7 @@ from .execution import (
     DoorWatcher,
     HardwareStopper,
 )
-from .state import StateStore, StateView
+from .state import StateSlice, StateStore, StateView
 from .plugins import AbstractPlugin, PluginStarter
 from .actions import (
     ActionDispatcher,
@@ -33,6 +34,7 @@ from .actions import (
     FinishAction,
     FinishErrorDetails,
     QueueCommandAction,
+    QueueCommandsAction,
     AddLabwareOffsetAction,
     AddLabwareDefinitionAction,
     AddLiquidAction,
@@ -165,6 +167,54 @@ class ProtocolEngine:
         self._action_dispatcher.dispatch(action)
         return self._state_store.commands.get(command_id)
 
+    def add_commands(
+        self, requests: Sequence[commands.CommandCreate]
+    ) -> List[commands.Command]:
+        """Add several commands to the `ProtocolEngine`'s queue, in order.
+
+        This is equivalent to calling `add_command` for each request, but
+        state is updated and change subscribers are notified only once.
+
+        Arguments:
+            requests: The command types and payload data used to construct
+                the commands in state.
+
+        Returns:
+            The full, newly queued commands.
+
+        Raises:
+            SetupCommandNotAllowed: a request specified a setup command,
+                but the engine was not idle or paused. No commands are added.
+            RunStoppedError: the run has been stopped, so no new commands
+                may be added.
+        """
+        queue_actions = []
+        last_hash = self._state_store.commands.get_latest_command_hash()
+
+        for request in requests:
+            request_hash = commands.hash_command_params(
+                create=request, last_hash=last_hash
+            )
+            if request_hash is not None:
+                last_hash = request_hash
+            queue_actions.append(
+                QueueCommandAction(
+                    request=request,
+                    request_hash=request_hash,
+                    command_id=self._model_utils.generate_id(),
+                    created_at=self._model_utils.get_timestamp(),
+                )
+            )
+
+        action = self.state_view.commands.validate_action_allowed(
+            QueueCommandsAction(actions=queue_actions)
+        )
+        self._action_dispatcher.dispatch(action)
+        return [
+            self._state_store.commands.get(queue_action.command_id)
+            for queue_action in queue_actions
+        ]
+
     async def wait_for_command(self, command_id: str) -> None:
         """Wait for a command to be completed.
 
@@ -173,6 +223,21 @@ class ProtocolEngine:
         await self._state_store.wait_for(
             self._state_store.commands.get_command_is_final,
             command_id=command_id,
+            slices=[StateSlice.COMMANDS],
+        )
+
+    async def wait_for_command_updates(self, cursor: int, status: EngineStatus) -> None:
+        """Wait for a command to be added or changed, or for the engine status to change.
+
+        Arguments:
+            cursor: Return once commands have been updated past this update cursor.
+            status: Return once the engine's status is no longer this value.
+        """
+        await self._state_store.wait_for(
+            self._state_store.commands.get_has_changed_since,
+            cursor=cursor,
+            status=status,
+            slices=[StateSlice.COMMANDS],
         )
 
     async def add_and_execute_command(
@@ -196,6 +261,40 @@ class ProtocolEngine:
         await self.wait_for_command(command.id)
         return self._state_store.commands.get(command.id)
 
+    async def add_and_execute_command_now(
+        self, request: commands.CommandCreate
+    ) -> commands.Command:
+        """Add a command and execute it right away, if nothing else is in the way.
+
+        This works like `add_and_execute_command`, but skips the round trip
+        through the queue worker when the new command is next in line
+        and no other command is running. With simulated hardware, that round
+        trip is a noticeable part of the time it takes to execute a command.
+
+        A command executed this way will not be interrupted by `stop`,
+        so this is only meant for simulations, which are never stopped midway.
+
+        Arguments:
+            request: The command type and payload data used to construct
+                the command in state.
+
+        Returns:
+            The command. If the command completed, it will be succeeded or failed.
+            If the engine was stopped before it reached the command,
+            the command will be queued.
+        """
+        command = self.add_command(request)
+
+        if (
+            self._state_store.commands.get_running() is None
+            and self._state_store.commands.get_next_to_execute() == command.id
+        ):
+            await self._queue_worker.execute_now(command.id)
+        else:
+            await self.wait_for_command(command.id)
+
+        return self._state_store.commands.get(command.id)
+
     async def stop(self) -> None:
         """Stop execution immediately, halting all motion and cancelling future commands.
 
@@ -216,7 +315,8 @@ class ProtocolEngine:
             CommandExecutionFailedError: if any protocol command failed.
         """
         await self._state_store.wait_for(
-            condition=self._state_store.commands.get_all_commands_final
+            condition=self._state_store.commands.get_all_commands_final,
+            slices=[StateSlice.COMMANDS],
         )
 
     async def finish(
@@ -1,9 +1,15 @@
 """Protocol engine state module."""
 
-from .state import State, StateStore, StateView
+from .state import State, StateSlice, StateStore, StateView
 from .state_summary import StateSummary
 from .config import Config
-from .commands import CommandState, CommandView, CommandSlice, CurrentCommand
+from .commands import (
+    CommandState,
+    CommandView,
+    CommandSlice,
+    CommandUpdateSlice,
+    CurrentCommand,
+)
 from .labware import LabwareState, LabwareView
 from .pipettes import PipetteState, PipetteView, HardwarePipette
 from .modules import ModuleState, ModuleView, HardwareModule
@@ -24,6 +30,7 @@ from .motion import MotionView, PipetteLocationData
 __all__ = [
     # top level state value and interfaces
     "State",
+    "StateSlice",
     "StateStore",
     "StateView",
     "StateSummary",
@@ -33,6 +40,7 @@ __all__ = [
     "CommandState",
     "CommandView",
     "CommandSlice",
+    "CommandUpdateSlice",
     "CurrentCommand",
     # labware state and values
     "LabwareState",
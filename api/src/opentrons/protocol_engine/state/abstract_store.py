@@ -1,6 +1,6 @@
 """Abstract state store interfaces."""
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, Optional, Tuple, Type, TypeVar
 
 from ..actions import Action
 
@@ -21,6 +21,13 @@ class HasState(ABC, Generic[StateT]):
 class HandlesActions(ABC):
     """Abstract interface for an object that reacts to actions."""
 
+    handled_action_types: Optional[Tuple[Type[Action], ...]] = None
+    """The action types this object reacts to, or `None` for all actions.
+
+    Actions that are not instances of these types may be skipped
+    instead of passed to `handle_action`.
+    """
+
     @abstractmethod
     def handle_action(self, action: Action) -> None:
         """React to a state-change action."""
@@ -1,19 +1,60 @@
 """Simple state change notification interface."""
 import asyncio
+from typing import Collection, Dict, Optional
 
 
 class ChangeNotifier:
-    """An interface tto emit or subscribe to state change notifications."""
+    """An interface tto emit or subscribe to state change notifications.
+
+    Subscribers may wait for any change, or only for changes to
+    specific topics.
+    """
 
     def __init__(self) -> None:
         """Initialize the ChangeNotifier with an internal Event."""
         self._event = asyncio.Event()
+        # dicts instead of sets to wake topic subscribers in subscription order
+        self._topic_events: Dict[str, Dict[asyncio.Event, None]] = {}
+
+    def notify(self, topics: Optional[Collection[str]] = None) -> None:
+        """Notify `wait`'ers that the state has changed.
 
-    def notify(self) -> None:
-        """Notify all `wait`'ers that the state has changed."""
+        Arguments:
+            topics: The topics that changed. Subscribers to other topics
+                will not be notified. If omitted, all topics changed.
+        """
         self._event.set()
 
-    async def wait(self) -> None:
-        """Wait until the next state change notification."""
-        self._event.clear()
-        await self._event.wait()
+        if topics is None:
+            topics = list(self._topic_events.keys())
+
+        for topic in topics:
+            for event in self._topic_events.get(topic, {}):
+                event.set()
+
+    async def wait(self, topics: Optional[Collection[str]] = None) -> None:
+        """Wait until the next state change notification.
+
+        Arguments:
+            topics: Only wait for a change to one of these topics.
+                If omitted, wait for a change to anything.
+        """
+        if topics is None:
+            self._event.clear()
+            await self._event.wait()
+            return
+
+        event = asyncio.Event()
+        topics = list(dict.fromkeys(topics))
+
+        for topic in topics:
+            self._topic_events.setdefault(topic, {})[event] = None
+
+        try:
+            await event.wait()
+        finally:
+            for topic in topics:
+                topic_events = self._topic_events[topic]
+                del topic_events[event]
+                if not topic_events:
+                    del self._topic_events[topic]
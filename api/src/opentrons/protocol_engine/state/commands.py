@@ -13,6 +13,7 @@ from opentrons.hardware_control.types import DoorState
 from ..actions import (
     Action,
     QueueCommandAction,
+    QueueCommandsAction,
     UpdateCommandAction,
     FailCommandAction,
     PlayAction,
@@ -75,6 +76,14 @@ class CommandSlice:
     total_length: int
 
 
+@dataclass(frozen=True)
+class CommandUpdateSlice:
+    """The commands that have been added or changed since a given update cursor."""
+
+    commands: List[Command]
+    cursor: int
+
+
 @dataclass(frozen=True)
 class CurrentCommand:
     """The "current" command's ID and index in the overall commands list."""
@@ -112,6 +121,13 @@ class CommandState:
     commands_by_id: Dict[str, CommandEntry]
     """All command resources, in insertion order, mapped by their unique IDs."""
 
+    command_update_ids: List[str]
+    """The IDs of commands, in the order they were added or changed.
+
+    A position in this list is a cursor that clients can use to resume
+    following command updates without re-reading every command.
+    """
+
     queue_status: QueueStatus
     """Whether the engine is currently pulling new commands off the queue to execute.
 
@@ -153,11 +169,37 @@ class CommandState:
     This value can be used to generate future hashes.
     """
 
+    latest_completed_command_id: Optional[str]
+    """The ID of the succeeded or failed command with the highest index, if any.
+
+    Maintained incrementally so the "current" command can be found
+    without scanning every command.
+    """
+
+    failed_protocol_command_id: Optional[str]
+    """The ID of the lowest-index non-setup command with an error, if any.
+
+    Maintained incrementally so checking whether all commands are final
+    does not need to scan every command for errors.
+    """
+
 
 class CommandStore(HasState[CommandState], HandlesActions):
     """Command state container."""
 
     _state: CommandState
+    handled_action_types = (
+        QueueCommandAction,
+        QueueCommandsAction,
+        UpdateCommandAction,
+        FailCommandAction,
+        PlayAction,
+        PauseAction,
+        StopAction,
+        FinishAction,
+        HardwareStoppedAction,
+        DoorChangeAction,
+    )
 
     def __init__(
         self,
@@ -176,10 +218,13 @@ class CommandStore(HasState[CommandState], HandlesActions):
             queued_command_ids=OrderedSet(),
             queued_setup_command_ids=OrderedSet(),
             commands_by_id=OrderedDict(),
+            command_update_ids=[],
             errors_by_id={},
             run_completed_at=None,
             run_started_at=None,
             latest_command_hash=None,
+            latest_completed_command_id=None,
+            failed_protocol_command_id=None,
         )
 
     def handle_action(self, action: Action) -> None:  # noqa: C901
@@ -187,39 +232,11 @@ class CommandStore(HasState[CommandState], HandlesActions):
         errors_by_id: Mapping[str, ErrorOccurrence]
 
         if isinstance(action, QueueCommandAction):
-            assert action.command_id not in self._state.commands_by_id
-
-            # TODO(mc, 2021-06-22): mypy has trouble with this automatic
-            # request > command mapping, figure out how to type precisely
-            # (or wait for a future mypy version that can figure it out).
-            # For now, unit tests cover mapping every request type
-            queued_command = action.request._CommandCls.construct(
-                id=action.command_id,
-                key=(
-                    action.request.key
-                    if action.request.key is not None
-                    else (action.request_hash or action.command_id)
-                ),
-                createdAt=action.created_at,
-                params=action.request.params,  # type: ignore[arg-type]
-                intent=action.request.intent,
-                status=CommandStatus.QUEUED,
-            )
+            self._queue_command(action)
 
-            next_index = len(self._state.all_command_ids)
-            self._state.all_command_ids.append(action.command_id)
-            self._state.commands_by_id[queued_command.id] = CommandEntry(
-                index=next_index,
-                command=queued_command,
-            )
-
-            if action.request.intent == CommandIntent.SETUP:
-                self._state.queued_setup_command_ids.add(queued_command.id)
-            else:
-                self._state.queued_command_ids.add(queued_command.id)
-
-            if action.request_hash is not None:
-                self._state.latest_command_hash = action.request_hash
+        elif isinstance(action, QueueCommandsAction):
+            for queue_action in action.actions:
+                self._queue_command(queue_action)
 
         # TODO(mc, 2021-12-28): replace "UpdateCommandAction" with explicit
         # state change actions (e.g. RunCommandAction, SucceedCommandAction)
@@ -241,6 +258,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
                     command=command,
                 )
 
+            self._state.command_update_ids.append(command.id)
+            self._update_completed_command_ids(command.id)
             self._state.queued_command_ids.discard(command.id)
             self._state.queued_setup_command_ids.discard(command.id)
 
@@ -271,6 +290,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
                     }
                 ),
             )
+            self._state.command_update_ids.append(action.command_id)
+            self._update_completed_command_ids(action.command_id)
 
             if prev_entry.command.intent == CommandIntent.SETUP:
                 other_command_ids_to_fail = [
@@ -295,6 +316,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
                         }
                     ),
                 )
+                self._state.command_update_ids.append(command_id)
+                self._update_completed_command_ids(command_id)
 
             if self._state.running_command_id == action.command_id:
                 self._state.running_command_id = None
@@ -358,6 +381,59 @@ class CommandStore(HasState[CommandState], HandlesActions):
                 elif action.door_state == DoorState.CLOSED:
                     self._state.is_door_blocking = False
 
+    def _queue_command(self, action: QueueCommandAction) -> None:
+        """Add a command request to the end of the queue."""
+        assert action.command_id not in self._state.commands_by_id
+
+        # TODO(mc, 2021-06-22): mypy has trouble with this automatic
+        # request > command mapping, figure out how to type precisely
+        # (or wait for a future mypy version that can figure it out).
+        # For now, unit tests cover mapping every request type
+        queued_command = action.request._CommandCls.construct(
+            id=action.command_id,
+            key=(
+                action.request.key
+                if action.request.key is not None
+                else (action.request_hash or action.command_id)
+            ),
+            createdAt=action.created_at,
+            params=action.request.params,  # type: ignore[arg-type]
+            intent=action.request.intent,
+            status=CommandStatus.QUEUED,
+        )
+
+        next_index = len(self._state.all_command_ids)
+        self._state.all_command_ids.append(action.command_id)
+        self._state.commands_by_id[queued_command.id] = CommandEntry(
+            index=next_index,
+            command=queued_command,
+        )
+        self._state.command_update_ids.append(queued_command.id)
+
+        if action.request.intent == CommandIntent.SETUP:
+            self._state.queued_setup_command_ids.add(queued_command.id)
+        else:
+            self._state.queued_command_ids.add(queued_command.id)
+
+        if action.request_hash is not None:
+            self._state.latest_command_hash = action.request_hash
+
+    def _update_completed_command_ids(self, command_id: str) -> None:
+        """Update the completed command bookkeeping after a command changes."""
+        commands_by_id = self._state.commands_by_id
+        entry = commands_by_id[command_id]
+        command = entry.command
+
+        if command.status in (CommandStatus.SUCCEEDED, CommandStatus.FAILED):
+            latest_id = self._state.latest_completed_command_id
+            if latest_id is None or entry.index >= commands_by_id[latest_id].index:
+                self._state.latest_completed_command_id = command_id
+
+        if command.error is not None and command.intent != CommandIntent.SETUP:
+            failed_id = self._state.failed_protocol_command_id
+            if failed_id is None or entry.index < commands_by_id[failed_id].index:
+                self._state.failed_protocol_command_id = command_id
+
 
 class CommandView(HasState[CommandState]):
     """Read-only command state view."""
@@ -426,6 +502,37 @@ class CommandView(HasState[CommandState]):
             total_length=total_length,
         )
 
+    def get_update_cursor(self) -> int:
+        """Get the cursor that follows the most recent command update."""
+        return len(self._state.command_update_ids)
+
+    def get_updates_since(self, cursor: int) -> CommandUpdateSlice:
+        """Get all commands that have been added or changed since `cursor`.
+
+        Each command is returned once, in its latest state, ordered by
+        when it was first updated after the cursor.
+
+        Arguments:
+            cursor: A value previously returned by `get_update_cursor`
+                or in a `CommandUpdateSlice`. Use 0 to get every command.
+        """
+        update_ids = self._state.command_update_ids[max(0, cursor) :]
+        commands_by_id = self._state.commands_by_id
+
+        return CommandUpdateSlice(
+            commands=[commands_by_id[cid].command for cid in dict.fromkeys(update_ids)],
+            cursor=len(self._state.command_update_ids),
+        )
+
+    def get_has_changed_since(self, cursor: int, status: EngineStatus) -> bool:
+        """Get whether commands or the engine status have changed.
+
+        Arguments:
+            cursor: A command update cursor, as returned by `get_update_cursor`.
+            status: A previously observed engine status.
+        """
+        return self.get_update_cursor() > cursor or self.get_status() != status
+
     def get_all_errors(self) -> List[ErrorOccurrence]:
         """Get a list of all errors that have occurred."""
         return list(self._state.errors_by_id.values())
@@ -445,20 +552,28 @@ class CommandView(HasState[CommandState]):
                 index=entry.index,
             )
 
-        # TODO(mc, 2022-02-07): this is O(n) in the worst case for no good reason.
-        # Resolve prior to JSONv6 support, where this will matter.
-        for reverse_index, cid in enumerate(reversed(self._state.all_command_ids)):
-            if self.get_command_is_final(cid):
-                entry = self._state.commands_by_id[cid]
-                return CurrentCommand(
-                    command_id=entry.command.id,
-                    command_key=entry.command.key,
-                    created_at=entry.command.createdAt,
-                    index=len(self._state.all_command_ids) - reverse_index - 1,
-                )
+        # Once the run has stopped, any command that never ran is final as well,
+        # so the current command is the last command in the list
+        if self._state.run_result is not None and len(self._state.all_command_ids) > 0:
+            current_id: Optional[str] = self._state.all_command_ids[-1]
+        else:
+            current_id = self._state.latest_completed_command_id
+
+        if current_id is not None:
+            entry = self._state.commands_by_id[current_id]
+            return CurrentCommand(
+                command_id=entry.command.id,
+                command_key=entry.command.key,
+                created_at=entry.command.createdAt,
+                index=entry.index,
+            )
 
         return None
 
+    def get_running(self) -> Optional[str]:
+        """Get the ID of the command that's currently running, if any."""
+        return self._state.running_command_id
+
     def get_next_to_execute(self) -> Optional[str]:
         """Return the next command in line to be executed.
 
@@ -546,10 +661,11 @@ class CommandView(HasState[CommandState]):
         )
 
         if no_command_running and no_command_to_execute:
-            for command_id in self._state.all_command_ids:
-                command = self._state.commands_by_id[command_id].command
-                if command.error and command.intent != CommandIntent.SETUP:
-                    raise ProtocolCommandFailedError(command.error.detail)
+            failed_command_id = self._state.failed_protocol_command_id
+            if failed_command_id is not None:
+                error = self._state.commands_by_id[failed_command_id].command.error
+                assert error is not None, "Failed protocol command must have an error"
+                raise ProtocolCommandFailedError(error.detail)
             return True
         else:
             return False
@@ -564,8 +680,12 @@ class CommandView(HasState[CommandState]):
 
     def validate_action_allowed(
         self,
-        action: Union[PlayAction, PauseAction, StopAction, QueueCommandAction],
-    ) -> Union[PlayAction, PauseAction, StopAction, QueueCommandAction]:
+        action: Union[
+            PlayAction, PauseAction, StopAction, QueueCommandAction, QueueCommandsAction
+        ],
+    ) -> Union[
+        PlayAction, PauseAction, StopAction, QueueCommandAction, QueueCommandsAction
+    ]:
         """Validate whether a given control action is allowed.
 
         Returns:
@@ -589,11 +709,13 @@ class CommandView(HasState[CommandState]):
             if not self.get_is_running():
                 raise PauseNotAllowedError("Cannot pause a run that is not running.")
 
-        elif (
-            isinstance(action, QueueCommandAction)
-            and action.request.intent == CommandIntent.SETUP
-        ):
-            if self._state.queue_status != QueueStatus.SETUP:
+        elif isinstance(action, (QueueCommandAction, QueueCommandsAction)):
+            queue_actions = (
+                action.actions if isinstance(action, QueueCommandsAction) else (action,)
+            )
+            if self._state.queue_status != QueueStatus.SETUP and any(
+                a.request.intent == CommandIntent.SETUP for a in queue_actions
+            ):
                 raise SetupCommandNotAllowedError(
                     "Setup commands are not allowed after run has started."
                 )
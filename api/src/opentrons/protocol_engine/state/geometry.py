@@ -1,5 +1,5 @@
 """Geometry state getters."""
-from typing import Optional, List, Set, Tuple, Union
+from typing import Dict, Optional, List, Set, Tuple, Union
 
 from opentrons.types import Point, DeckSlotName
 
@@ -43,6 +43,11 @@ class GeometryView:
         self._modules = module_view
         self._pipettes = pipette_view
 
+        # Calibrated labware origins, by labware ID, valid while the labware
+        # and module geometry versions are unchanged.
+        self._labware_position_cache: Dict[str, Point] = {}
+        self._labware_position_cache_version: Optional[Tuple[int, int]] = None
+
     def get_labware_highest_z(self, labware_id: str) -> float:
         """Get the highest Z-point of a labware."""
         labware_data = self._labware.get(labware_id)
@@ -147,15 +152,30 @@ class GeometryView:
         )
 
     def get_labware_position(self, labware_id: str) -> Point:
-        """Get the calibrated origin of the labware."""
-        origin_pos = self.get_labware_origin_position(labware_id)
-        cal_offset = self._labware.get_labware_offset_vector(labware_id)
+        """Get the calibrated origin of the labware.
 
-        return Point(
-            x=origin_pos.x + cal_offset.x,
-            y=origin_pos.y + cal_offset.y,
-            z=origin_pos.z + cal_offset.z,
+        The result is cached until a labware is loaded or moved,
+        or a labware offset or module calibration is added.
+        """
+        version = (
+            self._labware.get_geometry_version(),
+            self._modules.get_calibration_version(),
         )
+        if version != self._labware_position_cache_version:
+            self._labware_position_cache.clear()
+            self._labware_position_cache_version = version
+
+        labware_pos = self._labware_position_cache.get(labware_id)
+        if labware_pos is None:
+            origin_pos = self.get_labware_origin_position(labware_id)
+            cal_offset = self._labware.get_labware_offset_vector(labware_id)
+            labware_pos = self._labware_position_cache[labware_id] = Point(
+                x=origin_pos.x + cal_offset.x,
+                y=origin_pos.y + cal_offset.y,
+                z=origin_pos.z + cal_offset.z,
+            )
+
+        return labware_pos
 
     def get_well_position(
         self,
@@ -1,7 +1,7 @@
 """Basic labware data state and store."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
     Any,
     Dict,
@@ -86,11 +86,20 @@ class LabwareState:
     definitions_by_uri: Dict[str, LabwareDefinition]
     deck_definition: DeckDefinitionV3
 
+    # Incremented whenever labware is loaded or moved, or an offset or definition
+    # is added, so derived geometry can be cached until any of those change.
+    geometry_version: int = field(default=0, compare=False)
+
 
 class LabwareStore(HasState[LabwareState], HandlesActions):
     """Labware state container."""
 
     _state: LabwareState
+    handled_action_types = (
+        UpdateCommandAction,
+        AddLabwareOffsetAction,
+        AddLabwareDefinitionAction,
+    )
 
     def __init__(
         self,
@@ -150,6 +159,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 version=action.definition.version,
             )
             self._state.definitions_by_uri[uri] = action.definition
+            self._state.geometry_version += 1
 
     def _handle_command(self, command: Command) -> None:
         """Modify state in reaction to a command."""
@@ -175,6 +185,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             )
 
             self._state.definitions_by_uri[definition_uri] = command.result.definition
+            self._state.geometry_version += 1
 
         elif isinstance(command.result, MoveLabwareResult):
             labware_id = command.params.labwareId
@@ -183,6 +194,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
 
             self._state.labware_by_id[labware_id].offsetId = new_offset_id
             self._state.labware_by_id[labware_id].location = new_location
+            self._state.geometry_version += 1
 
     def _add_labware_offset(self, labware_offset: LabwareOffset) -> None:
         """Add a new labware offset to state.
@@ -194,6 +206,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
         assert labware_offset.id not in self._state.labware_offsets_by_id
 
         self._state.labware_offsets_by_id[labware_offset.id] = labware_offset
+        self._state.geometry_version += 1
 
 
 class LabwareView(HasState[LabwareState]):
@@ -218,6 +231,10 @@ class LabwareView(HasState[LabwareState]):
                 f"Labware {labware_id} not found."
             ) from e
 
+    def get_geometry_version(self) -> int:
+        """Get a counter that changes whenever labware positions may have changed."""
+        return self._state.geometry_version
+
     def get_id_by_module(self, module_id: str) -> str:
         """Return the ID of the labware loaded on the given module."""
         for labware_id, labware in self.state.labware_by_id.items():
@@ -19,6 +19,7 @@ class LiquidStore(HasState[LiquidState], HandlesActions):
     """Liquid state container."""
 
     _state: LiquidState
+    handled_action_types = (AddLiquidAction,)
 
     def __init__(self) -> None:
         """Initialize a liquid store and its state."""
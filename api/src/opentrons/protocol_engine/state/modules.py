@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
     Dict,
     List,
@@ -137,11 +137,15 @@ class ModuleState:
     module_offset_by_serial: Dict[str, ModuleOffsetVector]
     """Information about each modules offsets."""
 
+    calibration_version: int = field(default=0, compare=False)
+    """Incremented whenever a module is added or its calibration offset changes."""
+
 
 class ModuleStore(HasState[ModuleState], HandlesActions):
     """Module state container."""
 
     _state: ModuleState
+    handled_action_types = (UpdateCommandAction, AddModuleAction)
 
     def __init__(
         self, module_calibration_offsets: Optional[Dict[str, ModuleOffsetVector]] = None
@@ -240,6 +244,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             serial_number=serial_number,
             definition=definition,
         )
+        self._state.calibration_version += 1
 
         if ModuleModel.is_magnetic_module_model(actual_model):
             self._state.substate_by_module_id[module_id] = MagneticModuleSubState(
@@ -288,6 +293,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 module_serial is not None
             ), "Expected a module SN and got None instead."
             self._state.module_offset_by_serial[module_serial] = module_offset
+            self._state.calibration_version += 1
 
     def _handle_heater_shaker_commands(
         self,
@@ -636,6 +642,10 @@ class ModuleView(HasState[ModuleState]):
         """Get the specified module's dimensions."""
         return self.get_definition(module_id).dimensions
 
+    def get_calibration_version(self) -> int:
+        """Get a counter that changes whenever module positions may have changed."""
+        return self._state.calibration_version
+
     def get_module_calibration_offset(self, module_id: str) -> ModuleOffsetVector:
         """Get the stored module calibration offset."""
         module_serial = self.get(module_id).serialNumber
@@ -93,6 +93,11 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
     """Pipette state container."""
 
     _state: PipetteState
+    handled_action_types = (
+        UpdateCommandAction,
+        SetPipetteMovementSpeedAction,
+        AddPipetteConfigAction,
+    )
 
     def __init__(self) -> None:
         """Initialize a PipetteStore and its state."""
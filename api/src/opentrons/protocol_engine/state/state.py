@@ -1,10 +1,23 @@
 """Protocol engine state management."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from enum import Enum
 from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from opentrons.protocol_engine.types import ModuleOffsetVector
+from opentrons.util.command_timing import TimingPhase, get_command_timing
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
 
@@ -26,6 +39,20 @@ from .state_summary import StateSummary
 ReturnT = TypeVar("ReturnT")
 
 
+class StateSlice(str, Enum):
+    """A part of the engine's state, managed by a single substore.
+
+    Values match the field names of `State`.
+    """
+
+    COMMANDS = "commands"
+    LABWARE = "labware"
+    PIPETTES = "pipettes"
+    MODULES = "modules"
+    LIQUIDS = "liquids"
+    TIPS = "tips"
+
+
 @dataclass(frozen=True)
 class State:
     """Underlying engine state."""
@@ -154,14 +181,17 @@ class StateStore(StateView, ActionHandler):
         self._liquid_store = LiquidStore()
         self._tip_store = TipStore()
 
-        self._substores: List[HandlesActions] = [
-            self._command_store,
-            self._pipette_store,
-            self._labware_store,
-            self._module_store,
-            self._liquid_store,
-            self._tip_store,
-        ]
+        self._substores: Dict[StateSlice, HandlesActions] = {
+            StateSlice.COMMANDS: self._command_store,
+            StateSlice.PIPETTES: self._pipette_store,
+            StateSlice.LABWARE: self._labware_store,
+            StateSlice.MODULES: self._module_store,
+            StateSlice.LIQUIDS: self._liquid_store,
+            StateSlice.TIPS: self._tip_store,
+        }
+        self._substores_by_action_type: Dict[
+            Type[Action], List[Tuple[StateSlice, HandlesActions]]
+        ] = {}
         self._config = config
         self._change_notifier = change_notifier or ChangeNotifier()
         self._initialize_state()
@@ -171,17 +201,23 @@ class StateStore(StateView, ActionHandler):
 
         Arguments:
             action: An action object representing a state change. Will be
-                passed to all substores so they can react accordingly.
+                passed to every substore that handles its type so they can
+                react accordingly.
         """
-        for substore in self._substores:
-            substore.handle_action(action)
+        substores = self._get_substores_for_action(action)
+
+        with get_command_timing().span(TimingPhase.STATE_UPDATE, type(action).__name__):
+            for _, substore in substores:
+                substore.handle_action(action)
 
-        self._update_state_views()
+            if substores:
+                self._update_state_views([state_slice for state_slice, _ in substores])
 
     async def wait_for(
         self,
         condition: Callable[..., Optional[ReturnT]],
         *args: Any,
+        slices: Optional[Collection[StateSlice]] = None,
         **kwargs: Any,
     ) -> ReturnT:
         """Wait for a condition to become true, checking whenever state changes.
@@ -220,6 +256,9 @@ class StateStore(StateView, ActionHandler):
             condition: A function that returns a truthy value when the `await`
                 should resolve.
             *args: Positional arguments to pass to `condition`.
+            slices: The parts of state that `condition` depends on. If given,
+                `condition` will only be re-checked when one of them changes.
+                If omitted, it will be re-checked on every change.
             **kwargs: Named arguments to pass to `condition`.
 
         Returns:
@@ -232,11 +271,32 @@ class StateStore(StateView, ActionHandler):
         is_done = predicate()
 
         while not is_done:
-            await self._change_notifier.wait()
+            if slices is None:
+                await self._change_notifier.wait()
+            else:
+                await self._change_notifier.wait(topics=slices)
             is_done = predicate()
 
         return is_done
 
+    def _get_substores_for_action(
+        self, action: Action
+    ) -> List[Tuple[StateSlice, HandlesActions]]:
+        """Get the substores that handle an action, indexed by action type."""
+        action_type = type(action)
+        substores = self._substores_by_action_type.get(action_type)
+
+        if substores is None:
+            substores = [
+                (state_slice, substore)
+                for state_slice, substore in self._substores.items()
+                if substore.handled_action_types is None
+                or issubclass(action_type, substore.handled_action_types)
+            ]
+            self._substores_by_action_type[action_type] = substores
+
+        return substores
+
     def _get_next_state(self) -> State:
         """Get a new instance of the state value object."""
         return State(
@@ -275,14 +335,27 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
         )
 
-    def _update_state_views(self) -> None:
-        """Update state view interfaces to use latest underlying values."""
-        next_state = self._get_next_state()
-        self._state = next_state
-        self._commands._state = next_state.commands
-        self._labware._state = next_state.labware
-        self._pipettes._state = next_state.pipettes
-        self._modules._state = next_state.modules
-        self._liquid._state = next_state.liquids
-        self._tips._state = next_state.tips
-        self._change_notifier.notify()
+    def _update_state_views(self, changed_slices: List[StateSlice]) -> None:
+        """Update state view interfaces to use latest underlying values.
+
+        Arguments:
+            changed_slices: The parts of state that may have changed.
+                Only their views are updated and their waiters notified.
+        """
+        changes: Dict[str, Any] = {}
+
+        if StateSlice.COMMANDS in changed_slices:
+            self._commands._state = changes["commands"] = self._command_store.state
+        if StateSlice.LABWARE in changed_slices:
+            self._labware._state = changes["labware"] = self._labware_store.state
+        if StateSlice.PIPETTES in changed_slices:
+            self._pipettes._state = changes["pipettes"] = self._pipette_store.state
+        if StateSlice.MODULES in changed_slices:
+            self._modules._state = changes["modules"] = self._module_store.state
+        if StateSlice.LIQUIDS in changed_slices:
+            self._liquid._state = changes["liquids"] = self._liquid_store.state
+        if StateSlice.TIPS in changed_slices:
+            self._tips._state = changes["tips"] = self._tip_store.state
+
+        self._state = replace(self._state, **changes)
+        self._change_notifier.notify(topics=changed_slices)
@@ -1,6 +1,5 @@
 """Tip state tracking."""
 from dataclasses import dataclass
-from enum import Enum
 from typing import Dict, Optional, List
 
 from .abstract_store import HasState, HandlesActions
@@ -19,22 +18,96 @@ from ..commands import (
 )
 
 
-class TipRackWellState(Enum):
-    """The state of a single tip in a tip rack's well."""
+@dataclass
+class TipRackState:
+    """Which tips in a tip rack have been used.
+
+    Wells are numbered in the order of the tip rack definition's ``ordering``,
+    column by column. Used tips, and columns with any used tip, are tracked as
+    bitmaps over those numbers, so finding the next clean tip or column takes
+    a few integer operations rather than a scan of the rack's wells.
+    """
+
+    well_names: List[str]
+    well_indices: Dict[str, int]
+    column_by_well: List[int]
+    column_starts: List[int]
+    column_size: int
+    used_wells: int = 0
+    used_columns: int = 0
+
+    @classmethod
+    def from_ordering(cls, ordering: List[List[str]]) -> "TipRackState":
+        """Create the state of a clean tip rack from its definition's ordering."""
+        well_names = [well_name for column in ordering for well_name in column]
+        column_by_well = [
+            column_index for column_index, column in enumerate(ordering) for _ in column
+        ]
+        column_starts = []
+        next_start = 0
+        for column in ordering:
+            column_starts.append(next_start)
+            next_start += len(column)
+
+        return cls(
+            well_names=well_names,
+            well_indices={name: index for index, name in enumerate(well_names)},
+            column_by_well=column_by_well,
+            column_starts=column_starts,
+            column_size=len(ordering[0]) if ordering else 0,
+        )
+
+    def is_used(self, well_index: int) -> bool:
+        """Get whether the tip in a well has been used."""
+        return bool(self.used_wells >> well_index & 1)
+
+    def use_well(self, well_index: int) -> None:
+        """Mark the tip in a well as used."""
+        self.used_wells |= 1 << well_index
+        self.used_columns |= 1 << self.column_by_well[well_index]
+
+    def use_column(self, column_index: int) -> None:
+        """Mark every tip in a column as used."""
+        start = self.column_starts[column_index]
+        end = (
+            self.column_starts[column_index + 1]
+            if column_index + 1 < len(self.column_starts)
+            else len(self.well_names)
+        )
+        self.used_wells |= ((1 << (end - start)) - 1) << start
+        self.used_columns |= 1 << column_index
+
+    def use_all(self) -> None:
+        """Mark every tip in the rack as used."""
+        self.used_wells = (1 << len(self.well_names)) - 1
+        self.used_columns = (1 << len(self.column_starts)) - 1
 
-    CLEAN = "clean"
-    USED = "used"
+    def reset(self) -> None:
+        """Mark every tip in the rack as clean."""
+        self.used_wells = 0
+        self.used_columns = 0
 
+    def find_clean_well(self) -> Optional[int]:
+        """Get the first well with a clean tip, if any."""
+        return _lowest_clear_bit(self.used_wells, len(self.well_names), start=0)
 
-TipRackStateByWellName = Dict[str, TipRackWellState]
+    def find_clean_column(self, start: int) -> Optional[int]:
+        """Get the first column at or after `start` with all clean tips, if any."""
+        return _lowest_clear_bit(self.used_columns, len(self.column_starts), start)
+
+
+def _lowest_clear_bit(bitmap: int, size: int, start: int) -> Optional[int]:
+    candidates = ~bitmap & ((1 << size) - 1) & ~((1 << start) - 1)
+    if not candidates:
+        return None
+    return (candidates & -candidates).bit_length() - 1
 
 
 @dataclass
 class TipState:
     """State of all tips."""
 
-    tips_by_labware_id: Dict[str, TipRackStateByWellName]
-    column_by_labware_id: Dict[str, List[List[str]]]
+    tips_by_labware_id: Dict[str, TipRackState]
     channels_by_pipette_id: Dict[str, int]
     length_by_pipette_id: Dict[str, float]
 
@@ -43,12 +116,16 @@ class TipStore(HasState[TipState], HandlesActions):
     """Tip state container."""
 
     _state: TipState
+    handled_action_types = (
+        UpdateCommandAction,
+        ResetTipsAction,
+        AddPipetteConfigAction,
+    )
 
     def __init__(self) -> None:
         """Initialize a liquid store and its state."""
         self._state = TipState(
             tips_by_labware_id={},
-            column_by_labware_id={},
             channels_by_pipette_id={},
             length_by_pipette_id={},
         )
@@ -59,12 +136,7 @@ class TipStore(HasState[TipState], HandlesActions):
             self._handle_command(action.command)
 
         elif isinstance(action, ResetTipsAction):
-            labware_id = action.labware_id
-
-            for well_name in self._state.tips_by_labware_id[labware_id].keys():
-                self._state.tips_by_labware_id[labware_id][
-                    well_name
-                ] = TipRackWellState.CLEAN
+            self._state.tips_by_labware_id[action.labware_id].reset()
 
         elif isinstance(action, AddPipetteConfigAction):
             config = action.config
@@ -77,14 +149,9 @@ class TipStore(HasState[TipState], HandlesActions):
         ):
             labware_id = command.result.labwareId
             definition = command.result.definition
-            self._state.tips_by_labware_id[labware_id] = {
-                well_name: TipRackWellState.CLEAN
-                for column in definition.ordering
-                for well_name in column
-            }
-            self._state.column_by_labware_id[labware_id] = [
-                column for column in definition.ordering
-            ]
+            self._state.tips_by_labware_id[labware_id] = TipRackState.from_ordering(
+                definition.ordering
+            )
 
         elif isinstance(command.result, PickUpTipResult):
             labware_id = command.params.labwareId
@@ -103,22 +170,23 @@ class TipStore(HasState[TipState], HandlesActions):
 
     def _set_used_tips(self, pipette_id: str, well_name: str, labware_id: str) -> None:
         pipette_channels = self._state.channels_by_pipette_id.get(pipette_id)
-        columns = self._state.column_by_labware_id.get(labware_id, [])
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
+        tip_rack = self._state.tips_by_labware_id.get(labware_id)
+        well_index = tip_rack.well_indices.get(well_name) if tip_rack else None
+
+        if tip_rack is None:
+            return
+
+        elif pipette_channels == len(tip_rack.well_names):
+            tip_rack.use_all()
 
-        if pipette_channels == len(wells):
-            for well_name in wells.keys():
-                wells[well_name] = TipRackWellState.USED
+        elif well_index is None:
+            return
 
-        elif columns and pipette_channels == len(columns[0]):
-            for column in columns:
-                if well_name in column:
-                    for well in column:
-                        wells[well] = TipRackWellState.USED
-                    break
+        elif tip_rack.column_size and pipette_channels == tip_rack.column_size:
+            tip_rack.use_column(tip_rack.column_by_well[well_index])
 
         else:
-            wells[well_name] = TipRackWellState.USED
+            tip_rack.use_well(well_index)
 
 
 class TipView(HasState[TipState]):
@@ -138,44 +206,45 @@ class TipView(HasState[TipState]):
         self, labware_id: str, num_tips: int, starting_tip_name: Optional[str]
     ) -> Optional[str]:
         """Get the next available clean tip."""
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
-        columns = self._state.column_by_labware_id.get(labware_id, [])
+        tip_rack = self._state.tips_by_labware_id.get(labware_id)
+
+        if tip_rack is None or not tip_rack.well_names:
+            return None
 
-        if columns and num_tips == len(columns[0]):
-            column_head = [column[0] for column in columns]
+        if tip_rack.column_size and num_tips == tip_rack.column_size:
             starting_column_index = 0
+            starting_well_index = (
+                tip_rack.well_indices.get(starting_tip_name)
+                if starting_tip_name
+                else None
+            )
 
-            if starting_tip_name:
-                for idx, column in enumerate(columns):
-                    if starting_tip_name in column:
-                        if starting_tip_name not in column_head:
-                            starting_column_index = idx + 1
-                        else:
-                            starting_column_index = idx
+            if starting_well_index is not None:
+                starting_column_index = tip_rack.column_by_well[starting_well_index]
+                column_start = tip_rack.column_starts[starting_column_index]
+                if starting_well_index != column_start:
+                    starting_column_index += 1
 
-            for column in columns[starting_column_index:]:
-                if not any(wells[well] == TipRackWellState.USED for well in column):
-                    return column[0]
+            column_index = tip_rack.find_clean_column(start=starting_column_index)
+            if column_index is not None:
+                return tip_rack.well_names[tip_rack.column_starts[column_index]]
 
-        elif num_tips == len(wells.keys()):
-            if starting_tip_name and starting_tip_name != columns[0][0]:
+        elif num_tips == len(tip_rack.well_names):
+            if starting_tip_name and starting_tip_name != tip_rack.well_names[0]:
                 return None
 
-            if not any(
-                tip_state == TipRackWellState.USED for tip_state in wells.values()
-            ):
-                return next(iter(wells))
+            if not tip_rack.used_wells:
+                return tip_rack.well_names[0]
 
         else:
-            for well_name, tip_state in wells.items():
-                seen_start = (
-                    starting_tip_name is None
-                    or well_name == starting_tip_name
-                    or wells[starting_tip_name] == TipRackWellState.USED
-                )
+            if starting_tip_name is not None:
+                starting_well_index = tip_rack.well_indices[starting_tip_name]
+                if not tip_rack.is_used(starting_well_index):
+                    return starting_tip_name
 
-                if seen_start and tip_state == TipRackWellState.CLEAN:
-                    return well_name
+            well_index = tip_rack.find_clean_well()
+            if well_index is not None:
+                return tip_rack.well_names[well_index]
 
         return None
 
@@ -195,9 +264,13 @@ class TipView(HasState[TipState]):
             otherwise False.
         """
         tip_rack = self._state.tips_by_labware_id.get(labware_id)
-        well_state = tip_rack.get(well_name) if tip_rack else None
+        well_index = tip_rack.well_indices.get(well_name) if tip_rack else None
 
-        return well_state == TipRackWellState.CLEAN
+        return (
+            tip_rack is not None
+            and well_index is not None
+            and not tip_rack.is_used(well_index)
+        )
 
     def get_tip_length(self, pipette_id: str) -> float:
         """Return the given pipette's tip length."""
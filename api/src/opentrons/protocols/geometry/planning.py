@@ -6,6 +6,7 @@ from typing import List, Optional, Tuple
 from opentrons import types
 from opentrons.hardware_control.types import CriticalPoint
 from opentrons.hardware_control.util import plan_arc
+from opentrons.util.command_timing import TimingPhase, timed
 
 from opentrons.motion_planning import (
     DEFAULT_GENERAL_ARC_Z_MARGIN,
@@ -201,6 +202,7 @@ def _build_safe_height(
     )
 
 
+@timed(TimingPhase.MOTION_PLANNING)
 def plan_moves(
     from_loc: types.Location,
     to_loc: types.Location,
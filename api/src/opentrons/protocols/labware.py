@@ -7,10 +7,10 @@ import os
 from pathlib import Path
 from typing import Any, AnyStr, List, Dict, Optional, Union
 
-import jsonschema  # type: ignore
-
+from opentrons.protocols import schema_validation
+from opentrons.protocols.labware_catalog import get_standard_catalog
 from opentrons.protocols.api_support.util import ModifiedList
-from opentrons_shared_data import load_shared_data, get_shared_data_root
+from opentrons_shared_data import get_shared_data_root
 from opentrons.protocols.api_support.constants import (
     OPENTRONS_NAMESPACE,
     CUSTOM_NAMESPACE,
@@ -77,7 +77,7 @@ def get_all_labware_definitions() -> List[str]:
                     labware_list.append(sub_dir.name)
 
     # check for standard labware
-    _check_for_subdirectories(get_shared_data_root() / STANDARD_DEFS_PATH)
+    labware_list.extend(get_standard_catalog().load_names())
 
     # check for custom labware
     for namespace in os.scandir(USER_DEFS_PATH):
@@ -140,14 +140,12 @@ def verify_definition(
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
-    schema_body = load_shared_data("labware/schemas/2.json").decode("utf-8")
-    labware_schema_v2 = json.loads(schema_body)
-
     if isinstance(contents, dict):
         to_return = contents
+        schema_validation.validate_labware_definition(to_return)
     else:
         to_return = json.loads(contents)
-    jsonschema.validate(to_return, labware_schema_v2)
+        schema_validation.validate_labware_definition(to_return, contents)
     # we can type ignore this because if it passes the jsonschema it has
     # the correct structure
     return to_return  # type: ignore
@@ -234,17 +232,25 @@ def _get_standard_labware_definition(
         )
 
     namespace = namespace.lower()
-    def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
     try:
-        with open(def_path, "rb") as f:
-            labware_def = json.loads(f.read().decode("utf-8"))
+        return _read_labware_definition(load_name, namespace, checked_version)
     except FileNotFoundError:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
             f'in namespace "{namespace}".'
         )
 
+
+def _read_labware_definition(
+    load_name: str, namespace: str, version: int
+) -> LabwareDefinition:
+    if namespace == OPENTRONS_NAMESPACE:
+        return get_standard_catalog().get_definition(load_name, version)
+
+    def_path = _get_path_to_labware(load_name, namespace, version)
+    with open(def_path, "rb") as f:
+        labware_def: LabwareDefinition = json.loads(f.read().decode("utf-8"))
     return labware_def
 
 
@@ -0,0 +1,255 @@
+"""
+opentrons.protocols.labware_catalog: an index of the standard labware definitions
+
+The catalog maps each standard labware load name to its versions and where
+to find each one, so looking up a definition takes no filesystem probing.
+Definitions are parsed on first use and kept in a small in-memory LRU.
+
+The catalog is normally built by listing the shared-data definitions
+directory once per process. If a packed bundle of the definitions exists at
+the ``labware_standard_definitions_bundle`` config path, and it was packed
+from the installed version of shared-data, the catalog reads from that
+instead: a single memory-mapped file with its index up front.
+
+To write a bundle, run ``python -m opentrons.protocols.labware_catalog``.
+"""
+import functools
+import hashlib
+import json
+import logging
+import marshal
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from opentrons_shared_data import __version__ as shared_data_version
+from opentrons_shared_data import get_shared_data_root
+from opentrons_shared_data.labware.dev_types import LabwareDefinition
+
+from opentrons.config import CONFIG
+from opentrons.protocols.api_support.constants import STANDARD_DEFS_PATH
+
+MODULE_LOG = logging.getLogger(__name__)
+
+# How many parsed definitions to keep in memory. A few MB at most.
+DEFINITION_CACHE_SIZE = 256
+
+_BUNDLE_MAGIC = b"OTLWBNDL"
+# Magic, then the length of the JSON index that follows it.
+_BUNDLE_PREAMBLE = struct.Struct("<8sQ")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Where to find one version of a standard labware definition.
+
+    ``path`` is set for definitions read from the shared-data directory.
+    ``offset`` and ``length`` are set for definitions read from a bundle,
+    along with ``content_hash``, the sha256 of the definition's JSON.
+    """
+
+    load_name: str
+    version: int
+    path: Optional[Path] = None
+    offset: int = 0
+    length: int = 0
+    content_hash: Optional[str] = None
+
+
+class LabwareCatalog:
+    """An index of standard labware definitions, with an LRU of parsed ones."""
+
+    def __init__(
+        self,
+        entries: Dict[str, Dict[int, CatalogEntry]],
+        bundle: Optional[mmap.mmap] = None,
+        bundle_data_start: int = 0,
+    ) -> None:
+        self._entries = entries
+        self._bundle = bundle
+        self._bundle_data_start = bundle_data_start
+        # Definitions are kept in marshalled form, so each caller gets
+        # its own copy to mutate for much less than the cost of parsing.
+        self._parsed: "OrderedDict[Tuple[str, int], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_directory(cls, root: Path) -> "LabwareCatalog":
+        """Build a catalog by listing a directory with one subdirectory per load name."""
+        entries: Dict[str, Dict[int, CatalogEntry]] = {}
+        with os.scandir(root) as load_name_dirs:
+            for load_name_dir in load_name_dirs:
+                if not load_name_dir.is_dir():
+                    continue
+                versions = entries.setdefault(load_name_dir.name, {})
+                with os.scandir(load_name_dir.path) as definition_files:
+                    for definition_file in definition_files:
+                        stem, ext = os.path.splitext(definition_file.name)
+                        if ext == ".json" and stem.isdigit():
+                            versions[int(stem)] = CatalogEntry(
+                                load_name=load_name_dir.name,
+                                version=int(stem),
+                                path=Path(definition_file.path),
+                            )
+        return cls(entries)
+
+    @classmethod
+    def from_bundle(cls, bundle_path: Path) -> "LabwareCatalog":
+        """Open a catalog packed by `pack`.
+
+        :raises ValueError: If the file is not a bundle, or it was packed
+            from a different version of shared-data.
+        """
+        with open(bundle_path, "rb") as f:
+            bundle = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, index_length = _BUNDLE_PREAMBLE.unpack_from(bundle)
+        if magic != _BUNDLE_MAGIC:
+            raise ValueError(f"{bundle_path} is not a labware definitions bundle")
+        data_start = _BUNDLE_PREAMBLE.size + index_length
+        index = json.loads(bundle[_BUNDLE_PREAMBLE.size : data_start])
+        if index["sharedDataVersion"] != shared_data_version:
+            raise ValueError(
+                f"{bundle_path} was packed from shared-data"
+                f" {index['sharedDataVersion']}, not {shared_data_version}"
+            )
+
+        entries = {
+            load_name: {
+                int(version): CatalogEntry(
+                    load_name=load_name,
+                    version=int(version),
+                    offset=offset,
+                    length=length,
+                    content_hash=content_hash,
+                )
+                for version, (offset, length, content_hash) in versions.items()
+            }
+            for load_name, versions in index["definitions"].items()
+        }
+        return cls(entries, bundle=bundle, bundle_data_start=data_start)
+
+    def load_names(self) -> List[str]:
+        """Get the load names of every standard labware."""
+        return list(self._entries)
+
+    def versions(self, load_name: str) -> List[int]:
+        """Get the versions of a standard labware, or an empty list if none exist."""
+        return sorted(self._entries.get(load_name, {}))
+
+    def get_definition(self, load_name: str, version: int) -> LabwareDefinition:
+        """Get a copy of a standard labware definition.
+
+        :raises FileNotFoundError: If there is no such labware or version.
+        """
+        # Versions parsed from labware URIs may still be strings.
+        try:
+            version = int(version)
+        except ValueError:
+            raise FileNotFoundError(
+                f'Standard labware "{load_name}" has no version {version}.'
+            ) from None
+        key = (load_name, version)
+        with self._lock:
+            parsed = self._parsed.get(key)
+            if parsed is not None:
+                self._parsed.move_to_end(key)
+
+        if parsed is None:
+            definition = json.loads(self._read(load_name, version))
+            parsed = marshal.dumps(definition)
+            with self._lock:
+                self._parsed[key] = parsed
+                if len(self._parsed) > DEFINITION_CACHE_SIZE:
+                    self._parsed.popitem(last=False)
+            return definition
+
+        return marshal.loads(parsed)
+
+    def pack(self, bundle_path: Path) -> None:
+        """Write every definition in this catalog to a single bundle file."""
+        index: Dict[str, Dict[str, Tuple[int, int, str]]] = {}
+        contents: List[bytes] = []
+        offset = 0
+        for load_name, versions in self._entries.items():
+            index[load_name] = {}
+            for version in versions:
+                content = self._read(load_name, version)
+                index[load_name][str(version)] = (
+                    offset,
+                    len(content),
+                    hashlib.sha256(content).hexdigest(),
+                )
+                contents.append(content)
+                offset += len(content)
+
+        index_json = json.dumps(
+            {"sharedDataVersion": shared_data_version, "definitions": index}
+        ).encode("utf-8")
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = bundle_path.with_name(bundle_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_BUNDLE_PREAMBLE.pack(_BUNDLE_MAGIC, len(index_json)))
+            f.write(index_json)
+            for content in contents:
+                f.write(content)
+        os.replace(tmp_path, bundle_path)
+
+    def _read(self, load_name: str, version: int) -> bytes:
+        try:
+            entry = self._entries[load_name][version]
+        except KeyError:
+            raise FileNotFoundError(
+                f'Standard labware "{load_name}" has no version {version}.'
+            ) from None
+
+        if entry.path is not None:
+            return entry.path.read_bytes()
+
+        assert self._bundle is not None, "Bundle entry in a directory catalog"
+        start = self._bundle_data_start + entry.offset
+        content = self._bundle[start : start + entry.length]
+        if hashlib.sha256(content).hexdigest() != entry.content_hash:
+            raise ValueError(f'Bundled labware "{load_name}" v{version} is corrupt.')
+        return content
+
+
+def get_standard_definitions_dir() -> Path:
+    """Get the shared-data directory of standard labware definitions."""
+    return get_shared_data_root() / STANDARD_DEFS_PATH
+
+
+@functools.lru_cache(maxsize=None)
+def get_standard_catalog() -> LabwareCatalog:
+    """Get the catalog of standard labware definitions, built once per process."""
+    bundle_path = CONFIG["labware_standard_definitions_bundle"]
+    if bundle_path.is_file():
+        try:
+            return LabwareCatalog.from_bundle(bundle_path)
+        except (OSError, ValueError, KeyError, struct.error):
+            MODULE_LOG.warning(
+                f"Ignoring labware definitions bundle {bundle_path}", exc_info=True
+            )
+    return LabwareCatalog.from_directory(get_standard_definitions_dir())
+
+
+def pack_standard_definitions(bundle_path: Optional[Path] = None) -> Path:
+    """Pack the shared-data standard labware definitions into a bundle.
+
+    :param bundle_path: Where to write the bundle. Defaults to the
+        ``labware_standard_definitions_bundle`` config path, where
+        `get_standard_catalog` will find it.
+    :returns: The path the bundle was written to.
+    """
+    bundle_path = bundle_path or CONFIG["labware_standard_definitions_bundle"]
+    LabwareCatalog.from_directory(get_standard_definitions_dir()).pack(bundle_path)
+    return bundle_path
+
+
+if __name__ == "__main__":
+    print(f"Packed standard labware definitions to {pack_standard_definitions()}")
@@ -14,12 +14,7 @@ from typing import Any, Dict, Optional, Union, Tuple, TYPE_CHECKING
 
 import jsonschema  # type: ignore
 
-from opentrons_shared_data.labware import load_schema as load_labware_schema
-from opentrons_shared_data.protocol import (
-    Schema as JSONProtocolSchema,
-    load_schema as load_protocol_schema,
-)
-
+from . import schema_validation
 from .api_support.types import APIVersion
 from .types import (
     Protocol,
@@ -96,7 +91,7 @@ def version_from_string(vstr: str) -> APIVersion:
 def _parse_json(protocol_contents: str, filename: Optional[str] = None) -> JsonProtocol:
     """Parse a protocol known or at least suspected to be json"""
     protocol_json = json.loads(protocol_contents)
-    version, validated = validate_json(protocol_json)
+    version, validated = validate_json(protocol_json, raw_contents=protocol_contents)
     return JsonProtocol(
         text=protocol_contents,
         filename=filename,
@@ -431,8 +426,10 @@ def _get_protocol_schema_version(protocol_json: Dict[Any, Any]) -> int:
     )
 
 
-def _get_schema_for_protocol(version_num: int) -> JSONProtocolSchema:
-    """Retrieve the json schema for a protocol schema version"""
+def _validate_protocol_schema(
+    protocol_json: Dict[Any, Any], version_num: int, raw_contents: Optional[str]
+) -> None:
+    """Validate a protocol against the json schema for its schema version"""
     # TODO(IL, 2020/03/05): use $otSharedSchema, but maybe wait until
     # deprecating v1/v2 JSON protocols?
     if version_num > MAX_SUPPORTED_JSON_SCHEMA_VERSION:
@@ -441,22 +438,25 @@ def _get_schema_for_protocol(version_num: int) -> JSONProtocolSchema:
             + "supported in this version of the API"
         )
     try:
-        return load_protocol_schema(version=version_num)
+        schema_validation.validate_protocol(
+            protocol_json, version=version_num, raw_contents=raw_contents
+        )
     except FileNotFoundError:
         raise RuntimeError(
             'JSON Protocol schema "{}" does not exist'.format(version_num)
         ) from None
 
 
-def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"]:
-    """Validates a json protocol and returns its schema version"""
+def validate_json(
+    protocol_json: Dict[Any, Any], raw_contents: Optional[str] = None
+) -> Tuple[int, "JsonProtocolDef"]:
+    """Validates a json protocol and returns its schema version
+
+    If given, ``raw_contents`` (the text that ``protocol_json`` was parsed
+    from) is used to recognize protocols that have already been validated.
+    """
     # Check if this is actually a labware
-    labware_schema_v2 = load_labware_schema()
-    try:
-        jsonschema.validate(protocol_json, labware_schema_v2)
-    except jsonschema.ValidationError:
-        pass
-    else:
+    if schema_validation.get_labware_validator().is_valid(protocol_json):
         MODULE_LOG.error("labware uploaded instead of protocol")
         raise RuntimeError(
             "The file you are trying to open is a JSON labware definition, "
@@ -476,18 +476,10 @@ def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"
         )
     if version_num > MAX_SUPPORTED_JSON_SCHEMA_VERSION:
         raise JSONSchemaVersionTooNewError(attempted_schema_version=version_num)
-    protocol_schema = _get_schema_for_protocol(version_num)
-
-    # instruct schema how to resolve all $ref's used in protocol schemas
-    resolver = jsonschema.RefResolver(
-        protocol_schema.get("$id", ""),
-        protocol_schema,
-        store={"opentronsLabwareSchemaV2": labware_schema_v2},
-    )
 
     # do the validation
     try:
-        jsonschema.validate(protocol_json, protocol_schema, resolver=resolver)
+        _validate_protocol_schema(protocol_json, version_num, raw_contents)
     except jsonschema.ValidationError:
         MODULE_LOG.exception("JSON protocol validation failed")
         raise RuntimeError(
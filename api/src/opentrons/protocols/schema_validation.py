@@ -0,0 +1,110 @@
+"""
+opentrons.protocols.schema_validation: cached JSON schema validators
+
+Validators for the labware and JSON protocol schemas are built once per
+process, rather than on every validation. Content that has already passed
+validation is remembered by hash, so validating the same labware definition
+or protocol again (e.g. when a protocol is re-analyzed) is nearly free.
+"""
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Mapping, Optional, Tuple, Union
+
+import jsonschema  # type: ignore
+
+from opentrons_shared_data.labware import load_schema as load_labware_schema
+from opentrons_shared_data.protocol import load_schema as load_protocol_schema
+
+# How many validated contents to remember, across all schemas.
+_MAX_VALIDATED_CONTENTS = 1024
+
+_validated: "OrderedDict[Tuple[str, bytes], None]" = OrderedDict()
+_validated_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def get_labware_validator() -> Any:
+    """Get a validator for the labware definition schema, v2."""
+    schema = load_labware_schema()
+    return jsonschema.validators.validator_for(schema)(schema)
+
+
+@functools.lru_cache(maxsize=None)
+def get_protocol_validator(version: int) -> Any:
+    """Get a validator for a JSON protocol schema version.
+
+    :raises FileNotFoundError: If there is no schema for this version.
+    """
+    schema = load_protocol_schema(version=version)
+    # instruct schema how to resolve all $ref's used in protocol schemas
+    resolver = jsonschema.RefResolver(
+        schema.get("$id", ""),
+        schema,
+        store={"opentronsLabwareSchemaV2": get_labware_validator().schema},
+    )
+    return jsonschema.validators.validator_for(schema)(schema, resolver=resolver)
+
+
+def validate_labware_definition(
+    definition: Mapping[str, Any], raw_contents: Optional[Union[str, bytes]] = None
+) -> None:
+    """Validate a labware definition against the labware schema.
+
+    :param definition: The parsed definition.
+    :param raw_contents: The definition's serialized JSON, if available,
+        which is cheaper to hash than the parsed definition.
+    :raises jsonschema.ValidationError: If the definition is not valid.
+    """
+    _validate(get_labware_validator(), "labware/2", definition, raw_contents)
+
+
+def validate_protocol(
+    protocol: Mapping[str, Any],
+    version: int,
+    raw_contents: Optional[Union[str, bytes]] = None,
+) -> None:
+    """Validate a JSON protocol against its schema version.
+
+    :raises FileNotFoundError: If there is no schema for this version.
+    :raises jsonschema.ValidationError: If the protocol is not valid.
+    """
+    _validate(
+        get_protocol_validator(version), f"protocol/{version}", protocol, raw_contents
+    )
+
+
+def _validate(
+    validator: Any,
+    schema_key: str,
+    instance: Mapping[str, Any],
+    raw_contents: Optional[Union[str, bytes]],
+) -> None:
+    key = (schema_key, _content_hash(instance, raw_contents))
+
+    with _validated_lock:
+        if key in _validated:
+            _validated.move_to_end(key)
+            return
+
+    # same as `jsonschema.validate`, minus re-checking the schema itself
+    error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
+
+    with _validated_lock:
+        _validated[key] = None
+        if len(_validated) > _MAX_VALIDATED_CONTENTS:
+            _validated.popitem(last=False)
+
+
+def _content_hash(
+    instance: Mapping[str, Any], raw_contents: Optional[Union[str, bytes]]
+) -> bytes:
+    if raw_contents is None:
+        raw_contents = json.dumps(instance, sort_keys=True)
+    if isinstance(raw_contents, str):
+        raw_contents = raw_contents.encode("utf-8")
+    return hashlib.sha256(raw_contents).digest()
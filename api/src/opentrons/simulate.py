@@ -48,6 +48,7 @@ from opentrons.protocols.api_support.deck_type import (
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons_shared_data.labware.dev_types import LabwareDefinition
 
+from .util.command_timing import get_command_timing
 from .util.entrypoint_util import labware_from_paths, datafiles_from_paths
 
 
@@ -594,6 +595,17 @@ def get_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         " This is an experimental feature.",
     )
 
+    parser.add_argument(
+        "--timing-trace",
+        metavar="TRACE_FILE",
+        default=None,
+        help="Record how long each command spends queued, updating state, "
+        "calling the hardware, planning motion, and talking to the motor "
+        "controllers, and write it to TRACE_FILE as a Chrome trace. "
+        "Open it in chrome://tracing or https://ui.perfetto.dev. "
+        "This is an experimental feature.",
+    )
+
     parser.add_argument(
         "protocol",
         metavar="PROTOCOL",
@@ -656,6 +668,9 @@ def main() -> int:
     # TODO(mm, 2022-12-01): Configure the DurationEstimator with the correct deck type.
     duration_estimator = DurationEstimator() if args.estimate_duration else None  # type: ignore[no-untyped-call]
 
+    if args.timing_trace:
+        get_command_timing().enable(trace=True)
+
     runlog, maybe_bundle = simulate(
         args.protocol,
         args.protocol.name,
@@ -680,6 +695,9 @@ def main() -> int:
     if args.output == "runlog":
         print(format_runlog(runlog))
 
+    if args.timing_trace:
+        get_command_timing().write_chrome_trace(args.timing_trace)
+
     if duration_estimator:
         duration_seconds = duration_estimator.get_total_duration()
         hours = int(duration_seconds / 60 / 60)
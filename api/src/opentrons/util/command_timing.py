@@ -0,0 +1,323 @@
+"""
+opentrons.util.command_timing: opt-in timing of command execution
+
+When enabled, this records how long each command spends in each phase of
+its execution: waiting in the queue, updating protocol engine state, calling
+the hardware API, planning motion, and talking to the motor controllers.
+Durations are aggregated into a histogram per command type and phase, and
+can optionally be kept as a trace to view in ``chrome://tracing`` or
+https://ui.perfetto.dev.
+
+Recording is off by default. While it is off, every instrumentation point
+costs one attribute check.
+
+Phases nest: a hardware call's time includes the motion planning and
+driver I/O done inside it, and a command's time includes everything.
+A span inside another span of the same phase, like a timed hardware call
+made by another one, is not recorded, so each phase's time is counted once.
+The running command is tracked per thread and asyncio task, and follows
+calls handed to another event loop with ``run_coroutine_threadsafe``.
+"""
+import asyncio
+import functools
+import json
+import os
+import threading
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+# Upper bounds of the histogram buckets, in seconds, from 10 µs to about 84 s.
+# Durations past the last bound land in one more overflow bucket.
+HISTOGRAM_BUCKET_BOUNDS: Tuple[float, ...] = tuple(1e-5 * 2**i for i in range(24))
+
+# Trace events to keep before dropping new ones, about 100 MB at most.
+DEFAULT_MAX_TRACE_EVENTS = 500_000
+
+# The command type of time spent outside any command, like jogging.
+UNATTRIBUTED = "unattributed"
+
+FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+
+_NULL_CONTEXT: ContextManager[None] = nullcontext()
+
+
+class TimingPhase(str, Enum):
+    """A phase of command execution."""
+
+    COMMAND = "command"
+    QUEUE = "queue"
+    STATE_UPDATE = "stateUpdate"
+    HARDWARE = "hardware"
+    MOTION_PLANNING = "motionPlanning"
+    DRIVER_IO = "driverIO"
+
+
+@dataclass
+class TimingHistogram:
+    """A histogram of durations, in seconds, bucketed by `HISTOGRAM_BUCKET_BOUNDS`."""
+
+    bucket_counts: List[int] = field(
+        default_factory=lambda: [0] * (len(HISTOGRAM_BUCKET_BOUNDS) + 1)
+    )
+    count: int = 0
+    total: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """The mean duration, or 0 if nothing was recorded."""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, duration: float) -> None:
+        """Add a duration to the histogram."""
+        self.bucket_counts[_bucket_index(duration)] += 1
+        self.min = min(self.min, duration) if self.count else duration
+        self.max = max(self.max, duration)
+        self.count += 1
+        self.total += duration
+
+    def percentile(self, fraction: float) -> float:
+        """Estimate a percentile, like 0.9 for p90, by its bucket's upper bound."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index < len(HISTOGRAM_BUCKET_BOUNDS):
+                    return min(HISTOGRAM_BUCKET_BOUNDS[index], self.max)
+                break
+        return self.max
+
+    def copy(self) -> "TimingHistogram":
+        """Get a copy of this histogram."""
+        return TimingHistogram(
+            bucket_counts=list(self.bucket_counts),
+            count=self.count,
+            total=self.total,
+            min=self.min,
+            max=self.max,
+        )
+
+
+def _bucket_index(duration: float) -> int:
+    for index, bound in enumerate(HISTOGRAM_BUCKET_BOUNDS):
+        if duration <= bound:
+            return index
+    return len(HISTOGRAM_BUCKET_BOUNDS)
+
+
+class CommandTimingRecorder:
+    """Collect command execution timing from any thread."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._trace = False
+        self._max_trace_events = DEFAULT_MAX_TRACE_EVENTS
+        self._lock = threading.Lock()
+        # The types of the commands running in the current context, innermost last.
+        self._command_types: ContextVar[Tuple[str, ...]] = ContextVar(
+            "command_types", default=()
+        )
+        # The phases of the spans open in the current context.
+        self._open_phases: ContextVar[FrozenSet[TimingPhase]] = ContextVar(
+            "open_phases", default=frozenset()
+        )
+        self._histograms: Dict[Tuple[str, TimingPhase], TimingHistogram] = {}
+        self._trace_events: List[Dict[str, Any]] = []
+        self._dropped_trace_events = 0
+        self._time_origin = perf_counter()
+
+    @property
+    def current_command_type(self) -> str:
+        """The type of the innermost command running in this thread or task."""
+        command_types = self._command_types.get()
+        return command_types[-1] if command_types else UNATTRIBUTED
+
+    def enable(
+        self, trace: bool = False, max_trace_events: int = DEFAULT_MAX_TRACE_EVENTS
+    ) -> None:
+        """Start recording.
+
+        :param trace: Whether to keep every timed span, for `get_chrome_trace`,
+            on top of the histograms. Only meant for bounded runs like
+            simulations, since the trace grows with every command.
+        :param max_trace_events: How many spans to keep before dropping new ones.
+        """
+        self._trace = trace
+        self._max_trace_events = max_trace_events
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording, keeping anything already recorded."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._histograms.clear()
+            self._trace_events.clear()
+            self._dropped_trace_events = 0
+            self._time_origin = perf_counter()
+
+    def command(self, command_type: str) -> ContextManager[None]:
+        """Time a command, and attribute everything timed inside it to its type."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._command(command_type)
+
+    def span(self, phase: TimingPhase, name: str) -> ContextManager[None]:
+        """Time a phase of the current command."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._span(phase, name)
+
+    def record(
+        self,
+        phase: TimingPhase,
+        name: str,
+        start: float,
+        duration: float,
+        command_type: Optional[str] = None,
+    ) -> None:
+        """Record a span of time.
+
+        :param start: When the span started, from `time.perf_counter`.
+        :param duration: How long the span took, in seconds.
+        :param command_type: The command to attribute the span to.
+            Defaults to the current command.
+        """
+        command_type = command_type or self.current_command_type
+        with self._lock:
+            key = (command_type, phase)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = TimingHistogram()
+            histogram.add(duration)
+
+            if not self._trace:
+                return
+            if len(self._trace_events) >= self._max_trace_events:
+                self._dropped_trace_events += 1
+                return
+            self._trace_events.append(
+                {
+                    "name": name,
+                    "cat": phase.value,
+                    "ph": "X",
+                    "ts": (start - self._time_origin) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {"commandType": command_type},
+                }
+            )
+
+    def get_histograms(self) -> Dict[str, Dict[TimingPhase, TimingHistogram]]:
+        """Get a copy of the recorded histograms, by command type and phase."""
+        histograms: Dict[str, Dict[TimingPhase, TimingHistogram]] = {}
+        with self._lock:
+            for (command_type, phase), histogram in self._histograms.items():
+                histograms.setdefault(command_type, {})[phase] = histogram.copy()
+        return histograms
+
+    def get_chrome_trace(self) -> Dict[str, Any]:
+        """Get the recorded spans in the Chrome trace event format."""
+        with self._lock:
+            return {
+                "traceEvents": list(self._trace_events),
+                "displayTimeUnit": "ms",
+                "otherData": {"droppedEvents": self._dropped_trace_events},
+            }
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the recorded spans to a Chrome trace file."""
+        Path(path).write_text(json.dumps(self.get_chrome_trace()))
+
+    @contextmanager
+    def _command(self, command_type: str) -> Iterator[None]:
+        token = self._command_types.set(self._command_types.get() + (command_type,))
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(
+                TimingPhase.COMMAND,
+                command_type,
+                start,
+                perf_counter() - start,
+                command_type=command_type,
+            )
+            self._command_types.reset(token)
+
+    @contextmanager
+    def _span(self, phase: TimingPhase, name: str) -> Iterator[None]:
+        open_phases = self._open_phases.get()
+        if phase in open_phases:
+            # The outer span of this phase already covers this time.
+            yield
+            return
+
+        token = self._open_phases.set(open_phases | {phase})
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, name, start, perf_counter() - start)
+            self._open_phases.reset(token)
+
+
+_recorder = CommandTimingRecorder()
+
+
+def get_command_timing() -> CommandTimingRecorder:
+    """Get the process-wide command timing recorder."""
+    return _recorder
+
+
+def timed(phase: TimingPhase) -> Callable[[FuncT], FuncT]:
+    """Time every call of the decorated function or coroutine function as `phase`."""
+
+    def _decorator(func: FuncT) -> FuncT:
+        name = func.__qualname__
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def _async_decorated(*args: Any, **kwargs: Any) -> Any:
+                if not _recorder.enabled:
+                    return await func(*args, **kwargs)
+                with _recorder.span(phase, name):
+                    return await func(*args, **kwargs)
+
+            return cast(FuncT, _async_decorated)
+
+        @functools.wraps(func)
+        def _decorated(*args: Any, **kwargs: Any) -> Any:
+            if not _recorder.enabled:
+                return func(*args, **kwargs)
+            with _recorder.span(phase, name):
+                return func(*args, **kwargs)
+
+        return cast(FuncT, _decorated)
+
+    return _decorator
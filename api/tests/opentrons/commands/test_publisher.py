@@ -1,9 +1,10 @@
 """Tests for opentrons.commands.publisher."""
 from __future__ import annotations
 
+import logging
 import pytest
 from decoy import Decoy, matchers
-from typing import Any, Dict, cast
+from typing import Any, Dict, List, cast
 from opentrons.broker import Broker
 from opentrons.commands.types import Command as CommandDict, CommandMessage
 from opentrons.commands.publisher import CommandPublisher, publish, publish_context
@@ -11,8 +12,10 @@ from opentrons.commands.publisher import CommandPublisher, publish, publish_cont
 
 @pytest.fixture
 def broker(decoy: Decoy) -> Broker:
-    """Return a mocked out Broker."""
-    return decoy.mock(cls=Broker)
+    """Return a mocked out Broker with a subscriber."""
+    broker = decoy.mock(cls=Broker)
+    decoy.when(broker.has_subscribers("command")).then_return(True)
+    return broker
 
 
 def test_publish_decorator(decoy: Decoy, broker: Broker) -> None:
@@ -317,3 +320,60 @@ def test_publish_context_with_error(decoy: Decoy, broker: Broker) -> None:
     )
 
     assert before_message_id.value == after_message_id.value
+
+
+def test_publish_decorator_unobserved(decoy: Decoy) -> None:
+    """It should not create messages if nothing would see them."""
+    _act = decoy.mock()
+    _get_command_payload = decoy.mock()
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str) -> int:
+            _act(foo)
+            return 42
+
+    broker = Broker()
+    broker.set_logger(logging.getLogger("test_publish_decorator_unobserved"))
+    broker.logger.setLevel(logging.WARNING)
+    subject = _Subject(broker=broker)
+
+    assert subject.act("hello") == 42
+
+    decoy.verify(_act("hello"))
+    decoy.verify(_get_command_payload(), ignore_extra_args=True, times=0)
+
+
+def test_publish_context_unobserved() -> None:
+    """It should not publish if nothing would see the messages."""
+    command = cast(CommandDict, {"name": "some_command", "payload": {"foo": "bar"}})
+    messages: List[CommandMessage] = []
+    broker = Broker()
+    broker.set_logger(logging.getLogger("test_publish_context_unobserved"))
+    broker.logger.setLevel(logging.WARNING)
+
+    with publish_context(broker=broker, command=command):
+        pass
+
+    unsubscribe = broker.subscribe("command", messages.append)
+    with publish_context(broker=broker, command=command):
+        pass
+    unsubscribe()
+
+    assert [message["$"] for message in messages] == ["before", "after"]
+
+
+def test_publish_context_logs_lazily(caplog: pytest.LogCaptureFixture) -> None:
+    """It should log the payload of a command with no subscribers if logging is on."""
+    command = cast(
+        CommandDict,
+        {"name": "some_command", "payload": {"text": "hello", "foo": "bar"}},
+    )
+    broker = Broker()
+    broker.set_logger(logging.getLogger("test_publish_context_logs_lazily"))
+
+    with caplog.at_level(logging.INFO, logger=broker.logger.name):
+        with publish_context(broker=broker, command=command):
+            pass
+
+    assert caplog.messages == ["some_command: foo: bar"]
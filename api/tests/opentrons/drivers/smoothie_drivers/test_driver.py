@@ -464,3 +464,93 @@ async def test_auto_recover_on_error(
             await smoothie.move({"X": 10})
         mocked_send.assert_called_once()
         mocked_home.assert_called_once()
+
+
+async def test_streaming_moves(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should only wait for streamed moves when leaving the context."""
+    async with smoothie.streaming_moves():
+        await smoothie.move({"X": 10, "Y": 5})
+        await smoothie.move({"X": 20})
+        await smoothie.move({"Y": 30})
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X10 Y5",
+        # the currents are unchanged, so they aren't sent again
+        "G0 X20",
+        "G0 Y30",
+        "M400",
+    ]
+    assert smoothie.position["X"] == 20
+    assert smoothie.position["Y"] == 30
+
+
+async def test_streaming_moves_bounded(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should wait once it has queued the maximum number of moves."""
+    async with smoothie.streaming_moves(max_queued_moves=2):
+        for x in (10, 20, 30):
+            await smoothie.move({"X": x})
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X10",
+        "G0 X20",
+        "M400",
+        "G0 X30",
+        "M400",
+    ]
+
+
+async def test_streaming_moves_synchronizes(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should wait for streamed moves before current changes and other commands."""
+    async with smoothie.streaming_moves():
+        await smoothie.move({"X": 10})
+        # Z was dwelling, so the currents change
+        await smoothie.move({"Z": 20})
+        # plunger moves are never streamed
+        await smoothie.move({"B": 2})
+    cmds = [
+        c.kwargs["command"].build().strip()
+        for c in mock_connection.send_command.call_args_list
+    ]
+    assert cmds == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X10",
+        "M400",
+        # X is kept at its active current while streaming
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.8 G4 P0.005 G0 Z20",
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2.3 G0 B2",
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M400",
+    ]
+
+
+async def test_streaming_moves_error(
+    smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """It should forget streamed moves after an error, and not wait for them."""
+    with patch.object(smoothie, "_reset_from_error"), patch.object(smoothie, "home"):
+        mock_connection.send_command.side_effect = [
+            "ok",
+            AlarmResponse(port="", response="ALARM: Hard limit +X"),
+        ]
+        with pytest.raises(SmoothieError):
+            async with smoothie.streaming_moves():
+                await smoothie.move({"X": 10})
+                await smoothie.move({"X": 20})
+
+        cast(AsyncMock, smoothie.home).assert_called_once_with("X")
+
+    assert mock_connection.send_command.call_count == 2
+    assert smoothie._stream is None
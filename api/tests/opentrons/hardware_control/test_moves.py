@@ -165,6 +165,26 @@ async def test_move_extras_passed_through(hardware_api, monkeypatch):
     assert mock_be_move.call_args_list[0][1]["axis_max_speeds"] == {"Y": 20}
 
 
+async def test_move_through(hardware_api, monkeypatch):
+    mock_be_move = mock.AsyncMock()
+    monkeypatch.setattr(hardware_api._backend, "move", mock_be_move)
+    await hardware_api.home()
+    mock_be_move.reset_mock()
+    await hardware_api.move_through(
+        types.Mount.RIGHT,
+        [
+            (types.Point(30, 20, 100), None),
+            (types.Point(30, 20, 50), CriticalPoint.MOUNT),
+        ],
+        speed=30,
+    )
+    assert [c[0][0] for c in mock_be_move.call_args_list] == [
+        {"X": 30, "Y": 20, "A": 70},
+        {"X": 30, "Y": 20, "A": 20},
+    ]
+    assert all(c[1]["speed"] == 30 for c in mock_be_move.call_args_list)
+
+
 async def test_mount_offset_applied(hardware_api, is_robot):
     await hardware_api.home()
     abs_position = types.Point(30, 20, 10)
@@ -1194,6 +1194,65 @@ async def test_move_expect_stall_flag(
     assert condition == expected
 
 
+async def test_move_through(ot3_hardware: ThreadManager[OT3API]) -> None:
+    """It should plan each segment from the end of the last, and send them together."""
+    await ot3_hardware.home()
+    with patch.object(
+        ot3_hardware.managed_obj._backend,
+        "move_through",
+        AsyncMock(spec=ot3_hardware.managed_obj._backend.move_through),
+    ) as mock_move_through:
+        await ot3_hardware.move_through(
+            Mount.LEFT,
+            [
+                (Point(100, 100, 200), None),
+                (Point(100, 100, 200), None),
+                (Point(150, 200, 200), None),
+            ],
+        )
+
+    mock_move_through.assert_called_once()
+    segments = mock_move_through.call_args[0][0]
+    # the zero-length move is skipped
+    assert len(segments) == 2
+    (first_origin, first_moves), (second_origin, _) = segments
+    for axis in (OT3Axis.X, OT3Axis.Y, OT3Axis.Z_L):
+        assert second_origin[axis] == pytest.approx(
+            first_origin[axis]
+            + sum(
+                block.distance * move.unit_vector[axis]
+                for move in first_moves
+                for block in move.blocks
+            )
+        )
+
+
+async def test_move_through_max_speeds(ot3_hardware: ThreadManager[OT3API]) -> None:
+    """It should keep each axis of each segment under its max speed."""
+    await ot3_hardware.home()
+    with patch.object(
+        ot3_hardware.managed_obj._backend,
+        "move_through",
+        AsyncMock(spec=ot3_hardware.managed_obj._backend.move_through),
+    ) as mock_move_through:
+        await ot3_hardware.move_through(
+            Mount.LEFT,
+            [(Point(100, 100, 200), None), (Point(150, 200, 200), None)],
+            speed=400,
+            max_speeds={OT3Axis.Y: 20},
+        )
+
+    segments = mock_move_through.call_args[0][0]
+    assert len(segments) == 2
+    y_speeds = [
+        abs(block.final_speed * move.unit_vector[OT3Axis.Y])
+        for _, moves in segments
+        for move in moves
+        for block in move.blocks
+    ]
+    assert max(y_speeds) == pytest.approx(20)
+
+
 @pytest.mark.parametrize(
     "mount",
     (
@@ -1,9 +1,9 @@
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, List
 
 import pytest
 from decoy import Decoy, matchers
-from opentrons.hardware_control.poller import Poller, Reader
+from opentrons.hardware_control.poller import Poller, PollScheduler, Reader
 
 
 POLLING_INTERVAL = 0.1
@@ -150,3 +150,91 @@ async def test_poller_wait_next_poll_error(
         mock_reader.on_error(matchers.ErrorMatching(RuntimeError, match="oh no")),
         times=1,
     )
+
+
+class _RecordingReader(Reader):
+    """A reader that records the loop time of each read."""
+
+    def __init__(self, active: bool = False) -> None:
+        self.active = active
+        self.read_times: List[float] = []
+
+    async def read(self) -> None:
+        self.read_times.append(asyncio.get_running_loop().time())
+
+    def is_active(self) -> bool:
+        return self.active
+
+
+async def test_scheduler_aligns_reads() -> None:
+    """It should read pollers with the same interval on the same wakeup."""
+    scheduler = PollScheduler()
+    reader_1 = _RecordingReader()
+    reader_2 = _RecordingReader()
+    poller_1 = Poller(reader=reader_1, interval=POLLING_INTERVAL, scheduler=scheduler)
+    poller_2 = Poller(reader=reader_2, interval=POLLING_INTERVAL, scheduler=scheduler)
+
+    await poller_1.start()
+    await asyncio.sleep(POLLING_INTERVAL / 3)
+    await poller_2.start()
+    await asyncio.sleep(3 * POLLING_INTERVAL)
+    await poller_1.stop()
+    await poller_2.stop()
+
+    def _boundaries(read_times: List[float]) -> List[int]:
+        # After a poller's first read, its reads land on interval boundaries.
+        result = [round(t / POLLING_INTERVAL) for t in read_times[1:]]
+        for read_time, boundary in zip(read_times[1:], result):
+            assert read_time == pytest.approx(boundary * POLLING_INTERVAL, abs=0.02)
+        return result
+
+    boundaries_1 = _boundaries(reader_1.read_times)
+    boundaries_2 = _boundaries(reader_2.read_times)
+    assert len(boundaries_2) >= 2
+    assert set(boundaries_2) <= set(boundaries_1)
+
+
+async def test_poller_idle_interval() -> None:
+    """It should poll at the idle interval unless the reader is active."""
+    reader = _RecordingReader(active=False)
+    subject = Poller(
+        reader=reader, interval=POLLING_INTERVAL, idle_interval=10 * POLLING_INTERVAL
+    )
+
+    await subject.start()
+    await asyncio.sleep(3 * POLLING_INTERVAL)
+    assert len(reader.read_times) == 1
+
+    # Waiting for a poll brings the next read in to the fast interval.
+    await asyncio.wait_for(subject.wait_next_poll(), timeout=3 * POLLING_INTERVAL)
+    assert len(reader.read_times) == 2
+
+    reader.active = True
+    await asyncio.wait_for(subject.wait_next_poll(), timeout=3 * POLLING_INTERVAL)
+    await asyncio.sleep(3 * POLLING_INTERVAL)
+    await subject.stop()
+
+    assert len(reader.read_times) >= 5
+
+
+async def test_poller_metrics() -> None:
+    """It should record read latency and jitter for each poller."""
+    scheduler = PollScheduler()
+    subject = Poller(
+        reader=_RecordingReader(),
+        interval=POLLING_INTERVAL,
+        scheduler=scheduler,
+        name="some-port",
+    )
+
+    await subject.start()
+    await subject.wait_next_poll()
+    result = scheduler.metrics
+    await subject.stop()
+
+    assert list(result.keys()) == ["some-port"]
+    assert result["some-port"] is subject.metrics
+    assert subject.metrics.poll_count == 2
+    assert 0 <= subject.metrics.mean_latency <= subject.metrics.max_latency
+    assert 0 <= subject.metrics.mean_jitter <= subject.metrics.max_jitter
+    assert scheduler.metrics == {}
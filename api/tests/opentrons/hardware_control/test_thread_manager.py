@@ -4,6 +4,8 @@ from typing import Any
 
 import pytest
 
+from opentrons.types import Mount
+from opentrons.hardware_control import thread_manager as thread_manager_module
 from opentrons.hardware_control.modules import ModuleAtPort
 from opentrons.hardware_control.thread_manager import (
     ThreadManagerException,
@@ -71,3 +73,41 @@ async def test_module_cache_remove_entry():
     future.result()
     mods_after = thread_manager.attached_modules
     assert len(mods_after) == 1
+
+
+def test_bridged_methods_are_cached():
+    """Test that the same wrapper is returned for every access to a method."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+
+    try:
+        assert thread_manager.home is thread_manager.home
+        assert asyncio.iscoroutinefunction(thread_manager.home)
+        assert thread_manager.get_fw_version() == thread_manager.get_fw_version()
+    finally:
+        thread_manager.clean_up()
+
+
+def test_bridged_call_in_managed_loop(monkeypatch: pytest.MonkeyPatch):
+    """Test that calls from the managed loop are awaited directly."""
+    thread_manager = ThreadManager(API.build_hardware_simulator)
+
+    def _call_coroutine_threadsafe(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("Call should not have been handed off.")
+
+    monkeypatch.setattr(
+        thread_manager_module, "call_coroutine_threadsafe", _call_coroutine_threadsafe
+    )
+
+    async def _home_and_get_position() -> Any:
+        await thread_manager.home()
+        return await thread_manager.gantry_position(Mount.LEFT)
+
+    try:
+        future = asyncio.run_coroutine_threadsafe(
+            _home_and_get_position(), thread_manager._loop
+        )
+        assert future.result(timeout=10) == thread_manager.sync.gantry_position(
+            Mount.LEFT
+        )
+    finally:
+        thread_manager.clean_up()
@@ -42,8 +42,10 @@ def mock_core_map(decoy: Decoy) -> LoadedCoreMap:
 
 @pytest.fixture
 def mock_broker(decoy: Decoy) -> Broker:
-    """Get a mock command message broker."""
-    return decoy.mock(cls=Broker)
+    """Get a mock command message broker with a subscriber."""
+    broker = decoy.mock(cls=Broker)
+    decoy.when(broker.has_subscribers("command")).then_return(True)
+    return broker
 
 
 @pytest.fixture
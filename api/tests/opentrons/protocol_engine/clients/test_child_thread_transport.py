@@ -13,7 +13,10 @@ from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 
 from opentrons.protocol_engine import ProtocolEngine, commands, DeckPoint
 from opentrons.protocol_engine.errors import ErrorOccurrence, ProtocolEngineError
-from opentrons.protocol_engine.clients.transports import ChildThreadTransport
+from opentrons.protocol_engine.clients.transports import (
+    ChildThreadTransport,
+    SimulatingTransport,
+)
 
 
 @pytest.fixture
@@ -61,6 +64,39 @@ async def test_execute_command(
     assert result == cmd_result
 
 
+async def test_simulating_transport_executes_command_now(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+) -> None:
+    """It should execute commands without waiting for the engine's queue."""
+    subject = SimulatingTransport(engine=engine, loop=get_running_loop())
+    cmd_data = commands.MoveToWellParams(
+        pipetteId="pipette-id",
+        labwareId="labware-id",
+        wellName="A1",
+    )
+    cmd_result = commands.MoveToWellResult(position=DeckPoint(x=1, y=2, z=3))
+    cmd_request = commands.MoveToWellCreate(params=cmd_data)
+
+    decoy.when(
+        await engine.add_and_execute_command_now(request=cmd_request)
+    ).then_return(
+        commands.MoveToWell(
+            id="cmd-id",
+            key="cmd-key",
+            status=commands.CommandStatus.SUCCEEDED,
+            params=cmd_data,
+            result=cmd_result,
+            createdAt=datetime.now(),
+        )
+    )
+
+    task = partial(subject.execute_command, request=cmd_request)
+    result = await get_running_loop().run_in_executor(None, task)
+
+    assert result == cmd_result
+
+
 async def test_execute_command_failure(
     decoy: Decoy,
     engine: ProtocolEngine,
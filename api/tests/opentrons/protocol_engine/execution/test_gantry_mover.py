@@ -189,16 +189,12 @@ async def test_move_to(
     assert result == Point(4, 5, 6)
 
     decoy.verify(
-        await mock_hardware_api.move_to(
+        await mock_hardware_api.move_through(
             mount=Mount.RIGHT,
-            abs_position=Point(1, 2, 3),
-            critical_point=CriticalPoint.TIP,
-            speed=9001,
-        ),
-        await mock_hardware_api.move_to(
-            mount=Mount.RIGHT,
-            abs_position=Point(4, 5, 6),
-            critical_point=CriticalPoint.XY_CENTER,
+            moves=[
+                (Point(1, 2, 3), CriticalPoint.TIP),
+                (Point(4, 5, 6), CriticalPoint.XY_CENTER),
+            ],
             speed=9001,
         ),
     )
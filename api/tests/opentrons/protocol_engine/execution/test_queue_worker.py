@@ -4,7 +4,7 @@ from typing import Generator
 import pytest
 from decoy import Decoy, matchers
 
-from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state import StateSlice, StateStore
 from opentrons.protocol_engine.errors import RunStoppedError
 from opentrons.protocol_engine.execution import CommandExecutor, QueueWorker
 
@@ -50,7 +50,10 @@ async def queue_commands(decoy: Decoy, state_store: StateStore) -> None:
     get_next_to_execute_results = get_next_to_execute()
 
     decoy.when(
-        await state_store.wait_for(condition=state_store.commands.get_next_to_execute)
+        await state_store.wait_for(
+            condition=state_store.commands.get_next_to_execute,
+            slices=[StateSlice.COMMANDS],
+        )
     ).then_do(lambda *args, **kwargs: next(get_next_to_execute_results))
 
 
@@ -76,6 +79,17 @@ async def test_start_processes_commands(
     )
 
 
+async def test_execute_now(
+    decoy: Decoy,
+    command_executor: CommandExecutor,
+    subject: QueueWorker,
+) -> None:
+    """It should execute a command in the calling task."""
+    await subject.execute_now("command-id")
+
+    decoy.verify(await command_executor.execute(command_id="command-id"))
+
+
 async def test_cancel(
     decoy: Decoy,
     state_store: StateStore,
@@ -131,7 +145,10 @@ async def test_engine_stopped_exception_breaks_loop_gracefully(
 ) -> None:
     """It should `join` gracefully if a RunStoppedError is raised."""
     decoy.when(
-        await state_store.wait_for(condition=state_store.commands.get_next_to_execute)
+        await state_store.wait_for(
+            condition=state_store.commands.get_next_to_execute,
+            slices=[StateSlice.COMMANDS],
+        )
     ).then_raise(RunStoppedError("oh no"))
 
     subject.start()
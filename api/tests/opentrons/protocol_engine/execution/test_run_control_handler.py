@@ -6,7 +6,7 @@ from decoy import Decoy, matchers
 
 from opentrons.protocol_engine.actions import ActionDispatcher, PauseAction, PauseSource
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
-from opentrons.protocol_engine.state import Config, StateStore
+from opentrons.protocol_engine.state import Config, StateSlice, StateStore
 from opentrons.protocol_engine.types import DeckType
 
 
@@ -55,7 +55,8 @@ async def test_pause(
     decoy.verify(
         mock_action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL)),
         await mock_state_store.wait_for(
-            condition=mock_state_store.commands.get_is_running
+            condition=mock_state_store.commands.get_is_running,
+            slices=[StateSlice.COMMANDS],
         ),
     )
 
@@ -54,3 +54,39 @@ async def test_multiple_subscribers(count: int) -> None:
     await asyncio.gather(task_1, task_2, task_3)
 
     assert results == [1, 2, 3]
+
+
+async def test_topic_subscriber() -> None:
+    """It should only wake topic subscribers for changes to their topics."""
+    subject = ChangeNotifier()
+    result = asyncio.create_task(subject.wait(topics=["a", "b"]))
+
+    await asyncio.sleep(0)
+    subject.notify(topics=["c"])
+    await asyncio.sleep(0.1)
+    assert result.done() is False
+
+    subject.notify(topics=["b"])
+    await result
+
+
+async def test_topic_subscriber_notify_all() -> None:
+    """It should wake topic subscribers for changes without topics."""
+    subject = ChangeNotifier()
+    result = asyncio.create_task(subject.wait(topics=["a"]))
+
+    await asyncio.sleep(0)
+    subject.notify()
+
+    await result
+
+
+async def test_subscriber_notify_topics() -> None:
+    """It should wake subscribers without topics for changes to any topic."""
+    subject = ChangeNotifier()
+    result = asyncio.create_task(subject.wait())
+
+    await asyncio.sleep(0)
+    subject.notify(topics=["a"])
+
+    await result
@@ -2,7 +2,7 @@
 import pytest
 from collections import OrderedDict
 from datetime import datetime
-from typing import NamedTuple, Type
+from typing import Any, Iterator, NamedTuple, Type
 
 from opentrons.ordered_set import OrderedSet
 from opentrons_shared_data.pipette.dev_types import PipetteNameType
@@ -15,6 +15,7 @@ from opentrons.protocol_engine.state import Config
 from opentrons.protocol_engine.state.commands import (
     CommandState,
     CommandStore,
+    CommandView,
     CommandEntry,
     RunResult,
     QueueStatus,
@@ -22,6 +23,7 @@ from opentrons.protocol_engine.state.commands import (
 
 from opentrons.protocol_engine.actions import (
     QueueCommandAction,
+    QueueCommandsAction,
     UpdateCommandAction,
     FailCommandAction,
     PlayAction,
@@ -42,6 +44,29 @@ from .command_fixtures import (
 )
 
 
+class _NoScanDict(OrderedDict):  # type: ignore[type-arg]
+    """A dict that fails the test if anything iterates over it."""
+
+    def __iter__(self) -> Iterator[Any]:
+        raise AssertionError("Commands should not be scanned.")
+
+    def keys(self) -> Any:
+        raise AssertionError("Commands should not be scanned.")
+
+    def values(self) -> Any:
+        raise AssertionError("Commands should not be scanned.")
+
+    def items(self) -> Any:
+        raise AssertionError("Commands should not be scanned.")
+
+
+class _NoScanList(list):  # type: ignore[type-arg]
+    """A list that fails the test if anything iterates over it."""
+
+    def __iter__(self) -> Iterator[Any]:
+        raise AssertionError("Commands should not be scanned.")
+
+
 def _make_config(block_on_door_open: bool = False) -> Config:
     return Config(
         block_on_door_open=block_on_door_open,
@@ -79,8 +104,11 @@ def test_initial_state(
         queued_setup_command_ids=OrderedSet(),
         all_command_ids=[],
         commands_by_id=OrderedDict(),
+        command_update_ids=[],
         errors_by_id={},
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -264,6 +292,54 @@ def test_command_queue_with_hash() -> None:
     assert subject.state.latest_command_hash == "def456"
 
 
+def test_command_store_queues_many_commands() -> None:
+    """It should add several commands to the store in order."""
+    create = commands.WaitForResumeCreate(params=commands.WaitForResumeParams())
+    setup_create = commands.WaitForResumeCreate(
+        params=commands.WaitForResumeParams(),
+        intent=commands.CommandIntent.SETUP,
+    )
+
+    subject = CommandStore(is_door_open=False, config=_make_config())
+    subject.handle_action(
+        QueueCommandsAction(
+            actions=[
+                QueueCommandAction(
+                    request=create,
+                    request_hash="abc123",
+                    created_at=datetime(year=2021, month=1, day=1),
+                    command_id="command-id-1",
+                ),
+                QueueCommandAction(
+                    request=setup_create,
+                    request_hash=None,
+                    created_at=datetime(year=2021, month=1, day=1),
+                    command_id="command-id-2",
+                ),
+                QueueCommandAction(
+                    request=create,
+                    request_hash="def456",
+                    created_at=datetime(year=2021, month=1, day=1),
+                    command_id="command-id-3",
+                ),
+            ]
+        )
+    )
+
+    assert subject.state.all_command_ids == [
+        "command-id-1",
+        "command-id-2",
+        "command-id-3",
+    ]
+    assert subject.state.command_update_ids == subject.state.all_command_ids
+    assert subject.state.commands_by_id["command-id-3"].index == 2
+    assert subject.state.queued_command_ids == OrderedSet(
+        ["command-id-1", "command-id-3"]
+    )
+    assert subject.state.queued_setup_command_ids == OrderedSet(["command-id-2"])
+    assert subject.state.latest_command_hash == "def456"
+
+
 def test_command_queue_and_unqueue() -> None:
     """It should queue on QueueCommandAction and dequeue on UpdateCommandAction."""
     queue_1 = QueueCommandAction(
@@ -301,6 +377,13 @@ def test_command_queue_and_unqueue() -> None:
     subject.handle_action(update_1)
     assert subject.state.queued_command_ids == OrderedSet()
 
+    assert subject.state.command_update_ids == [
+        "command-id-1",
+        "command-id-2",
+        "command-id-2",
+        "command-id-1",
+    ]
+
 
 def test_setup_command_queue_and_unqueue() -> None:
     """It should queue and dequeue on setup commands."""
@@ -497,6 +580,8 @@ def test_command_failure_clears_queues() -> None:
         "command-id-1": CommandEntry(index=0, command=expected_failed_1),
         "command-id-2": CommandEntry(index=1, command=expected_failed_2),
     }
+    assert subject.state.latest_completed_command_id == "command-id-2"
+    assert subject.state.failed_protocol_command_id == "command-id-1"
 
 
 def test_setup_command_failure_only_clears_setup_command_queue() -> None:
@@ -655,8 +740,11 @@ def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
+        command_update_ids=[],
         errors_by_id={},
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -676,9 +764,12 @@ def test_command_store_handles_play_action(pause_source: PauseSource) -> None:
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
+        command_update_ids=[],
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -699,9 +790,12 @@ def test_command_store_handles_finish_action() -> None:
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
+        command_update_ids=[],
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -732,9 +826,12 @@ def test_command_store_handles_stop_action() -> None:
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
+        command_update_ids=[],
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -754,9 +851,12 @@ def test_command_store_cannot_restart_after_should_stop() -> None:
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
+        command_update_ids=[],
         errors_by_id={},
         run_started_at=None,
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -813,6 +913,7 @@ def test_command_store_saves_unknown_finish_error() -> None:
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
+        command_update_ids=[],
         errors_by_id={
             "error-id": errors.ErrorOccurrence(
                 id="error-id",
@@ -823,6 +924,8 @@ def test_command_store_saves_unknown_finish_error() -> None:
         },
         run_started_at=None,
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -844,9 +947,12 @@ def test_command_store_ignores_stop_after_graceful_finish() -> None:
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
+        command_update_ids=[],
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -868,9 +974,12 @@ def test_command_store_ignores_finish_after_non_graceful_stop() -> None:
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
+        command_update_ids=[],
         errors_by_id={},
         run_started_at=datetime(year=2021, month=1, day=1),
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -914,9 +1023,12 @@ def test_command_store_handles_command_failed() -> None:
         commands_by_id={
             "command-id": CommandEntry(index=0, command=expected_failed_command),
         },
+        command_update_ids=["command-id", "command-id"],
         errors_by_id={},
         run_started_at=None,
         latest_command_hash=None,
+        latest_completed_command_id="command-id",
+        failed_protocol_command_id="command-id",
     )
 
 
@@ -936,9 +1048,12 @@ def test_handles_hardware_stopped() -> None:
         queued_command_ids=OrderedSet(),
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
+        command_update_ids=[],
         errors_by_id={},
         run_started_at=None,
         latest_command_hash=None,
+        latest_completed_command_id=None,
+        failed_protocol_command_id=None,
     )
 
 
@@ -1012,3 +1127,48 @@ def test_handles_door_open_and_close_event_after_play(
 
     assert subject.state.queue_status == expected_queue_status
     assert subject.state.is_door_blocking is False
+
+
+def test_command_lifecycle_does_not_scan_commands() -> None:
+    """Running commands and reading the current command should not scan all commands.
+
+    These selectors are called after every action, so their cost must not grow
+    with the number of commands that have already run.
+    """
+    subject = CommandStore(is_door_open=False, config=_make_config())
+    view = CommandView(subject.state)
+    created_at = datetime(year=2021, month=1, day=1)
+    request = commands.WaitForResumeCreate(params=commands.WaitForResumeParams())
+
+    subject.state.commands_by_id = _NoScanDict()
+    subject.state.all_command_ids = _NoScanList()
+    subject.handle_action(PlayAction(requested_at=created_at))
+
+    for i in range(3):
+        command_id = f"command-id-{i}"
+        subject.handle_action(
+            QueueCommandAction(
+                request=request,
+                request_hash=None,
+                created_at=created_at,
+                command_id=command_id,
+            )
+        )
+        queued = view.get(command_id)
+        subject.handle_action(
+            UpdateCommandAction(
+                command=queued.copy(update={"status": commands.CommandStatus.RUNNING})
+            )
+        )
+        assert view.get_current() is not None
+        assert view.get_all_commands_final() is False
+        subject.handle_action(
+            UpdateCommandAction(
+                command=queued.copy(update={"status": commands.CommandStatus.SUCCEEDED})
+            )
+        )
+        current = view.get_current()
+        assert current is not None
+        assert current.command_id == command_id
+        assert view.get_all_commands_final() is True
+        assert view.get_all_errors() == []
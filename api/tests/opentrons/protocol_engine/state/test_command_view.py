@@ -13,12 +13,14 @@ from opentrons.protocol_engine.actions import (
     PauseSource,
     StopAction,
     QueueCommandAction,
+    QueueCommandsAction,
 )
 
 from opentrons.protocol_engine.state.commands import (
     CommandState,
     CommandView,
     CommandSlice,
+    CommandUpdateSlice,
     CommandEntry,
     CurrentCommand,
     RunResult,
@@ -44,6 +46,7 @@ def get_command_view(
     queued_setup_command_ids: Sequence[str] = (),
     errors_by_id: Optional[Dict[str, errors.ErrorOccurrence]] = None,
     commands: Sequence[cmd.Command] = (),
+    command_update_ids: Optional[List[str]] = None,
     latest_command_hash: Optional[str] = None,
 ) -> CommandView:
     """Get a command view test subject."""
@@ -64,8 +67,29 @@ def get_command_view(
         errors_by_id=errors_by_id or {},
         all_command_ids=all_command_ids,
         commands_by_id=commands_by_id,
+        command_update_ids=(
+            command_update_ids if command_update_ids is not None else all_command_ids
+        ),
         run_started_at=run_started_at,
         latest_command_hash=latest_command_hash,
+        latest_completed_command_id=next(
+            (
+                command.id
+                for command in reversed(commands)
+                if command.status
+                in (cmd.CommandStatus.SUCCEEDED, cmd.CommandStatus.FAILED)
+            ),
+            None,
+        ),
+        failed_protocol_command_id=next(
+            (
+                command.id
+                for command in commands
+                if command.error is not None
+                and command.intent != cmd.CommandIntent.SETUP
+            ),
+            None,
+        ),
     )
 
     return CommandView(state=state)
@@ -99,6 +123,14 @@ def test_get_all() -> None:
     assert subject.get_all() == [command_1, command_2, command_3]
 
 
+def test_get_running() -> None:
+    """It should return the ID of the running command, if any."""
+    assert get_command_view(running_command_id="command-id").get_running() == (
+        "command-id"
+    )
+    assert get_command_view(running_command_id=None).get_running() is None
+
+
 def test_get_next_to_execute_returns_first_queued() -> None:
     """It should return the next queued command ID."""
     subject = get_command_view(
@@ -303,7 +335,9 @@ class ActionAllowedSpec(NamedTuple):
     """Spec data to test CommandView.validate_action_allowed."""
 
     subject: CommandView
-    action: Union[PlayAction, PauseAction, StopAction, QueueCommandAction]
+    action: Union[
+        PlayAction, PauseAction, StopAction, QueueCommandAction, QueueCommandsAction
+    ]
     expected_error: Optional[Type[errors.ProtocolEngineError]]
 
 
@@ -349,6 +383,21 @@ action_allowed_specs: List[ActionAllowedSpec] = [
         ),
         expected_error=None,
     ),
+    # queue commands is allowed while running if none are setup commands
+    ActionAllowedSpec(
+        subject=get_command_view(queue_status=QueueStatus.RUNNING),
+        action=QueueCommandsAction(
+            actions=[
+                QueueCommandAction(
+                    request=cmd.HomeCreate(params=cmd.HomeParams()),
+                    request_hash=None,
+                    command_id="command-id",
+                    created_at=datetime(year=2021, month=1, day=1),
+                ),
+            ]
+        ),
+        expected_error=None,
+    ),
     # play is disallowed if paused and door is blocking
     ActionAllowedSpec(
         subject=get_command_view(
@@ -426,6 +475,30 @@ action_allowed_specs: List[ActionAllowedSpec] = [
         ),
         expected_error=errors.SetupCommandNotAllowedError,
     ),
+    # queue commands is disallowed if running and any is a setup command
+    ActionAllowedSpec(
+        subject=get_command_view(queue_status=QueueStatus.RUNNING),
+        action=QueueCommandsAction(
+            actions=[
+                QueueCommandAction(
+                    request=cmd.HomeCreate(params=cmd.HomeParams()),
+                    request_hash=None,
+                    command_id="command-id-1",
+                    created_at=datetime(year=2021, month=1, day=1),
+                ),
+                QueueCommandAction(
+                    request=cmd.HomeCreate(
+                        params=cmd.HomeParams(),
+                        intent=cmd.CommandIntent.SETUP,
+                    ),
+                    request_hash=None,
+                    command_id="command-id-2",
+                    created_at=datetime(year=2021, month=1, day=1),
+                ),
+            ]
+        ),
+        expected_error=errors.SetupCommandNotAllowedError,
+    ),
 ]
 
 
@@ -723,6 +796,51 @@ def test_get_slice() -> None:
     )
 
 
+def test_get_updates_since() -> None:
+    """It should return each command updated since the cursor, once."""
+    command_1 = create_succeeded_command(command_id="command-id-1")
+    command_2 = create_running_command(command_id="command-id-2")
+    command_3 = create_queued_command(command_id="command-id-3")
+
+    subject = get_command_view(
+        commands=[command_1, command_2, command_3],
+        command_update_ids=[
+            "command-id-1",
+            "command-id-2",
+            "command-id-3",
+            "command-id-1",
+            "command-id-2",
+            "command-id-1",
+        ],
+    )
+
+    assert subject.get_update_cursor() == 6
+    assert subject.get_updates_since(cursor=0) == CommandUpdateSlice(
+        commands=[command_1, command_2, command_3],
+        cursor=6,
+    )
+    assert subject.get_updates_since(cursor=3) == CommandUpdateSlice(
+        commands=[command_1, command_2],
+        cursor=6,
+    )
+    assert subject.get_updates_since(cursor=6) == CommandUpdateSlice(
+        commands=[],
+        cursor=6,
+    )
+
+
+def test_get_has_changed_since() -> None:
+    """It should report whether commands or the engine status have changed."""
+    subject = get_command_view(
+        queue_status=QueueStatus.RUNNING,
+        commands=[create_running_command(command_id="command-id-1")],
+    )
+
+    assert subject.get_has_changed_since(cursor=1, status=EngineStatus.RUNNING) is False
+    assert subject.get_has_changed_since(cursor=0, status=EngineStatus.RUNNING) is True
+    assert subject.get_has_changed_since(cursor=1, status=EngineStatus.PAUSED) is True
+
+
 def test_get_slice_default_cursor_no_current() -> None:
     """It should return a slice from the tail if no current command."""
     command_1 = create_succeeded_command(command_id="command-id-1")
@@ -457,6 +457,48 @@ def test_get_labware_position(
     )
 
 
+def test_get_labware_position_cached(
+    decoy: Decoy,
+    well_plate_def: LabwareDefinition,
+    labware_view: LabwareView,
+    module_view: ModuleView,
+    subject: GeometryView,
+) -> None:
+    """It should reuse a labware's position until the geometry version changes."""
+    labware_data = LoadedLabware(
+        id="labware-id",
+        loadName="load-name",
+        definitionUri="definition-uri",
+        location=DeckSlotLocation(slotName=DeckSlotName.SLOT_4),
+        offsetId=None,
+    )
+
+    decoy.when(labware_view.get_geometry_version()).then_return(1)
+    decoy.when(module_view.get_calibration_version()).then_return(1)
+    decoy.when(labware_view.get("labware-id")).then_return(labware_data)
+    decoy.when(labware_view.get_definition("labware-id")).then_return(well_plate_def)
+    decoy.when(labware_view.get_labware_offset_vector("labware-id")).then_return(
+        LabwareOffsetVector(x=0, y=0, z=0)
+    )
+    decoy.when(labware_view.get_slot_position(DeckSlotName.SLOT_4)).then_return(
+        Point(4, 5, 6)
+    )
+
+    first_position = subject.get_labware_position(labware_id="labware-id")
+
+    decoy.when(labware_view.get_labware_offset_vector("labware-id")).then_return(
+        LabwareOffsetVector(x=1, y=-2, z=3)
+    )
+
+    assert subject.get_labware_position(labware_id="labware-id") == first_position
+
+    decoy.when(labware_view.get_geometry_version()).then_return(2)
+
+    assert subject.get_labware_position(
+        labware_id="labware-id"
+    ) == first_position + Point(x=1, y=-2, z=3)
+
+
 def test_get_well_position(
     decoy: Decoy,
     well_plate_def: LabwareDefinition,
@@ -96,6 +96,8 @@ def test_handles_add_labware_offset(
         vector=LabwareOffsetVector(x=1, y=2, z=3),
     )
 
+    initial_version = subject.state.geometry_version
+
     subject.handle_action(
         AddLabwareOffsetAction(
             labware_offset_id="offset-id",
@@ -105,6 +107,7 @@ def test_handles_add_labware_offset(
     )
 
     assert subject.state.labware_offsets_by_id == {"offset-id": resolved_offset}
+    assert subject.state.geometry_version > initial_version
 
 
 def test_handles_load_labware(
@@ -203,12 +206,14 @@ def test_handles_move_labware(
         offset_id="my-new-offset",
         strategy=LabwareMovementStrategy.MANUAL_MOVE_WITH_PAUSE,
     )
+    version_before_move = subject.state.geometry_version
     subject.handle_action(UpdateCommandAction(command=move_command))
 
     assert subject.state.labware_by_id["my-labware-id"].location == DeckSlotLocation(
         slotName=DeckSlotName.SLOT_4
     )
     assert subject.state.labware_by_id["my-labware-id"].offsetId == "my-new-offset"
+    assert subject.state.geometry_version > version_before_move
 
 
 def test_handles_move_labware_off_deck(
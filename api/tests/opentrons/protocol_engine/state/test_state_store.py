@@ -7,10 +7,10 @@ from decoy import Decoy
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
 
-from opentrons.protocol_engine.actions import PlayAction
-from opentrons.protocol_engine.state import State, StateStore, Config
+from opentrons.protocol_engine.actions import AddLiquidAction, PlayAction
+from opentrons.protocol_engine.state import State, StateSlice, StateStore, Config
 from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
-from opentrons.protocol_engine.types import DeckType
+from opentrons.protocol_engine.types import DeckType, Liquid
 
 
 @pytest.fixture
@@ -69,7 +69,23 @@ def test_notify_on_state_change(
     """It should notify state changes when actions are handled."""
     decoy.verify(change_notifier.notify(), times=0)
     subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
-    decoy.verify(change_notifier.notify(), times=1)
+    decoy.verify(change_notifier.notify(topics=[StateSlice.COMMANDS]), times=1)
+
+
+def test_handle_action_skips_unrelated_substores(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should only dispatch actions to, and notify for, substores that handle them."""
+    commands_before = subject.state.commands
+    liquid = Liquid(id="liquid-id", displayName="water", description="")
+
+    subject.handle_action(AddLiquidAction(liquid=liquid))
+
+    assert subject.state.commands is commands_before
+    assert subject.liquid.get_all() == [liquid]
+    decoy.verify(change_notifier.notify(topics=[StateSlice.LIQUIDS]), times=1)
 
 
 async def test_wait_for_state(
@@ -108,6 +124,25 @@ async def test_wait_for_state_short_circuit(
     decoy.verify(await change_notifier.wait(), times=0)
 
 
+async def test_wait_for_state_slices(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should only wait for changes to the given parts of state."""
+    check_condition: Callable[..., Optional[str]] = decoy.mock()
+
+    decoy.when(check_condition("foo", bar="baz")).then_return(None, "hello world")
+
+    result = await subject.wait_for(
+        check_condition, "foo", bar="baz", slices=[StateSlice.COMMANDS]
+    )
+    assert result == "hello world"
+
+    decoy.verify(await change_notifier.wait(topics=[StateSlice.COMMANDS]), times=1)
+    decoy.verify(await change_notifier.wait(), times=0)
+
+
 async def test_wait_for_already_true(decoy: Decoy, subject: StateStore) -> None:
     """It should signal immediately if condition is already met."""
     check_condition = decoy.mock()
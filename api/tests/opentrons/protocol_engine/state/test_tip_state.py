@@ -1,7 +1,7 @@
 """Tests for tip state store and selectors."""
 import pytest
 
-from typing import Optional
+from typing import List, Optional
 
 from opentrons_shared_data.labware.labware_definition import (
     LabwareDefinition,
@@ -9,7 +9,7 @@ from opentrons_shared_data.labware.labware_definition import (
 )
 
 from opentrons.protocol_engine import actions, commands
-from opentrons.protocol_engine.state.tips import TipStore, TipView
+from opentrons.protocol_engine.state.tips import TipRackState, TipStore, TipView
 from opentrons.protocol_engine.types import FlowRates, DeckPoint
 from opentrons.protocol_engine.resources.pipette_data_provider import (
     LoadedStaticPipetteData,
@@ -374,3 +374,106 @@ def test_drop_tip(
     )
     result = TipView(subject.state).get_tip_length("pipette-id")
     assert result == 0
+
+
+def _add_pipette(subject: TipStore, channels: int) -> None:
+    subject.handle_action(
+        actions.AddPipetteConfigAction(
+            pipette_id="pipette-id",
+            serial_number="pipette-serial",
+            config=LoadedStaticPipetteData(
+                channels=channels,
+                max_volume=15,
+                min_volume=3,
+                model="gen a",
+                display_name="display name",
+                flow_rates=FlowRates(
+                    default_aspirate={},
+                    default_dispense={},
+                    default_blow_out={},
+                ),
+                return_tip_scale=0,
+                nominal_tip_overlap={},
+                nozzle_offset_z=1.23,
+                home_position=4.56,
+            ),
+        )
+    )
+
+
+def _pick_up_tip(subject: TipStore, well_name: str) -> None:
+    subject.handle_action(
+        actions.UpdateCommandAction(
+            command=commands.PickUpTip.construct(  # type: ignore[call-arg]
+                params=commands.PickUpTipParams.construct(
+                    pipetteId="pipette-id",
+                    labwareId="cool-labware",
+                    wellName=well_name,
+                ),
+                result=commands.PickUpTipResult.construct(
+                    position=DeckPoint(x=0, y=0, z=0), tipLength=1.23
+                ),
+            )
+        )
+    )
+
+
+@pytest.mark.parametrize("channels", [1, 8, 96])
+def test_get_next_tip_uses_up_rack(
+    load_labware_command: commands.LoadLabware,
+    labware_definition: LabwareDefinition,
+    subject: TipStore,
+    channels: int,
+) -> None:
+    """It should return each clean tip in order until the rack is used up."""
+    subject.handle_action(actions.UpdateCommandAction(command=load_labware_command))
+    _add_pipette(subject, channels)
+    view = TipView(subject.state)
+    picked_up: List[str] = []
+
+    while True:
+        well_name = view.get_next_tip(
+            labware_id="cool-labware", num_tips=channels, starting_tip_name=None
+        )
+        if well_name is None:
+            break
+        picked_up.append(well_name)
+        _pick_up_tip(subject, well_name)
+
+    ordering = labware_definition.ordering
+    if channels == 1:
+        assert picked_up == [well for column in ordering for well in column]
+    elif channels == 8:
+        assert picked_up == [column[0] for column in ordering]
+    else:
+        assert picked_up == ["A1"]
+
+    for num_tips in (1, 8, 96):
+        assert view.get_next_tip("cool-labware", num_tips, None) is None
+
+
+def test_tip_rack_state_bitmaps() -> None:
+    """It should track used tips and columns as bitmaps in ordering order."""
+    subject = TipRackState.from_ordering([["A1", "B1"], ["A2", "B2"], ["A3", "B3"]])
+
+    assert subject.well_names == ["A1", "B1", "A2", "B2", "A3", "B3"]
+    assert subject.find_clean_well() == 0
+    assert subject.find_clean_column(start=0) == 0
+
+    subject.use_well(subject.well_indices["A1"])
+    assert subject.is_used(0)
+    assert not subject.is_used(1)
+    assert subject.find_clean_well() == 1
+    assert subject.find_clean_column(start=0) == 1
+
+    subject.use_column(1)
+    assert (subject.used_wells, subject.used_columns) == (0b001101, 0b011)
+    assert subject.find_clean_column(start=0) == 2
+    assert subject.find_clean_column(start=2) == 2
+
+    subject.use_all()
+    assert subject.find_clean_well() is None
+    assert subject.find_clean_column(start=0) is None
+
+    subject.reset()
+    assert (subject.used_wells, subject.used_columns) == (0, 0)
@@ -1,6 +1,6 @@
 """Tests for the ProtocolEngine class."""
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 import pytest
 from decoy import Decoy
@@ -21,6 +21,7 @@ from opentrons.protocol_engine.types import (
     ModuleDefinition,
     ModuleModel,
     Liquid,
+    EngineStatus,
 )
 from opentrons.protocol_engine.execution import (
     QueueWorker,
@@ -28,7 +29,7 @@ from opentrons.protocol_engine.execution import (
     DoorWatcher,
 )
 from opentrons.protocol_engine.resources import ModelUtils, ModuleDataProvider
-from opentrons.protocol_engine.state import StateStore
+from opentrons.protocol_engine.state import StateSlice, StateStore
 from opentrons.protocol_engine.plugins import AbstractPlugin, PluginStarter
 
 from opentrons.protocol_engine.actions import (
@@ -44,6 +45,7 @@ from opentrons.protocol_engine.actions import (
     FinishAction,
     FinishErrorDetails,
     QueueCommandAction,
+    QueueCommandsAction,
     HardwareStoppedAction,
     ResetTipsAction,
 )
@@ -213,6 +215,70 @@ def test_add_command(
     assert result == queued
 
 
+def test_add_commands(
+    decoy: Decoy,
+    state_store: StateStore,
+    action_dispatcher: ActionDispatcher,
+    model_utils: ModelUtils,
+    subject: ProtocolEngine,
+) -> None:
+    """It should add several commands to the state in one action."""
+    created_at = datetime(year=2021, month=1, day=1)
+    request_1 = commands.HomeCreate(params=commands.HomeParams())
+    request_2 = commands.WaitForResumeCreate(params=commands.WaitForResumeParams())
+    queued_1 = commands.Home(
+        id="command-id-1",
+        key="command-key-1",
+        status=commands.CommandStatus.QUEUED,
+        createdAt=created_at,
+        params=commands.HomeParams(),
+    )
+    queued_2 = commands.WaitForResume(
+        id="command-id-2",
+        key="command-key-2",
+        status=commands.CommandStatus.QUEUED,
+        createdAt=created_at,
+        params=commands.WaitForResumeParams(),
+    )
+    action = QueueCommandsAction(
+        actions=[
+            QueueCommandAction(
+                command_id="command-id-1",
+                created_at=created_at,
+                request=request_1,
+                request_hash="123",
+            ),
+            QueueCommandAction(
+                command_id="command-id-2",
+                created_at=created_at,
+                request=request_2,
+                request_hash="456",
+            ),
+        ]
+    )
+
+    decoy.when(model_utils.generate_id()).then_return("command-id-1", "command-id-2")
+    decoy.when(model_utils.get_timestamp()).then_return(created_at)
+    decoy.when(state_store.commands.get_latest_command_hash()).then_return("abc")
+    decoy.when(
+        commands.hash_command_params(create=request_1, last_hash="abc")
+    ).then_return("123")
+    decoy.when(
+        commands.hash_command_params(create=request_2, last_hash="123")
+    ).then_return("456")
+    decoy.when(state_store.commands.validate_action_allowed(action)).then_return(action)
+
+    def _stub_queued(*_a: object, **_k: object) -> None:
+        decoy.when(state_store.commands.get("command-id-1")).then_return(queued_1)
+        decoy.when(state_store.commands.get("command-id-2")).then_return(queued_2)
+
+    decoy.when(action_dispatcher.dispatch(action)).then_do(_stub_queued)
+
+    result = subject.add_commands([request_1, request_2])
+
+    assert result == [queued_1, queued_2]
+
+
 async def test_add_and_execute_command(
     decoy: Decoy,
     state_store: StateStore,
@@ -283,6 +349,7 @@ async def test_add_and_execute_command(
         await state_store.wait_for(
             condition=state_store.commands.get_command_is_final,
             command_id="command-id",
+            slices=[StateSlice.COMMANDS],
         ),
     ).then_do(_stub_completed)
 
@@ -291,6 +358,86 @@ async def test_add_and_execute_command(
     assert result == completed
 
 
+@pytest.mark.parametrize(
+    ("running_command_id", "next_command_id", "expect_execute_now"),
+    [
+        (None, "command-id", True),
+        ("other-command-id", "command-id", False),
+        (None, "other-command-id", False),
+    ],
+)
+async def test_add_and_execute_command_now(
+    decoy: Decoy,
+    state_store: StateStore,
+    action_dispatcher: ActionDispatcher,
+    model_utils: ModelUtils,
+    queue_worker: QueueWorker,
+    subject: ProtocolEngine,
+    running_command_id: Optional[str],
+    next_command_id: Optional[str],
+    expect_execute_now: bool,
+) -> None:
+    """It should execute the command itself, if nothing else is in the way."""
+    created_at = datetime(year=2021, month=1, day=1)
+    params = commands.HomeParams()
+    request = commands.HomeCreate(params=params)
+    queued = commands.Home(
+        id="command-id",
+        key="command-key",
+        status=commands.CommandStatus.QUEUED,
+        createdAt=created_at,
+        params=params,
+    )
+    completed = commands.Home(
+        id="command-id",
+        key="command-key",
+        status=commands.CommandStatus.SUCCEEDED,
+        createdAt=created_at,
+        params=params,
+    )
+    queue_action = QueueCommandAction(
+        command_id="command-id",
+        created_at=created_at,
+        request=request,
+        request_hash=None,
+    )
+
+    decoy.when(model_utils.generate_id()).then_return("command-id")
+    decoy.when(model_utils.get_timestamp()).then_return(created_at)
+    decoy.when(state_store.commands.validate_action_allowed(queue_action)).then_return(
+        queue_action
+    )
+    decoy.when(state_store.commands.get_running()).then_return(running_command_id)
+    decoy.when(state_store.commands.get_next_to_execute()).then_return(next_command_id)
+
+    def _stub_queued(*_a: object, **_k: object) -> None:
+        decoy.when(state_store.commands.get("command-id")).then_return(queued)
+
+    def _stub_executed(*_a: object, **_k: object) -> None:
+        decoy.when(state_store.commands.get("command-id")).then_return(completed)
+
+    def _stub_completed(*_a: object, **_k: object) -> bool:
+        _stub_executed()
+        return True
+
+    decoy.when(action_dispatcher.dispatch(queue_action)).then_do(_stub_queued)
+
+    if expect_execute_now:
+        decoy.when(await queue_worker.execute_now("command-id")).then_do(_stub_executed)
+    else:
+        decoy.when(
+            await state_store.wait_for(
+                condition=state_store.commands.get_command_is_final,
+                command_id="command-id",
+                slices=[StateSlice.COMMANDS],
+            ),
+        ).then_do(_stub_completed)
+
+    result = await subject.add_and_execute_command_now(request)
+
+    assert result == completed
+
+
 def test_play(
     decoy: Decoy,
     state_store: StateStore,
@@ -503,7 +650,26 @@ async def test_wait_until_complete(
 
     decoy.verify(
         await state_store.wait_for(
-            condition=state_store.commands.get_all_commands_final
+            condition=state_store.commands.get_all_commands_final,
+            slices=[StateSlice.COMMANDS],
+        )
+    )
+
+
+async def test_wait_for_command_updates(
+    decoy: Decoy,
+    state_store: StateStore,
+    subject: ProtocolEngine,
+) -> None:
+    """It should wait for commands or the engine status to change."""
+    await subject.wait_for_command_updates(cursor=42, status=EngineStatus.RUNNING)
+
+    decoy.verify(
+        await state_store.wait_for(
+            state_store.commands.get_has_changed_since,
+            cursor=42,
+            status=EngineStatus.RUNNING,
+            slices=[StateSlice.COMMANDS],
         )
     )
 
@@ -357,22 +357,22 @@ async def test_load_json_runner(
         protocol_engine.add_liquid(
             id="water-id", name="water", description="water desc", color=None
         ),
-        protocol_engine.add_command(
-            request=pe_commands.WaitForResumeCreate(
-                params=pe_commands.WaitForResumeParams(message="hello")
-            )
-        ),
-        protocol_engine.add_command(
-            request=pe_commands.WaitForResumeCreate(
-                params=pe_commands.WaitForResumeParams(message="goodbye")
-            )
-        ),
-        protocol_engine.add_command(
-            request=pe_commands.LoadLiquidCreate(
-                params=pe_commands.LoadLiquidParams(
-                    liquidId="water-id", labwareId="labware-id", volumeByWell={"A1": 30}
-                )
-            ),
+        protocol_engine.add_commands(
+            [
+                pe_commands.WaitForResumeCreate(
+                    params=pe_commands.WaitForResumeParams(message="hello")
+                ),
+                pe_commands.WaitForResumeCreate(
+                    params=pe_commands.WaitForResumeParams(message="goodbye")
+                ),
+                pe_commands.LoadLiquidCreate(
+                    params=pe_commands.LoadLiquidParams(
+                        liquidId="water-id",
+                        labwareId="labware-id",
+                        volumeByWell={"A1": 30},
+                    )
+                ),
+            ]
         ),
         task_queue.set_run_func(func=protocol_engine.wait_until_complete),
     )
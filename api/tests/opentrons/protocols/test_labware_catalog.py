@@ -0,0 +1,99 @@
+"""Tests for opentrons.protocols.labware_catalog."""
+import json
+from pathlib import Path
+
+import pytest
+
+from opentrons.protocols import labware_catalog
+from opentrons.protocols.labware_catalog import LabwareCatalog
+
+
+LOAD_NAME = "corning_96_wellplate_360ul_flat"
+
+
+@pytest.fixture
+def definitions_dir() -> Path:
+    """Get the shared-data standard definitions directory."""
+    return labware_catalog.get_standard_definitions_dir()
+
+
+@pytest.fixture(params=["directory", "bundle"])
+def subject(
+    request: pytest.FixtureRequest, definitions_dir: Path, tmp_path: Path
+) -> LabwareCatalog:
+    """Get a catalog read from the definitions directory or from a bundle."""
+    catalog = LabwareCatalog.from_directory(definitions_dir)
+    if request.param == "directory":  # type: ignore[attr-defined]
+        return catalog
+    catalog.pack(tmp_path / "definitions.bundle")
+    return LabwareCatalog.from_bundle(tmp_path / "definitions.bundle")
+
+
+def test_load_names(subject: LabwareCatalog, definitions_dir: Path) -> None:
+    """It should list every load name and version."""
+    assert sorted(subject.load_names()) == sorted(
+        p.name for p in definitions_dir.iterdir() if p.is_dir()
+    )
+    assert subject.versions(LOAD_NAME) == [1]
+    assert subject.versions("not_a_labware") == []
+
+
+def test_get_definition(subject: LabwareCatalog, definitions_dir: Path) -> None:
+    """It should return a fresh copy of the definition on every call."""
+    expected = json.loads((definitions_dir / LOAD_NAME / "1.json").read_bytes())
+
+    result_1 = subject.get_definition(LOAD_NAME, 1)
+    result_1["ordering"] = []
+    result_2 = subject.get_definition(LOAD_NAME, 1)
+    result_3 = subject.get_definition(LOAD_NAME, 1)
+
+    assert result_2 == expected
+    assert result_3 == expected
+    assert result_3 is not result_2
+
+
+def test_get_definition_not_found(subject: LabwareCatalog) -> None:
+    """It should raise FileNotFoundError for unknown labware and versions."""
+    with pytest.raises(FileNotFoundError):
+        subject.get_definition("not_a_labware", 1)
+    with pytest.raises(FileNotFoundError):
+        subject.get_definition(LOAD_NAME, 99)
+
+
+def test_bundle_from_other_shared_data_version(
+    monkeypatch: pytest.MonkeyPatch, definitions_dir: Path, tmp_path: Path
+) -> None:
+    """It should refuse bundles packed from a different shared-data version."""
+    bundle_path = tmp_path / "definitions.bundle"
+    monkeypatch.setattr(labware_catalog, "shared_data_version", "0.0.0-old")
+    LabwareCatalog.from_directory(definitions_dir).pack(bundle_path)
+    monkeypatch.undo()
+
+    with pytest.raises(ValueError, match="0.0.0-old"):
+        LabwareCatalog.from_bundle(bundle_path)
+
+
+def test_corrupt_bundle(definitions_dir: Path, tmp_path: Path) -> None:
+    """It should check bundled definitions against their content hashes."""
+    bundle_path = tmp_path / "definitions.bundle"
+    LabwareCatalog.from_directory(definitions_dir).pack(bundle_path)
+    contents = bytearray(bundle_path.read_bytes())
+    contents[-2] ^= 0xFF
+    bundle_path.write_bytes(bytes(contents))
+
+    subject = LabwareCatalog.from_bundle(bundle_path)
+    corrupted = [
+        (load_name, version)
+        for load_name in subject.load_names()
+        for version in subject.versions(load_name)
+        if not _can_read(subject, load_name, version)
+    ]
+    assert len(corrupted) == 1
+
+
+def _can_read(subject: LabwareCatalog, load_name: str, version: int) -> bool:
+    try:
+        subject.get_definition(load_name, version)
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,61 @@
+"""Tests for opentrons.protocols.schema_validation."""
+import json
+from typing import Any, Iterator
+
+import jsonschema  # type: ignore
+import pytest
+
+from opentrons_shared_data import load_shared_data
+from opentrons.protocols import schema_validation
+
+
+def _raise_if_validated(instance: Any) -> Iterator[jsonschema.ValidationError]:
+    raise AssertionError("Content should not have been validated again.")
+
+
+def test_validators_are_cached() -> None:
+    """It should only build each validator once."""
+    assert (
+        schema_validation.get_labware_validator()
+        is schema_validation.get_labware_validator()
+    )
+    assert schema_validation.get_protocol_validator(
+        6
+    ) is schema_validation.get_protocol_validator(6)
+
+
+def test_protocol_validator_resolves_labware_schema() -> None:
+    """It should validate protocols that reference the labware schema."""
+    protocol = json.loads(
+        load_shared_data("protocol/fixtures/6/simpleV6.json").decode("utf-8")
+    )
+
+    schema_validation.validate_protocol(protocol, version=6)
+
+
+def test_validate_labware_definition_skips_validated_contents(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """It should not validate the same contents twice."""
+    raw = load_shared_data("labware/definitions/2/agilent_1_reservoir_290ml/1.json")
+    definition = json.loads(raw)
+    schema_validation.validate_labware_definition(definition)
+    schema_validation.validate_labware_definition(definition, raw)
+
+    monkeypatch.setattr(
+        schema_validation.get_labware_validator(), "iter_errors", _raise_if_validated
+    )
+    schema_validation.validate_labware_definition(json.loads(raw))
+    schema_validation.validate_labware_definition(definition, raw)
+
+
+def test_validate_labware_definition_raises_every_time() -> None:
+    """It should not remember invalid contents."""
+    definition = json.loads(
+        load_shared_data("labware/definitions/2/agilent_1_reservoir_290ml/1.json")
+    )
+    del definition["wells"]
+
+    for _ in range(2):
+        with pytest.raises(jsonschema.ValidationError):
+            schema_validation.validate_labware_definition(definition)
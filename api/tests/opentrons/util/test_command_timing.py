@@ -0,0 +1,259 @@
+"""Tests for opentrons.util.command_timing."""
+import asyncio
+import json
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from opentrons.util.command_timing import (
+    HISTOGRAM_BUCKET_BOUNDS,
+    UNATTRIBUTED,
+    CommandTimingRecorder,
+    TimingHistogram,
+    TimingPhase,
+    get_command_timing,
+    timed,
+)
+
+
+@pytest.fixture
+def subject() -> CommandTimingRecorder:
+    """Get an enabled recorder with tracing."""
+    recorder = CommandTimingRecorder()
+    recorder.enable(trace=True)
+    return recorder
+
+
+def test_disabled_records_nothing() -> None:
+    """It should not record anything until enabled."""
+    subject = CommandTimingRecorder()
+
+    with subject.command("aspirate"):
+        with subject.span(TimingPhase.HARDWARE, "API.aspirate"):
+            pass
+
+    assert subject.get_histograms() == {}
+    assert subject.get_chrome_trace()["traceEvents"] == []
+
+
+def test_attributes_spans_to_innermost_command(
+    subject: CommandTimingRecorder,
+) -> None:
+    """It should attribute spans to the command running when they were timed."""
+    with subject.span(TimingPhase.HARDWARE, "API.home"):
+        pass
+    with subject.command("transfer"):
+        with subject.command("aspirate"):
+            with subject.span(TimingPhase.HARDWARE, "API.aspirate"):
+                pass
+        with subject.span(TimingPhase.MOTION_PLANNING, "plan_moves"):
+            pass
+
+    histograms = subject.get_histograms()
+
+    assert {
+        command_type: set(phases) for command_type, phases in histograms.items()
+    } == {
+        UNATTRIBUTED: {TimingPhase.HARDWARE},
+        "transfer": {TimingPhase.COMMAND, TimingPhase.MOTION_PLANNING},
+        "aspirate": {TimingPhase.COMMAND, TimingPhase.HARDWARE},
+    }
+    assert histograms["aspirate"][TimingPhase.HARDWARE].count == 1
+
+
+def test_attributes_spans_per_thread(subject: CommandTimingRecorder) -> None:
+    """It should keep commands running in different threads apart."""
+    both_started = threading.Barrier(2)
+    both_timed = threading.Barrier(2)
+
+    def run_command(command_type: str) -> None:
+        with subject.command(command_type):
+            both_started.wait()
+            with subject.span(TimingPhase.HARDWARE, command_type):
+                pass
+            both_timed.wait()
+
+    threads = [
+        threading.Thread(target=run_command, args=(command_type,))
+        for command_type in ("aspirate", "home")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert {
+        event["name"]: event["args"]["commandType"]
+        for event in subject.get_chrome_trace()["traceEvents"]
+        if event["cat"] == TimingPhase.HARDWARE
+    } == {"aspirate": "aspirate", "home": "home"}
+
+
+async def test_attributes_spans_per_task(subject: CommandTimingRecorder) -> None:
+    """It should keep commands running in interleaved tasks apart."""
+    both_started = asyncio.Event()
+    started: List[str] = []
+
+    async def run_command(command_type: str) -> None:
+        with subject.command(command_type):
+            started.append(command_type)
+            if len(started) == 2:
+                both_started.set()
+            await both_started.wait()
+            with subject.span(TimingPhase.HARDWARE, command_type):
+                pass
+
+    await asyncio.gather(run_command("aspirate"), run_command("home"))
+
+    assert {
+        event["name"]: event["args"]["commandType"]
+        for event in subject.get_chrome_trace()["traceEvents"]
+        if event["cat"] == TimingPhase.HARDWARE
+    } == {"aspirate": "aspirate", "home": "home"}
+    assert subject.current_command_type == UNATTRIBUTED
+
+
+def test_histogram() -> None:
+    """It should bucket durations and estimate percentiles from the buckets."""
+    subject = TimingHistogram()
+
+    for _ in range(9):
+        subject.add(HISTOGRAM_BUCKET_BOUNDS[0] / 2)
+    subject.add(1.0)
+
+    assert subject.count == 10
+    assert subject.min == HISTOGRAM_BUCKET_BOUNDS[0] / 2
+    assert subject.max == 1.0
+    assert subject.mean == pytest.approx((9 * HISTOGRAM_BUCKET_BOUNDS[0] / 2 + 1) / 10)
+    assert subject.percentile(0.5) == HISTOGRAM_BUCKET_BOUNDS[0]
+    assert 1.0 <= subject.percentile(0.99) <= 2.0
+    assert sum(subject.bucket_counts) == 10
+
+
+def test_histogram_overflow() -> None:
+    """It should count durations past the last bucket in an overflow bucket."""
+    subject = TimingHistogram()
+
+    subject.add(HISTOGRAM_BUCKET_BOUNDS[-1] * 2)
+
+    assert subject.bucket_counts[-1] == 1
+    assert subject.percentile(0.5) == HISTOGRAM_BUCKET_BOUNDS[-1] * 2
+
+
+def test_write_chrome_trace(subject: CommandTimingRecorder, tmp_path: Path) -> None:
+    """It should write spans as complete events in the Chrome trace format."""
+    with subject.command("dispense"):
+        with subject.span(TimingPhase.DRIVER_IO, "send"):
+            pass
+
+    subject.write_chrome_trace(tmp_path / "trace.json")
+    trace = json.loads((tmp_path / "trace.json").read_text())
+
+    assert [(event["name"], event["cat"]) for event in trace["traceEvents"]] == [
+        ("send", "driverIO"),
+        ("dispense", "command"),
+    ]
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
+    assert trace["traceEvents"][1]["args"] == {"commandType": "dispense"}
+
+
+def test_trace_is_bounded() -> None:
+    """It should drop spans past the trace limit, but keep counting them."""
+    subject = CommandTimingRecorder()
+    subject.enable(trace=True, max_trace_events=2)
+
+    for _ in range(3):
+        with subject.span(TimingPhase.HARDWARE, "API.move_to"):
+            pass
+
+    trace = subject.get_chrome_trace()
+    assert len(trace["traceEvents"]) == 2
+    assert trace["otherData"] == {"droppedEvents": 1}
+    assert subject.get_histograms()[UNATTRIBUTED][TimingPhase.HARDWARE].count == 3
+
+
+def test_reset(subject: CommandTimingRecorder) -> None:
+    """It should forget everything on reset."""
+    with subject.command("home"):
+        pass
+
+    subject.reset()
+
+    assert subject.get_histograms() == {}
+    assert subject.get_chrome_trace()["traceEvents"] == []
+
+
+async def test_timed() -> None:
+    """It should time calls of decorated functions and coroutine functions."""
+
+    @timed(TimingPhase.MOTION_PLANNING)
+    def plan(value: int) -> int:
+        return value + 1
+
+    @timed(TimingPhase.HARDWARE)
+    async def move(value: int) -> int:
+        return value + 2
+
+    recorder = get_command_timing()
+    recorder.enable()
+    try:
+        with recorder.command("moveToWell"):
+            assert plan(1) == 2
+            assert await move(1) == 3
+        histograms = recorder.get_histograms()["moveToWell"]
+    finally:
+        recorder.disable()
+        recorder.reset()
+
+    assert histograms[TimingPhase.MOTION_PLANNING].count == 1
+    assert histograms[TimingPhase.HARDWARE].count == 1
+
+
+async def test_timed_nested_same_phase() -> None:
+    """It should count a timed call made by another of the same phase once."""
+
+    @timed(TimingPhase.MOTION_PLANNING)
+    def plan(value: int) -> int:
+        return value + 1
+
+    @timed(TimingPhase.HARDWARE)
+    async def move_rel(value: int) -> int:
+        return plan(value) + 1
+
+    @timed(TimingPhase.HARDWARE)
+    async def pick_up_tip(value: int) -> int:
+        return await move_rel(value) + await move_rel(value)
+
+    recorder = get_command_timing()
+    recorder.enable(trace=True)
+    try:
+        with recorder.command("pickUpTip"):
+            assert await pick_up_tip(1) == 6
+        histograms = recorder.get_histograms()["pickUpTip"]
+        trace_events = recorder.get_chrome_trace()["traceEvents"]
+    finally:
+        recorder.disable()
+        recorder.reset()
+
+    assert histograms[TimingPhase.HARDWARE].count == 1
+    assert histograms[TimingPhase.MOTION_PLANNING].count == 2
+    assert [event["name"] for event in trace_events if event["cat"] == "hardware"] == [
+        "test_timed_nested_same_phase.<locals>.pick_up_tip"
+    ]
+
+
+def test_same_phase_in_another_thread(subject: CommandTimingRecorder) -> None:
+    """It should record a span whose outer span of that phase is in another thread."""
+
+    def _in_thread() -> None:
+        with subject.span(TimingPhase.DRIVER_IO, "inner"):
+            pass
+
+    with subject.span(TimingPhase.DRIVER_IO, "outer"):
+        thread = threading.Thread(target=_in_thread)
+        thread.start()
+        thread.join()
+
+    assert subject.get_histograms()[UNATTRIBUTED][TimingPhase.DRIVER_IO].count == 2
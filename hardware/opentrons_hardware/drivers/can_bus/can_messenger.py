@@ -1,8 +1,22 @@
 """Can messenger class."""
 from __future__ import annotations
 import asyncio
+from dataclasses import dataclass
 from inspect import Traceback
-from typing import Optional, Callable, Tuple, Dict, Union, List, cast
+from itertools import chain, count, product
+from typing import (
+    Optional,
+    Callable,
+    FrozenSet,
+    Iterable,
+    Tuple,
+    Type,
+    Dict,
+    Union,
+    List,
+    Sequence,
+    cast,
+)
 
 import logging
 
@@ -51,6 +65,68 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+@dataclass(frozen=True)
+class ArbitrationIdFilter:
+    """A message filter that accepts messages by message ID and originating node.
+
+    CanMessenger indexes listeners that use this filter by its IDs, so
+    they are not called, or even checked, for other messages.
+    """
+
+    message_ids: Optional[FrozenSet[MessageId]] = None
+    """Accept these message IDs. If `None`, accept any message ID."""
+
+    originating_node_ids: Optional[FrozenSet[NodeId]] = None
+    """Accept messages from these nodes. If `None`, accept any node."""
+
+    @classmethod
+    def build(
+        cls,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        originating_node_ids: Optional[Iterable[NodeId]] = None,
+    ) -> ArbitrationIdFilter:
+        """Build a filter from any iterables of IDs."""
+        return cls(
+            message_ids=frozenset(message_ids) if message_ids is not None else None,
+            originating_node_ids=(
+                frozenset(originating_node_ids)
+                if originating_node_ids is not None
+                else None
+            ),
+        )
+
+    def __call__(self, arbitration_id: ArbitrationId) -> bool:
+        """Check whether a message is accepted."""
+        return (
+            self.message_ids is None
+            or arbitration_id.parts.message_id in self.message_ids
+        ) and (
+            self.originating_node_ids is None
+            or arbitration_id.parts.originating_node_id in self.originating_node_ids
+        )
+
+    def index_keys(self) -> List[_ListenerIndexKey]:
+        """Get the listener index keys of the messages this filter accepts."""
+        message_ids: List[Optional[int]] = (
+            list(self.message_ids) if self.message_ids is not None else [None]
+        )
+        node_ids: List[Optional[int]] = (
+            list(self.originating_node_ids)
+            if self.originating_node_ids is not None
+            else [None]
+        )
+        return list(product(message_ids, node_ids))
+
+
+_ListenerIndexKey = Tuple[Optional[int], Optional[int]]
+"""Listener index key: a message ID and originating node ID, `None` for any."""
+
+_ListenerEntry = Tuple[
+    int, MessageListenerCallback, Optional[MessageListenerCallbackFilter]
+]
+"""Indexed listener: its registration order, callback, and filter."""
+
+
 _AckResponses = Union[ErrorMessage, Acknowledgement]
 _AckPacket = Tuple[ArbitrationId, _AckResponses]
 _Acks = List[_AckPacket]
@@ -61,40 +137,24 @@ _Gripper_SubNodes: List[NodeId] = [NodeId.gripper_g, NodeId.gripper_z]
 _Head_SubNodes: List[NodeId] = [NodeId.head_l, NodeId.head_r]
 
 
-class AcknowledgeListener:
-    """Helper class for CanMessenger to listen for Acks back from commands."""
+class _ExpectedAcks:
+    """The nodes that have yet to acknowledge a sent message."""
 
-    def __init__(
-        self,
-        can_messenger: CanMessenger,
-        node_id: NodeId,
-        message: MessageDefinition,
-        timeout: float,
-        expected_nodes: List[NodeId],
-    ) -> None:
-        """Build this listener class and ready the queue."""
-        self._can_messenger = can_messenger
-        self._node_id = node_id
-        self._message = message
-        self._timeout = timeout
-        self._event = asyncio.Event()
+    def __init__(self, expected_nodes: List[NodeId]) -> None:
         # todo add ability to know how many nodes will ack to a broadcast
         # we can assume at least 3 for the gantry and head boards
-        self._expected_nodes = expected_nodes
+        self._expected_nodes = expected_nodes.copy()
         self._expected_gripper_subnodes = (
             _Gripper_SubNodes.copy() if NodeId.gripper in expected_nodes else []
         )
         self._expected_head_subnodes = (
             _Head_SubNodes.copy() if NodeId.head in expected_nodes else []
         )
-        self._ack_queue: asyncio.Queue[_AckPacket] = asyncio.Queue()
 
-    def __call__(
-        self, message: MessageDefinition, arbitration_id: ArbitrationId
-    ) -> None:
-        """Called by can messenger when a message arrives."""
-        if isinstance(message, Acknowledgement) or isinstance(message, ErrorMessage):
-            self.handle_ack(message, arbitration_id)
+    @property
+    def done(self) -> bool:
+        """Whether every expected node has responded."""
+        return len(self._expected_nodes) == 0
 
     def _remove_response_subnodes(self, node: NodeId) -> None:
         if node in self._expected_gripper_subnodes:
@@ -109,7 +169,8 @@ class AcknowledgeListener:
             if len(self._expected_head_subnodes) == 0:
                 self._expected_nodes.remove(NodeId.head)
 
-    def _remove_response_node(self, node: NodeId) -> None:
+    def remove(self, node: NodeId) -> None:
+        """Record a response from a node."""
         # this is a bit of a hack, some nodes don't responde with the same originating nodes
         # and respond with their subnodes instead
         if node in self._expected_nodes:
@@ -117,23 +178,54 @@ class AcknowledgeListener:
         else:
             self._remove_response_subnodes(node)
 
+
+def _default_expected_nodes(node_id: NodeId) -> List[NodeId]:
+    if node_id == NodeId.broadcast:
+        return _Basic_Nodes.copy()
+    return [node_id]
+
+
+class AcknowledgeListener:
+    """Helper class for CanMessenger to listen for Acks back from commands."""
+
+    def __init__(
+        self,
+        can_messenger: CanMessenger,
+        node_id: NodeId,
+        message: MessageDefinition,
+        timeout: float,
+        expected_nodes: List[NodeId],
+    ) -> None:
+        """Build this listener class and ready the queue."""
+        self._can_messenger = can_messenger
+        self._node_id = node_id
+        self._message = message
+        self._timeout = timeout
+        self._event = asyncio.Event()
+        self._expected = _ExpectedAcks(expected_nodes)
+        self._ack_queue: asyncio.Queue[_AckPacket] = asyncio.Queue()
+
+    def __call__(
+        self, message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> None:
+        """Called by can messenger when a message arrives."""
+        if isinstance(message, Acknowledgement) or isinstance(message, ErrorMessage):
+            self.handle_ack(message, arbitration_id)
+
     def handle_ack(self, message: _AckResponses, arbitration_id: ArbitrationId) -> None:
         """Add the ack to the queue if it matches the message_index of the sent message."""
         if message.payload.message_index == self._message.payload.message_index:
-            self._remove_response_node(arbitration_id.parts.originating_node_id)
+            self._expected.remove(arbitration_id.parts.originating_node_id)
         self._ack_queue.put_nowait((arbitration_id, message))
         # If we've recieved all responses exit the listener
-        if len(self._expected_nodes) == 0:
+        if self._expected.done:
             self._event.set()
 
     async def send_and_verify_recieved(self) -> ErrorCode:
         """Send the message and wait for an Ack."""
         try:
             self._can_messenger.add_listener(
-                self,
-                lambda arbitration_id: bool(
-                    arbitration_id.parts.message_id in _AckIdFilter
-                ),
+                self, ArbitrationIdFilter.build(message_ids=_AckIdFilter)
             )
             self._event.clear()
             await self._can_messenger.send(self._node_id, self._message)
@@ -157,6 +249,88 @@ class AcknowledgeListener:
         return ErrorCode.ok
 
 
+class BatchAcknowledgeListener:
+    """Helper class for CanMessenger to listen for Acks back from many commands.
+
+    All of the messages are written to the bus before waiting for any acks,
+    so a batch costs about one round trip no matter how many messages it has.
+    """
+
+    def __init__(
+        self,
+        can_messenger: CanMessenger,
+        messages: Sequence[Tuple[NodeId, MessageDefinition]],
+        timeout: float,
+    ) -> None:
+        """Build this listener class."""
+        self._can_messenger = can_messenger
+        self._messages = messages
+        self._timeout = timeout
+        self._event = asyncio.Event()
+        self._outstanding: Dict[int, _ExpectedAcks] = {
+            message.payload.message_index.value: _ExpectedAcks(
+                _default_expected_nodes(node_id)
+            )
+            for node_id, message in messages
+        }
+        self._errors: Dict[int, ErrorCode] = {}
+
+    def __call__(
+        self, message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> None:
+        """Called by can messenger when a message arrives."""
+        if isinstance(message, Acknowledgement) or isinstance(message, ErrorMessage):
+            self.handle_ack(message, arbitration_id)
+
+    def handle_ack(self, message: _AckResponses, arbitration_id: ArbitrationId) -> None:
+        """Record the response against the sent message with the same message_index."""
+        message_index = message.payload.message_index.value
+        expected = self._outstanding.get(message_index)
+        if expected is None:
+            return
+        if isinstance(message, ErrorMessage):
+            self._errors.setdefault(
+                message_index, ErrorCode(message.payload.error_code.value)
+            )
+        expected.remove(arbitration_id.parts.originating_node_id)
+        if expected.done:
+            del self._outstanding[message_index]
+            # If we've recieved all responses exit the listener
+            if not self._outstanding:
+                self._event.set()
+
+    def _result(self, message: MessageDefinition) -> ErrorCode:
+        message_index = message.payload.message_index.value
+        if message_index in self._errors:
+            return self._errors[message_index]
+        if message_index in self._outstanding:
+            return ErrorCode.timeout
+        return ErrorCode.ok
+
+    async def send_and_verify_recieved(self) -> List[ErrorCode]:
+        """Send all the messages and wait for their Acks."""
+        try:
+            self._can_messenger.add_listener(
+                self, ArbitrationIdFilter.build(message_ids=_AckIdFilter)
+            )
+            self._event.clear()
+            for node_id, message in self._messages:
+                await self._can_messenger.send(node_id, message)
+            if self._outstanding:
+                await asyncio.wait_for(
+                    self._event.wait(),
+                    max(1.0, self._timeout),
+                )
+        except asyncio.TimeoutError:
+            log.error(
+                f"Messages did not receive acks for message indices {list(self._outstanding)}"
+            )
+        finally:
+            self._can_messenger.remove_listener(self)
+
+        return [self._result(message) for _, message in self._messages]
+
+
 class CanMessenger:
     """High level can messaging class wrapping a CanDriver.
 
@@ -176,6 +350,10 @@ class CanMessenger:
             MessageListenerCallback,
             Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
         ] = {}
+        self._listener_index: Dict[
+            _ListenerIndexKey, Dict[MessageListenerCallback, _ListenerEntry]
+        ] = {}
+        self._listener_counter = count()
         self._task: Optional[asyncio.Task[None]] = None
 
     async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
@@ -195,10 +373,11 @@ class CanMessenger:
             )
         )
         data = message.payload.serialize()
-        log.debug(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
+                f"payload: {message.payload}"
+            )
         await self._drive.send(
             message=CanMessage(arbitration_id=arbitration_id, data=data)
         )
@@ -213,10 +392,7 @@ class CanMessenger:
         """Send a message and wait for the ack."""
         if len(expected_nodes) == 0:
             log.warning("Expected Nodes should have been specified")
-            if node_id == NodeId.broadcast:
-                expected_nodes = _Basic_Nodes.copy()
-            else:
-                expected_nodes = [node_id]
+            expected_nodes = _default_expected_nodes(node_id)
 
         listener = AcknowledgeListener(
             can_messenger=self,
@@ -227,6 +403,30 @@ class CanMessenger:
         )
         return await listener.send_and_verify_recieved()
 
+    async def ensure_send_batch(
+        self,
+        messages: Sequence[Tuple[NodeId, MessageDefinition]],
+        timeout: float = 3,
+    ) -> List[ErrorCode]:
+        """Send many messages back-to-back and wait for all of their acks.
+
+        Each message must be acked by the node it was sent to, or by the basic
+        nodes if it was broadcast.
+
+        Args:
+            messages: The node to send each message to, and the message.
+            timeout: How long to wait for acks after the last message is sent.
+
+        Returns:
+            The result of each message, in the order they were given.
+        """
+        listener = BatchAcknowledgeListener(
+            can_messenger=self,
+            messages=messages,
+            timeout=timeout,
+        )
+        return await listener.send_and_verify_recieved()
+
     async def __aenter__(self) -> CanMessenger:
         """Start messenger."""
         self.start()
@@ -261,13 +461,60 @@ class CanMessenger:
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
     ) -> None:
-        """Add a message listener."""
+        """Add a message listener.
+
+        If `filter` is an `ArbitrationIdFilter`, the listener is only
+        considered for messages with the IDs it accepts.
+        """
+        self.remove_listener(listener)
         self._listeners[listener] = listener, filter
 
+        entry = (next(self._listener_counter), listener, filter)
+        keys: List[_ListenerIndexKey] = (
+            filter.index_keys()
+            if isinstance(filter, ArbitrationIdFilter)
+            else [(None, None)]
+        )
+        for key in keys:
+            self._listener_index.setdefault(key, {})[listener] = entry
+
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
         if listener in self._listeners:
-            self._listeners.pop(listener)
+            _, filter = self._listeners.pop(listener)
+            keys: List[_ListenerIndexKey] = (
+                filter.index_keys()
+                if isinstance(filter, ArbitrationIdFilter)
+                else [(None, None)]
+            )
+            for key in keys:
+                listeners = self._listener_index[key]
+                del listeners[listener]
+                if not listeners:
+                    del self._listener_index[key]
+
+    def _get_listeners(self, arbitration_id: ArbitrationId) -> List[_ListenerEntry]:
+        """Get the listeners that may accept a message, in registration order."""
+        message_id = arbitration_id.parts.message_id
+        node_id = arbitration_id.parts.originating_node_id
+        buckets = [
+            bucket
+            for bucket in (
+                self._listener_index.get((message_id, node_id)),
+                self._listener_index.get((message_id, None)),
+                self._listener_index.get((None, node_id)),
+                self._listener_index.get((None, None)),
+            )
+            if bucket
+        ]
+
+        if len(buckets) == 1:
+            return list(buckets[0].values())
+
+        return sorted(
+            chain.from_iterable(bucket.values() for bucket in buckets),
+            key=lambda entry: entry[0],
+        )
 
     async def _read_task_shield(self) -> None:
         try:
@@ -287,15 +534,14 @@ class CanMessenger:
             if message_definition:
                 try:
                     build = message_definition.payload_type.build(message.data)
-                    log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug(
+                            f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
+                            f"payload: {build}"
+                        )
+                    self._notify_listeners(
+                        message_definition, build, message.arbitration_id
                     )
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            log.debug("message ignored by filter")
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
                     if (
                         message.arbitration_id.parts.message_id
                         == MessageId.error_message
@@ -306,6 +552,20 @@ class CanMessenger:
             else:
                 log.error(f"Message {message} is not recognized.")
 
+    def _notify_listeners(
+        self,
+        message_definition: Type[MessageDefinition],
+        build: BinarySerializable,
+        arbitration_id: ArbitrationId,
+    ) -> None:
+        """Call the listeners that accept a message."""
+        for _, listener, filter in self._get_listeners(arbitration_id):
+            if filter and not filter(arbitration_id):
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("message ignored by filter")
+                continue
+            listener(message_definition(payload=build), arbitration_id)  # type: ignore[arg-type]
+
     async def _handle_error(self, build: BinarySerializable) -> None:
         err_msg = ErrorMessage(payload=build)  # type: ignore[arg-type]
         error_payload: ErrorMessagePayload = err_msg.payload
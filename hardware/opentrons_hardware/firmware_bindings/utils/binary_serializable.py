@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic, Type
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, TypeVar, Generic, Tuple, Type
 
 
 class BinarySerializableException(BaseException):
@@ -138,6 +138,29 @@ class Int8Field(IntFieldBase):
     FORMAT = "b"
 
 
+_FieldBuilder = Callable[[Any], BinaryFieldBase[Any]]
+
+
+@dataclass(frozen=True)
+class _Codec:
+    """The precompiled packing and unpacking details of a BinarySerializable class."""
+
+    packer: struct.Struct
+    """Packs and unpacks all the fields, in order."""
+
+    names: Tuple[str, ...]
+    """The names of all the fields, in order."""
+
+    init_fields: Tuple[Tuple[int, str, _FieldBuilder], ...]
+    """Position, name and builder of each field passed to the constructor."""
+
+    non_init_fields: Tuple[Tuple[int, str, _FieldBuilder], ...]
+    """Position, name and builder of each field set after construction."""
+
+
+_codecs: Dict[type, _Codec] = {}
+
+
 @dataclass
 class BinarySerializable:
     """Base class of a dataclass that can be serialized/deserialized into bytes.
@@ -157,10 +180,9 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = self._get_codec()
         try:
-            return struct.pack(string, *vals)
+            return codec.packer.pack(*(getattr(self, n).value for n in codec.names))
         except struct.error as e:
             raise SerializationException(str(e))
 
@@ -169,6 +191,7 @@ class BinarySerializable:
         """Create a BinarySerializable from a byte buffer.
 
         The byte buffer must be at least enough bytes to satisfy all fields.
+        It may be a memoryview, which is read without copying.
 
         Extra bytes will be ignored. This is for two reasons:
             - CANFD requires padding to round byte lengths to fixed sizes.
@@ -181,34 +204,43 @@ class BinarySerializable:
         Returns:
             cls
         """
+        codec = cls._get_codec()
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
             # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
+            b = codec.packer.unpack_from(data)
             # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
             # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
-            args = {
-                v.name: v.type.build(b[i])
-                for i, v in enumerate(fields(cls))
-                if not (v.name == "message_index")
-            }
-            message_index = next(
-                (
-                    v.type.build(b[i])
-                    for i, v in enumerate(fields(cls))
-                    if v.name == "message_index"
-                ),
-                None,
-            )
+            args = {name: build(b[i]) for i, name, build in codec.init_fields}
             # Mypy is not liking constructing the derived types.
             ret_instance = cls(**args)  # type: ignore[call-arg]
-            if message_index is not None:
-                ret_instance.message_index = message_index  # type: ignore[attr-defined]
+            for i, name, build in codec.non_init_fields:
+                setattr(ret_instance, name, build(b[i]))
             return ret_instance
         except struct.error as e:
             raise InvalidFieldException(str(e))
 
+    @classmethod
+    def _get_codec(cls) -> _Codec:
+        """Get the precompiled codec for this class, compiling it on first use."""
+        codec = _codecs.get(cls)
+        if codec is None:
+            dataclass_fields = fields(cls)
+            builders = [
+                (i, v.name, v.type.build) for i, v in enumerate(dataclass_fields)
+            ]
+            codec = _Codec(
+                packer=struct.Struct(cls._get_format_string()),
+                names=tuple(v.name for v in dataclass_fields),
+                init_fields=tuple(
+                    b for b, v in zip(builders, dataclass_fields) if v.init
+                ),
+                non_init_fields=tuple(
+                    b for b, v in zip(builders, dataclass_fields) if not v.init
+                ),
+            )
+            _codecs[cls] = codec
+        return codec
+
     @classmethod
     def _get_format_string(cls) -> str:
         """Get the `struct` format string for this class.
@@ -229,7 +261,7 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_codec().packer.size
 
 
 class LittleEndianMixIn:
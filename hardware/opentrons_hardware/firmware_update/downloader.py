@@ -18,11 +18,22 @@ from opentrons_hardware.firmware_bindings.messages import (
     payloads,
     fields,
 )
-from typing import AsyncIterator
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _UnackedChunk:
+    """A chunk that was sent and is waiting for an ACK."""
+
+    message: message_definitions.FirmwareUpdateData
+    size: int
+    deadline: float
+    retransmits: int = 0
+
+
 class FirmwareUpdateDownloader:
     """Class that downloads FW using CAN messages."""
 
@@ -30,50 +41,96 @@ class FirmwareUpdateDownloader:
         """Constructor."""
         self._messenger = messenger
 
-    async def run(
+    async def run(  # noqa: C901
         self,
         node_id: NodeId,
         hex_processor: HexRecordProcessor,
         ack_wait_seconds: float,
+        window_size: int = 1,
+        retransmit_count: int = 0,
     ) -> AsyncIterator[float]:
         """Download hex record chunks to node.
 
+        Chunks are sent as they're produced by the hex processor, with up to
+        `window_size` of them waiting for an ACK at once. A chunk that isn't
+        ACKed in time is sent again, without resending the chunks after it.
+
         Args:
             node_id: The target node id.
             hex_processor: The producer of hex chunks.
             ack_wait_seconds: Number of seconds to wait for an ACK.
+            window_size: Number of chunks that may be waiting for an ACK.
+                1 means each chunk waits for the previous one's ACK.
+            retransmit_count: Number of times to resend a chunk that
+                wasn't ACKed before giving up.
 
         Returns:
             None
         """
-        chunks = list(hex_processor.process(fields.FirmwareUpdateDataField.NUM_BYTES))
-        total_chunks = len(chunks)
+        if window_size < 1:
+            raise ValueError("window_size must be at least 1.")
+
+        chunks = hex_processor.process(fields.FirmwareUpdateDataField.NUM_BYTES)
+        total_bytes = hex_processor.data_size
+        loop = asyncio.get_running_loop()
         with WaitableCallback(self._messenger) as reader:
+            # Chunks waiting for an ACK, by address, in the order they were sent.
+            unacked: Dict[int, _UnackedChunk] = {}
             num_messages = 0
+            acked_bytes = 0
             crc32 = 0
-            for chunk in chunks:
-                logger.debug(
-                    f"Sending chunk {num_messages} to address {chunk.address:x}."
-                )
-                # Create and send message from this chunk
-                data = bytes(chunk.data)
-                data_message = message_definitions.FirmwareUpdateData(
-                    payload=payloads.FirmwareUpdateData.create(
-                        address=chunk.address, data=data
+            chunks_remaining = True
+            while chunks_remaining or unacked:
+                while chunks_remaining and len(unacked) < window_size:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        chunks_remaining = False
+                        break
+                    logger.debug(
+                        f"Sending chunk {num_messages} to address {chunk.address:x}."
                     )
-                )
-                await self._messenger.send(node_id=node_id, message=data_message)
+                    # Create and send message from this chunk
+                    data = bytes(chunk.data)
+                    data_message = message_definitions.FirmwareUpdateData(
+                        payload=payloads.FirmwareUpdateData.create(
+                            address=chunk.address, data=data
+                        )
+                    )
+                    await self._messenger.send(node_id=node_id, message=data_message)
+                    unacked[chunk.address] = _UnackedChunk(
+                        message=data_message,
+                        size=len(data),
+                        deadline=loop.time() + ack_wait_seconds,
+                    )
+                    crc32 = binascii.crc32(data, crc32)
+                    num_messages += 1
+
+                if not unacked:
+                    break
+
+                next_deadline = min(c.deadline for c in unacked.values())
                 try:
                     # Wait for ack.
-                    await asyncio.wait_for(
-                        self._wait_data_message_ack(node_id, reader), ack_wait_seconds
+                    address = await asyncio.wait_for(
+                        self._wait_data_message_ack(node_id, reader),
+                        max(0.0, next_deadline - loop.time()),
                     )
                 except asyncio.TimeoutError:
-                    raise TimeoutResponse(data_message)
+                    await self._retransmit_expired(
+                        node_id,
+                        unacked,
+                        loop.time(),
+                        ack_wait_seconds,
+                        retransmit_count,
+                    )
+                    continue
 
-                crc32 = binascii.crc32(data, crc32)
-                num_messages += 1
-                yield num_messages / total_chunks
+                acked = unacked.pop(address, None)
+                if acked is None:
+                    logger.debug(f"Ignoring ACK for address {address:x}.")
+                    continue
+                acked_bytes += acked.size
+                yield acked_bytes / total_bytes
 
             # Create and send firmware update complete message.
             complete_message = message_definitions.FirmwareUpdateComplete(
@@ -90,17 +147,40 @@ class FirmwareUpdateDownloader:
             except asyncio.TimeoutError:
                 raise TimeoutResponse(complete_message)
 
+    async def _retransmit_expired(
+        self,
+        node_id: NodeId,
+        unacked: Dict[int, "_UnackedChunk"],
+        now: float,
+        ack_wait_seconds: float,
+        retransmit_count: int,
+    ) -> None:
+        """Resend the chunks whose ACKs are overdue."""
+        for address, chunk in unacked.items():
+            if chunk.deadline > now:
+                continue
+            if chunk.retransmits >= retransmit_count:
+                raise TimeoutResponse(chunk.message)
+            chunk.retransmits += 1
+            logger.warning(
+                f"No ACK for chunk at address {address:x}."
+                f" Resending, attempt {chunk.retransmits}."
+            )
+            await self._messenger.send(node_id=node_id, message=chunk.message)
+            chunk.deadline = now + ack_wait_seconds
+
     @staticmethod
-    async def _wait_data_message_ack(node_id: NodeId, reader: WaitableCallback) -> None:
-        """Wait for response to data."""
-        async for response, arbitration_id in reader:
+    async def _wait_data_message_ack(node_id: NodeId, reader: WaitableCallback) -> int:
+        """Wait for response to data, returning the ACKed address."""
+        while True:
+            response, arbitration_id = await reader.read()
             if arbitration_id.parts.originating_node_id == node_id:
                 if isinstance(
                     response, message_definitions.FirmwareUpdateDataAcknowledge
                 ):
                     if response.payload.error_code.value != ErrorCode.ok:
                         raise ErrorResponse(response)
-                    break
+                    return response.payload.address.value
 
     @staticmethod
     async def _wait_update_complete_ack(
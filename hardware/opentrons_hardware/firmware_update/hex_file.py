@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, List, Generator, TextIO
+from typing import Iterable, Iterator, List, Generator, TextIO
 import binascii
 import struct
 import logging
@@ -69,15 +69,37 @@ class BadChunkSizeException(HexFileException):
 def from_hex_file_path(file_path: Path) -> Iterable[HexRecord]:
     """A generator that processes a hex file at file_path."""
     with open(file_path) as hex_file:
-        return from_hex_file(hex_file)
+        yield from from_hex_file(hex_file)
 
 
 def from_hex_file(hex_file: TextIO) -> Iterable[HexRecord]:
     """A generator that processes a hex file contents."""
-    for line in hex_file.readlines():
+    for line in hex_file:
         yield process_line(line)
 
 
+class _HexFileRecords:
+    """The records of a hex file, read again on each iteration."""
+
+    def __init__(self, hex_file: TextIO) -> None:
+        self._hex_file = hex_file
+        self._start = hex_file.tell()
+
+    def __iter__(self) -> Iterator[HexRecord]:
+        self._hex_file.seek(self._start)
+        return iter(from_hex_file(self._hex_file))
+
+
+class _HexFilePathRecords:
+    """The records of the hex file at a path, read again on each iteration."""
+
+    def __init__(self, file_path: Path) -> None:
+        self._file_path = file_path
+
+    def __iter__(self) -> Iterator[HexRecord]:
+        return iter(from_hex_file_path(self._file_path))
+
+
 def process_line(line: str) -> HexRecord:
     """Convert a line in a HEX file into a HexRecord."""
     if len(line) < 11:
@@ -142,19 +164,27 @@ class HexRecordProcessor:
     """
 
     def __init__(self, records: Iterable[HexRecord]) -> None:
-        """Constructor."""
+        """Constructor.
+
+        Args:
+            records: The hex records. These are iterated by data_size as well
+                as by process. Re-iterable collections are read again each
+                time; a one-shot iterator is read into a list up front.
+        """
+        if iter(records) is records:
+            records = list(records)
         self._records = records
         self._start_address: int = 0
 
     @classmethod
     def from_file_path(cls, file_path: Path) -> HexRecordProcessor:
         """Construct from file."""
-        return HexRecordProcessor(from_hex_file_path(file_path))
+        return HexRecordProcessor(_HexFilePathRecords(file_path))
 
     @classmethod
     def from_file(cls, hex_file: TextIO) -> HexRecordProcessor:
         """Construct from file."""
-        return HexRecordProcessor(from_hex_file(hex_file))
+        return HexRecordProcessor(_HexFileRecords(hex_file))
 
     @property
     def start_address(self) -> int:
@@ -164,6 +194,17 @@ class HexRecordProcessor:
         """
         return self._start_address
 
+    @property
+    def data_size(self) -> int:
+        """Get the total number of data bytes that process will produce."""
+        size = 0
+        for record in self._records:
+            if record.record_type == RecordType.Data:
+                size += len(record.data)
+            elif record.record_type == RecordType.EOF:
+                break
+        return size
+
     def process(self, chunk_size: int) -> Generator[Chunk, None, None]:  # noqa: C901
         """Process the records.
 
@@ -139,6 +139,7 @@ class RunUpdate:
         retry_count: int,
         timeout_seconds: float,
         erase: Optional[bool] = True,
+        download_window_size: int = 1,
     ) -> None:
         """Initialize RunUpdate class.
 
@@ -148,6 +149,8 @@ class RunUpdate:
             retry_count: Number of times to retry.
             timeout_seconds: How much to wait for responses.
             erase: Whether to erase flash before updating.
+            download_window_size: Number of firmware chunks to send
+                before waiting for their ACKs.
 
         Returns:
             None
@@ -158,6 +161,7 @@ class RunUpdate:
         self._retry_count = retry_count
         self._timeout_seconds = timeout_seconds
         self._erase = erase
+        self._download_window_size = download_window_size
         self._status_dict = {
             target: (FirmwareUpdateStatus.queued, 0) for target in update_details.keys()
         }
@@ -297,6 +301,9 @@ class RunUpdate:
         else:
             logger.info("Skipping erase step.")
 
+        # A chunk whose ACK was lost may already be in flash, so only resend
+        # chunks when they're windowed and a late ACK is expected to happen.
+        retransmit_count = retry_count if self._download_window_size > 1 else 0
         logger.info(f"Downloading {filepath} to {target.bootloader_node}.")
         with open(filepath) as f:
             hex_processor = HexRecordProcessor.from_file(f)
@@ -304,6 +311,8 @@ class RunUpdate:
                 node_id=target.bootloader_node,
                 hex_processor=hex_processor,
                 ack_wait_seconds=timeout_seconds,
+                window_size=self._download_window_size,
+                retransmit_count=retransmit_count,
             ):
                 await self._status_queue.put(
                     (
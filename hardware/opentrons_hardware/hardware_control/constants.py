@@ -9,3 +9,6 @@ tip_interrupts_per_sec: Final = 100000
 
 interrupts_per_sec: Final = 200000
 """The number of motor interrupts per second."""
+
+move_group_slots: Final = 3
+"""The number of move groups the firmware can hold at once."""
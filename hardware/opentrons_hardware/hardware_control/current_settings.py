@@ -1,5 +1,5 @@
 """Utilities for updating the current settings on the OT3."""
-from typing import Tuple, Union, Type
+from typing import List, Tuple, Union, Type
 import logging
 from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
 from opentrons_hardware.firmware_bindings.messages import payloads
@@ -7,7 +7,7 @@ from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     WriteMotorCurrentRequest,
     GearWriteMotorCurrentRequest,
 )
-from opentrons_hardware.firmware_bindings.constants import ErrorCode
+from opentrons_hardware.firmware_bindings.constants import ErrorCode, NodeId
 from opentrons_hardware.firmware_bindings.utils import UInt32Field
 from .types import NodeMap, NodeList
 
@@ -15,6 +15,8 @@ from .types import NodeMap, NodeList
 CompleteCurrentSettings = NodeMap[Tuple[float, float]]
 PartialCurrentSettings = NodeMap[float]
 
+_CurrentMessage = Union[GearWriteMotorCurrentRequest, WriteMotorCurrentRequest]
+
 log = logging.getLogger(__name__)
 
 
@@ -27,28 +29,37 @@ def _motor_current_message_for(
         return WriteMotorCurrentRequest
 
 
+async def _send_current_messages(
+    can_messenger: CanMessenger,
+    messages: List[Tuple[NodeId, _CurrentMessage]],
+    action: str,
+) -> None:
+    """Send current messages to every node at once, then check each node's ack."""
+    errors = await can_messenger.ensure_send_batch(messages)
+    for (node, _), error in zip(messages, errors):
+        if error != ErrorCode.ok:
+            log.error(f"received error {str(error)} trying to {action} for {str(node)}")
+
+
 async def set_currents(
     can_messenger: CanMessenger,
     current_settings: CompleteCurrentSettings,
     use_tip_motor_message_for: NodeList = [],
 ) -> None:
     """Set hold current and run current for each node."""
-    for node, currents in current_settings.items():
-        motor_message = _motor_current_message_for(node in use_tip_motor_message_for)
-        error = await can_messenger.ensure_send(
-            node_id=node,
-            message=motor_message(
+    messages = [
+        (
+            node,
+            _motor_current_message_for(node in use_tip_motor_message_for)(
                 payload=payloads.MotorCurrentPayload(
                     hold_current=UInt32Field(int(currents[0] * (2**16))),
                     run_current=UInt32Field(int(currents[1] * (2**16))),
                 )
             ),
-            expected_nodes=[node],
         )
-        if error != ErrorCode.ok:
-            log.error(
-                f"received error {str(error)} trying to set currents for {str(node)}"
-            )
+        for node, currents in current_settings.items()
+    ]
+    await _send_current_messages(can_messenger, messages, "set currents")
 
 
 async def set_run_current(
@@ -57,22 +68,19 @@ async def set_run_current(
     use_tip_motor_message_for: NodeList = [],
 ) -> None:
     """Set only the run current for each node."""
-    for node, current in current_settings.items():
-        motor_message = _motor_current_message_for(node in use_tip_motor_message_for)
-        error = await can_messenger.ensure_send(
-            node_id=node,
-            message=motor_message(
+    messages = [
+        (
+            node,
+            _motor_current_message_for(node in use_tip_motor_message_for)(
                 payload=payloads.MotorCurrentPayload(
                     hold_current=UInt32Field(0),
                     run_current=UInt32Field(int(current * (2**16))),
                 )
             ),
-            expected_nodes=[node],
         )
-        if error != ErrorCode.ok:
-            log.error(
-                f"recieved error {str(error)} trying to set run current for {str(node)}"
-            )
+        for node, current in current_settings.items()
+    ]
+    await _send_current_messages(can_messenger, messages, "set run current")
 
 
 async def set_hold_current(
@@ -81,19 +89,16 @@ async def set_hold_current(
     use_tip_motor_message_for: NodeList = [],
 ) -> None:
     """Set only the hold current for each node."""
-    for node, current in current_settings.items():
-        motor_message = _motor_current_message_for(node in use_tip_motor_message_for)
-        error = await can_messenger.ensure_send(
-            node_id=node,
-            message=motor_message(
+    messages = [
+        (
+            node,
+            _motor_current_message_for(node in use_tip_motor_message_for)(
                 payload=payloads.MotorCurrentPayload(
                     hold_current=UInt32Field(int(current * (2**16))),
                     run_current=UInt32Field(0),
                 )
             ),
-            expected_nodes=[node],
         )
-        if error != ErrorCode.ok:
-            log.error(
-                f"recieved error {str(error)} trying to set run current for {str(node)}"
-            )
+        for node, current in current_settings.items()
+    ]
+    await _send_current_messages(can_messenger, messages, "set hold current")
@@ -3,10 +3,10 @@ import logging
 import asyncio
 from dataclasses import dataclass
 from opentrons_hardware.drivers.can_bus.can_messenger import (
+    ArbitrationIdFilter,
     CanMessenger,
     WaitableCallback,
 )
-from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 
 from opentrons_hardware.firmware_bindings.messages import payloads
 from opentrons_hardware.firmware_bindings.messages.message_definitions import (
@@ -96,9 +96,7 @@ async def get_gripper_jaw_motor_param(
     can_messenger: CanMessenger,
 ) -> DriverConfig:
     """Get gripper brushed motor driver params: reference voltage and duty cycle."""
-
-    def _filter(arbitration_id: ArbitrationId) -> bool:
-        return NodeId(arbitration_id.parts.originating_node_id) == NodeId.gripper_g
+    _filter = ArbitrationIdFilter.build(originating_node_ids=[NodeId.gripper_g])
 
     async def _wait_for_response(reader: WaitableCallback) -> DriverConfig:
         """Listener for receiving messages back."""
@@ -0,0 +1,681 @@
+"""Array-wide motion planning.
+
+The functions in this module plan a whole list of moves at once. Instead of
+one ``Move`` object per move, a ``MoveBatch`` holds the moves as a set of
+parallel NumPy arrays, with one row per move (and one column per axis or
+per block, where applicable). Each blending iteration then computes speed
+limits, blocks, and blend checks for every move with array operations.
+
+The results match the scalar functions in ``move_utils``, which remain the
+reference implementation, to within floating point rounding. To keep them
+that close:
+
+- Calculations loop over axes in the same order as the scalar code, because
+  some per-axis steps depend on the result of the previous axis, and only
+  vectorize across moves.
+- Squares and norms are computed the way the scalar code computes them for
+  a single value or vector, so blocks that are empty there, like the speed
+  changes of a move that stays at its starting speed, are empty here too.
+- Blocks keep the ``final_speed`` and ``time`` they were constructed with,
+  even if their distance is later trimmed, just like ``Block`` objects.
+"""
+import dataclasses
+import logging
+from typing import Generic, Iterable, List, Set, Tuple, TYPE_CHECKING, cast
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisConstraints,
+    Block,
+    Coordinates,
+    CoordinateValue,
+    Move,
+    MoveTarget,
+    AxisKey,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+log = logging.getLogger(__name__)
+
+_BLOCK_COUNT = 3
+
+
+@dataclasses.dataclass
+class AxisConstraintArrays(Generic[AxisKey]):
+    """System constraints as arrays, one entry per axis.
+
+    Axes without constraints get NaN values. Like the scalar planner, the
+    batch planner only raises a KeyError for them if it needs their values.
+    """
+
+    axes: List[AxisKey]
+    max_acceleration: "NDArray[np.float64]"
+    max_speed_discont: "NDArray[np.float64]"
+    max_direction_change_speed_discont: "NDArray[np.float64]"
+    max_speed: "NDArray[np.float64]"
+
+    @classmethod
+    def build(
+        cls, constraints: SystemConstraints[AxisKey], axes: List[AxisKey]
+    ) -> "AxisConstraintArrays[AxisKey]":
+        """Build constraint arrays in the order of the given axes."""
+        missing = AxisConstraints.build(np.nan, np.nan, np.nan, np.nan)
+        axis_constraints = [constraints.get(a, missing) for a in axes]
+        return cls(
+            axes=axes,
+            max_acceleration=np.array(
+                [c.max_acceleration for c in axis_constraints], dtype=np.float64
+            ),
+            max_speed_discont=np.array(
+                [c.max_speed_discont for c in axis_constraints], dtype=np.float64
+            ),
+            max_direction_change_speed_discont=np.array(
+                [c.max_direction_change_speed_discont for c in axis_constraints],
+                dtype=np.float64,
+            ),
+            max_speed=np.array(
+                [c.max_speed for c in axis_constraints], dtype=np.float64
+            ),
+        )
+
+    def check_axis(self, index: int) -> None:
+        """Raise a KeyError if an axis has no constraints."""
+        if np.isnan(self.max_acceleration[index]):
+            raise KeyError(self.axes[index])
+
+
+@dataclasses.dataclass
+class MoveBatch:
+    """A list of moves, stored as parallel arrays.
+
+    Per-move arrays have shape ``(moves,)``, ``unit_vector`` has shape
+    ``(moves, axes)``, and the block arrays have shape ``(moves, 3)``.
+    """
+
+    unit_vector: "NDArray[np.float64]"
+    distance: "NDArray[np.float64]"
+    max_speed: "NDArray[np.float64]"
+    block_distance: "NDArray[np.float64]"
+    block_initial_speed: "NDArray[np.float64]"
+    block_acceleration: "NDArray[np.float64]"
+    block_final_speed: "NDArray[np.float64]"
+    block_time: "NDArray[np.float64]"
+
+    def __len__(self) -> int:
+        """Get the number of moves in the batch."""
+        return len(self.distance)
+
+    @property
+    def initial_speed(self) -> "NDArray[np.float64]":
+        """Get each move's initial speed, as in `Move.initial_speed`."""
+        result = np.zeros(len(self), dtype=np.float64)
+        found = np.zeros(len(self), dtype=bool)
+        for i in range(_BLOCK_COUNT):
+            use = ~found & (self.block_distance[:, i] != 0)
+            result[use] = self.block_initial_speed[use, i]
+            found |= use
+        return result
+
+    @property
+    def final_speed(self) -> "NDArray[np.float64]":
+        """Get each move's final speed, as in `Move.final_speed`."""
+        result = np.zeros(len(self), dtype=np.float64)
+        found = np.zeros(len(self), dtype=bool)
+        for i in reversed(range(_BLOCK_COUNT)):
+            use = ~found & (self.block_distance[:, i] != 0)
+            result[use] = self.block_final_speed[use, i]
+            found |= use
+        return result
+
+    def with_dummy_start_end(self) -> "MoveBatch":
+        """Get a copy of this batch with dummy moves added to the start and end."""
+        dummy_unit_vector = np.zeros(self.unit_vector.shape[1], dtype=np.float64)
+        dummy_unit_vector[0] = 1.0
+        zero_blocks = np.zeros((1, _BLOCK_COUNT), dtype=np.float64)
+
+        def _pad(
+            values: "NDArray[np.float64]", dummy: "NDArray[np.float64]"
+        ) -> "NDArray[np.float64]":
+            return cast(
+                "NDArray[np.float64]",
+                np.concatenate((dummy, values, dummy)),  # type: ignore[no-untyped-call]
+            )
+
+        return MoveBatch(
+            unit_vector=_pad(self.unit_vector, dummy_unit_vector[np.newaxis, :]),
+            distance=_pad(self.distance, np.zeros(1, dtype=np.float64)),
+            max_speed=_pad(self.max_speed, np.zeros(1, dtype=np.float64)),
+            block_distance=_pad(self.block_distance, zero_blocks),
+            block_initial_speed=_pad(self.block_initial_speed, zero_blocks),
+            block_acceleration=_pad(self.block_acceleration, zero_blocks),
+            block_final_speed=_pad(self.block_final_speed, zero_blocks),
+            block_time=_pad(self.block_time, zero_blocks),
+        )
+
+    def to_moves(self, axes: List[AxisKey]) -> List[Move[AxisKey]]:
+        """Convert the batch into a list of `Move` objects."""
+        moves: List[Move[AxisKey]] = []
+        for row in range(len(self)):
+            blocks = tuple(
+                _restore_block(
+                    distance=self.block_distance[row, i],
+                    initial_speed=self.block_initial_speed[row, i],
+                    acceleration=self.block_acceleration[row, i],
+                    final_speed=self.block_final_speed[row, i],
+                    time=self.block_time[row, i],
+                )
+                for i in range(_BLOCK_COUNT)
+            )
+            moves.append(
+                Move(
+                    unit_vector=dict(zip(axes, self.unit_vector[row])),
+                    distance=self.distance[row],
+                    max_speed=self.max_speed[row],
+                    blocks=blocks,  # type: ignore[arg-type]
+                )
+            )
+        return moves
+
+
+def _restore_block(
+    distance: np.float64,
+    initial_speed: np.float64,
+    acceleration: np.float64,
+    final_speed: np.float64,
+    time: np.float64,
+) -> Block:
+    """Create a Block with precomputed values, without recalculating them."""
+    block: Block = Block.__new__(Block)
+    block.distance = distance
+    block.initial_speed = initial_speed
+    block.acceleration = acceleration
+    block.final_speed = final_speed
+    block.time = time
+    return block
+
+
+def _row_norms(values: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Get the norm of each row, the way `np.linalg.norm` gets a vector's norm.
+
+    A norm along an axis sums the squares in a different order than the dot
+    product `np.linalg.norm` uses for a single vector, so take it row by row.
+    """
+    return np.array(
+        [np.linalg.norm(row) for row in values],  # type: ignore[no-untyped-call]
+        dtype=np.float64,
+    )
+
+
+def _square(values: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    """Square values, like `value**2` does for a single float.
+
+    `np.power` can use a vectorized `pow` that isn't correctly rounded, so
+    `sqrt(x**2)` may not give back `x`, and blocks that should be empty aren't.
+    """
+    return cast("NDArray[np.float64]", np.square(values))
+
+
+def _block_final_speed(
+    distance: "NDArray[np.float64]",
+    initial_speed: "NDArray[np.float64]",
+    acceleration: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Compute block final speeds, as in `Block.final_speed`."""
+    speed_squared: "NDArray[np.float64]" = (
+        _square(initial_speed) + acceleration * distance * 2
+    )
+    negative: "NDArray[np.bool_]" = speed_squared < 0
+    if np.any(negative):
+        log.warning(
+            f"Block encountered negative value in final_speed "
+            f"({speed_squared[negative]}). "
+            f"Setting Block.final_speed to 0.0 instead."
+        )
+    return cast(
+        "NDArray[np.float64]",
+        np.sqrt(np.where(negative, np.float64(0.0), speed_squared)),
+    )
+
+
+def _block_time(
+    distance: "NDArray[np.float64]",
+    initial_speed: "NDArray[np.float64]",
+    acceleration: "NDArray[np.float64]",
+    final_speed: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Compute block durations, as in `Block.time`."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        accelerating: "NDArray[np.float64]" = (
+            final_speed - initial_speed
+        ) / acceleration
+        coasting: "NDArray[np.float64]" = distance / initial_speed
+    return cast(
+        "NDArray[np.float64]",
+        np.where(
+            acceleration != 0,
+            accelerating,
+            np.where(initial_speed != 0, coasting, np.float64(0.0)),
+        ),
+    )
+
+
+def targets_to_batch(
+    initial: Coordinates[AxisKey, CoordinateValue],
+    targets: List[MoveTarget[AxisKey]],
+    constraints: SystemConstraints[AxisKey],
+) -> Tuple[List[AxisKey], MoveBatch]:
+    """Transform a list of MoveTargets into a batch of unblended moves.
+
+    Equivalent to `move_utils.targets_to_moves`.
+
+    Returns:
+        The axes of the batch's columns, in order, and the batch itself.
+    """
+    all_axes: Set[AxisKey] = set()
+    for target in targets:
+        all_axes.update(set(target.position.keys()))
+    axes = list({k: None for k in all_axes}.keys())
+    axis_constraints = AxisConstraintArrays.build(constraints, axes)
+
+    initial_checked = {k: np.float64(initial.get(k, 0)) for k in axes}
+    positions = [initial_checked] + [
+        {k: np.float64(target.position.get(k, 0)) for k in axes} for target in targets
+    ]
+    position_array = np.array([list(p.values()) for p in positions], dtype=np.float64)
+
+    displacement = position_array[1:] - position_array[:-1]
+    distance = _row_norms(displacement)
+
+    for i, d in enumerate(distance):
+        if not d or np.array_equal(position_array[i], position_array[i + 1]):
+            raise ZeroLengthMoveError(positions[i], positions[i + 1])
+
+    unit_vector = displacement / distance[:, np.newaxis]
+
+    # limit each target speed to fall inside the max speed of every axis
+    target_speed = np.array([t.max_speed for t in targets], dtype=np.float64)
+    scale = np.ones(len(targets), dtype=np.float64)
+    for a in range(len(axes)):
+        speed = unit_vector[:, a] * target_speed
+        if np.any(speed != 0.0):
+            axis_constraints.check_axis(a)
+        with np.errstate(divide="ignore"):
+            axis_ratio = axis_constraints.max_speed[a] / np.abs(speed)
+        limit = (speed != 0.0) & (axis_ratio < scale)
+        scale = np.where(limit, axis_ratio, scale)
+    max_speed: "NDArray[np.float64]" = target_speed * scale
+
+    third_distance: "NDArray[np.float64]" = distance / 3
+    block_distance = np.repeat(third_distance[:, np.newaxis], _BLOCK_COUNT, axis=1)
+    block_initial_speed = np.repeat(max_speed[:, np.newaxis], _BLOCK_COUNT, axis=1)
+    block_acceleration = np.zeros_like(block_distance)
+    block_final_speed = _block_final_speed(
+        block_distance, block_initial_speed, block_acceleration
+    )
+    block_time = _block_time(
+        block_distance, block_initial_speed, block_acceleration, block_final_speed
+    )
+
+    return axes, MoveBatch(
+        unit_vector=unit_vector,
+        distance=distance,
+        max_speed=max_speed,
+        block_distance=block_distance,
+        block_initial_speed=block_initial_speed,
+        block_acceleration=block_acceleration,
+        block_final_speed=block_final_speed,
+        block_time=block_time,
+    )
+
+
+def _find_initial_speed(
+    constraints: "AxisConstraintArrays[AxisKey]",
+    moves: MoveBatch,
+    prev_moves: MoveBatch,
+) -> "NDArray[np.float64]":
+    """Get each move's initial speed, as in `move_utils.find_initial_speed`."""
+    initial_speed = moves.initial_speed
+    prev_final_speed = prev_moves.final_speed
+    prev_is_moving: "NDArray[np.bool_]" = prev_moves.distance > FLOAT_THRESHOLD
+
+    for a in range(moves.unit_vector.shape[1]):
+        component = moves.unit_vector[:, a]
+        active = ~(np.abs(component * initial_speed) < FLOAT_THRESHOLD)
+        prev_component = np.where(
+            prev_is_moving, prev_moves.unit_vector[:, a], np.float64(0)
+        )
+
+        from_stop = (prev_component == 0) | (prev_final_speed == 0)
+        same_direction = ~from_stop & (prev_component * component > 0)
+        changed_direction = ~from_stop & (prev_component * component < 0)
+        if np.any(active & ~(from_stop | same_direction | changed_direction)):
+            assert False, "planning initial speed failed"
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            limit = np.select(  # type: ignore[no-untyped-call]
+                [from_stop, same_direction],
+                [
+                    np.abs(constraints.max_speed_discont[a] / component),
+                    np.abs(
+                        np.maximum(
+                            np.abs(prev_final_speed * prev_component),
+                            constraints.max_speed_discont[a],
+                        )
+                        / component
+                    ),
+                ],
+                np.abs(constraints.max_direction_change_speed_discont[a] / component),
+            )
+        initial_speed = np.where(
+            active, np.minimum(limit, initial_speed), initial_speed
+        )
+
+    return initial_speed
+
+
+def _find_final_speed(
+    constraints: "AxisConstraintArrays[AxisKey]",
+    moves: MoveBatch,
+    next_moves: MoveBatch,
+) -> "NDArray[np.float64]":
+    """Get each move's final speed, as in `move_utils.find_final_speed`."""
+    final_speed = moves.final_speed
+    next_initial_speed = next_moves.initial_speed
+    next_is_moving: "NDArray[np.bool_]" = next_moves.distance > FLOAT_THRESHOLD
+
+    for a in range(moves.unit_vector.shape[1]):
+        component = moves.unit_vector[:, a]
+        active = ~(np.abs(component * final_speed) < FLOAT_THRESHOLD)
+        next_component = np.where(
+            next_is_moving, next_moves.unit_vector[:, a], np.float64(0)
+        )
+
+        stopping = (next_component == 0) | (next_initial_speed == 0)
+        same_direction = ~stopping & (next_component * component > 0)
+        changed_direction = ~stopping & (next_component * component < 0)
+        if np.any(active & ~(stopping | same_direction | changed_direction)):
+            assert False, "planning final speed failed"
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            limit = np.select(  # type: ignore[no-untyped-call]
+                [stopping, same_direction],
+                [
+                    np.abs(constraints.max_speed_discont[a] / component),
+                    np.abs(
+                        np.maximum(
+                            constraints.max_speed_discont[a],
+                            np.abs(next_initial_speed * next_component),
+                        )
+                        / component
+                    ),
+                ],
+                np.abs(constraints.max_direction_change_speed_discont[a] / component),
+            )
+        final_speed = np.where(active, np.minimum(limit, final_speed), final_speed)
+
+    return final_speed
+
+
+def _achievable_final(
+    constraints: "AxisConstraintArrays[AxisKey]",
+    moves: MoveBatch,
+    initial_speed: "NDArray[np.float64]",
+    final_speed: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Limit final speeds to what is achievable, as in `move_utils.achievable_final`."""
+    for a in range(moves.unit_vector.shape[1]):
+        component = moves.unit_vector[:, a]
+        active = component != 0
+        max_final_velocity_sq = (
+            _square(initial_speed * component)
+            + 2 * constraints.max_acceleration[a] * moves.distance
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            max_final_velocity = (
+                np.copysign(
+                    np.sqrt(max_final_velocity_sq) / component,
+                    final_speed - initial_speed,
+                )
+                + initial_speed
+            )
+        constrained = np.copysign(
+            np.minimum(np.abs(max_final_velocity), np.abs(final_speed)), final_speed
+        )
+        final_speed = np.where(active, constrained, final_speed)
+
+    return final_speed
+
+
+def _check_less_or_close(
+    constraint: "NDArray[np.float64]", values: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    return cast(
+        "NDArray[np.bool_]",
+        (np.abs(values) <= constraint) | np.isclose(values, constraint),
+    )
+
+
+def _build_blocks(
+    constraints: "AxisConstraintArrays[AxisKey]",
+    moves: MoveBatch,
+    initial_speed: "NDArray[np.float64]",
+    final_speed: "NDArray[np.float64]",
+) -> MoveBatch:
+    """Build each move's blocks, as in `move_utils.build_blocks`."""
+    distance = moves.distance
+    max_speed = moves.max_speed
+
+    for speed, name in ((initial_speed, "initial"), (final_speed, "final")):
+        exceeds = ~((np.abs(speed) <= max_speed) | np.isclose(np.abs(speed), max_speed))
+        if np.any(exceeds):
+            row = int(np.argmax(exceeds))
+            assert (
+                False
+            ), f"{name} speed {speed[row]} exceeds max speed {max_speed[row]}"
+
+    max_acc = np.where(
+        moves.unit_vector != 0, constraints.max_acceleration, np.float64(0.0)
+    )
+    acc_v = _row_norms(max_acc)[:, np.newaxis] * moves.unit_vector
+    for a in range(acc_v.shape[1]):
+        a_i = acc_v[:, a]
+        over = np.abs(a_i) > max_acc[:, a]
+        acc_v[over] *= (max_acc[over, a] / a_i[over])[:, np.newaxis]
+    max_acceleration = _row_norms(acc_v)
+
+    initial_speed_sq = _square(initial_speed)
+    final_speed_sq = _square(final_speed)
+
+    max_achievable_speed = np.sqrt(
+        0.5 * (2 * max_acceleration * distance + initial_speed_sq + final_speed_sq)
+    )
+    max_speed = np.minimum(max_achievable_speed, max_speed)
+    max_speed_sq = _square(max_speed)
+
+    first_distance = np.abs(max_speed_sq - initial_speed_sq) / (2 * max_acceleration)
+    first_final_speed = _block_final_speed(
+        first_distance, initial_speed, max_acceleration
+    )
+    first_time = _block_time(
+        first_distance, initial_speed, max_acceleration, first_final_speed
+    )
+
+    last_acceleration = -max_acceleration
+    last_distance = np.abs(max_speed_sq - final_speed_sq) / (2 * max_acceleration)
+    last_final_speed = _block_final_speed(
+        last_distance, first_final_speed, last_acceleration
+    )
+    last_time = _block_time(
+        last_distance, first_final_speed, last_acceleration, last_final_speed
+    )
+
+    # see move_utils.build_blocks: trim triangle moves that overshoot, leaving
+    # the blocks' final speed and time as originally computed
+    overshoot = first_distance + last_distance > (distance + FLOAT_THRESHOLD)
+    trimmed_max_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+    first_distance = np.where(
+        overshoot,
+        np.abs(trimmed_max_speed_sq - initial_speed_sq) / (2 * max_acceleration),
+        first_distance,
+    )
+    last_distance = np.where(
+        overshoot,
+        np.abs(trimmed_max_speed_sq - final_speed_sq) / (2 * max_acceleration),
+        last_distance,
+    )
+
+    has_coast = first_distance + last_distance < (distance - FLOAT_THRESHOLD)
+    zero = np.zeros_like(distance)
+    coast_distance = np.where(has_coast, distance - first_distance - last_distance, 0)
+    coast_initial_speed = np.where(has_coast, first_final_speed, 0)
+    coast_final_speed = _block_final_speed(coast_distance, coast_initial_speed, zero)
+    coast_time = _block_time(
+        coast_distance, coast_initial_speed, zero, coast_final_speed
+    )
+
+    return MoveBatch(
+        unit_vector=moves.unit_vector,
+        distance=distance,
+        max_speed=moves.max_speed,
+        block_distance=np.stack((first_distance, coast_distance, last_distance), 1),
+        block_initial_speed=np.stack(
+            (initial_speed, coast_initial_speed, first_final_speed), 1
+        ),
+        block_acceleration=np.stack((max_acceleration, zero, last_acceleration), 1),
+        block_final_speed=np.stack(
+            (first_final_speed, coast_final_speed, last_final_speed), 1
+        ),
+        block_time=np.stack((first_time, coast_time, last_time), 1),
+    )
+
+
+def _take(moves: MoveBatch, rows: slice) -> MoveBatch:
+    return MoveBatch(
+        **{
+            field.name: getattr(moves, field.name)[rows]
+            for field in dataclasses.fields(moves)
+        }
+    )
+
+
+def build_batch(
+    constraints: "AxisConstraintArrays[AxisKey]", to_blend: MoveBatch
+) -> MoveBatch:
+    """Build every move from its neighbors, as in `move_utils.build_move`.
+
+    Args:
+        constraints: The system constraints, as arrays.
+        to_blend: The moves to build, with a leading and trailing move
+            that act as the neighbors of the first and last moves.
+
+    Returns:
+        The built moves, without the leading and trailing moves.
+    """
+    moves = _take(to_blend, slice(1, -1))
+    prev_moves = _take(to_blend, slice(None, -2))
+    next_moves = _take(to_blend, slice(2, None))
+
+    initial_speed = _find_initial_speed(constraints, moves, prev_moves)
+    final_speed = _find_final_speed(constraints, moves, next_moves)
+    final_speed = _achievable_final(constraints, moves, initial_speed, final_speed)
+
+    return _build_blocks(constraints, moves, initial_speed, final_speed)
+
+
+def all_blended_batch(
+    constraints: "AxisConstraintArrays[AxisKey]", moves: MoveBatch
+) -> bool:
+    """Check if the moves in the batch are all blended.
+
+    Equivalent to `move_utils.all_blended`.
+    """
+    if len(moves) < 2:
+        return True
+
+    dist_sum = (
+        0 + moves.block_distance[:, 0] + moves.block_distance[:, 1]
+    ) + moves.block_distance[:, 2]
+    dist_matches = ~(
+        (np.abs(dist_sum - moves.distance) > FLOAT_THRESHOLD)
+        | ~np.isclose(dist_sum, moves.distance)
+    )
+    if not np.all(dist_matches[:-1] & dist_matches[1:]):
+        return False
+
+    first = _take(moves, slice(None, -1))
+    second = _take(moves, slice(1, None))
+
+    for a in range(moves.unit_vector.shape[1]):
+        constraints.check_axis(a)
+        final_speed = first.block_final_speed[:, -1] * first.unit_vector[:, a]
+        initial_speed = second.block_initial_speed[:, 0] * second.unit_vector[:, a]
+        same_direction = first.unit_vector[:, a] * second.unit_vector[:, a] > 0
+
+        discont = constraints.max_speed_discont[a]
+        speeds_match = np.abs(initial_speed - final_speed) < FLOAT_THRESHOLD
+        under_discont: "NDArray[np.bool_]" = _check_less_or_close(
+            discont, final_speed
+        ) | _check_less_or_close(discont, initial_speed)
+
+        change_discont = constraints.max_direction_change_speed_discont[a]
+        under_change_discont: "NDArray[np.bool_]" = _check_less_or_close(
+            change_discont, final_speed
+        ) | _check_less_or_close(change_discont, initial_speed)
+
+        ok = np.where(
+            same_direction, speeds_match | under_discont, under_change_discont
+        )
+        if not np.all(ok):
+            return False
+
+    return True
+
+
+def plan_batch(
+    origin: Coordinates[AxisKey, CoordinateValue],
+    target_list: List[MoveTarget[AxisKey]],
+    constraints: SystemConstraints[AxisKey],
+    iteration_limit: int,
+) -> Tuple[bool, List[Tuple[List[AxisKey], MoveBatch, bool]]]:
+    """Create and blend moves from targets, one array-wide pass per iteration.
+
+    Returns:
+        Whether the moves converged, and the result of each iteration:
+        the axes, the built moves, and whether the moves were blended.
+    """
+    axes, initial_moves = targets_to_batch(origin, target_list, constraints)
+    axis_constraints = AxisConstraintArrays.build(constraints, axes)
+    to_blend = initial_moves.with_dummy_start_end()
+    iterations: List[Tuple[List[AxisKey], MoveBatch, bool]] = []
+
+    for i in range(iteration_limit):
+        log.debug(f"Motion blending iteration: {i}")
+        built = build_batch(axis_constraints, to_blend)
+        is_blended = all_blended_batch(axis_constraints, built)
+        iterations.append((axes, built, is_blended))
+        if is_blended:
+            return True, iterations
+        to_blend = built.with_dummy_start_end()
+
+    return False, iterations
+
+
+def batch_log_to_moves(
+    iterations: Iterable[Tuple[List[AxisKey], MoveBatch, bool]]
+) -> List[List[Move[AxisKey]]]:
+    """Convert batch planning iterations into a `MoveManager` blend log."""
+    blend_log: List[List[Move[AxisKey]]] = []
+    for axes, moves, is_blended in iterations:
+        move_list = moves.to_moves(axes)
+        if not is_blended:
+            move_list = [Move.build_dummy(axes)] + move_list + [Move.build_dummy(axes)]
+        blend_log.append(move_list)
+    return blend_log
@@ -16,12 +16,11 @@ async def set_enable_motor(
     nodes: Set[NodeId],
 ) -> None:
     """Set enable motor each node."""
-    for node in nodes:
-        error = await can_messenger.ensure_send(
-            node_id=node,
-            message=EnableMotorRequest(),
-            expected_nodes=[node],
-        )
+    node_list = list(nodes)
+    errors = await can_messenger.ensure_send_batch(
+        [(node, EnableMotorRequest()) for node in node_list]
+    )
+    for node, error in zip(node_list, errors):
         if error != ErrorCode.ok:
             log.error(f"recieved error {str(error)} trying to enable {str(node)} ")
 
@@ -31,11 +30,10 @@ async def set_disable_motor(
     nodes: Set[NodeId],
 ) -> None:
     """Set disable motor each node."""
-    for node in nodes:
-        error = await can_messenger.ensure_send(
-            node_id=node,
-            message=DisableMotorRequest(),
-            expected_nodes=[node],
-        )
+    node_list = list(nodes)
+    errors = await can_messenger.ensure_send_batch(
+        [(node, DisableMotorRequest()) for node in node_list]
+    )
+    for node, error in zip(node_list, errors):
         if error != ErrorCode.ok:
             log.error(f"recieved error {str(error)} trying to disable {str(node)} ")
@@ -3,6 +3,7 @@ import asyncio
 from typing import Set, Tuple
 import logging
 from opentrons_hardware.drivers.can_bus.can_messenger import (
+    ArbitrationIdFilter,
     CanMessenger,
     WaitableCallback,
     MultipleMessagesWaitableCallback,
@@ -13,10 +14,8 @@ from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     UpdateMotorPositionEstimationRequest,
     UpdateMotorPositionEstimationResponse,
 )
-from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
-    MessageId,
     MotorPositionFlags,
 )
 
@@ -61,11 +60,9 @@ async def get_motor_position(
     """Request node to respond with motor and encoder status."""
     data: MotorPositionStatus = {}
 
-    def _listener_filter(arbitration_id: ArbitrationId) -> bool:
-        return (NodeId(arbitration_id.parts.originating_node_id) in nodes) and (
-            MessageId(arbitration_id.parts.message_id)
-            == MotorPositionResponse.message_id
-        )
+    _listener_filter = ArbitrationIdFilter.build(
+        message_ids=[MotorPositionResponse.message_id], originating_node_ids=nodes
+    )
 
     with MultipleMessagesWaitableCallback(
         can_messenger,
@@ -115,12 +112,10 @@ async def update_motor_position_estimation(
     Request node to update motor position from its encoder and respond
     with updated motor and encoder status.
     """
-
-    def _listener_filter(arbitration_id: ArbitrationId) -> bool:
-        return (NodeId(arbitration_id.parts.originating_node_id) in nodes) and (
-            MessageId(arbitration_id.parts.message_id)
-            == UpdateMotorPositionEstimationResponse.message_id
-        )
+    _listener_filter = ArbitrationIdFilter.build(
+        message_ids=[UpdateMotorPositionEstimationResponse.message_id],
+        originating_node_ids=nodes,
+    )
 
     data = {}
 
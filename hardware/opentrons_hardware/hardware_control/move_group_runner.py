@@ -1,5 +1,6 @@
 """Class that schedules motion on can bus."""
 import asyncio
+import contextlib
 from collections import defaultdict
 import logging
 from typing import List, Set, Tuple, Iterator, Union, Optional
@@ -14,7 +15,10 @@ from opentrons_hardware.firmware_bindings.constants import (
     GearMotorId,
     MoveAckId,
 )
-from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
+from opentrons_hardware.drivers.can_bus.can_messenger import (
+    ArbitrationIdFilter,
+    CanMessenger,
+)
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
 from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     ClearAllMoveGroupsRequest,
@@ -40,6 +44,7 @@ from opentrons_hardware.firmware_bindings.messages.payloads import (
 )
 from .constants import (
     interrupts_per_sec,
+    move_group_slots,
     tip_interrupts_per_sec,
     brushed_motor_interrupts_per_sec,
 )
@@ -102,28 +107,42 @@ class MoveGroupRunner:
                     return True
         return False
 
-    async def prep(self, can_messenger: CanMessenger) -> None:
+    async def prep(
+        self, can_messenger: CanMessenger, clear_groups: bool = True
+    ) -> None:
         """Prepare the move group. The first thing that happens during run().
 
         prep() and execute() can be used to replace a single call to run() to
         ensure tighter timing, if you want something else to start as soon as
         possible to the actual execution of the move.
+
+        Args:
+            can_messenger: a can messenger
+            clear_groups: Whether to clear every group on the nodes first.
+                Only skip this if this runner's groups are known to be empty,
+                because groups are not overwritten, only added to.
         """
         if not self._has_moves(self._move_groups):
             log.debug("No moves. Nothing to do.")
             return
-        await self._clear_groups(can_messenger)
+        if clear_groups:
+            await self._clear_groups(can_messenger)
         await self._send_groups(can_messenger)
         self._is_prepped = True
 
     async def execute(
-        self, can_messenger: CanMessenger
+        self, can_messenger: CanMessenger, started: Optional[asyncio.Event] = None
     ) -> NodeDict[Tuple[float, float, bool, bool]]:
         """Execute a pre-prepared move group. The second thing that run() does.
 
         prep() and execute() can be used to replace a single call to run() to
         ensure tighter timing, if you want something else to start as soon as
         possible to the actual execution of the move.
+
+        Args:
+            can_messenger: a can messenger
+            started: An event to set once the nodes have acknowledged the
+                request to execute the first group.
         """
         if not self._has_moves(self._move_groups):
             log.debug("No moves. Nothing to do.")
@@ -131,7 +150,9 @@ class MoveGroupRunner:
         if not self._is_prepped:
             raise RuntimeError("A group must be prepped before it can be executed.")
         try:
-            move_completion_data = await self._move(can_messenger, self._start_at_index)
+            move_completion_data = await self._move(
+                can_messenger, self._start_at_index, started
+            )
         except RuntimeError:
             log.error("raising error from Move group runner")
             raise
@@ -311,23 +332,125 @@ class MoveGroupRunner:
         return TipActionRequest(payload=tip_action_payload)
 
     async def _move(
-        self, can_messenger: CanMessenger, start_at_index: int
+        self,
+        can_messenger: CanMessenger,
+        start_at_index: int,
+        started: Optional[asyncio.Event] = None,
     ) -> _Completions:
         """Run all the move groups."""
-        scheduler = MoveScheduler(self._move_groups, start_at_index)
+        scheduler = MoveScheduler(self._move_groups, start_at_index, started)
         try:
-            can_messenger.add_listener(scheduler)
+            can_messenger.add_listener(
+                scheduler,
+                ArbitrationIdFilter.build(
+                    message_ids=[
+                        MoveCompleted.message_id,
+                        TipActionResponse.message_id,
+                        ErrorMessage.message_id,
+                    ]
+                ),
+            )
             completions = await scheduler.run(can_messenger)
         finally:
             can_messenger.remove_listener(scheduler)
         return completions
 
 
+class MoveGroupPipeline:
+    """Run move groups back to back, sending each while the one before executes.
+
+    A MoveGroupRunner sends all of its groups before executing the first,
+    which delays the start of the first by the time to send them all, and
+    is limited by how many groups the firmware holds. Here each group gets
+    its own firmware group slot, and the next group is sent as soon as the
+    nodes have started the current one, without clearing the groups. Once
+    every slot is used, the pipeline waits for the running group, clears
+    all groups, and starts over from the first slot.
+    """
+
+    def __init__(
+        self,
+        move_groups: MoveGroups,
+        ignore_stalls: bool = False,
+        slots: int = move_group_slots,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            move_groups: The move groups to run, in order.
+            ignore_stalls: Depends on the disableStallDetection feature flag
+            slots: How many firmware move groups to use.
+        """
+        self._runners = [
+            MoveGroupRunner(
+                move_groups=[move_group],
+                start_at_index=index % slots,
+                ignore_stalls=ignore_stalls,
+            )
+            for index, move_group in enumerate(
+                group for group in move_groups if MoveGroupRunner._has_moves([group])
+            )
+        ]
+
+    async def run(
+        self, can_messenger: CanMessenger
+    ) -> NodeDict[Tuple[float, float, bool, bool]]:
+        """Run the move groups.
+
+        Args:
+            can_messenger: a can messenger
+
+        Returns:
+            The current position after the moves for all the axes that
+            acknowledged completing moves.
+        """
+        positions: NodeDict[Tuple[float, float, bool, bool]] = {}
+        if not self._runners:
+            return positions
+
+        await self._runners[0].prep(can_messenger)
+        next_runners: List[Optional[MoveGroupRunner]] = [*self._runners[1:], None]
+        for runner, next_runner in zip(self._runners, next_runners):
+            if next_runner is None or next_runner._start_at_index == 0:
+                positions.update(await runner.execute(can_messenger))
+                if next_runner is not None:
+                    await next_runner.prep(can_messenger)
+                continue
+
+            started = asyncio.Event()
+            send_next = asyncio.get_event_loop().create_task(
+                self._prep_once_started(next_runner, started, can_messenger)
+            )
+            try:
+                positions.update(await runner.execute(can_messenger, started))
+                await send_next
+            finally:
+                if not send_next.done():
+                    send_next.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await send_next
+        return positions
+
+    @staticmethod
+    async def _prep_once_started(
+        runner: MoveGroupRunner, started: asyncio.Event, can_messenger: CanMessenger
+    ) -> None:
+        await started.wait()
+        # the groups were cleared before the first slot was used
+        await runner.prep(can_messenger, clear_groups=False)
+
+
 class MoveScheduler:
     """A message listener that manages the sending of execute move group messages."""
 
-    def __init__(self, move_groups: MoveGroups, start_at_index: int = 0) -> None:
+    def __init__(
+        self,
+        move_groups: MoveGroups,
+        start_at_index: int = 0,
+        started: Optional[asyncio.Event] = None,
+    ) -> None:
         """Constructor."""
+        self._started = started
         # For each move group create a set identifying the node and seq id.
         self._moves: List[Set[Tuple[int, int]]] = []
         self._durations: List[float] = []
@@ -365,6 +488,9 @@ class MoveScheduler:
         seq_id = message.payload.seq_id.value
         group_id = message.payload.group_id.value - self._start_at_index
         node_id = arbitration_id.parts.originating_node_id
+        if group_id < 0:
+            # a group before ours, from another runner
+            return
         try:
             in_group = (node_id, seq_id) in self._moves[group_id]
             self._moves[group_id].remove((node_id, seq_id))
@@ -402,6 +528,8 @@ class MoveScheduler:
         group_id = message.payload.group_id.value - self._start_at_index
         ack_id = message.payload.ack_id.value
         node_id = arbitration_id.parts.originating_node_id
+        if group_id < 0:
+            return
         try:
             stop_cond = self._stop_condition[group_id]
             if (
@@ -484,6 +612,8 @@ class MoveScheduler:
             )
             if error != ErrorCode.ok:
                 log.error(f"recieved error trying to execute move group {str(error)}")
+            if self._started is not None:
+                self._started.set()
 
             try:
                 # TODO: The max here can be removed once can_driver.send() no longer
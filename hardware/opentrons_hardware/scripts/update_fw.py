@@ -78,6 +78,7 @@ async def run(args: argparse.Namespace) -> None:
             retry_count=retry_count,
             timeout_seconds=timeout_seconds,
             erase=erase,
+            download_window_size=args.window_size,
         )
         async for progress in updater.run_updates():
             logger.info(f"{progress[0]} is {progress[1][0]} and {progress[1][1]} done")
@@ -112,6 +113,12 @@ def main() -> None:
     parser.add_argument(
         "--timeout-seconds", help="Number of seconds to wait.", type=float, default=10
     )
+    parser.add_argument(
+        "--window-size",
+        help="Number of firmware chunks to send before waiting for their ACKs.",
+        type=int,
+        default=1,
+    )
     parser.add_argument(
         "--no-erase",
         help="Don't erase existing application from flash.",
@@ -16,6 +16,7 @@ from opentrons_hardware.firmware_bindings.constants import (
 from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 
 from opentrons_hardware.drivers.can_bus.can_messenger import (
+    ArbitrationIdFilter,
     CanMessenger,
     WaitableCallback,
     MultipleMessagesWaitableCallback,
@@ -86,23 +87,15 @@ class SensorScheduler:
     @staticmethod
     def _create_filter(
         node_id: Optional[NodeId] = None, message_id: Optional[MessageId] = None
-    ) -> Optional[Callable[[ArbitrationId], bool]]:
+    ) -> Optional[ArbitrationIdFilter]:
         """Create listener filter by NodeId and MessageId."""
         if not node_id and not message_id:
             return None
 
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            return (
-                NodeId(arbitration_id.parts.originating_node_id) == node_id
-                if node_id
-                else True
-            ) and (
-                MessageId(arbitration_id.parts.message_id) == message_id
-                if message_id
-                else True
-            )
-
-        return _filter
+        return ArbitrationIdFilter.build(
+            message_ids=[message_id] if message_id else None,
+            originating_node_ids=[node_id] if node_id else None,
+        )
 
     async def run_baseline(
         self,
@@ -378,7 +371,15 @@ class SensorScheduler:
 
         try:
             if do_log:
-                can_messenger.add_listener(self._log_sensor_output)
+                can_messenger.add_listener(
+                    self._log_sensor_output,
+                    ArbitrationIdFilter.build(
+                        message_ids=[
+                            MessageId.read_sensor_response,
+                            MessageId.error_message,
+                        ]
+                    ),
+                )
             yield
         finally:
             if do_log:
@@ -421,15 +422,10 @@ class SensorScheduler:
             if isinstance(message, ErrorMessage):
                 log.error(f"Recieved error message {str(message)}")
 
-        def _filter(arbitration_id: ArbitrationId) -> bool:
-            return (
-                NodeId(arbitration_id.parts.originating_node_id)
-                == target_sensor.node_id
-            ) and (
-                MessageId(arbitration_id.parts.message_id)
-                == MessageId.read_sensor_response
-                or MessageId(arbitration_id.parts.message_id) == MessageId.error_message
-            )
+        _filter = ArbitrationIdFilter.build(
+            message_ids=[MessageId.read_sensor_response, MessageId.error_message],
+            originating_node_ids=[target_sensor.node_id],
+        )
 
         can_messenger.add_listener(_logging_listener, _filter)
         error = await can_messenger.ensure_send(
@@ -18,6 +18,7 @@ from opentrons_hardware.firmware_bindings.arbitration_id import (
     ArbitrationIdParts,
 )
 from opentrons_hardware.drivers.can_bus.can_messenger import (
+    ArbitrationIdFilter,
     CanMessenger,
     MessageListenerCallback,
     WaitableCallback,
@@ -352,6 +353,102 @@ async def test_ensure_send_timeout(
     )
 
 
+def _ack_for(message: MessageDefinition, originating_node_id: NodeId) -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=MessageId.acknowledgement,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=originating_node_id,
+            )
+        ),
+        data=message.payload.message_index.value.to_bytes(4, "big"),
+    )
+
+
+def _move_group_message() -> MessageDefinition:
+    return GetMoveGroupRequest(payload=MoveGroupRequestPayload(group_id=UInt8Field(0)))
+
+
+async def test_ensure_send_batch(
+    subject: CanMessenger,
+    mock_driver: AsyncMock,
+    incoming_messages: Queue[CanMessage],
+) -> None:
+    """It should send every message before waiting for acks in any order."""
+    messages = [
+        (NodeId.gantry_x, _move_group_message()),
+        (NodeId.gantry_y, _move_group_message()),
+        (NodeId.head, _move_group_message()),
+    ]
+    incoming_messages.put_nowait(_ack_for(messages[2][1], NodeId.head_r))
+    incoming_messages.put_nowait(_ack_for(messages[1][1], NodeId.gantry_y))
+    incoming_messages.put_nowait(_ack_for(messages[2][1], NodeId.head_l))
+    incoming_messages.put_nowait(_ack_for(messages[0][1], NodeId.gantry_x))
+
+    errors, ignore = await asyncio.gather(
+        subject.ensure_send_batch(messages),
+        subject.__aenter__(),
+    )
+
+    assert errors == [ErrorCode.ok, ErrorCode.ok, ErrorCode.ok]
+    assert [c.kwargs["message"] for c in mock_driver.send.call_args_list] == [
+        CanMessage(
+            arbitration_id=ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=message.message_id,
+                    node_id=node_id,
+                    function_code=0,
+                    originating_node_id=NodeId.host,
+                )
+            ),
+            data=message.payload.serialize(),
+        )
+        for node_id, message in messages
+    ]
+
+
+async def test_ensure_send_batch_errors(
+    subject: CanMessenger,
+    incoming_messages: Queue[CanMessage],
+) -> None:
+    """It should report the result of each message in the batch."""
+    messages = [
+        (NodeId.gantry_x, _move_group_message()),
+        (NodeId.gantry_y, _move_group_message()),
+        (NodeId.head, _move_group_message()),
+    ]
+    error_payload = ErrorMessagePayload(
+        severity=ErrorSeverityField(1),
+        error_code=ErrorCodeField(5),
+    )
+    error_payload.message_index = messages[1][1].payload.message_index
+    incoming_messages.put_nowait(_ack_for(messages[0][1], NodeId.gantry_x))
+    incoming_messages.put_nowait(
+        CanMessage(
+            arbitration_id=ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=MessageId.error_message,
+                    node_id=NodeId.host,
+                    function_code=2,
+                    originating_node_id=NodeId.gantry_y,
+                )
+            ),
+            data=error_payload.serialize(),
+        )
+    )
+    # only one of the head's subnodes responds
+    incoming_messages.put_nowait(_ack_for(messages[2][1], NodeId.head_l))
+
+    errors, ignore = await asyncio.gather(
+        subject.ensure_send_batch(messages, timeout=0.1),
+        subject.__aenter__(),
+    )
+
+    assert errors == [ErrorCode.ok, 5, ErrorCode.timeout]
+
+
 async def test_listen_messages(
     subject: CanMessenger, incoming_messages: Queue[CanMessage]
 ) -> None:
@@ -444,6 +541,85 @@ async def test_filter_messages(
     listener.assert_not_called()
 
 
+async def test_indexed_listeners(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should only call listeners whose filter IDs match, in order added."""
+    arbitration_id = ArbitrationId(
+        parts=ArbitrationIdParts(
+            message_id=MessageId.get_move_group_request,
+            node_id=NodeId.host,
+            function_code=0,
+            originating_node_id=NodeId.gantry_x,
+        )
+    )
+    incoming_messages.put_nowait(
+        CanMessage(arbitration_id=arbitration_id, data=b"\x00\x00\x00\x01\1")
+    )
+
+    calls: List[str] = []
+    subject.add_listener(
+        lambda m, a: calls.append("node"),
+        ArbitrationIdFilter.build(originating_node_ids=[NodeId.gantry_x]),
+    )
+    subject.add_listener(lambda m, a: calls.append("any"))
+    subject.add_listener(
+        lambda m, a: calls.append("message and node"),
+        ArbitrationIdFilter.build(
+            message_ids=[MessageId.get_move_group_request],
+            originating_node_ids=[NodeId.gantry_x, NodeId.gantry_y],
+        ),
+    )
+    subject.add_listener(
+        lambda m, a: calls.append("other message"),
+        ArbitrationIdFilter.build(message_ids=[MessageId.acknowledgement]),
+    )
+    subject.add_listener(
+        lambda m, a: calls.append("other node"),
+        ArbitrationIdFilter.build(originating_node_ids=[NodeId.gantry_y]),
+    )
+    removed_listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(
+        removed_listener,
+        ArbitrationIdFilter.build(message_ids=[MessageId.get_move_group_request]),
+    )
+    subject.remove_listener(removed_listener)
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    assert calls == ["node", "any", "message and node"]
+    removed_listener.assert_not_called()
+
+
+def test_arbitration_id_filter() -> None:
+    """It should accept messages with matching IDs."""
+    subject = ArbitrationIdFilter.build(
+        message_ids=[MessageId.acknowledgement],
+        originating_node_ids=[NodeId.head, NodeId.gripper],
+    )
+
+    def _arbitration_id(message_id: MessageId, node_id: NodeId) -> ArbitrationId:
+        return ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        )
+
+    assert subject(_arbitration_id(MessageId.acknowledgement, NodeId.head))
+    assert subject(_arbitration_id(MessageId.acknowledgement, NodeId.gripper))
+    assert not subject(_arbitration_id(MessageId.acknowledgement, NodeId.gantry_x))
+    assert not subject(_arbitration_id(MessageId.error_message, NodeId.head))
+    assert ArbitrationIdFilter.build()(
+        _arbitration_id(MessageId.error_message, NodeId.head)
+    )
+
+
 async def test_waitable_callback_context() -> None:
     """It should add itself and remove itself using context manager."""
     mock_messenger = Mock(spec=CanMessenger)
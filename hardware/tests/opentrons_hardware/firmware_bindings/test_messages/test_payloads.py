@@ -98,3 +98,38 @@ def test_new_get_device_info() -> None:
     assert reparsed_new.revision.secondary == new.revision.secondary
     assert reparsed_new.revision.tertiary == new.revision.tertiary
     assert reparsed_new.subidentifier == new.subidentifier
+
+
+def test_serialize_and_build() -> None:
+    """It should pack fields big endian, message index first, and parse them back."""
+    payload = payloads.GetStatusResponsePayload(
+        status=utils.UInt8Field(1), data=utils.UInt32Field(0x01020304)
+    )
+    payload.message_index = utils.UInt32Field(5)
+
+    serialized = payload.serialize()
+    reparsed = payloads.GetStatusResponsePayload.build(serialized)
+    assert isinstance(reparsed, payloads.GetStatusResponsePayload)
+
+    assert serialized == b"\x00\x00\x00\x05\x01\x01\x02\x03\x04"
+    assert payloads.GetStatusResponsePayload.get_size() == len(serialized)
+    assert reparsed == payload
+    assert reparsed.message_index == utils.UInt32Field(5)
+
+
+def test_build_from_memoryview() -> None:
+    """It should parse a padded memoryview without copying it first."""
+    buffer = bytearray(b"\x00\x00\x00\x05\x01\x01\x02\x03\x04\x00\x00\x00")
+
+    reparsed = payloads.GetStatusResponsePayload.build(memoryview(buffer))
+    assert isinstance(reparsed, payloads.GetStatusResponsePayload)
+
+    assert reparsed.status == utils.UInt8Field(1)
+    assert reparsed.data == utils.UInt32Field(0x01020304)
+    assert reparsed.message_index == utils.UInt32Field(5)
+
+
+def test_build_too_short() -> None:
+    """It should raise if the buffer is too short for all the fields."""
+    with pytest.raises(utils.InvalidFieldException):
+        payloads.GetStatusResponsePayload.build(b"\x00\x00\x00\x05\x01")
@@ -1,6 +1,7 @@
 """Tests for the firmware downloader."""
 import binascii
-from typing import List
+import asyncio
+from typing import List, Set
 
 import pytest
 from mock import AsyncMock, MagicMock, call
@@ -28,12 +29,6 @@ from opentrons_hardware.firmware_update.hex_file import HexRecordProcessor, Chun
 from tests.conftest import MockCanMessageNotifier
 
 
-@pytest.fixture
-def mock_hex_processor() -> MagicMock:
-    """Mock hex file record producer."""
-    return MagicMock(spec=HexRecordProcessor)
-
-
 @pytest.fixture
 def chunks() -> List[Chunk]:
     """Data chunks produced by hex processor."""
@@ -44,6 +39,14 @@ def chunks() -> List[Chunk]:
     ]
 
 
+@pytest.fixture
+def mock_hex_processor(chunks: List[Chunk]) -> MagicMock:
+    """Mock hex file record producer."""
+    mock = MagicMock(spec=HexRecordProcessor)
+    mock.data_size = sum(len(c.data) for c in chunks)
+    return mock
+
+
 @pytest.fixture
 def crc32(chunks: List[Chunk]) -> int:
     """crc32 of data chunks."""
@@ -299,3 +302,142 @@ async def test_messaging_complete_no_response(
             NodeId.gantry_y_bootloader, mock_hex_processor, 0.5
         ):
             pass
+
+
+def _notify_data_ack(
+    can_message_notifier: MockCanMessageNotifier,
+    node_id: NodeId,
+    message: FirmwareUpdateData,
+) -> None:
+    can_message_notifier.notify(
+        FirmwareUpdateDataAcknowledge(
+            payload=payloads.FirmwareUpdateDataAcknowledge(
+                address=message.payload.address,
+                error_code=ErrorCodeField(ErrorCode.ok),
+            )
+        ),
+        ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=FirmwareUpdateDataAcknowledge.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        ),
+    )
+
+
+def _notify_complete_ack(
+    can_message_notifier: MockCanMessageNotifier, node_id: NodeId
+) -> None:
+    can_message_notifier.notify(
+        FirmwareUpdateCompleteAcknowledge(
+            payload=payloads.FirmwareUpdateAcknowledge(
+                error_code=ErrorCodeField(ErrorCode.ok)
+            )
+        ),
+        ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=FirmwareUpdateCompleteAcknowledge.message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=node_id,
+            )
+        ),
+    )
+
+
+async def test_messaging_windowed(
+    subject: downloader.FirmwareUpdateDownloader,
+    chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+) -> None:
+    """It should keep several chunks waiting for an ACK at once."""
+    events: List[str] = []
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Message responder that ACKs data some time after it's sent."""
+        if isinstance(message, FirmwareUpdateData):
+            data_message = message
+            address = data_message.payload.address.value
+            events.append(f"send {address:x}")
+
+            def ack() -> None:
+                events.append(f"ack {address:x}")
+                _notify_data_ack(can_message_notifier, node_id, data_message)
+
+            asyncio.get_running_loop().call_later(0.05, ack)
+        elif isinstance(message, FirmwareUpdateComplete):
+            _notify_complete_ack(can_message_notifier, node_id)
+
+    mock_messenger.send.side_effect = responder
+
+    mock_hex_processor.process.return_value = iter(chunks)
+
+    progress = [
+        p
+        async for p in subject.run(
+            NodeId.gantry_y_bootloader, mock_hex_processor, 10, window_size=2
+        )
+    ]
+
+    # The second chunk goes out before the first one is ACKed,
+    # but the third waits for a free spot in the window.
+    assert events[:3] == ["send 0", "send 100", "ack 0"]
+    assert events.index("send 200") > events.index("ack 0")
+    assert len(events) == 6
+    assert progress == [48 / 54, 52 / 54, 1.0]
+
+
+async def test_messaging_retransmits_unacked_chunk(
+    subject: downloader.FirmwareUpdateDownloader,
+    chunks: List[Chunk],
+    mock_hex_processor: MagicMock,
+    mock_messenger: AsyncMock,
+    can_message_notifier: MockCanMessageNotifier,
+    crc32: int,
+) -> None:
+    """It should resend only the chunk whose ACK didn't arrive in time."""
+    dropped: Set[int] = set()
+
+    def responder(node_id: NodeId, message: MessageDefinition) -> None:
+        """Message responder that drops the first copy of one chunk."""
+        if isinstance(message, FirmwareUpdateData):
+            address = message.payload.address.value
+            if address == 0x100 and address not in dropped:
+                dropped.add(address)
+                return
+            _notify_data_ack(can_message_notifier, node_id, message)
+        elif isinstance(message, FirmwareUpdateComplete):
+            _notify_complete_ack(can_message_notifier, node_id)
+
+    mock_messenger.send.side_effect = responder
+
+    mock_hex_processor.process.return_value = iter(chunks)
+
+    async for progress in subject.run(
+        NodeId.gantry_y_bootloader,
+        mock_hex_processor,
+        0.2,
+        window_size=3,
+        retransmit_count=1,
+    ):
+        pass
+
+    sent_addresses = [
+        c.kwargs["message"].payload.address.value
+        for c in mock_messenger.send.call_args_list
+        if isinstance(c.kwargs["message"], FirmwareUpdateData)
+    ]
+    assert sent_addresses == [0x000, 0x100, 0x200, 0x100]
+    mock_messenger.send.assert_called_with(
+        node_id=NodeId.gantry_y_bootloader,
+        message=FirmwareUpdateComplete(
+            payload=payloads.FirmwareUpdateComplete(
+                num_messages=utils.UInt32Field(len(chunks)),
+                crc32=utils.UInt32Field(crc32),
+            )
+        ),
+    )
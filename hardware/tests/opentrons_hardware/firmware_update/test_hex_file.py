@@ -1,4 +1,6 @@
 """Tests for hex file processing."""
+import io
+from pathlib import Path
 from typing import Iterable, List
 
 import pytest
@@ -257,3 +259,55 @@ def test_process_failure_zero_size(hex_records: Iterable[hex_file.HexRecord]) ->
     subject = hex_file.HexRecordProcessor(records=hex_records)
     with pytest.raises(hex_file.BadChunkSizeException):
         list(subject.process(0))
+
+
+def test_data_size(hex_records: Iterable[hex_file.HexRecord]) -> None:
+    """It should count the data bytes that processing will produce."""
+    subject = hex_file.HexRecordProcessor(records=hex_records)
+
+    assert subject.data_size == sum(len(chunk.data) for chunk in subject.process(5))
+
+
+def test_data_size_one_shot_records(
+    hex_records: Iterable[hex_file.HexRecord],
+) -> None:
+    """It should still process records from a generator after counting them."""
+    subject = hex_file.HexRecordProcessor(records=(r for r in hex_records))
+
+    assert subject.data_size == 20
+    assert sum(len(chunk.data) for chunk in subject.process(5)) == 20
+
+
+def test_data_size_stops_at_eof(hex_records: List[hex_file.HexRecord]) -> None:
+    """It should not count data records after the EOF record."""
+    subject = hex_file.HexRecordProcessor(records=hex_records + hex_records[:1])
+
+    assert subject.data_size == sum(len(chunk.data) for chunk in subject.process(5))
+
+
+HEX_FILE_CONTENTS = """\
+:020000040800F2
+:1001C000E9450008E9450008E9450008E945000857
+:0451A0008943000837
+:00000001FF
+"""
+
+
+def test_from_file(tmp_path: Path) -> None:
+    """It should re-read the file to count data and to process it."""
+    expected = list(
+        hex_file.HexRecordProcessor(
+            records=list(hex_file.from_hex_file(io.StringIO(HEX_FILE_CONTENTS)))
+        ).process(16)
+    )
+    file_path = tmp_path / "firmware.hex"
+    file_path.write_text(HEX_FILE_CONTENTS)
+
+    with open(file_path) as f:
+        from_file = hex_file.HexRecordProcessor.from_file(f)
+        assert from_file.data_size == 20
+        assert list(from_file.process(16)) == expected
+
+    from_file_path = hex_file.HexRecordProcessor.from_file_path(file_path)
+    assert from_file_path.data_size == 20
+    assert list(from_file_path.process(16)) == expected
@@ -65,12 +65,22 @@ def mock_path_exists() -> Iterator[MagicMock]:
 
 
 @pytest.mark.parametrize(argnames=["should_erase"], argvalues=[[True], [False]])
+@pytest.mark.parametrize(
+    argnames=["window_size", "retransmit_count"],
+    argvalues=[
+        # unwindowed downloads don't resend chunks, like before windowing
+        [1, 0],
+        [4, 12],
+    ],
+)
 async def test_run_update(
     mock_initiator_run: AsyncMock,
     mock_downloader_run: AsyncMock,
     mock_eraser_run: AsyncMock,
     mock_hex_record_builder: MagicMock,
     should_erase: bool,
+    window_size: int,
+    retransmit_count: int,
     mock_path_exists: MagicMock,
     hex_file_path: str,
 ) -> None:
@@ -92,6 +102,7 @@ async def test_run_update(
         retry_count=12,
         timeout_seconds=11,
         erase=should_erase,
+        download_window_size=window_size,
     )
 
     with mock.patch("os.path.exists"), mock.patch("builtins.open"):
@@ -116,6 +127,8 @@ async def test_run_update(
         node_id=target.bootloader_node,
         hex_processor=mock_hex_record_processor,
         ack_wait_seconds=11,
+        window_size=window_size,
+        retransmit_count=retransmit_count,
     )
     mock_can_messenger.send.assert_called_once_with(
         node_id=target.bootloader_node, message=FirmwareUpdateStartApp()
@@ -178,12 +191,16 @@ async def test_run_updates(
                 node_id=target_1.bootloader_node,
                 hex_processor=mock_hex_record_processor,
                 ack_wait_seconds=11,
+                window_size=1,
+                retransmit_count=0,
             ),
             mock.call().__aiter__(),
             mock.call(
                 node_id=target_2.bootloader_node,
                 hex_processor=mock_hex_record_processor,
                 ack_wait_seconds=11,
+                window_size=1,
+                retransmit_count=0,
             ),
             mock.call().__aiter__(),
         ]
@@ -0,0 +1,294 @@
+"""Tests for array-wide motion planning."""
+import numpy as np
+import pytest
+from hypothesis import given, settings, strategies as st
+from typing import List, Tuple
+
+from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning.batch_planner import (
+    batch_log_to_moves,
+    plan_batch,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisConstraints,
+    Coordinates,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+)
+
+from .test_motion_plan import (
+    generate_axis_constraint,
+    generate_close_target_list,
+    generate_coordinates,
+)
+
+CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(
+        max_acceleration=np.float64(100),
+        max_speed_discont=np.float64(40),
+        max_direction_change_speed_discont=np.float64(20),
+        max_speed=np.float64(500),
+    ),
+    "Y": AxisConstraints.build(
+        max_acceleration=np.float64(100),
+        max_speed_discont=np.float64(40),
+        max_direction_change_speed_discont=np.float64(20),
+        max_speed=np.float64(500),
+    ),
+    "Z": AxisConstraints.build(
+        max_acceleration=np.float64(50),
+        max_speed_discont=np.float64(10),
+        max_direction_change_speed_discont=np.float64(5),
+        max_speed=np.float64(100),
+    ),
+}
+
+
+def _plan_one_at_a_time(
+    origin: Coordinates[str, np.float64],
+    target_list: List[MoveTarget[str]],
+    constraints: SystemConstraints[str],
+    iteration_limit: int,
+) -> Tuple[bool, List[List[Move[str]]]]:
+    """Plan motion by building each move in turn, as a reference."""
+    initial_moves = list(move_utils.targets_to_moves(origin, target_list, constraints))
+    axes = initial_moves[0].unit_vector.keys()
+    to_blend = [Move.build_dummy(axes)] + initial_moves + [Move.build_dummy(axes)]
+    blend_log: List[List[Move[str]]] = []
+    for _ in range(iteration_limit):
+        built = [
+            move_utils.build_move(move, prev_move, next_move, constraints)
+            for prev_move, move, next_move in zip(to_blend, to_blend[1:], to_blend[2:])
+        ]
+        if move_utils.all_blended(constraints, built):
+            blend_log.append(built)
+            return True, blend_log
+        to_blend = [Move.build_dummy(axes)] + built + [Move.build_dummy(axes)]
+        blend_log.append(to_blend)
+    return False, blend_log
+
+
+def _assert_plans_match(
+    actual: Tuple[bool, List[List[Move[str]]]],
+    expected: Tuple[bool, List[List[Move[str]]]],
+) -> None:
+    """Check that two plans match, up to floating point rounding.
+
+    The planners sum and multiply in different orders, so their results may
+    differ in the last few bits, depending on the NumPy version.
+    """
+
+    def _approx(value: np.float64) -> object:
+        return pytest.approx(value, rel=1e-9, abs=1e-9)
+
+    assert actual[0] == expected[0]
+    assert [len(moves) for moves in actual[1]] == [len(moves) for moves in expected[1]]
+    for actual_moves, expected_moves in zip(actual[1], expected[1]):
+        for actual_move, expected_move in zip(actual_moves, expected_moves):
+            assert actual_move.unit_vector.keys() == expected_move.unit_vector.keys()
+            for axis, component in expected_move.unit_vector.items():
+                assert actual_move.unit_vector[axis] == _approx(component)
+            assert actual_move.distance == _approx(expected_move.distance)
+            assert actual_move.max_speed == _approx(expected_move.max_speed)
+            assert actual_move.initial_speed == _approx(expected_move.initial_speed)
+            assert actual_move.final_speed == _approx(expected_move.final_speed)
+            assert actual_move.nonzero_blocks == expected_move.nonzero_blocks
+            for actual_block, expected_block in zip(
+                actual_move.blocks, expected_move.blocks
+            ):
+                assert actual_block.distance == _approx(expected_block.distance)
+                assert actual_block.initial_speed == _approx(
+                    expected_block.initial_speed
+                )
+                assert actual_block.acceleration == _approx(expected_block.acceleration)
+                assert actual_block.final_speed == _approx(expected_block.final_speed)
+                assert actual_block.time == _approx(expected_block.time)
+
+
+def test_plan_batch_matches_reference() -> None:
+    """It should plan the same moves as the scalar planner."""
+    origin = {"X": np.float64(0), "Y": np.float64(0), "Z": np.float64(0)}
+    target_list = [
+        MoveTarget.build(
+            {"X": np.float64(10), "Y": np.float64(0), "Z": np.float64(0)},
+            np.float64(30),
+        ),
+        MoveTarget.build(
+            {"X": np.float64(10), "Y": np.float64(10), "Z": np.float64(0)},
+            np.float64(20),
+        ),
+        MoveTarget.build(
+            {"X": np.float64(10), "Y": np.float64(10), "Z": np.float64(15)},
+            np.float64(10),
+        ),
+        MoveTarget.build(
+            {"X": np.float64(200), "Y": np.float64(150), "Z": np.float64(15)},
+            np.float64(500),
+        ),
+        MoveTarget.build(
+            {"X": np.float64(0), "Y": np.float64(0), "Z": np.float64(0)},
+            np.float64(500),
+        ),
+    ]
+
+    converged, iterations = plan_batch(origin, target_list, CONSTRAINTS, 10)
+
+    _assert_plans_match(
+        (converged, batch_log_to_moves(iterations)),
+        _plan_one_at_a_time(origin, target_list, CONSTRAINTS, 10),
+    )
+
+
+def test_plan_batch_triangle_move() -> None:
+    """It should trim overshooting triangle moves like the scalar planner."""
+    origin = {
+        "X": np.float64(261.077),
+        "Y": np.float64(229.898),
+        "Z": np.float64(0.0),
+    }
+    target_list = [
+        MoveTarget(
+            position={
+                "X": np.float64(261.105),
+                "Y": np.float64(229.925),
+                "Z": np.float64(149.80000000000004),
+            },
+            max_speed=np.float64(500),
+        ),
+    ]
+
+    converged, iterations = plan_batch(origin, target_list, CONSTRAINTS, 10)
+
+    _assert_plans_match(
+        (converged, batch_log_to_moves(iterations)),
+        _plan_one_at_a_time(origin, target_list, CONSTRAINTS, 10),
+    )
+
+
+def test_plan_batch_constant_speed_move() -> None:
+    """It should leave out the speed changes of a move that never speeds up."""
+    axes = ["X", "Y", "Z", "A", "B", "C"]
+    constraints = {
+        axis: AxisConstraints.build(
+            max_acceleration=np.float64(500),
+            max_speed_discont=np.float64(10),
+            max_direction_change_speed_discont=np.float64(5),
+            max_speed=np.float64(500),
+        )
+        for axis in axes
+    }
+    origin = {axis: np.float64(0) for axis in axes}
+    target_list = [
+        MoveTarget.build(
+            {axis: np.float64(1) for axis in axes}, np.float64(0.728068949481305)
+        )
+    ]
+
+    converged, iterations = plan_batch(origin, target_list, constraints, 20)
+    moves = batch_log_to_moves(iterations)
+
+    assert [move.nonzero_blocks for move in moves[-1]] == [1]
+    _assert_plans_match(
+        (converged, moves),
+        _plan_one_at_a_time(origin, target_list, constraints, 20),
+    )
+
+
+def test_plan_batch_many_moves() -> None:
+    """It should match the scalar planner for a long path."""
+    rng = np.random.default_rng(seed=0)
+    origin = {"X": np.float64(0), "Y": np.float64(0), "Z": np.float64(0)}
+    target_list = [
+        MoveTarget.build(
+            dict(zip(["X", "Y", "Z"], rng.uniform(0, 100, size=3))),
+            np.float64(rng.uniform(10, 500)),
+        )
+        for _ in range(200)
+    ]
+
+    converged, iterations = plan_batch(origin, target_list, CONSTRAINTS, 20)
+
+    _assert_plans_match(
+        (converged, batch_log_to_moves(iterations)),
+        _plan_one_at_a_time(origin, target_list, CONSTRAINTS, 20),
+    )
+
+
+@settings(max_examples=50, deadline=None)
+@given(
+    x_constraint=generate_axis_constraint(),
+    y_constraint=generate_axis_constraint(),
+    z_constraint=generate_axis_constraint(),
+    a_constraint=generate_axis_constraint(),
+    b_constraint=generate_axis_constraint(),
+    c_constraint=generate_axis_constraint(),
+    origin=generate_coordinates(),
+    data=st.data(),
+)
+def test_plan_batch_matches_reference_hypothesis(
+    x_constraint: AxisConstraints,
+    y_constraint: AxisConstraints,
+    z_constraint: AxisConstraints,
+    a_constraint: AxisConstraints,
+    b_constraint: AxisConstraints,
+    c_constraint: AxisConstraints,
+    origin: Coordinates[str, np.float64],
+    data: st.DataObject,
+) -> None:
+    """It should match the scalar planner for generated targets."""
+    targets = data.draw(generate_close_target_list(origin))
+    constraints: SystemConstraints[str] = {
+        "X": x_constraint,
+        "Y": y_constraint,
+        "Z": z_constraint,
+        "A": a_constraint,
+        "B": b_constraint,
+        "C": c_constraint,
+    }
+
+    converged, iterations = plan_batch(origin, targets, constraints, 20)
+
+    _assert_plans_match(
+        (converged, batch_log_to_moves(iterations)),
+        _plan_one_at_a_time(origin, targets, constraints, 20),
+    )
+
+
+def test_plan_batch_unconstrained_axis() -> None:
+    """It should allow targets with unconstrained axes that do not move."""
+    origin = {
+        "X": np.float64(0),
+        "Y": np.float64(0),
+        "Z": np.float64(0),
+        "G": np.float64(5),
+    }
+    target_list = [
+        MoveTarget.build(
+            {
+                "X": np.float64(10),
+                "Y": np.float64(10),
+                "Z": np.float64(10),
+                "G": np.float64(5),
+            },
+            np.float64(100),
+        ),
+    ]
+
+    converged, iterations = plan_batch(origin, target_list, CONSTRAINTS, 10)
+
+    _assert_plans_match(
+        (converged, batch_log_to_moves(iterations)),
+        _plan_one_at_a_time(origin, target_list, CONSTRAINTS, 10),
+    )
+
+
+def test_plan_batch_unconstrained_axis_moves() -> None:
+    """It should raise a KeyError if an unconstrained axis moves."""
+    origin = {"X": np.float64(0), "G": np.float64(0)}
+    target_list = [
+        MoveTarget.build({"X": np.float64(10), "G": np.float64(5)}, np.float64(100)),
+    ]
+
+    with pytest.raises(KeyError):
+        plan_batch(origin, target_list, CONSTRAINTS, 10)
@@ -1,7 +1,7 @@
 """Tests for current settings."""
 import pytest
 from mock import AsyncMock
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 from opentrons_hardware.firmware_bindings.constants import NodeId
 from opentrons_hardware.firmware_bindings.messages import (
@@ -70,6 +70,12 @@ def mock_can_messenger() -> AsyncMock:
     return AsyncMock()
 
 
+def _sent_messages(mock_can_messenger: AsyncMock) -> List[Tuple[NodeId, Any]]:
+    """The messages passed to the single batched send."""
+    mock_can_messenger.ensure_send_batch.assert_called_once()
+    return list(mock_can_messenger.ensure_send_batch.call_args[0][0])
+
+
 async def test_complete_current_settings(
     mock_can_messenger: AsyncMock,
     current_settings: CompleteCurrentSettings,
@@ -78,16 +84,15 @@ async def test_complete_current_settings(
     """It should send correct hold and run current to the correct nodes."""
     await set_currents(mock_can_messenger, current_settings)
     for node_id, currents in current_settings_in_uint32.items():
-        mock_can_messenger.ensure_send.assert_any_call(
-            node_id=node_id,
-            message=md.WriteMotorCurrentRequest(
+        assert (
+            node_id,
+            md.WriteMotorCurrentRequest(
                 payload=MotorCurrentPayload(
                     hold_current=currents[0],
                     run_current=currents[1],
                 )
             ),
-            expected_nodes=[node_id],
-        )
+        ) in _sent_messages(mock_can_messenger)
 
 
 async def test_send_hold_current_only(
@@ -98,16 +103,15 @@ async def test_send_hold_current_only(
     """It should send correct hold current only to the correct nodes."""
     await set_hold_current(mock_can_messenger, partial_current_settings)
     for node_id, current in partial_current_settings_in_uint32.items():
-        mock_can_messenger.ensure_send.assert_any_call(
-            node_id=node_id,
-            message=md.WriteMotorCurrentRequest(
+        assert (
+            node_id,
+            md.WriteMotorCurrentRequest(
                 payload=MotorCurrentPayload(
                     hold_current=current,
                     run_current=UInt32Field(0),
                 )
             ),
-            expected_nodes=[node_id],
-        )
+        ) in _sent_messages(mock_can_messenger)
 
 
 async def test_send_run_current_only(
@@ -118,16 +122,15 @@ async def test_send_run_current_only(
     """It should send correct run current only to the correct nodes."""
     await set_run_current(mock_can_messenger, partial_current_settings)
     for node_id, current in partial_current_settings_in_uint32.items():
-        mock_can_messenger.ensure_send.assert_any_call(
-            node_id=node_id,
-            message=md.WriteMotorCurrentRequest(
+        assert (
+            node_id,
+            md.WriteMotorCurrentRequest(
                 payload=MotorCurrentPayload(
                     hold_current=UInt32Field(0),
                     run_current=current,
                 )
             ),
-            expected_nodes=[node_id],
-        )
+        ) in _sent_messages(mock_can_messenger)
 
 
 async def test_send_current_for_tip_motors(
@@ -143,23 +146,21 @@ async def test_send_current_for_tip_motors(
     )
     for node_id, currents in current_settings_in_uint32.items():
         if node_id == NodeId.pipette_left:
-            mock_can_messenger.ensure_send.assert_any_call(
-                node_id=node_id,
-                message=md.GearWriteMotorCurrentRequest(
+            assert (
+                node_id,
+                md.GearWriteMotorCurrentRequest(
                     payload=MotorCurrentPayload(
                         hold_current=currents[0], run_current=currents[1]
                     )
                 ),
-                expected_nodes=[node_id],
-            )
+            ) in _sent_messages(mock_can_messenger)
         else:
-            mock_can_messenger.ensure_send.assert_any_call(
-                node_id=node_id,
-                message=md.WriteMotorCurrentRequest(
+            assert (
+                node_id,
+                md.WriteMotorCurrentRequest(
                     payload=MotorCurrentPayload(
                         hold_current=currents[0],
                         run_current=currents[1],
                     )
                 ),
-                expected_nodes=[node_id],
-            )
+            ) in _sent_messages(mock_can_messenger)
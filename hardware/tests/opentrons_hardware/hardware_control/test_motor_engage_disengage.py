@@ -1,8 +1,9 @@
 """Tests for current settings."""
 import pytest
 from mock import AsyncMock
+from typing import Any, List, Tuple
 
-from opentrons_hardware.firmware_bindings.constants import NodeId
+from opentrons_hardware.firmware_bindings.constants import ErrorCode, NodeId
 from opentrons_hardware.firmware_bindings.messages import (
     message_definitions as md,
 )
@@ -18,16 +19,21 @@ def mock_can_messenger() -> AsyncMock:
     return AsyncMock()
 
 
+def _sent_messages(mock_can_messenger: AsyncMock) -> List[Tuple[NodeId, Any]]:
+    """The messages passed to the single batched send."""
+    mock_can_messenger.ensure_send_batch.assert_called_once()
+    return list(mock_can_messenger.ensure_send_batch.call_args[0][0])
+
+
 async def test_set_enable_current(mock_can_messenger: AsyncMock) -> None:
     """It should send a request to enable each node's motor."""
     nodes_to_enable = {NodeId.gantry_x, NodeId.gantry_y}
     await set_enable_motor(mock_can_messenger, nodes_to_enable)
     for node_id in nodes_to_enable:
-        mock_can_messenger.ensure_send.assert_any_call(
-            node_id=node_id,
-            message=md.EnableMotorRequest(),
-            expected_nodes=[node_id],
-        )
+        assert (
+            node_id,
+            md.EnableMotorRequest(),
+        ) in _sent_messages(mock_can_messenger)
 
 
 async def test_set_disable_current(mock_can_messenger: AsyncMock) -> None:
@@ -35,8 +41,22 @@ async def test_set_disable_current(mock_can_messenger: AsyncMock) -> None:
     nodes_to_enable = {NodeId.gantry_x, NodeId.gantry_y}
     await set_disable_motor(mock_can_messenger, nodes_to_enable)
     for node_id in nodes_to_enable:
-        mock_can_messenger.ensure_send.assert_any_call(
-            node_id=node_id,
-            message=md.DisableMotorRequest(),
-            expected_nodes=[node_id],
-        )
+        assert (
+            node_id,
+            md.DisableMotorRequest(),
+        ) in _sent_messages(mock_can_messenger)
+
+
+async def test_set_enable_logs_failed_node(
+    mock_can_messenger: AsyncMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """It should log an error for each node that did not acknowledge."""
+    mock_can_messenger.ensure_send_batch.return_value = [
+        ErrorCode.ok,
+        ErrorCode.timeout,
+    ]
+    await set_enable_motor(mock_can_messenger, {NodeId.gantry_x, NodeId.gantry_y})
+    failed_node = _sent_messages(mock_can_messenger)[1][0]
+    assert [r.getMessage() for r in caplog.records if r.levelname == "ERROR"] == [
+        f"recieved error {str(ErrorCode.timeout)} trying to enable {str(failed_node)} "
+    ]
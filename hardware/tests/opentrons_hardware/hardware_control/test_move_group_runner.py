@@ -1,7 +1,7 @@
 """Tests for the move scheduler."""
 import pytest
 import logging
-from typing import List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from numpy import float64, float32, int32
 from mock import AsyncMock, call, MagicMock, patch
 import asyncio
@@ -50,6 +50,7 @@ from opentrons_hardware.hardware_control.motion import (
     MoveStopCondition,
 )
 from opentrons_hardware.hardware_control.move_group_runner import (
+    MoveGroupPipeline,
     MoveGroupRunner,
     MoveScheduler,
     _CompletionPacket,
@@ -1352,3 +1353,120 @@ async def test_multiple_move_error(
     with pytest.raises(RuntimeError):
         await subject.run(can_messenger=mock_can_messenger)
     assert mock_sender.call_count == 2
+
+
+class MockPipelineMessenger:
+    """A CAN messenger whose nodes complete a move group shortly after it starts.
+
+    Like the firmware, move groups are only added to until they are cleared.
+    """
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self._listeners: List[Any] = []
+        self._groups: Dict[int, List[Tuple[NodeId, MessageDefinition]]] = {}
+        self._moving: Optional["asyncio.Task[None]"] = None
+        self.events: List[str] = []
+
+    def add_listener(self, listener: Any, filter: Any = None) -> None:
+        """Add a listener."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Any) -> None:
+        """Remove a listener."""
+        self._listeners.remove(listener)
+
+    async def send(self, node_id: NodeId, message: MessageDefinition) -> None:
+        """Clear the move groups, or add a move to one."""
+        if isinstance(message, md.ClearAllMoveGroupsRequest):
+            assert self._moving is None or self._moving.done(), "Cleared while moving"
+            self._groups.clear()
+            self.events.append("clear")
+            return
+        group_id = message.payload.group_id.value  # type: ignore[attr-defined]
+        if self.events[-1:] != [f"send {group_id}"]:
+            assert group_id not in self._groups, f"Group {group_id} is not empty"
+            self.events.append(f"send {group_id}")
+        self._groups.setdefault(group_id, []).append((node_id, message))
+
+    async def ensure_send(
+        self,
+        node_id: NodeId,
+        message: MessageDefinition,
+        expected_nodes: List[NodeId],
+        timeout: float = 3,
+    ) -> ErrorCode:
+        """Execute a move group."""
+        assert isinstance(message, md.ExecuteMoveGroupRequest)
+        group_id = message.payload.group_id.value
+        self.events.append(f"execute {group_id}")
+        self._moving = asyncio.get_event_loop().create_task(self._complete(group_id))
+        return ErrorCode.ok
+
+    async def _complete(self, group_id: int) -> None:
+        await asyncio.sleep(0.01)
+        self.events.append(f"complete {group_id}")
+        for node, message in self._groups[group_id]:
+            payload = MoveCompletedPayload(
+                group_id=UInt8Field(group_id),
+                seq_id=message.payload.seq_id,  # type: ignore[attr-defined]
+                current_position_um=UInt32Field(len(self.events)),
+                encoder_position_um=Int32Field(0),
+                position_flags=MotorPositionFlagsField(0),
+                ack_id=UInt8Field(1),
+            )
+            for listener in list(self._listeners):
+                listener(
+                    md.MoveCompleted(payload=payload),
+                    ArbitrationId(parts=ArbitrationIdParts(originating_node_id=node)),
+                )
+
+
+async def test_pipeline_sends_next_group_while_moving(
+    move_group_multiple: MoveGroups,
+) -> None:
+    """It should send each group while the one before it is moving."""
+    messenger = MockPipelineMessenger()
+    subject = MoveGroupPipeline(move_groups=move_group_multiple * 2, slots=3)
+
+    position = await subject.run(can_messenger=messenger)  # type: ignore[arg-type]
+
+    assert messenger.events == [
+        "clear",
+        "send 0",
+        "execute 0",
+        "send 1",
+        "complete 0",
+        "execute 1",
+        "send 2",
+        "complete 1",
+        "execute 2",
+        # out of slots, so wait before clearing
+        "complete 2",
+        "clear",
+        "send 0",
+        "execute 0",
+        "send 1",
+        "complete 0",
+        "execute 1",
+        "send 2",
+        "complete 1",
+        "execute 2",
+        "complete 2",
+    ]
+    # each node's position comes from the last group it moved in, which the
+    # mock reports as the number of events so far
+    last_head_move = messenger.events.index("complete 0", 10) + 1
+    assert position[NodeId.head][0] == pytest.approx(last_head_move / 1000)
+    assert position[NodeId.pipette_left][0] == pytest.approx(
+        len(messenger.events) / 1000
+    )
+
+
+async def test_pipeline_skips_empty_groups() -> None:
+    """It should not send or execute groups without moves."""
+    messenger = MockPipelineMessenger()
+    subject = MoveGroupPipeline(move_groups=[[], [{}]])
+
+    assert await subject.run(can_messenger=messenger) == {}  # type: ignore[arg-type]
+    assert messenger.events == []
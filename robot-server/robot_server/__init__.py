@@ -2,9 +2,21 @@
 
 This server provides the main control interface for an Opentrons robot.
 """
+from typing import TYPE_CHECKING, Any
 
-from .app_setup import app
+if TYPE_CHECKING:
+    from .app_setup import app
 
 __all__ = [
     "app",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The app is imported on first use, so processes that only need part of
+    # this package, like protocol analysis workers, don't have to build it.
+    if name == "app":
+        from .app_setup import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,53 @@
+"""The code that runs in protocol analysis worker processes.
+
+Workers import this module when they start, so it must not import
+the rest of the server, like the app or the HTTP routers.
+"""
+import asyncio
+import logging
+import os
+
+from opentrons import protocol_runner
+from opentrons.config import robot_configs
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.util import logging_config
+
+from robot_server.service.logging import initialize_logging
+
+
+_log = logging.getLogger(__name__)
+
+# How much lower than the server's own CPU scheduling priority to run analyses.
+_WORKER_NICENESS = 10
+
+
+def initialize_worker() -> None:
+    """Set up a newly started worker process.
+
+    Workers are spawned, so they don't inherit the server's logging setup.
+    """
+    logging_config.log_init(robot_configs.load().log_level)
+    initialize_logging()
+
+    try:
+        os.nice(_WORKER_NICENESS)
+    except OSError:
+        _log.warning("Could not lower the CPU priority of an analysis worker.")
+
+
+def simulate_protocol(protocol_source: ProtocolSource) -> protocol_runner.RunResult:
+    """Analyze a protocol by simulating it from start to finish.
+
+    This is run in a worker process, so it blocks until the simulation is done.
+    """
+    return asyncio.run(_simulate_protocol(protocol_source))
+
+
+async def _simulate_protocol(
+    protocol_source: ProtocolSource,
+) -> protocol_runner.RunResult:
+    runner = await protocol_runner.create_simulating_runner(
+        robot_type=protocol_source.robot_type,
+        protocol_config=protocol_source.config,
+    )
+    return await runner.run(protocol_source)
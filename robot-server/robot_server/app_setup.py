@@ -5,10 +5,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from opentrons import __version__
+from opentrons.util.command_timing import get_command_timing
 
 from .errors import exception_handlers
 from .hardware import start_initializing_hardware, clean_up_hardware
 from .persistence import start_initializing_persistence, clean_up_persistence
+from .protocols.dependencies import (
+    initialize_analysis_executor,
+    clean_up_analysis_executor,
+)
 from .router import router
 from .service import initialize_logging
 from .service.task_runner import (
@@ -52,6 +57,8 @@ async def on_startup() -> None:
     settings = get_settings()
 
     initialize_logging()
+    if settings.command_timing_enabled:
+        get_command_timing().enable()
     start_initializing_hardware(app_state=app.state)
     start_initializing_persistence(
         app_state=app.state,
@@ -62,6 +69,7 @@ async def on_startup() -> None:
         ),
     )
     initialize_task_runner(app_state=app.state)
+    initialize_analysis_executor(app_state=app.state)
 
 
 @app.on_event("shutdown")
@@ -71,6 +79,7 @@ async def on_shutdown() -> None:
         clean_up_hardware(app.state),
         clean_up_persistence(app.state),
         clean_up_task_runner(app.state),
+        clean_up_analysis_executor(app.state),
         return_exceptions=True,
     )
 
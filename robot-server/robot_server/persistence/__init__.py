@@ -16,6 +16,7 @@ from ._tables import (
     analysis_table,
     run_table,
     action_table,
+    run_command_table,
 )
 
 
@@ -29,6 +30,7 @@ __all__ = [
     "analysis_table",
     "run_table",
     "action_table",
+    "run_command_table",
     # initialization and teardown
     "start_initializing_persistence",
     "clean_up_persistence",
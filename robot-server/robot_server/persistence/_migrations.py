@@ -23,17 +23,26 @@ Database schema versions:
     - `run_table.commands` column added
     - `run_table.engine_status` column added
     - `run_table._updated_at` column added
+- Version 2
+    - `run_command_table` added
+    - `run_table.commands` contents moved to `run_command_table`, one row per command
+- Version 3
+    - `analysis_table.completed_analysis_as_document` column added,
+      holding a JSON copy of `analysis_table.completed_analysis`,
+      filled in lazily for analyses stored before this version
 """
+import json
 import logging
 from datetime import datetime, timezone
 from typing import Optional
 from typing_extensions import Final
 
 import sqlalchemy
+from pydantic.json import pydantic_encoder
 
-from ._tables import migration_table, run_table
+from ._tables import migration_table, run_table, run_command_table
 
-_LATEST_SCHEMA_VERSION: Final = 1
+_LATEST_SCHEMA_VERSION: Final = 3
 
 _log = logging.getLogger(__name__)
 
@@ -53,6 +62,10 @@ def migrate(sql_engine: sqlalchemy.engine.Engine) -> None:
         if version is not None:
             if version < 1:
                 _migrate_0_to_1(transaction)
+            if version < 2:
+                _migrate_1_to_2(transaction)
+            if version < 3:
+                _migrate_2_to_3(transaction)
 
             _log.info(
                 f"Migrated database from schema {version}"
@@ -135,3 +148,57 @@ def _migrate_0_to_1(transaction: sqlalchemy.engine.Connection) -> None:
     transaction.execute(add_commands_column)
     transaction.execute(add_status_column)
     transaction.execute(add_updated_at_column)
+
+
+def _migrate_1_to_2(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 2.
+
+    This migration moves each run's commands out of the pickled
+    `run_table.commands` blob and into the `run_command_table`,
+    one JSON-serialized row per command. The `run_command_table` itself
+    has already been created by SQLAlchemy, since it is a new table.
+
+    The `run_table.commands` column is left in place, but cleared.
+    """
+    select_run_commands = sqlalchemy.select(run_table.c.id, run_table.c.commands).where(
+        run_table.c.commands.isnot(None)
+    )
+
+    run_rows = transaction.execute(select_run_commands).all()
+
+    for run_row in run_rows:
+        command_rows = [
+            {
+                "run_id": run_row.id,
+                "index_in_run": index,
+                "command_id": command["id"],
+                "command": json.dumps(command, default=pydantic_encoder),
+            }
+            for index, command in enumerate(run_row.commands)
+        ]
+
+        if len(command_rows) > 0:
+            transaction.execute(sqlalchemy.insert(run_command_table), command_rows)
+
+    transaction.execute(
+        sqlalchemy.update(run_table)
+        .where(run_table.c.commands.isnot(None))
+        .values(commands=None)
+    )
+
+
+def _migrate_2_to_3(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 3.
+
+    This migration adds the following nullable column to the analysis table:
+
+    - Column("completed_analysis_as_document", sqlalchemy.String, nullable=True)
+
+    The column is left empty for existing analyses, rather than converting every
+    pickled analysis while the server starts up. The protocols package fills it in
+    from `analysis_table.completed_analysis` when each analysis is first read.
+    """
+    add_document_column = sqlalchemy.text(
+        "ALTER TABLE analysis ADD completed_analysis_as_document VARCHAR"
+    )
+    transaction.execute(add_document_column)
@@ -59,6 +59,17 @@ analysis_table = sqlalchemy.Table(
         sqlalchemy.LargeBinary,
         nullable=False,
     ),
+    # column added in schema v3
+    # The completed analysis, serialized as JSON.
+    # NOTE: `completed_analysis` above is still written, since it can't be made
+    # nullable without rebuilding the table and older software reads it,
+    # but this is what gets read. Analyses stored before v3 have NULL here
+    # until they're first read.
+    sqlalchemy.Column(
+        "completed_analysis_as_document",
+        sqlalchemy.String,
+        nullable=True,
+    ),
 )
 
 
@@ -88,6 +99,8 @@ run_table = sqlalchemy.Table(
         nullable=True,
     ),
     # column added in schema v1
+    # NOTE: no longer written to since schema v2,
+    # which moved commands into the run_command table.
     sqlalchemy.Column(
         "commands",
         sqlalchemy.PickleType(pickler=legacy_pickle),
@@ -117,6 +130,30 @@ action_table = sqlalchemy.Table(
     ),
 )
 
+# table added in schema v2
+run_command_table = sqlalchemy.Table(
+    "run_command",
+    _metadata,
+    sqlalchemy.Column("row_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column(
+        "run_id",
+        sqlalchemy.String,
+        sqlalchemy.ForeignKey("run.id"),
+        nullable=False,
+    ),
+    sqlalchemy.Column("index_in_run", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("command_id", sqlalchemy.String, nullable=False),
+    # The command, serialized as JSON.
+    sqlalchemy.Column("command", sqlalchemy.String, nullable=False),
+    sqlalchemy.Index(
+        "ix_run_command_run_id_command_id",
+        "run_id",
+        "command_id",
+        unique=True,
+    ),
+    sqlalchemy.UniqueConstraint("run_id", "index_in_run"),
+)
+
 
 def add_tables_to_db(sql_engine: sqlalchemy.engine.Engine) -> None:
     """Create the necessary database tables to back all data stores.
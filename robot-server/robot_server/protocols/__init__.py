@@ -1,6 +1,7 @@
 """Protocol file upload and management."""
 from .router import protocols_router, ProtocolNotFound
-from .dependencies import get_protocol_store
+from .dependencies import get_protocol_store, get_analysis_executor
+from .analysis_executor import AnalysisExecutor
 from .protocol_store import ProtocolStore, ProtocolResource, ProtocolNotFoundError
 
 __all__ = [
@@ -13,4 +14,7 @@ __all__ = [
     "ProtocolStore",
     "ProtocolResource",
     "ProtocolNotFoundError",
+    # protocol analysis queue
+    "get_analysis_executor",
+    "AnalysisExecutor",
 ]
@@ -0,0 +1,215 @@
+"""Run protocol analyses in a bounded pool of worker processes.
+
+Analysis simulates a whole protocol, which can keep a CPU busy for a long time.
+Running it in worker processes, rather than on the server's event loop,
+keeps it from slowing down HTTP requests, like the ones controlling a live run.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import count
+from typing import Callable, Dict, List, Optional
+
+from opentrons import protocol_runner
+from opentrons.protocol_reader import ProtocolSource
+
+from robot_server.analysis_worker import initialize_worker, simulate_protocol
+
+
+_log = logging.getLogger(__name__)
+
+QueuePositionCallback = Callable[[Optional[int]], None]
+"""Called with an analysis's position in the queue, or `None` once it has started."""
+
+
+class AnalysisCancelledError(Exception):
+    """Raised when an analysis is cancelled before it completes."""
+
+    def __init__(self, analysis_id: str) -> None:
+        """Initialize the error's message."""
+        super().__init__(f'Analysis "{analysis_id}" was cancelled.')
+
+
+def create_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create a pool of low-priority worker processes to run analyses in.
+
+    Workers are spawned, rather than forked, so they don't inherit
+    the server's threads and open resources. They only import
+    `robot_server.analysis_worker`, not the whole server.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initialize_worker,
+    )
+
+
+@dataclass
+class _AnalysisJob:
+    analysis_id: str
+    protocol_id: str
+    protocol_source: ProtocolSource
+    sequence: int
+    on_queue_position: QueuePositionCallback
+    result: asyncio.Future[protocol_runner.RunResult] = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+
+
+class AnalysisExecutor:
+    """A queue of protocol analyses, run a few at a time in an `Executor`.
+
+    Analyses are started in the order they were submitted, except that analyses
+    of the prioritized protocol (the one most recently selected to run) go first.
+    """
+
+    def __init__(self, executor: Executor, max_concurrent_analyses: int) -> None:
+        """Initialize the queue.
+
+        Args:
+            executor: Where to run simulations. Normally a process pool
+                from `create_process_pool()`.
+            max_concurrent_analyses: How many simulations to run at once.
+                This should match the number of workers in `executor`.
+        """
+        self._executor = executor
+        self._max_concurrent_analyses = max_concurrent_analyses
+        self._queue: List[_AnalysisJob] = []
+        self._running: Dict[
+            asyncio.Future[protocol_runner.RunResult], _AnalysisJob
+        ] = {}
+        self._sequence = count()
+        self._prioritized_protocol_id: Optional[str] = None
+
+    async def analyze(
+        self,
+        analysis_id: str,
+        protocol_id: str,
+        protocol_source: ProtocolSource,
+        on_queue_position: QueuePositionCallback,
+    ) -> protocol_runner.RunResult:
+        """Queue a protocol for analysis and wait for the result.
+
+        Args:
+            analysis_id: The ID of the analysis, for cancellation and logging.
+            protocol_id: The ID of the protocol being analyzed,
+                for prioritization and cancellation.
+            protocol_source: The protocol to analyze.
+            on_queue_position: Called whenever the analysis's position
+                in the queue changes, and with `None` when it starts.
+
+        Raises:
+            AnalysisCancelledError: The analysis was cancelled with `cancel()`.
+        """
+        job = _AnalysisJob(
+            analysis_id=analysis_id,
+            protocol_id=protocol_id,
+            protocol_source=protocol_source,
+            sequence=next(self._sequence),
+            on_queue_position=on_queue_position,
+        )
+        self._queue.append(job)
+        self._start_queued_jobs()
+
+        try:
+            return await job.result
+        except asyncio.CancelledError:
+            # The caller was cancelled, e.g. because the server is shutting down.
+            self._cancel_job(job)
+            raise
+
+    def prioritize(self, protocol_id: str) -> None:
+        """Move any queued analyses of the given protocol to the front of the queue."""
+        self._prioritized_protocol_id = protocol_id
+        self._report_queue_positions()
+
+    def cancel(self, protocol_id: str) -> None:
+        """Cancel any queued or running analyses of the given protocol.
+
+        A running simulation can't be interrupted, so its worker stays busy
+        until the simulation finishes, but its result is thrown away.
+        """
+        jobs = [job for job in self._queue if job.protocol_id == protocol_id] + [
+            job for job in self._running.values() if job.protocol_id == protocol_id
+        ]
+        for job in jobs:
+            self._cancel_job(job)
+
+    async def shut_down(self) -> None:
+        """Cancel every analysis and wait for the executor to stop.
+
+        Simulations that are already running can't be interrupted,
+        so this waits for them to finish before the workers exit.
+
+        Intended to be called just once, when the server shuts down.
+        """
+        for job in self._queue + list(self._running.values()):
+            self._cancel_job(job)
+        await asyncio.get_running_loop().run_in_executor(
+            None, partial(self._executor.shutdown, wait=True)
+        )
+
+    def _cancel_job(self, job: _AnalysisJob) -> None:
+        if job in self._queue:
+            self._queue.remove(job)
+            self._report_queue_positions()
+        if not job.result.done():
+            _log.info(f'Cancelling analysis "{job.analysis_id}".')
+            job.result.set_exception(AnalysisCancelledError(job.analysis_id))
+
+    def _sorted_queue(self) -> List[_AnalysisJob]:
+        return sorted(
+            self._queue,
+            key=lambda job: (
+                job.protocol_id != self._prioritized_protocol_id,
+                job.sequence,
+            ),
+        )
+
+    def _report_queue_positions(self) -> None:
+        for position, job in enumerate(self._sorted_queue()):
+            job.on_queue_position(position)
+
+    def _start_queued_jobs(self) -> None:
+        for job in self._sorted_queue():
+            if len(self._running) >= self._max_concurrent_analyses:
+                break
+
+            self._queue.remove(job)
+            job.on_queue_position(None)
+            _log.info(f'Starting analysis "{job.analysis_id}".')
+
+            # `simulate_protocol` is looked up when the job starts, not at import.
+            simulation = asyncio.wrap_future(
+                self._executor.submit(simulate_protocol, job.protocol_source)
+            )
+            self._running[simulation] = job
+            simulation.add_done_callback(self._handle_simulation_done)
+
+        self._report_queue_positions()
+
+    def _handle_simulation_done(
+        self, simulation: asyncio.Future[protocol_runner.RunResult]
+    ) -> None:
+        job = self._running.pop(simulation)
+
+        if job.result.done():
+            # The job was cancelled. Retrieve its simulation's exception anyway,
+            # so asyncio doesn't warn that it was never retrieved.
+            if not simulation.cancelled():
+                simulation.exception()
+        elif simulation.cancelled():
+            job.result.set_exception(AnalysisCancelledError(job.analysis_id))
+        else:
+            exception = simulation.exception()
+            if exception is not None:
+                job.result.set_exception(exception)
+            else:
+                job.result.set_result(simulation.result())
+
+        self._start_queued_jobs()
@@ -2,7 +2,7 @@
 # TODO(mc, 2021-08-25): add modules to simulation result
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import List, Union
+from typing import List, Optional, Union
 from typing_extensions import Literal
 
 from opentrons.protocol_engine import (
@@ -52,6 +52,13 @@ class PendingAnalysis(BaseModel):
         AnalysisStatus.PENDING,
         description="Status marking the analysis as pending",
     )
+    queuePosition: Optional[int] = Field(
+        None,
+        description=(
+            "How many other analyses must start before this one can."
+            " Null once this analysis has started running."
+        ),
+    )
 
 
 class CompletedAnalysis(BaseModel):
@@ -8,6 +8,8 @@ from typing_extensions import Final
 
 import sqlalchemy
 
+from opentrons_shared_data.robot.dev_types import RobotType
+
 from opentrons.protocol_engine import (
     Command,
     ErrorOccurrence,
@@ -26,7 +28,11 @@ from .analysis_models import (
     AnalysisStatus,
 )
 
-from .completed_analysis_store import CompletedAnalysisStore, CompletedAnalysisResource
+from .completed_analysis_store import (
+    AnalysisSourceKey,
+    CompletedAnalysisStore,
+    CompletedAnalysisResource,
+)
 from .analysis_memcache import MemoryCache
 
 _log = getLogger(__name__)
@@ -94,6 +100,9 @@ class AnalysisStore:
             sql_engine=sql_engine,
             memory_cache=MemoryCache(_CACHE_MAX_SIZE, str, CompletedAnalysisResource),
             current_analyzer_version=_CURRENT_ANALYZER_VERSION,
+            source_cache=MemoryCache(
+                _CACHE_MAX_SIZE, AnalysisSourceKey, CompletedAnalysis
+            ),
         )
 
     def add_pending(self, protocol_id: str, analysis_id: str) -> AnalysisSummary:
@@ -114,6 +123,27 @@ class AnalysisStore:
         )
         return _summarize_pending(pending_analysis=new_pending_analysis)
 
+    def update_pending(self, analysis_id: str, queue_position: Optional[int]) -> None:
+        """Report the progress of a pending analysis.
+
+        Args:
+            analysis_id: The ID of the analysis to update.
+                Must point to a valid pending analysis.
+            queue_position: See `PendingAnalysis.queuePosition`.
+        """
+        self._pending_store.update(
+            analysis_id=analysis_id, queue_position=queue_position
+        )
+
+    def remove_pending(self, analysis_id: str) -> None:
+        """Remove a pending analysis that will never complete, like a cancelled one.
+
+        Args:
+            analysis_id: The ID of the analysis to remove.
+                Must point to a valid pending analysis.
+        """
+        self._pending_store.remove(analysis_id=analysis_id)
+
     async def update(
         self,
         analysis_id: str,
@@ -123,6 +153,8 @@ class AnalysisStore:
         pipettes: List[LoadedPipette],
         errors: List[ErrorOccurrence],
         liquids: List[Liquid],
+        content_hash: Optional[str] = None,
+        robot_type: Optional[RobotType] = None,
     ) -> None:
         """Promote a pending analysis to completed, adding details of its results.
 
@@ -136,7 +168,10 @@ class AnalysisStore:
             errors: See `CompletedAnalysis.errors`. Also used to infer whether
                 the completed analysis result is `OK` or `NOT_OK`.
             liquids: See `CompletedAnalysis.liquids`.
-            robot_type: See `CompletedAnalysis.robotType`.
+            content_hash: The content hash of the analyzed protocol files.
+                If given along with `robot_type`, the results are cached
+                for `get_cached_result()`.
+            robot_type: The robot type the protocol files were analyzed for.
         """
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
 
@@ -166,8 +201,18 @@ class AnalysisStore:
             analyzer_version=_CURRENT_ANALYZER_VERSION,
             completed_analysis=completed_analysis,
         )
+        source_key = (
+            AnalysisSourceKey(
+                content_hash=content_hash,
+                robot_type=robot_type,
+                analyzer_version=_CURRENT_ANALYZER_VERSION,
+            )
+            if content_hash is not None and robot_type is not None
+            else None
+        )
         await self._completed_store.add(
-            completed_analysis_resource=completed_analysis_resource
+            completed_analysis_resource=completed_analysis_resource,
+            source_key=source_key,
         )
 
         self._pending_store.remove(analysis_id=analysis_id)
@@ -190,6 +235,56 @@ class AnalysisStore:
         else:
             raise AnalysisNotFoundError(analysis_id=analysis_id)
 
+    async def get_as_document(self, analysis_id: str) -> str:
+        """Like `get()`, but return the analysis serialized as JSON.
+
+        Completed analyses are returned as stored, without parsing them.
+
+        Raises:
+            AnalysisNotFoundError
+        """
+        pending_analysis = self._pending_store.get(analysis_id=analysis_id)
+        if pending_analysis is not None:
+            return pending_analysis.json()
+
+        completed_analysis_document = await self._completed_store.get_by_id_as_document(
+            analysis_id=analysis_id
+        )
+        if completed_analysis_document is not None:
+            return completed_analysis_document
+        else:
+            raise AnalysisNotFoundError(analysis_id=analysis_id)
+
+    async def get_by_protocol_as_document(self, protocol_id: str) -> List[str]:
+        """Like `get_by_protocol()`, but return each analysis serialized as JSON.
+
+        Completed analyses are returned as stored, without parsing them.
+        """
+        completed_analysis_documents = (
+            await self._completed_store.get_by_protocol_as_document(
+                protocol_id=protocol_id
+            )
+        )
+
+        pending_analysis = self._pending_store.get_by_protocol(protocol_id=protocol_id)
+
+        if pending_analysis is None:
+            return completed_analysis_documents
+        else:
+            return completed_analysis_documents + [pending_analysis.json()]
+
+    def get_cached_result(
+        self, content_hash: str, robot_type: RobotType
+    ) -> Optional[CompletedAnalysis]:
+        """Get a previous analysis of protocol files with the given contents, if any.
+
+        Only analyses made by the current analyzer version are considered,
+        and only recent ones are kept, so a cache miss is always possible.
+        """
+        return self._completed_store.get_by_source(
+            content_hash=content_hash, robot_type=robot_type
+        )
+
     def get_summaries_by_protocol(self, protocol_id: str) -> List[AnalysisSummary]:
         """Get summaries of all analyses for a protocol, in order from oldest first.
 
@@ -258,6 +353,15 @@ class _PendingAnalysisStore:
 
         return new_pending_analysis
 
+    def update(self, analysis_id: str, queue_position: Optional[int]) -> None:
+        """Replace the pending analysis with the given ID with an updated one.
+
+        The given analysis must exist.
+        """
+        self._analyses_by_id[analysis_id] = PendingAnalysis.construct(
+            id=analysis_id, queuePosition=queue_position
+        )
+
     def remove(self, analysis_id: str) -> None:
         """Remove the pending analysis with the given ID.
 
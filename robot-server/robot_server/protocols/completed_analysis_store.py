@@ -1,11 +1,15 @@
 """Completed analysis storage and access."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import json
+from typing import Dict, List, Optional, Tuple
 from logging import getLogger
 from dataclasses import dataclass
 import sqlalchemy
 import anyio
+from pydantic.json import pydantic_encoder
+
+from opentrons_shared_data.robot.dev_types import RobotType
 
 from robot_server.persistence import analysis_table, sqlite_rowid
 from robot_server.persistence import legacy_pickle
@@ -40,10 +44,19 @@ class CompletedAnalysisResource:
         Avoid calling this from inside a SQL transaction, since it might be slow.
         """
 
-        def serialize_completed_analysis() -> bytes:
-            return legacy_pickle.dumps(self.completed_analysis.dict())
+        def serialize_completed_analysis() -> Tuple[bytes, str]:
+            # Both serializations start from the same dict, like `.json()` would,
+            # so the analysis model is only walked once.
+            serialized_dict = self.completed_analysis.dict()
+            return (
+                legacy_pickle.dumps(serialized_dict),
+                json.dumps(serialized_dict, default=pydantic_encoder),
+            )
 
-        serialized_completed_analysis = await anyio.to_thread.run_sync(
+        (
+            serialized_completed_analysis,
+            completed_analysis_as_document,
+        ) = await anyio.to_thread.run_sync(
             serialize_completed_analysis,
             # Cancellation may orphan the worker thread,
             # but that should be harmless in this case.
@@ -54,7 +67,11 @@ class CompletedAnalysisResource:
             "id": self.id,
             "protocol_id": self.protocol_id,
             "analyzer_version": self.analyzer_version,
+            # Still written because the column is NOT NULL in existing databases,
+            # and so that older software can read analyses stored by this one
+            # after a downgrade.
             "completed_analysis": serialized_completed_analysis,
+            "completed_analysis_as_document": completed_analysis_as_document,
         }
 
     @classmethod
@@ -83,6 +100,9 @@ class CompletedAnalysisResource:
         assert isinstance(protocol_id, str)
 
         def parse_completed_analysis() -> CompletedAnalysis:
+            document = sql_row.completed_analysis_as_document
+            if document is not None:
+                return CompletedAnalysis.parse_raw(document)
             return CompletedAnalysis.parse_obj(
                 legacy_pickle.loads(sql_row.completed_analysis)
             )
@@ -102,15 +122,34 @@ class CompletedAnalysisResource:
         )
 
 
+@dataclass(frozen=True)
+class AnalysisSourceKey:
+    """Everything that determines the result of analyzing some protocol files.
+
+    Analyzing files with the same contents, for the same robot type,
+    under the same analyzer version should always give the same result.
+    """
+
+    content_hash: str
+    robot_type: RobotType
+    analyzer_version: str
+
+
 class CompletedAnalysisStore:
     """A SQL-persistent and memory-cached store of protocol analyses that are completed.
 
     To make accesses to analyses faster, this class does its own in-memory caching of
     completed analyses. This is an annoying thing to have to do, but we can't use an LRU
     cache because the access methods are async, and lru_cache doesn't work with those.
+
+    It also keeps a content-addressed cache of recent analysis results, keyed by
+    `AnalysisSourceKey`, so protocol files that have already been analyzed don't
+    need to be simulated again. Entries in this cache outlive the protocols and
+    analyses they came from, but not the server process.
     """
 
     _memcache: MemoryCache[str, CompletedAnalysisResource]
+    _source_cache: MemoryCache[AnalysisSourceKey, CompletedAnalysis]
     _sql_engine: sqlalchemy.engine.Engine
     _current_analyzer_version: str
 
@@ -119,10 +158,12 @@ class CompletedAnalysisStore:
         sql_engine: sqlalchemy.engine.Engine,
         memory_cache: MemoryCache[str, CompletedAnalysisResource],
         current_analyzer_version: str,
+        source_cache: MemoryCache[AnalysisSourceKey, CompletedAnalysis],
     ) -> None:
         self._sql_engine = sql_engine
         self._memcache = memory_cache
         self._current_analyzer_version = current_analyzer_version
+        self._source_cache = source_cache
 
     async def get_by_id(self, analysis_id: str) -> Optional[CompletedAnalysisResource]:
         """Return the analysis with the given ID, if it exists."""
@@ -202,6 +243,65 @@ class CompletedAnalysisStore:
             local_memcache[analysis_id] for analysis_id in ordered_analyses_for_protocol
         ]
 
+    async def get_by_id_as_document(self, analysis_id: str) -> Optional[str]:
+        """Return the JSON of the analysis with the given ID, if it exists.
+
+        This is the stored JSON, returned as-is, so it's much cheaper than
+        `get_by_id()` when the analysis only needs to be sent somewhere else.
+        """
+        statement = sqlalchemy.select(
+            analysis_table.c.completed_analysis_as_document
+        ).where(analysis_table.c.id == analysis_id)
+        with self._sql_engine.begin() as transaction:
+            try:
+                document = transaction.execute(statement).scalar_one()
+            except sqlalchemy.exc.NoResultFound:
+                return None
+        if document is None:
+            return await self._get_by_id_as_new_document(analysis_id)
+        assert isinstance(document, str)
+        return document
+
+    async def get_by_protocol_as_document(self, protocol_id: str) -> List[str]:
+        """Like `get_by_protocol()`, but return the stored JSON of each analysis."""
+        statement = (
+            sqlalchemy.select(
+                analysis_table.c.id, analysis_table.c.completed_analysis_as_document
+            )
+            .where(analysis_table.c.protocol_id == protocol_id)
+            .order_by(sqlite_rowid)
+        )
+        with self._sql_engine.begin() as transaction:
+            results = transaction.execute(statement).all()
+
+        documents: List[str] = []
+        for row in results:
+            document = row.completed_analysis_as_document
+            if document is None:
+                document = await self._get_by_id_as_new_document(row.id)
+            assert isinstance(document, str)
+            documents.append(document)
+
+        return documents
+
+    async def _get_by_id_as_new_document(self, analysis_id: str) -> Optional[str]:
+        # Analyses stored before schema v3, or by older software after a downgrade,
+        # won't have a document yet. Make one from the pickled analysis and store it,
+        # so this only happens once per analysis.
+        resource = await self.get_by_id(analysis_id)
+        if resource is None:
+            return None
+        document = resource.completed_analysis.json()
+        statement = (
+            analysis_table.update()
+            .where(analysis_table.c.id == analysis_id)
+            .where(analysis_table.c.completed_analysis_as_document.is_(None))
+            .values(completed_analysis_as_document=document)
+        )
+        with self._sql_engine.begin() as transaction:
+            transaction.execute(statement)
+        return document
+
     def get_ids_by_protocol(self, protocol_id: str) -> List[str]:
         """Like `get_by_protocol()`, but return only the ID of each analysis."""
         statement = (
@@ -219,8 +319,34 @@ class CompletedAnalysisStore:
 
         return result_ids
 
-    async def add(self, completed_analysis_resource: CompletedAnalysisResource) -> None:
-        """Add a resource to the store."""
+    def get_by_source(
+        self, content_hash: str, robot_type: RobotType
+    ) -> Optional[CompletedAnalysis]:
+        """Return a cached analysis of protocol files with the given contents, if any.
+
+        Only analyses made by the current analyzer version are returned.
+        The returned analysis keeps the ID it was originally stored under.
+        """
+        key = AnalysisSourceKey(
+            content_hash=content_hash,
+            robot_type=robot_type,
+            analyzer_version=self._current_analyzer_version,
+        )
+        try:
+            return self._source_cache.get(key)
+        except KeyError:
+            return None
+
+    async def add(
+        self,
+        completed_analysis_resource: CompletedAnalysisResource,
+        source_key: Optional[AnalysisSourceKey] = None,
+    ) -> None:
+        """Add a resource to the store.
+
+        If `source_key` is given, also cache the analysis by the files it analyzed,
+        for `get_by_source()`.
+        """
         statement = analysis_table.insert().values(
             await completed_analysis_resource.to_sql_values()
         )
@@ -229,3 +355,7 @@ class CompletedAnalysisStore:
         self._memcache.insert(
             completed_analysis_resource.id, completed_analysis_resource
         )
+        if source_key is not None:
+            self._source_cache.insert(
+                source_key, completed_analysis_resource.completed_analysis
+            )
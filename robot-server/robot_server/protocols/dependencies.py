@@ -27,6 +27,7 @@ from .protocol_store import (
 )
 from .protocol_analyzer import ProtocolAnalyzer
 from .analysis_store import AnalysisStore
+from .analysis_executor import AnalysisExecutor, create_process_pool
 
 
 _PROTOCOL_FILES_SUBDIRECTORY: Final = "protocols"
@@ -38,6 +39,8 @@ _protocol_store_accessor = AppStateAccessor[ProtocolStore]("protocol_store")
 
 _analysis_store_accessor = AppStateAccessor[AnalysisStore]("analysis_store")
 
+_analysis_executor_accessor = AppStateAccessor[AnalysisExecutor]("analysis_executor")
+
 _protocol_directory_init_lock = AsyncLock()
 _protocol_directory_accessor = AppStateAccessor[Path]("protocol_directory")
 
@@ -106,12 +109,49 @@ async def get_analysis_store(
     return analysis_store
 
 
+def initialize_analysis_executor(app_state: AppState) -> None:
+    """Create a new `AnalysisExecutor` and store it on `app_state`.
+
+    Intended to be called just once, when the server starts up.
+    """
+    max_concurrent_analyses = get_settings().maximum_concurrent_analyses
+    _analysis_executor_accessor.set_on(
+        app_state,
+        AnalysisExecutor(
+            executor=create_process_pool(max_workers=max_concurrent_analyses),
+            max_concurrent_analyses=max_concurrent_analyses,
+        ),
+    )
+
+
+async def clean_up_analysis_executor(app_state: AppState) -> None:
+    """Clean up the `AnalysisExecutor` stored on `app_state`.
+
+    Intended to be called just once, when the server shuts down.
+    """
+    analysis_executor = _analysis_executor_accessor.get_from(app_state)
+
+    if analysis_executor is not None:
+        await analysis_executor.shut_down()
+
+
+def get_analysis_executor(
+    app_state: AppState = Depends(get_app_state),
+) -> AnalysisExecutor:
+    """Get the singleton AnalysisExecutor that queues and runs protocol analyses."""
+    analysis_executor = _analysis_executor_accessor.get_from(app_state)
+    assert analysis_executor, "Analysis executor was not initialized"
+    return analysis_executor
+
+
 async def get_protocol_analyzer(
     analysis_store: AnalysisStore = Depends(get_analysis_store),
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
 ) -> ProtocolAnalyzer:
     """Construct a ProtocolAnalyzer for a single request."""
     return ProtocolAnalyzer(
         analysis_store=analysis_store,
+        analysis_executor=analysis_executor,
     )
 
 
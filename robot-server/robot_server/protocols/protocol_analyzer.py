@@ -1,10 +1,10 @@
 """Protocol analysis module."""
 import logging
-
-from opentrons import protocol_runner
+from typing import Optional
 
 from .protocol_store import ProtocolResource
 from .analysis_store import AnalysisStore
+from .analysis_executor import AnalysisExecutor, AnalysisCancelledError
 
 
 log = logging.getLogger(__name__)
@@ -16,21 +16,60 @@ class ProtocolAnalyzer:
     def __init__(
         self,
         analysis_store: AnalysisStore,
+        analysis_executor: AnalysisExecutor,
     ) -> None:
         """Initialize the analyzer and its dependencies."""
         self._analysis_store = analysis_store
+        self._analysis_executor = analysis_executor
 
     async def analyze(
         self,
         protocol_resource: ProtocolResource,
         analysis_id: str,
     ) -> None:
-        """Analyze a given protocol, storing the analysis when complete."""
-        runner = await protocol_runner.create_simulating_runner(
-            robot_type=protocol_resource.source.robot_type,
-            protocol_config=protocol_resource.source.config,
+        """Analyze a given protocol, storing the analysis when complete.
+
+        If files with the same contents were recently analyzed, their results
+        are reused instead of simulating the protocol again. Otherwise, the
+        simulation is queued on the analysis executor, and the pending
+        analysis's queue position is kept up to date while it waits.
+        """
+        source = protocol_resource.source
+        cached = self._analysis_store.get_cached_result(
+            content_hash=source.content_hash,
+            robot_type=source.robot_type,
         )
-        result = await runner.run(protocol_resource.source)
+
+        if cached is not None:
+            log.info(f'Completed analysis "{analysis_id}" from "{cached.id}".')
+
+            await self._analysis_store.update(
+                analysis_id=analysis_id,
+                commands=cached.commands,
+                labware=cached.labware,
+                modules=cached.modules,
+                pipettes=cached.pipettes,
+                errors=cached.errors,
+                liquids=cached.liquids,
+            )
+            return
+
+        def on_queue_position(queue_position: Optional[int]) -> None:
+            self._analysis_store.update_pending(
+                analysis_id=analysis_id, queue_position=queue_position
+            )
+
+        try:
+            result = await self._analysis_executor.analyze(
+                analysis_id=analysis_id,
+                protocol_id=protocol_resource.protocol_id,
+                protocol_source=source,
+                on_queue_position=on_queue_position,
+            )
+        except AnalysisCancelledError:
+            log.info(f'Cancelled analysis "{analysis_id}".')
+            self._analysis_store.remove_pending(analysis_id=analysis_id)
+            return
 
         log.info(f'Completed analysis "{analysis_id}".')
 
@@ -42,4 +81,6 @@ class ProtocolAnalyzer:
             pipettes=result.state_summary.pipettes,
             errors=result.state_summary.errors,
             liquids=result.state_summary.liquids,
+            content_hash=source.content_hash,
+            robot_type=source.robot_type,
         )
@@ -27,12 +27,14 @@ from robot_server.service.json_api import (
     SimpleEmptyBody,
     MultiBodyMeta,
     PydanticResponse,
+    PreSerializedResponse,
 )
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_models import Protocol, ProtocolFile, Metadata
 from .protocol_analyzer import ProtocolAnalyzer
 from .analysis_store import AnalysisStore, AnalysisNotFoundError
+from .analysis_executor import AnalysisExecutor
 from .analysis_models import ProtocolAnalysis
 from .protocol_store import (
     ProtocolStore,
@@ -46,6 +48,7 @@ from .dependencies import (
     get_protocol_store,
     get_analysis_store,
     get_protocol_analyzer,
+    get_analysis_executor,
     get_protocol_directory,
     get_file_reader_writer,
     get_file_hasher,
@@ -396,15 +399,19 @@ async def get_protocol_by_id(
 async def delete_protocol_by_id(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
 ) -> PydanticResponse[SimpleEmptyBody]:
     """Delete an uploaded protocol by ID.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
         protocol_store: In-memory database of protocol resources.
+        analysis_executor: The protocol analysis queue, to cancel
+            any analysis of the deleted protocol.
     """
     try:
         protocol_store.remove(protocol_id=protocolId)
+        analysis_executor.cancel(protocol_id=protocolId)
 
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND) from e
@@ -430,7 +437,7 @@ async def get_protocol_analyses(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> PydanticResponse[SimpleMultiBody[ProtocolAnalysis]]:
+) -> PreSerializedResponse:
     """Get a protocol's full analyses list.
 
     Analyses are returned in order from least-recently started to most-recently started.
@@ -445,13 +452,11 @@ async def get_protocol_analyses(
             status.HTTP_404_NOT_FOUND
         )
 
-    analyses = await analysis_store.get_by_protocol(protocolId)
+    analyses = await analysis_store.get_by_protocol_as_document(protocolId)
 
-    return await PydanticResponse.create(
-        content=SimpleMultiBody.construct(
-            data=analyses,
-            meta=MultiBodyMeta(cursor=0, totalLength=len(analyses)),
-        )
+    return PreSerializedResponse.create_simple_multi(
+        data=analyses,
+        meta=MultiBodyMeta(cursor=0, totalLength=len(analyses)),
     )
 
 
@@ -470,7 +475,7 @@ async def get_protocol_analysis_by_id(
     analysisId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> PydanticResponse[SimpleBody[ProtocolAnalysis]]:
+) -> PreSerializedResponse:
     """Get a protocol analysis by analysis ID.
 
     Arguments:
@@ -487,10 +492,10 @@ async def get_protocol_analysis_by_id(
     try:
         # TODO(mm, 2022-04-28): This will erroneously return an analysis even if
         # this analysis isn't owned by this protocol. This should be an error.
-        analysis = await analysis_store.get(analysisId)
+        analysis = await analysis_store.get_as_document(analysisId)
     except AnalysisNotFoundError as error:
         raise AnalysisNotFound(detail=str(error)).as_error(
             status.HTTP_404_NOT_FOUND
         ) from error
 
-    return await PydanticResponse.create(content=SimpleBody.construct(data=analysis))
+    return PreSerializedResponse.create_simple(data=analysis)
@@ -28,7 +28,9 @@ from robot_server.protocols import (
     ProtocolStore,
     ProtocolNotFound,
     ProtocolNotFoundError,
+    AnalysisExecutor,
     get_protocol_store,
+    get_analysis_executor,
 )
 
 from ..run_models import RunNotFoundError
@@ -127,6 +129,7 @@ async def create_run(
     run_id: str = Depends(get_unique_id),
     created_at: datetime = Depends(get_current_time),
     run_auto_deleter: RunAutoDeleter = Depends(get_run_auto_deleter),
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
 ) -> PydanticResponse[SimpleBody[Run]]:
     """Create a new run.
 
@@ -138,6 +141,8 @@ async def create_run(
         created_at: Timestamp to attach to created run.
         run_auto_deleter: An interface to delete old resources to make room for
             the new run.
+        analysis_executor: The protocol analysis queue, so the protocol
+            about to be run can have its analysis finished first.
     """
     protocol_id = request_body.data.protocolId if request_body is not None else None
     offsets = request_body.data.labwareOffsets if request_body is not None else []
@@ -150,6 +155,7 @@ async def create_run(
             protocol_resource = protocol_store.get(protocol_id=protocol_id)
         except ProtocolNotFoundError as e:
             raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
+        analysis_executor.prioritize(protocol_id=protocol_id)
 
     # TODO(mc, 2022-05-13): move inside `RunDataManager` or return data
     # to pass to `RunDataManager.create`. Right now, runs may be deleted
@@ -1,14 +1,17 @@
 """Router for /runs commands endpoints."""
 import textwrap
 from datetime import datetime
-from typing import Optional, Union
+from typing import AsyncIterator, List, Optional, Union
 from typing_extensions import Final, Literal
 
 from anyio import move_on_after
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from opentrons.protocol_engine import (
+    CurrentCommand,
+    EngineStatus,
     ProtocolEngine,
     commands as pe_commands,
     errors as pe_errors,
@@ -21,6 +24,7 @@ from robot_server.service.json_api import (
     MultiBody,
     MultiBodyMeta,
     PydanticResponse,
+    BaseResponseBody,
 )
 
 from ..run_models import RunCommandSummary
@@ -34,6 +38,10 @@ from .base_router import RunNotFound, RunStopped
 
 _DEFAULT_COMMAND_LIST_LENGTH: Final = 20
 
+# How long the command event stream may sit idle before sending a keep-alive
+# comment, so that clients and proxies don't consider the connection dead.
+_EVENT_STREAM_KEEPALIVE_SEC: Final = 15.0
+
 commands_router = APIRouter()
 
 
@@ -80,6 +88,31 @@ class CommandCollectionLinks(BaseModel):
     )
 
 
+class RunCommandEvent(BaseResponseBody):
+    """An incremental update to a run, sent over the command event stream."""
+
+    cursor: int = Field(
+        ...,
+        description=(
+            "The position of this event in the run's command updates."
+            " Pass it as the `cursor` query parameter (or `Last-Event-ID` header)"
+            " to resume the stream after this event."
+        ),
+    )
+    status: EngineStatus = Field(..., description="The run's current status.")
+    current: Optional[CommandLink] = Field(
+        None,
+        description="Path to the currently running or most recently executed command.",
+    )
+    data: List[RunCommandSummary] = Field(
+        ...,
+        description=(
+            "Commands that were added or changed since the previous event,"
+            " in their latest state."
+        ),
+    )
+
+
 async def get_current_run_engine_from_url(
     runId: str,
     engine_store: EngineStore = Depends(get_engine_store),
@@ -265,40 +298,16 @@ async def get_run_commands(
 
     current_command = run_data_manager.get_current_command(run_id=runId)
 
-    data = [
-        RunCommandSummary.construct(
-            id=c.id,
-            key=c.key,
-            commandType=c.commandType,
-            intent=c.intent,
-            status=c.status,
-            createdAt=c.createdAt,
-            startedAt=c.startedAt,
-            completedAt=c.completedAt,
-            params=c.params,
-            error=c.error,
-        )
-        for c in command_slice.commands
-    ]
+    data = [_summarize_command(c) for c in command_slice.commands]
 
     meta = MultiBodyMeta(
         cursor=command_slice.cursor,
         totalLength=command_slice.total_length,
     )
 
-    links = CommandCollectionLinks()
-
-    if current_command is not None:
-        links.current = CommandLink(
-            href=f"/runs/{runId}/commands/{current_command.command_id}",
-            meta=CommandLinkMeta(
-                runId=runId,
-                commandId=current_command.command_id,
-                index=current_command.index,
-                key=current_command.command_key,
-                createdAt=current_command.created_at,
-            ),
-        )
+    links = CommandCollectionLinks(
+        current=_link_current_command(runId, current_command)
+    )
 
     return await PydanticResponse.create(
         content=MultiBody.construct(data=data, meta=meta, links=links),
@@ -306,6 +315,80 @@ async def get_run_commands(
     )
 
 
+@commands_router.get(
+    path="/runs/{runId}/command_events",
+    summary="Stream command and status updates for the current run",
+    description=textwrap.dedent(
+        """
+        Open a [Server-Sent Events](https://html.spec.whatwg.org/multipage/server-sent-events.html)
+        stream of updates to the current run, as an alternative to repeatedly
+        polling `GET /runs/{runId}` and `GET /runs/{runId}/commands`.
+
+        Each event's data is a JSON object containing the run's status,
+        its current command, and every command that was added or changed
+        since the previous event. The first event contains every command
+        changed since `cursor`, or all commands if no cursor is given.
+
+        Each event's `id` is its `cursor`. If the connection drops,
+        reconnect with that value in the `cursor` query parameter
+        or the `Last-Event-ID` header to receive only the updates you missed.
+
+        The stream ends once the run has stopped, or once the run
+        is no longer the current run.
+        """
+    ),
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "model": RunCommandEvent,
+            "content": {"text/event-stream": {}},
+        },
+        status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
+        status.HTTP_409_CONFLICT: {"model": ErrorBody[RunStopped]},
+    },
+)
+async def get_run_command_events(
+    runId: str,
+    cursor: Optional[int] = Query(
+        None,
+        ge=0,
+        description=(
+            "The `cursor` of the last event you received."
+            " If unspecified, the stream starts with all of the run's commands."
+        ),
+    ),
+    lastEventId: Optional[str] = Header(
+        None,
+        alias="Last-Event-ID",
+        description="Set automatically by `EventSource` clients on reconnection.",
+    ),
+    engine_store: EngineStore = Depends(get_engine_store),
+    protocol_engine: ProtocolEngine = Depends(get_current_run_engine_from_url),
+) -> StreamingResponse:
+    """Stream incremental command and status updates for the current run.
+
+    Arguments:
+        runId: Requested run ID, from the URL.
+        cursor: Command update cursor to resume from.
+        lastEventId: Command update cursor to resume from, if `cursor` is not set.
+        engine_store: Engine store used to check that the run is still current.
+        protocol_engine: The run's `ProtocolEngine`.
+    """
+    if cursor is None and lastEventId is not None and lastEventId.isdigit():
+        cursor = int(lastEventId)
+
+    return StreamingResponse(
+        _stream_run_command_events(
+            run_id=runId,
+            cursor=cursor or 0,
+            engine_store=engine_store,
+            protocol_engine=protocol_engine,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @commands_router.get(
     path="/runs/{runId}/commands/{commandId}",
     summary="Get full details about a specific command in the run",
@@ -343,3 +426,75 @@ async def get_run_command(
         content=SimpleBody.construct(data=command),
         status_code=status.HTTP_200_OK,
     )
+
+
+async def _stream_run_command_events(
+    run_id: str,
+    cursor: int,
+    engine_store: EngineStore,
+    protocol_engine: ProtocolEngine,
+) -> AsyncIterator[str]:
+    """Yield server-sent events for a run until it stops or is no longer current."""
+    last_status: Optional[EngineStatus] = None
+
+    while engine_store.current_run_id == run_id:
+        command_view = protocol_engine.state_view.commands
+        updates = command_view.get_updates_since(cursor)
+        run_status = command_view.get_status()
+
+        if len(updates.commands) > 0 or run_status != last_status:
+            cursor = updates.cursor
+            last_status = run_status
+            event = RunCommandEvent.construct(
+                cursor=cursor,
+                status=run_status,
+                current=_link_current_command(run_id, command_view.get_current()),
+                data=[_summarize_command(c) for c in updates.commands],
+            )
+            yield f"id: {cursor}\nevent: run\ndata: {event.json()}\n\n"
+
+        if command_view.get_is_stopped():
+            break
+
+        with move_on_after(_EVENT_STREAM_KEEPALIVE_SEC) as keepalive_scope:
+            await protocol_engine.wait_for_command_updates(
+                cursor=cursor,
+                status=run_status,
+            )
+
+        if keepalive_scope.cancel_called:
+            yield ": keepalive\n\n"
+
+
+def _summarize_command(command: pe_commands.Command) -> RunCommandSummary:
+    return RunCommandSummary.construct(
+        id=command.id,
+        key=command.key,
+        commandType=command.commandType,
+        intent=command.intent,
+        status=command.status,
+        createdAt=command.createdAt,
+        startedAt=command.startedAt,
+        completedAt=command.completedAt,
+        params=command.params,
+        error=command.error,
+    )
+
+
+def _link_current_command(
+    run_id: str,
+    current_command: Optional[CurrentCommand],
+) -> Optional[CommandLink]:
+    if current_command is None:
+        return None
+
+    return CommandLink(
+        href=f"/runs/{run_id}/commands/{current_command.command_id}",
+        meta=CommandLinkMeta(
+            runId=run_id,
+            commandId=current_command.command_id,
+            index=current_command.index,
+            key=current_command.command_key,
+            createdAt=current_command.created_at,
+        ),
+    )
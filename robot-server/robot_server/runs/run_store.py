@@ -3,16 +3,21 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, cast
+from typing import Dict, List, Optional
 
 import sqlalchemy
-from pydantic import parse_obj_as
+from pydantic import parse_raw_as
 
 from opentrons.util.helpers import utc_now
 from opentrons.protocol_engine import StateSummary, CommandSlice
 from opentrons.protocol_engine.commands import Command
 
-from robot_server.persistence import run_table, action_table, sqlite_rowid
+from robot_server.persistence import (
+    run_table,
+    action_table,
+    run_command_table,
+    sqlite_rowid,
+)
 from robot_server.protocols import ProtocolNotFoundError
 
 from .action_models import RunAction, RunActionType
@@ -74,13 +79,15 @@ class RunStore:
             .where(run_table.c.id == run_id)
             .values(
                 _convert_state_to_sql_values(
-                    run_id=run_id,
-                    commands=commands,
                     state_summary=summary,
                     engine_status=summary.status,
                 )
             )
         )
+        delete_old_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
+        insert_commands = sqlalchemy.insert(run_command_table)
         select_run_resource = sqlalchemy.select(_run_columns).where(
             run_table.c.id == run_id
         )
@@ -99,6 +106,13 @@ class RunStore:
 
             action_rows = transaction.execute(select_actions).all()
 
+            transaction.execute(delete_old_commands)
+            if len(commands) > 0:
+                transaction.execute(
+                    insert_commands,
+                    _convert_commands_to_sql_values(run_id=run_id, commands=commands),
+                )
+
         self._clear_caches()
         return _convert_row_to_run(row=run_row, action_rows=action_rows)
 
@@ -262,22 +276,6 @@ class RunStore:
             else None
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def _get_all_unparsed_commands(self, run_id: str) -> List[Dict[str, Any]]:
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
-        )
-
-        with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound:
-                raise RunNotFoundError(run_id=run_id)
-
-        return (
-            cast(List[Dict[str, Any]], row.commands) if row.commands is not None else []
-        )
-
     def get_commands_slice(
         self,
         run_id: str,
@@ -286,6 +284,8 @@ class RunStore:
     ) -> CommandSlice:
         """Get a slice of run commands from the store.
 
+        Only the commands within the slice are read from the database and parsed.
+
         Args:
             run_id: Run ID to pull commands from.
             length: Number of commands to return.
@@ -298,17 +298,36 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
-        command_intent_dicts = self._get_all_unparsed_commands(run_id)
-        commands_length = len(command_intent_dicts)
-        if cursor is None:
-            cursor = commands_length - length
-
-        # start is inclusive, stop is exclusive
-        actual_cursor = max(0, min(cursor, commands_length - 1))
-        stop = min(commands_length, actual_cursor + length)
+        with self._sql_engine.begin() as transaction:
+            if not self._run_exists(run_id, transaction):
+                raise RunNotFoundError(run_id=run_id)
+
+            select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
+                run_command_table.c.run_id == run_id
+            )
+            commands_length: int = transaction.execute(select_count).scalar_one()
+
+            if cursor is None:
+                cursor = commands_length - length
+
+            # start is inclusive, stop is exclusive
+            actual_cursor = max(0, min(cursor, commands_length - 1))
+            stop = min(commands_length, actual_cursor + length)
+
+            select_slice = (
+                sqlalchemy.select(run_command_table.c.command)
+                .where(
+                    run_command_table.c.run_id == run_id,
+                    run_command_table.c.index_in_run >= actual_cursor,
+                    run_command_table.c.index_in_run < stop,
+                )
+                .order_by(run_command_table.c.index_in_run)
+            )
+            slice_rows = transaction.execute(select_slice).all()
+
         sliced_commands: List[Command] = [
-            parse_obj_as(Command, command)  # type: ignore[arg-type]
-            for command in command_intent_dicts[actual_cursor:stop]
+            parse_raw_as(Command, row.command)  # type: ignore[arg-type]
+            for row in slice_rows
         ]
 
         return CommandSlice(
@@ -332,21 +351,21 @@ class RunStore:
             RunNotFoundError: The given run ID was not found in the store.
             CommandNotFoundError: The given command ID was not found in the store.
         """
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
-            run_table.c.id == run_id
+        select_command = sqlalchemy.select(run_command_table.c.command).where(
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.command_id == command_id,
         )
+
         with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound as e:
-                raise RunNotFoundError(run_id=run_id) from e
+            if not self._run_exists(run_id, transaction):
+                raise RunNotFoundError(run_id=run_id)
 
-        try:
-            command = next(c for c in row.commands if c["id"] == command_id)
-        except StopIteration as e:
-            raise CommandNotFoundError(command_id=command_id) from e
+            command = transaction.execute(select_command).scalar_one_or_none()
 
-        return parse_obj_as(Command, command)  # type: ignore[arg-type]
+        if command is None:
+            raise CommandNotFoundError(command_id=command_id)
+
+        return parse_raw_as(Command, command)  # type: ignore[arg-type]
 
     def remove(self, run_id: str) -> None:
         """Remove a run by its unique identifier.
@@ -361,8 +380,12 @@ class RunStore:
         delete_actions = sqlalchemy.delete(action_table).where(
             action_table.c.run_id == run_id
         )
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
         with self._sql_engine.begin() as transaction:
             transaction.execute(delete_actions)
+            transaction.execute(delete_commands)
             result = transaction.execute(delete_run)
 
         if result.rowcount < 1:
@@ -376,7 +399,11 @@ class RunStore:
         self.get_all.cache_clear()
         self.get_state_summary.cache_clear()
         self.get_command.cache_clear()
-        self._get_all_unparsed_commands.cache_clear()
+
+    @staticmethod
+    def _run_exists(run_id: str, connection: sqlalchemy.engine.Connection) -> bool:
+        statement = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
+        return connection.execute(statement).first() is not None
 
 
 # The columns that must be present in a row passed to _convert_row_to_run().
@@ -429,14 +456,26 @@ def _convert_action_to_sql_values(action: RunAction, run_id: str) -> Dict[str, o
 
 
 def _convert_state_to_sql_values(
-    run_id: str,
     state_summary: StateSummary,
-    commands: List[Command],
     engine_status: str,
 ) -> Dict[str, object]:
     return {
         "state_summary": state_summary.dict(),
         "engine_status": engine_status,
-        "commands": [command.dict() for command in commands],
         "_updated_at": utc_now(),
     }
+
+
+def _convert_commands_to_sql_values(
+    run_id: str,
+    commands: List[Command],
+) -> List[Dict[str, object]]:
+    return [
+        {
+            "run_id": run_id,
+            "index_in_run": index,
+            "command_id": command.id,
+            "command": command.json(),
+        }
+        for index, command in enumerate(commands)
+    ]
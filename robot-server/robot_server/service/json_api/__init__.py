@@ -14,6 +14,7 @@ from .response import (
     DeprecatedResponseDataModel,
     ResourceModel,
     PydanticResponse,
+    PreSerializedResponse,
     ResponseList,
 )
 
@@ -23,6 +24,7 @@ __all__ = [
     "RequestModel",
     # response models
     "PydanticResponse",
+    "PreSerializedResponse",
     # response body models
     "BaseResponseBody",
     "Body",
@@ -1,9 +1,9 @@
 from __future__ import annotations
 from anyio import to_thread
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Sequence, TypeVar
 from pydantic import Field, BaseModel
 from pydantic.generics import GenericModel
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from .resource_links import ResourceLinks as DeprecatedResourceLinks
 
 
@@ -140,6 +140,34 @@ class PydanticResponse(JSONResponse, Generic[ResponseBodyT]):
         return content.json().encode(self.charset)
 
 
+class PreSerializedResponse(Response):
+    """A JSON response around resource data that's already serialized to JSON.
+
+    Use this to return stored resources without parsing them
+    into Pydantic models just to render them back into JSON.
+    """
+
+    media_type = "application/json"
+
+    @classmethod
+    def create_simple(cls, data: str, status_code: int = 200) -> PreSerializedResponse:
+        """Create a response with the same shape as a `SimpleBody`."""
+        return cls(content=f'{{"data":{data}}}', status_code=status_code)
+
+    @classmethod
+    def create_simple_multi(
+        cls,
+        data: Sequence[str],
+        meta: MultiBodyMeta,
+        status_code: int = 200,
+    ) -> PreSerializedResponse:
+        """Create a response with the same shape as a `SimpleMultiBody`."""
+        return cls(
+            content=f'{{"data":[{",".join(data)}],"meta":{meta.json()}}}',
+            status_code=status_code,
+        )
+
+
 # TODO(mc, 2021-12-09): remove this model
 class DeprecatedResponseDataModel(BaseModel):
     """A model representing an identifiable resource of the server.
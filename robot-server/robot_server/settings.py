@@ -94,5 +94,24 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    maximum_concurrent_analyses: int = Field(
+        default=1,
+        gt=0,
+        description=(
+            "The maximum number of protocol analyses to run at once."
+            " Each one runs in its own worker process, so raising this"
+            " speeds up analysis at the cost of memory and CPU time."
+        ),
+    )
+
+    command_timing_enabled: bool = Field(
+        default=False,
+        description=(
+            "Whether to record how long each command spends in each phase of"
+            " its execution, for `GET /system/commandTiming`."
+            " This adds a little overhead to every command."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -1,6 +1,9 @@
 """Request and response models for /system endpoints."""
 from datetime import datetime
-from pydantic import BaseModel
+from typing import Dict, List
+from pydantic import BaseModel, Field
+
+from opentrons.util.command_timing import TimingPhase
 from robot_server.service.json_api import (
     DeprecatedResponseModel,
     DeprecatedResponseDataModel,
@@ -21,3 +24,45 @@ class SystemTimeResponseAttributes(DeprecatedResponseDataModel, SystemTimeAttrib
 SystemTimeResponse = DeprecatedResponseModel[SystemTimeResponseAttributes]
 
 SystemTimeRequest = RequestModel[SystemTimeAttributes]
+
+
+class TimingHistogram(BaseModel):
+    """How long one phase of one type of command took, in seconds."""
+
+    count: int
+    totalSeconds: float
+    meanSeconds: float
+    minSeconds: float
+    maxSeconds: float
+    p50Seconds: float = Field(..., description="Estimated median.")
+    p90Seconds: float = Field(..., description="Estimated 90th percentile.")
+    p99Seconds: float = Field(..., description="Estimated 99th percentile.")
+    bucketCounts: List[int] = Field(
+        ...,
+        description=(
+            "How many durations fell in each bucket of `bucketUpperBoundsSeconds`,"
+            " plus one final bucket for longer durations."
+        ),
+    )
+
+
+class CommandTypeTiming(BaseModel):
+    """Timing of one type of command, by execution phase."""
+
+    commandType: str
+    phases: Dict[TimingPhase, TimingHistogram]
+
+
+class CommandTiming(BaseModel):
+    """Timing of command execution since the server started or timing was reset."""
+
+    enabled: bool = Field(
+        ...,
+        description=(
+            "Whether timing is being recorded."
+            " Enable it with the `OT_ROBOT_SERVER_COMMAND_TIMING_ENABLED`"
+            " environment variable."
+        ),
+    )
+    bucketUpperBoundsSeconds: List[float]
+    commandTypes: List[CommandTypeTiming]
@@ -3,13 +3,33 @@
 Endpoints include:
 
 - /system/time: allows the client to read & update robot system time
+- /system/commandTiming: allows the client to read & reset command timing
 """
 from datetime import datetime
-from fastapi import APIRouter
+from fastapi import APIRouter, status
 
+from opentrons.util.command_timing import (
+    HISTOGRAM_BUCKET_BOUNDS,
+    CommandTimingRecorder,
+    TimingHistogram as RecordedHistogram,
+    get_command_timing,
+)
+
+from robot_server.service.json_api import (
+    PydanticResponse,
+    SimpleBody,
+    SimpleEmptyBody,
+)
 from robot_server.service.json_api.resource_links import ResourceLinkKey, ResourceLink
 
-from .models import SystemTimeRequest, SystemTimeResponse, SystemTimeResponseAttributes
+from .models import (
+    CommandTiming,
+    CommandTypeTiming,
+    SystemTimeRequest,
+    SystemTimeResponse,
+    SystemTimeResponseAttributes,
+    TimingHistogram,
+)
 from .time_utils import get_system_time, set_system_time
 
 
@@ -51,3 +71,73 @@ async def set_time(new_time: SystemTimeRequest) -> SystemTimeResponse:
     """Set the robot's system time."""
     sys_time = await set_system_time(new_time.data.systemTime)
     return _create_time_response(sys_time)
+
+
+def _create_histogram(histogram: RecordedHistogram) -> TimingHistogram:
+    return TimingHistogram(
+        count=histogram.count,
+        totalSeconds=histogram.total,
+        meanSeconds=histogram.mean,
+        minSeconds=histogram.min,
+        maxSeconds=histogram.max,
+        p50Seconds=histogram.percentile(0.5),
+        p90Seconds=histogram.percentile(0.9),
+        p99Seconds=histogram.percentile(0.99),
+        bucketCounts=histogram.bucket_counts,
+    )
+
+
+def _create_command_timing(recorder: CommandTimingRecorder) -> CommandTiming:
+    return CommandTiming(
+        enabled=recorder.enabled,
+        bucketUpperBoundsSeconds=list(HISTOGRAM_BUCKET_BOUNDS),
+        commandTypes=[
+            CommandTypeTiming(
+                commandType=command_type,
+                phases={
+                    phase: _create_histogram(histogram)
+                    for phase, histogram in histograms.items()
+                },
+            )
+            for command_type, histograms in sorted(recorder.get_histograms().items())
+        ],
+    )
+
+
+@system_router.get(
+    "/system/commandTiming",
+    summary="Get command timing",
+    description=(
+        "Get histograms of how long each type of command has spent in each"
+        " phase of its execution: waiting in the queue, updating state,"
+        " calling the hardware, planning motion, and talking to the motor"
+        " controllers. Phases nest, so a command's hardware time includes"
+        " its motion planning and driver I/O time."
+        " Timing is only recorded if the server was started with"
+        " `OT_ROBOT_SERVER_COMMAND_TIMING_ENABLED` set."
+    ),
+    responses={status.HTTP_200_OK: {"model": SimpleBody[CommandTiming]}},
+)
+async def get_command_timing_histograms() -> PydanticResponse[
+    SimpleBody[CommandTiming]
+]:
+    """Get the command timing recorded so far."""
+    return await PydanticResponse.create(
+        content=SimpleBody.construct(data=_create_command_timing(get_command_timing())),
+        status_code=status.HTTP_200_OK,
+    )
+
+
+@system_router.delete(
+    "/system/commandTiming",
+    summary="Reset command timing",
+    description="Forget the command timing recorded so far.",
+    responses={status.HTTP_200_OK: {"model": SimpleEmptyBody}},
+)
+async def reset_command_timing() -> PydanticResponse[SimpleEmptyBody]:
+    """Reset the command timing recorded so far."""
+    get_command_timing().reset()
+    return await PydanticResponse.create(
+        content=SimpleEmptyBody.construct(),
+        status_code=status.HTTP_200_OK,
+    )
@@ -1,11 +1,14 @@
 """Test SQL database migrations."""
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Generator
+from typing import Generator, List
 
 import pytest
 import sqlalchemy
 from pytest_lazyfixture import lazy_fixture  # type: ignore[import]
 
+from opentrons.protocol_engine import commands as pe_commands
+
 from robot_server.persistence import create_sql_engine
 from robot_server.persistence import (
     migration_table,
@@ -13,10 +16,12 @@ from robot_server.persistence import (
     action_table,
     protocol_table,
     analysis_table,
+    run_command_table,
 )
+from robot_server.runs.run_store import RunStore
 
 
-TABLES = [run_table, action_table, protocol_table, analysis_table]
+TABLES = [run_table, action_table, protocol_table, analysis_table, run_command_table]
 
 
 @pytest.fixture
@@ -26,6 +31,9 @@ def database_v0(tmp_path: Path) -> Path:
     sql_engine = create_sql_engine(db_path)
     sql_engine.execute("DROP TABLE migration")
     sql_engine.execute("DROP TABLE run")
+    sql_engine.execute(
+        "ALTER TABLE analysis DROP COLUMN completed_analysis_as_document"
+    )
     sql_engine.execute(
         """
         CREATE TABLE run (
@@ -46,6 +54,33 @@ def database_v1(tmp_path: Path) -> Path:
     """Create a database matching schema version 1."""
     db_path = tmp_path / "migration-test-v1.db"
     sql_engine = create_sql_engine(db_path)
+    sql_engine.execute("DROP TABLE run_command")
+    sql_engine.execute(
+        "ALTER TABLE analysis DROP COLUMN completed_analysis_as_document"
+    )
+    sql_engine.execute("UPDATE migration SET version = 1")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v2(tmp_path: Path) -> Path:
+    """Create a database matching schema version 2."""
+    db_path = tmp_path / "migration-test-v2.db"
+    sql_engine = create_sql_engine(db_path)
+    sql_engine.execute(
+        "ALTER TABLE analysis DROP COLUMN completed_analysis_as_document"
+    )
+    sql_engine.execute("UPDATE migration SET version = 2")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v3(tmp_path: Path) -> Path:
+    """Create a database matching schema version 3."""
+    db_path = tmp_path / "migration-test-v3.db"
+    sql_engine = create_sql_engine(db_path)
     sql_engine.dispose()
     return db_path
 
@@ -64,19 +99,104 @@ def subject(database_path: Path) -> Generator[sqlalchemy.engine.Engine, None, No
 
 
 @pytest.mark.parametrize(
-    "database_path",
+    ("database_path", "expected_versions"),
     [
-        lazy_fixture("database_v0"),
-        lazy_fixture("database_v1"),
+        (lazy_fixture("database_v0"), [3]),
+        (lazy_fixture("database_v1"), [1, 3]),
+        (lazy_fixture("database_v2"), [2, 3]),
+        (lazy_fixture("database_v3"), [3]),
     ],
 )
-def test_migration(subject: sqlalchemy.engine.Engine) -> None:
+def test_migration(
+    subject: sqlalchemy.engine.Engine,
+    expected_versions: List[int],
+) -> None:
     """It should migrate a table."""
     migrations = subject.execute(sqlalchemy.select(migration_table)).all()
 
-    assert [m.version for m in migrations] == [1]
+    assert [m.version for m in migrations] == expected_versions
 
     # all table queries work without raising
     for table in TABLES:
         values = subject.execute(sqlalchemy.select(table)).all()
         assert values == []
+
+
+def test_migrate_1_to_2_moves_commands(database_v1: Path) -> None:
+    """It should move pickled run commands into the run_command table."""
+    command = pe_commands.WaitForResume(
+        id="pause-1",
+        key="command-key",
+        createdAt=datetime(year=2022, month=1, day=1, tzinfo=timezone.utc),
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+        result=pe_commands.WaitForResumeResult(),
+    )
+
+    sql_engine = create_sql_engine(database_v1)
+    sql_engine.execute("DROP TABLE run_command")
+    sql_engine.execute(
+        "ALTER TABLE analysis DROP COLUMN completed_analysis_as_document"
+    )
+    sql_engine.execute("DELETE FROM migration")
+    sql_engine.execute(
+        sqlalchemy.insert(migration_table).values(
+            created_at=datetime.now(tz=timezone.utc), version=1
+        )
+    )
+    sql_engine.execute(
+        sqlalchemy.insert(run_table).values(
+            id="run-id",
+            created_at=datetime.now(tz=timezone.utc),
+            commands=[command.dict()],
+        )
+    )
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v1)
+
+    try:
+        run_row = subject.execute(sqlalchemy.select(run_table)).one()
+        result = RunStore(subject).get_commands_slice(
+            run_id="run-id", cursor=None, length=20
+        )
+    finally:
+        subject.dispose()
+
+    assert run_row.commands is None
+    assert result.total_length == 1
+    assert result.commands == [command]
+
+
+def test_migrate_2_to_3_adds_analysis_document_column(database_v2: Path) -> None:
+    """It should add the document column without reading stored analyses."""
+    # Open the database without migrating it.
+    sql_engine = sqlalchemy.create_engine(f"sqlite:///{database_v2}")
+    sql_engine.execute(
+        sqlalchemy.insert(protocol_table).values(
+            id="protocol-id", created_at=datetime.now(tz=timezone.utc)
+        )
+    )
+    sql_engine.execute(
+        sqlalchemy.text(
+            "INSERT INTO analysis"
+            " (id, protocol_id, analyzer_version, completed_analysis)"
+            " VALUES (:id, :protocol_id, :analyzer_version, :completed_analysis)"
+        ),
+        id="analysis-id",
+        protocol_id="protocol-id",
+        analyzer_version="initial",
+        # A corrupt analysis shouldn't keep the server from starting.
+        completed_analysis=b"not a pickle",
+    )
+    sql_engine.dispose()
+
+    subject = create_sql_engine(database_v2)
+
+    try:
+        analysis_row = subject.execute(sqlalchemy.select(analysis_table)).one()
+    finally:
+        subject.dispose()
+
+    assert analysis_row.completed_analysis == b"not a pickle"
+    assert analysis_row.completed_analysis_as_document is None
@@ -41,6 +41,7 @@ EXPECTED_STATEMENTS = [
         protocol_id VARCHAR NOT NULL,
         analyzer_version VARCHAR NOT NULL,
         completed_analysis BLOB NOT NULL,
+        completed_analysis_as_document VARCHAR,
         PRIMARY KEY (id),
         FOREIGN KEY(protocol_id) REFERENCES protocol (id)
     )
@@ -71,6 +72,21 @@ EXPECTED_STATEMENTS = [
         FOREIGN KEY(run_id) REFERENCES run (id)
     )
     """,
+    """
+    CREATE TABLE run_command (
+        row_id INTEGER NOT NULL,
+        run_id VARCHAR NOT NULL,
+        index_in_run INTEGER NOT NULL,
+        command_id VARCHAR NOT NULL,
+        command VARCHAR NOT NULL,
+        PRIMARY KEY (row_id),
+        UNIQUE (run_id, index_in_run),
+        FOREIGN KEY(run_id) REFERENCES run (id)
+    )
+    """,
+    """
+    CREATE UNIQUE INDEX ix_run_command_run_id_command_id ON run_command (run_id, command_id)
+    """,
 ]
 
 
@@ -0,0 +1,270 @@
+"""Tests for the AnalysisExecutor interface."""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+import pytest
+
+from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
+
+from robot_server.protocols import analysis_executor
+from robot_server.protocols.analysis_executor import (
+    AnalysisCancelledError,
+    AnalysisExecutor,
+)
+
+
+class _FakeSimulations:
+    """Stand-in simulations that block until the test lets them finish."""
+
+    def __init__(self) -> None:
+        self._finish_events: Dict[str, threading.Event] = {}
+        self._errors: Dict[str, Exception] = {}
+
+    def prepare(self, content_hash: str, error: Optional[Exception] = None) -> None:
+        self._finish_events[content_hash] = threading.Event()
+        if error is not None:
+            self._errors[content_hash] = error
+
+    def finish(self, content_hash: str) -> None:
+        self._finish_events[content_hash].set()
+
+    def finish_all(self) -> None:
+        for event in self._finish_events.values():
+            event.set()
+
+    def simulate(self, protocol_source: ProtocolSource) -> str:
+        content_hash = protocol_source.content_hash
+        self._finish_events[content_hash].wait()
+        if content_hash in self._errors:
+            raise self._errors[content_hash]
+        return f"result-{content_hash}"
+
+
+@pytest.fixture
+def simulations(monkeypatch: pytest.MonkeyPatch) -> Iterator[_FakeSimulations]:
+    """Replace the simulation that runs in the executor with a fake."""
+    fake = _FakeSimulations()
+    monkeypatch.setattr(analysis_executor, "simulate_protocol", fake.simulate)
+    yield fake
+    fake.finish_all()
+
+
+@pytest.fixture
+def thread_pool(simulations: _FakeSimulations) -> Iterator[ThreadPoolExecutor]:
+    """Get a thread pool to stand in for the process pool."""
+    pool = ThreadPoolExecutor(max_workers=2)
+    yield pool
+    simulations.finish_all()
+    pool.shutdown(wait=True)
+
+
+@pytest.fixture
+def queue_positions() -> Dict[str, List[Optional[int]]]:
+    """Get a record of the queue positions reported for each analysis."""
+    return {}
+
+
+@pytest.fixture
+def start_analysis(
+    simulations: _FakeSimulations,
+    queue_positions: Dict[str, List[Optional[int]]],
+) -> Callable[..., "asyncio.Task[object]"]:
+    """Get a function to queue an analysis as a background task."""
+
+    def _start_analysis(
+        subject: AnalysisExecutor,
+        analysis_id: str,
+        protocol_id: str,
+        error: Optional[Exception] = None,
+    ) -> "asyncio.Task[object]":
+        simulations.prepare(content_hash=analysis_id, error=error)
+        queue_positions[analysis_id] = []
+        protocol_source = ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-2 Standard",
+            content_hash=analysis_id,
+        )
+        return asyncio.create_task(
+            subject.analyze(
+                analysis_id=analysis_id,
+                protocol_id=protocol_id,
+                protocol_source=protocol_source,
+                on_queue_position=queue_positions[analysis_id].append,
+            )
+        )
+
+    return _start_analysis
+
+
+async def _wait_until(condition: Callable[[], bool]) -> None:
+    for _ in range(500):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Condition was never met.")
+
+
+async def test_analyze_limits_concurrency(
+    thread_pool: ThreadPoolExecutor,
+    simulations: _FakeSimulations,
+    queue_positions: Dict[str, List[Optional[int]]],
+    start_analysis: Callable[..., "asyncio.Task[object]"],
+) -> None:
+    """It should only run so many analyses at once, in submission order."""
+    subject = AnalysisExecutor(executor=thread_pool, max_concurrent_analyses=1)
+
+    task_1 = start_analysis(subject, "analysis-1", "protocol-1")
+    task_2 = start_analysis(subject, "analysis-2", "protocol-2")
+    task_3 = start_analysis(subject, "analysis-3", "protocol-3")
+    await asyncio.sleep(0)
+
+    assert queue_positions["analysis-1"][-1] is None
+    assert queue_positions["analysis-2"][-1] == 0
+    assert queue_positions["analysis-3"][-1] == 1
+
+    simulations.finish("analysis-1")
+    assert await task_1 == "result-analysis-1"
+    assert queue_positions["analysis-2"][-1] is None
+    assert queue_positions["analysis-3"][-1] == 0
+
+    simulations.finish("analysis-2")
+    simulations.finish("analysis-3")
+    assert await task_2 == "result-analysis-2"
+    assert await task_3 == "result-analysis-3"
+
+
+async def test_analyze_raises_simulation_errors(
+    thread_pool: ThreadPoolExecutor,
+    simulations: _FakeSimulations,
+    start_analysis: Callable[..., "asyncio.Task[object]"],
+) -> None:
+    """It should raise any error from the simulation and move on to the next one."""
+    subject = AnalysisExecutor(executor=thread_pool, max_concurrent_analyses=1)
+
+    task_1 = start_analysis(
+        subject, "analysis-1", "protocol-1", error=RuntimeError("oh no")
+    )
+    task_2 = start_analysis(subject, "analysis-2", "protocol-2")
+    await asyncio.sleep(0)
+
+    simulations.finish("analysis-1")
+    with pytest.raises(RuntimeError, match="oh no"):
+        await task_1
+
+    simulations.finish("analysis-2")
+    assert await task_2 == "result-analysis-2"
+
+
+async def test_prioritize(
+    thread_pool: ThreadPoolExecutor,
+    simulations: _FakeSimulations,
+    queue_positions: Dict[str, List[Optional[int]]],
+    start_analysis: Callable[..., "asyncio.Task[object]"],
+) -> None:
+    """It should start analyses of the prioritized protocol first."""
+    subject = AnalysisExecutor(executor=thread_pool, max_concurrent_analyses=1)
+
+    task_1 = start_analysis(subject, "analysis-1", "protocol-1")
+    task_2 = start_analysis(subject, "analysis-2", "protocol-2")
+    task_3 = start_analysis(subject, "analysis-3", "protocol-3")
+    await asyncio.sleep(0)
+
+    subject.prioritize(protocol_id="protocol-3")
+    assert queue_positions["analysis-2"][-1] == 1
+    assert queue_positions["analysis-3"][-1] == 0
+
+    simulations.finish("analysis-1")
+    await task_1
+    assert queue_positions["analysis-2"][-1] == 0
+    assert queue_positions["analysis-3"][-1] is None
+
+    simulations.finish("analysis-2")
+    simulations.finish("analysis-3")
+    await asyncio.gather(task_2, task_3)
+
+
+async def test_cancel_queued(
+    thread_pool: ThreadPoolExecutor,
+    simulations: _FakeSimulations,
+    queue_positions: Dict[str, List[Optional[int]]],
+    start_analysis: Callable[..., "asyncio.Task[object]"],
+) -> None:
+    """It should drop a cancelled analysis from the queue."""
+    subject = AnalysisExecutor(executor=thread_pool, max_concurrent_analyses=1)
+
+    task_1 = start_analysis(subject, "analysis-1", "protocol-1")
+    task_2 = start_analysis(subject, "analysis-2", "protocol-2")
+    task_3 = start_analysis(subject, "analysis-3", "protocol-3")
+    await asyncio.sleep(0)
+
+    subject.cancel(protocol_id="protocol-2")
+
+    with pytest.raises(AnalysisCancelledError):
+        await task_2
+    assert queue_positions["analysis-3"][-1] == 0
+
+    simulations.finish("analysis-1")
+    simulations.finish("analysis-3")
+    await asyncio.gather(task_1, task_3)
+    assert None not in queue_positions["analysis-2"]
+
+
+async def test_cancel_running(
+    thread_pool: ThreadPoolExecutor,
+    simulations: _FakeSimulations,
+    queue_positions: Dict[str, List[Optional[int]]],
+    start_analysis: Callable[..., "asyncio.Task[object]"],
+) -> None:
+    """It should discard a cancelled analysis's result as soon as it's cancelled.
+
+    The simulation itself can't be interrupted, so the next analysis
+    shouldn't start until it's done.
+    """
+    subject = AnalysisExecutor(executor=thread_pool, max_concurrent_analyses=1)
+
+    task_1 = start_analysis(subject, "analysis-1", "protocol-1")
+    task_2 = start_analysis(subject, "analysis-2", "protocol-2")
+    await asyncio.sleep(0)
+
+    subject.cancel(protocol_id="protocol-1")
+
+    with pytest.raises(AnalysisCancelledError):
+        await task_1
+    assert queue_positions["analysis-2"][-1] == 0
+
+    simulations.finish("analysis-1")
+    await _wait_until(lambda: queue_positions["analysis-2"][-1] is None)
+
+    simulations.finish("analysis-2")
+    assert await task_2 == "result-analysis-2"
+
+
+async def test_shut_down(
+    thread_pool: ThreadPoolExecutor,
+    simulations: _FakeSimulations,
+    start_analysis: Callable[..., "asyncio.Task[object]"],
+) -> None:
+    """It should cancel every analysis and wait for running simulations to stop."""
+    subject = AnalysisExecutor(executor=thread_pool, max_concurrent_analyses=1)
+
+    task_1 = start_analysis(subject, "analysis-1", "protocol-1")
+    task_2 = start_analysis(subject, "analysis-2", "protocol-2")
+    await asyncio.sleep(0)
+
+    shut_down_task = asyncio.create_task(subject.shut_down())
+
+    with pytest.raises(AnalysisCancelledError):
+        await task_1
+    with pytest.raises(AnalysisCancelledError):
+        await task_2
+    assert not shut_down_task.done()
+
+    simulations.finish("analysis-1")
+    await shut_down_task
@@ -110,6 +110,37 @@ async def test_add_pending(
     assert subject.get_summaries_by_protocol("protocol-id") == [expected_summary]
 
 
+async def test_update_pending(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should report the queue position of a pending analysis."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+
+    subject.update_pending(analysis_id="analysis-id", queue_position=3)
+
+    expected_analysis = PendingAnalysis(id="analysis-id", queuePosition=3)
+    assert await subject.get("analysis-id") == expected_analysis
+    assert await subject.get_by_protocol("protocol-id") == [expected_analysis]
+    assert subject.get_summaries_by_protocol("protocol-id") == [
+        AnalysisSummary(id="analysis-id", status=AnalysisStatus.PENDING)
+    ]
+
+
+async def test_remove_pending(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should remove a pending analysis that will never complete."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id")
+
+    subject.remove_pending(analysis_id="analysis-id")
+
+    with pytest.raises(AnalysisNotFoundError):
+        await subject.get("analysis-id")
+    assert await subject.get_by_protocol("protocol-id") == []
+
+
 async def test_returned_in_order_added(
     subject: AnalysisStore, protocol_store: ProtocolStore
 ) -> None:
@@ -253,3 +284,85 @@ async def test_update_infers_status_from_errors(
     analysis = (await subject.get_by_protocol("protocol-id"))[0]
     assert isinstance(analysis, CompletedAnalysis)
     assert analysis.result == expected_result
+
+
+async def test_get_as_document(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should return pending and completed analyses as JSON."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-1")
+    await subject.update(
+        analysis_id="analysis-id-1",
+        commands=[],
+        errors=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        liquids=[],
+    )
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-2")
+
+    completed_document = await subject.get_as_document("analysis-id-1")
+    pending_document = await subject.get_as_document("analysis-id-2")
+    documents = await subject.get_by_protocol_as_document("protocol-id")
+
+    assert CompletedAnalysis.parse_raw(completed_document) == await subject.get(
+        "analysis-id-1"
+    )
+    assert PendingAnalysis.parse_raw(pending_document) == await subject.get(
+        "analysis-id-2"
+    )
+    assert documents == [completed_document, pending_document]
+
+    with pytest.raises(AnalysisNotFoundError, match="analysis-id-3"):
+        await subject.get_as_document("analysis-id-3")
+
+
+async def test_get_cached_result(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should return the results of analyses of the same protocol files."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+
+    assert subject.get_cached_result("abc123", "OT-2 Standard") is None
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-1")
+    await subject.update(
+        analysis_id="analysis-id-1",
+        commands=[],
+        errors=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        liquids=[],
+    )
+
+    # Analyses stored without their source are not cached.
+    assert subject.get_cached_result("abc123", "OT-2 Standard") is None
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-2")
+    await subject.update(
+        analysis_id="analysis-id-2",
+        commands=[],
+        errors=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        liquids=[],
+        content_hash="abc123",
+        robot_type="OT-2 Standard",
+    )
+
+    assert subject.get_cached_result("abc123", "OT-2 Standard") == CompletedAnalysis(
+        id="analysis-id-2",
+        result=AnalysisResult.OK,
+        commands=[],
+        errors=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        liquids=[],
+    )
+    assert subject.get_cached_result("abc123", "OT-3 Standard") is None
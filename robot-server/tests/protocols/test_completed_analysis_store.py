@@ -3,10 +3,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
+import sqlalchemy
 from sqlalchemy.engine import Engine
 from decoy import Decoy
 
 from robot_server.protocols.completed_analysis_store import (
+    AnalysisSourceKey,
     CompletedAnalysisResource,
     CompletedAnalysisStore,
 )
@@ -14,6 +16,7 @@ from opentrons.protocol_reader import (
     ProtocolSource,
     JsonProtocolConfig,
 )
+from robot_server.persistence import analysis_table
 from robot_server.protocols.analysis_memcache import MemoryCache
 from robot_server.protocols.analysis_models import CompletedAnalysis, AnalysisResult
 from robot_server.protocols.protocol_store import (
@@ -28,13 +31,20 @@ def memcache(decoy: Decoy) -> MemoryCache[str, CompletedAnalysisResource]:
     return decoy.mock(cls=MemoryCache)
 
 
+@pytest.fixture
+def source_cache() -> MemoryCache[AnalysisSourceKey, CompletedAnalysis]:
+    """Get a real memcache for analyses by source."""
+    return MemoryCache(2, AnalysisSourceKey, CompletedAnalysis)
+
+
 @pytest.fixture
 def subject(
     memcache: MemoryCache[str, CompletedAnalysisResource],
+    source_cache: MemoryCache[AnalysisSourceKey, CompletedAnalysis],
     sql_engine: Engine,
 ) -> CompletedAnalysisStore:
     """Get a subject."""
-    return CompletedAnalysisStore(sql_engine, memcache, "2")
+    return CompletedAnalysisStore(sql_engine, memcache, "2", source_cache)
 
 
 @pytest.fixture
@@ -142,6 +152,52 @@ async def test_get_by_analysis_id_caches_results(
     decoy.verify(memcache.insert("analysis-id", from_sql))
 
 
+async def test_get_by_source(
+    subject: CompletedAnalysisStore,
+    protocol_store: ProtocolStore,
+) -> None:
+    """It should return analyses added with a source key by their source."""
+    resource = _completed_analysis_resource("analysis-id", "protocol-id")
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+
+    assert subject.get_by_source("abc123", "OT-2 Standard") is None
+
+    await subject.add(
+        resource,
+        source_key=AnalysisSourceKey(
+            content_hash="abc123",
+            robot_type="OT-2 Standard",
+            analyzer_version="2",
+        ),
+    )
+
+    assert (
+        subject.get_by_source("abc123", "OT-2 Standard") is resource.completed_analysis
+    )
+    assert subject.get_by_source("abc123", "OT-3 Standard") is None
+    assert subject.get_by_source("def456", "OT-2 Standard") is None
+
+
+async def test_get_by_source_ignores_other_versions(
+    subject: CompletedAnalysisStore,
+    protocol_store: ProtocolStore,
+) -> None:
+    """It should not return analyses made by a different analyzer version."""
+    resource = _completed_analysis_resource("analysis-id", "protocol-id")
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+
+    await subject.add(
+        resource,
+        source_key=AnalysisSourceKey(
+            content_hash="abc123",
+            robot_type="OT-2 Standard",
+            analyzer_version="1",
+        ),
+    )
+
+    assert subject.get_by_source("abc123", "OT-2 Standard") is None
+
+
 async def test_get_ids_by_protocol(
     subject: CompletedAnalysisStore, sql_engine: Engine, protocol_store: ProtocolStore
 ) -> None:
@@ -185,3 +241,60 @@ async def test_get_by_protocol(
     decoy.when(memcache.insert("analysis-id-1", resource_1)).then_return(None)
     resources = await subject.get_by_protocol("protocol-id-1")
     assert resources == [resource_1, resource_2]
+
+
+async def test_get_as_document(
+    subject: CompletedAnalysisStore,
+    protocol_store: ProtocolStore,
+) -> None:
+    """It should return the stored JSON of analyses."""
+    resource_1 = _completed_analysis_resource("analysis-id-1", "protocol-id-1")
+    resource_2 = _completed_analysis_resource("analysis-id-2", "protocol-id-1")
+    resource_3 = _completed_analysis_resource("analysis-id-3", "protocol-id-2")
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id-1"))
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id-2"))
+    await subject.add(resource_1)
+    await subject.add(resource_2)
+    await subject.add(resource_3)
+
+    document = await subject.get_by_id_as_document("analysis-id-1")
+    assert document is not None
+    assert CompletedAnalysis.parse_raw(document) == resource_1.completed_analysis
+    assert await subject.get_by_id_as_document("not-an-analysis-id") is None
+
+    documents = await subject.get_by_protocol_as_document("protocol-id-1")
+    assert [CompletedAnalysis.parse_raw(d) for d in documents] == [
+        resource_1.completed_analysis,
+        resource_2.completed_analysis,
+    ]
+
+
+async def test_get_as_document_without_stored_document(
+    subject: CompletedAnalysisStore,
+    sql_engine: Engine,
+    memcache: MemoryCache[str, CompletedAnalysisResource],
+    protocol_store: ProtocolStore,
+    decoy: Decoy,
+) -> None:
+    """It should fall back to the pickled analysis if no JSON was stored."""
+    resource = _completed_analysis_resource("analysis-id", "protocol-id")
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+    await subject.add(resource)
+    sql_engine.execute(
+        analysis_table.update().values(completed_analysis_as_document=None)
+    )
+    decoy.when(memcache.get("analysis-id")).then_raise(KeyError())
+
+    document = await subject.get_by_id_as_document("analysis-id")
+    assert document is not None
+    assert CompletedAnalysis.parse_raw(document) == resource.completed_analysis
+
+    documents = await subject.get_by_protocol_as_document("protocol-id")
+    assert [CompletedAnalysis.parse_raw(d) for d in documents] == [
+        resource.completed_analysis
+    ]
+
+    stored_document = sql_engine.execute(
+        sqlalchemy.select(analysis_table.c.completed_analysis_as_document)
+    ).scalar_one()
+    assert stored_document == document
@@ -1,6 +1,6 @@
 """Tests for the ProtocolAnalyzer."""
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 from datetime import datetime
 from pathlib import Path
 
@@ -17,43 +17,44 @@ from opentrons.protocol_engine import (
 import opentrons.protocol_runner as protocol_runner
 from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
 
+from robot_server.protocols.analysis_models import AnalysisResult, CompletedAnalysis
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_executor import (
+    AnalysisCancelledError,
+    AnalysisExecutor,
+)
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 
 
-@pytest.fixture(autouse=True)
-def patch_mock_create_simulating_runner(
-    decoy: Decoy, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Replace protocol_runner.check() with a mock."""
-    mock = decoy.mock(func=protocol_runner.create_simulating_runner)
-    monkeypatch.setattr(protocol_runner, "create_simulating_runner", mock)
-
-
 @pytest.fixture
 def analysis_store(decoy: Decoy) -> AnalysisStore:
     """Get a mocked out AnalysisStore."""
     return decoy.mock(cls=AnalysisStore)
 
 
+@pytest.fixture
+def analysis_executor(decoy: Decoy) -> AnalysisExecutor:
+    """Get a mocked out AnalysisExecutor."""
+    return decoy.mock(cls=AnalysisExecutor)
+
+
 @pytest.fixture
 def subject(
     analysis_store: AnalysisStore,
+    analysis_executor: AnalysisExecutor,
 ) -> ProtocolAnalyzer:
     """Get a ProtocolAnalyzer test subject."""
     return ProtocolAnalyzer(
         analysis_store=analysis_store,
+        analysis_executor=analysis_executor,
     )
 
 
-async def test_analyze(
-    decoy: Decoy,
-    analysis_store: AnalysisStore,
-    subject: ProtocolAnalyzer,
-) -> None:
-    """It should be able to analyze a protocol."""
-    protocol_resource = ProtocolResource(
+@pytest.fixture
+def protocol_resource() -> ProtocolResource:
+    """Get a protocol resource to analyze."""
+    return ProtocolResource(
         protocol_id="protocol-id",
         created_at=datetime(year=2021, month=1, day=1),
         source=ProtocolSource(
@@ -68,6 +69,15 @@ async def test_analyze(
         protocol_key="dummy-data-111",
     )
 
+
+async def test_analyze(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    analysis_executor: AnalysisExecutor,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should be able to analyze a protocol."""
     analysis_command = pe_commands.WaitForResume(
         id="command-id",
         key="command-key",
@@ -97,16 +107,14 @@ async def test_analyze(
         mount=MountType.LEFT,
     )
 
-    json_runner = decoy.mock(cls=protocol_runner.JsonRunner)
-
     decoy.when(
-        await protocol_runner.create_simulating_runner(
-            robot_type="OT-3 Standard",
-            protocol_config=JsonProtocolConfig(schema_version=123),
+        await analysis_executor.analyze(
+            analysis_id="analysis-id",
+            protocol_id="protocol-id",
+            protocol_source=protocol_resource.source,
+            on_queue_position=matchers.Anything(),
         )
-    ).then_return(json_runner)
-
-    decoy.when(await json_runner.run(protocol_resource.source)).then_return(
+    ).then_return(
         protocol_runner.RunResult(
             commands=[analysis_command],
             state_summary=StateSummary(
@@ -136,5 +144,139 @@ async def test_analyze(
             pipettes=[analysis_pipette],
             errors=[analysis_error],
             liquids=[],
+            content_hash="abc123",
+            robot_type="OT-3 Standard",
+        ),
+    )
+
+
+async def test_analyze_cached(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    analysis_executor: AnalysisExecutor,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should reuse the results of analyzing the same protocol files."""
+    analysis_labware = pe_types.LoadedLabware(
+        id="labware-id",
+        loadName="load-name",
+        definitionUri="namespace/load-name/42",
+        location=pe_types.DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+        offsetId=None,
+    )
+
+    decoy.when(
+        analysis_store.get_cached_result(
+            content_hash="abc123", robot_type="OT-3 Standard"
+        )
+    ).then_return(
+        CompletedAnalysis(
+            id="old-analysis-id",
+            result=AnalysisResult.OK,
+            commands=[],
+            labware=[analysis_labware],
+            modules=[],
+            pipettes=[],
+            errors=[],
+            liquids=[],
+        )
+    )
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        await analysis_executor.analyze(
+            analysis_id=matchers.Anything(),
+            protocol_id=matchers.Anything(),
+            protocol_source=matchers.Anything(),
+            on_queue_position=matchers.Anything(),
+        ),
+        times=0,
+    )
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[],
+            labware=[analysis_labware],
+            modules=[],
+            pipettes=[],
+            errors=[],
+            liquids=[],
+        ),
+    )
+
+
+async def test_analyze_reports_queue_position(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    analysis_executor: AnalysisExecutor,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should keep the pending analysis's queue position up to date."""
+    on_queue_position = matchers.Captor()
+
+    decoy.when(
+        await analysis_executor.analyze(
+            analysis_id="analysis-id",
+            protocol_id="protocol-id",
+            protocol_source=protocol_resource.source,
+            on_queue_position=on_queue_position,
+        )
+    ).then_raise(AnalysisCancelledError("analysis-id"))
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    on_queue_position.value(2)
+    on_queue_position.value(None)
+
+    decoy.verify(
+        analysis_store.update_pending(analysis_id="analysis-id", queue_position=2),
+        analysis_store.update_pending(analysis_id="analysis-id", queue_position=None),
+    )
+
+
+async def test_analyze_cancelled(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    analysis_executor: AnalysisExecutor,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should drop the pending analysis if the analysis is cancelled."""
+    decoy.when(
+        await analysis_executor.analyze(
+            analysis_id="analysis-id",
+            protocol_id="protocol-id",
+            protocol_source=protocol_resource.source,
+            on_queue_position=matchers.Anything(),
+        )
+    ).then_raise(AnalysisCancelledError("analysis-id"))
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(analysis_store.remove_pending(analysis_id="analysis-id"))
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id=matchers.Anything(),
+            commands=matchers.Anything(),
+            labware=matchers.Anything(),
+            modules=matchers.Anything(),
+            pipettes=matchers.Anything(),
+            errors=matchers.Anything(),
+            liquids=matchers.Anything(),
+            content_hash=matchers.Anything(),
+            robot_type=matchers.Anything(),
         ),
+        times=0,
     )
@@ -21,16 +21,23 @@ from opentrons.protocol_reader import (
 )
 
 from robot_server.errors import ApiError
-from robot_server.service.json_api import SimpleEmptyBody, MultiBodyMeta
+from robot_server.service.json_api import (
+    SimpleBody,
+    SimpleEmptyBody,
+    SimpleMultiBody,
+    MultiBodyMeta,
+)
 from robot_server.service.task_runner import TaskRunner
 from robot_server.protocols.analysis_store import AnalysisStore, AnalysisNotFoundError
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
+from robot_server.protocols.analysis_executor import AnalysisExecutor
 from robot_server.protocols.protocol_auto_deleter import ProtocolAutoDeleter
 from robot_server.protocols.analysis_models import (
     AnalysisStatus,
     AnalysisSummary,
     CompletedAnalysis,
     PendingAnalysis,
+    ProtocolAnalysis,
     AnalysisResult,
 )
 
@@ -95,6 +102,12 @@ def protocol_analyzer(decoy: Decoy) -> ProtocolAnalyzer:
     return decoy.mock(cls=ProtocolAnalyzer)
 
 
+@pytest.fixture
+def analysis_executor(decoy: Decoy) -> AnalysisExecutor:
+    """Get a mocked out AnalysisExecutor."""
+    return decoy.mock(cls=AnalysisExecutor)
+
+
 @pytest.fixture
 def task_runner(decoy: Decoy) -> TaskRunner:
     """Get a mocked out TaskRunner."""
@@ -506,11 +519,19 @@ async def test_create_protocol_different_robot_type(
 async def test_delete_protocol_by_id(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_executor: AnalysisExecutor,
 ) -> None:
-    """It should remove a single protocol file."""
-    result = await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+    """It should remove a single protocol file and cancel its analysis."""
+    result = await delete_protocol_by_id(
+        "protocol-id",
+        protocol_store=protocol_store,
+        analysis_executor=analysis_executor,
+    )
 
-    decoy.verify(protocol_store.remove(protocol_id="protocol-id"))
+    decoy.verify(
+        protocol_store.remove(protocol_id="protocol-id"),
+        analysis_executor.cancel(protocol_id="protocol-id"),
+    )
 
     assert result.content == SimpleEmptyBody()
     assert result.status_code == 200
@@ -567,9 +588,9 @@ async def test_get_protocol_analyses(
     )
 
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get_by_protocol("protocol-id")).then_return(
-        [analysis]
-    )
+    decoy.when(
+        await analysis_store.get_by_protocol_as_document("protocol-id")
+    ).then_return([analysis.json()])
 
     result = await get_protocol_analyses(
         protocolId="protocol-id",
@@ -578,7 +599,10 @@ async def test_get_protocol_analyses(
     )
 
     assert result.status_code == 200
-    assert result.content.data == [analysis]
+    assert result.media_type == "application/json"
+    assert SimpleMultiBody[ProtocolAnalysis].parse_raw(result.body) == SimpleMultiBody(
+        data=[analysis], meta=MultiBodyMeta(cursor=0, totalLength=1)
+    )
 
 
 async def test_get_protocol_analyses_not_found(
@@ -609,7 +633,9 @@ async def test_get_protocol_analysis_by_id(
     analysis = PendingAnalysis(id="analysis-id")
 
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get("analysis-id")).then_return(analysis)
+    decoy.when(await analysis_store.get_as_document("analysis-id")).then_return(
+        analysis.json()
+    )
 
     result = await get_protocol_analysis_by_id(
         protocolId="protocol-id",
@@ -619,7 +645,10 @@ async def test_get_protocol_analysis_by_id(
     )
 
     assert result.status_code == 200
-    assert result.content.data == analysis
+    assert result.media_type == "application/json"
+    assert SimpleBody[ProtocolAnalysis].parse_raw(result.body) == SimpleBody(
+        data=analysis
+    )
 
 
 async def test_get_protocol_analysis_by_id_protocol_not_found(
@@ -649,7 +678,7 @@ async def test_get_protocol_analysis_by_id_analysis_not_found(
 ) -> None:
     """It should get a single full analysis by ID."""
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get("analysis-id")).then_raise(
+    decoy.when(await analysis_store.get_as_document("analysis-id")).then_raise(
         AnalysisNotFoundError("oh no")
     )
 
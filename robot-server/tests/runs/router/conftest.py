@@ -2,7 +2,7 @@
 import pytest
 from decoy import Decoy
 
-from robot_server.protocols import ProtocolStore
+from robot_server.protocols import AnalysisExecutor, ProtocolStore
 from robot_server.runs.run_auto_deleter import RunAutoDeleter
 from robot_server.runs.run_store import RunStore
 from robot_server.runs.engine_store import EngineStore
@@ -18,6 +18,12 @@ def mock_protocol_store(decoy: Decoy) -> ProtocolStore:
     return decoy.mock(cls=ProtocolStore)
 
 
+@pytest.fixture()
+def mock_analysis_executor(decoy: Decoy) -> AnalysisExecutor:
+    """Get a mock AnalysisExecutor interface."""
+    return decoy.mock(cls=AnalysisExecutor)
+
+
 @pytest.fixture()
 def mock_run_store(decoy: Decoy) -> RunStore:
     """Get a mock RunStore interface."""
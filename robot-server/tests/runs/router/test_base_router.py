@@ -18,6 +18,7 @@ from robot_server.service.json_api import (
 )
 
 from robot_server.protocols import (
+    AnalysisExecutor,
     ProtocolStore,
     ProtocolResource,
     ProtocolNotFoundError,
@@ -105,6 +106,7 @@ async def test_create_protocol_run(
     mock_protocol_store: ProtocolStore,
     mock_run_data_manager: RunDataManager,
     mock_run_auto_deleter: RunAutoDeleter,
+    mock_analysis_executor: AnalysisExecutor,
 ) -> None:
     """It should be able to create a protocol run."""
     run_id = "run-id"
@@ -161,12 +163,14 @@ async def test_create_protocol_run(
         run_id=run_id,
         created_at=run_created_at,
         run_auto_deleter=mock_run_auto_deleter,
+        analysis_executor=mock_analysis_executor,
     )
 
     assert result.content.data == expected_response
     assert result.status_code == 201
 
     decoy.verify(mock_run_auto_deleter.make_room_for_new_run(), times=1)
+    decoy.verify(mock_analysis_executor.prioritize(protocol_id=protocol_id), times=1)
 
 
 async def test_create_protocol_run_bad_protocol_id(
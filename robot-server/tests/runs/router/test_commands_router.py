@@ -6,7 +6,9 @@ from decoy import Decoy, matchers
 
 from opentrons.protocol_engine import (
     CommandSlice,
+    CommandUpdateSlice,
     CurrentCommand,
+    EngineStatus,
     ProtocolEngine,
     commands as pe_commands,
     errors as pe_errors,
@@ -26,8 +28,10 @@ from robot_server.runs.router.commands_router import (
     CommandCollectionLinks,
     CommandLink,
     CommandLinkMeta,
+    RunCommandEvent,
     create_run_command,
     get_run_command,
+    get_run_command_events,
     get_run_commands,
     get_current_run_engine_from_url,
 )
@@ -423,3 +427,71 @@ async def test_get_run_command_missing(
     assert exc_info.value.content["errors"][0]["detail"] == matchers.StringMatching(
         "oh no"
     )
+
+
+async def test_get_run_command_events(
+    decoy: Decoy,
+    mock_engine_store: EngineStore,
+    mock_protocol_engine: ProtocolEngine,
+) -> None:
+    """It should stream command updates until the run stops."""
+    command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+    )
+    command_view = mock_protocol_engine.state_view.commands
+
+    decoy.when(mock_engine_store.current_run_id).then_return("run-id")
+    decoy.when(command_view.get_updates_since(3)).then_return(
+        CommandUpdateSlice(commands=[command], cursor=5)
+    )
+    decoy.when(command_view.get_updates_since(5)).then_return(
+        CommandUpdateSlice(commands=[], cursor=5)
+    )
+    decoy.when(command_view.get_status()).then_return(
+        EngineStatus.RUNNING, EngineStatus.SUCCEEDED
+    )
+    decoy.when(command_view.get_current()).then_return(None)
+    decoy.when(command_view.get_is_stopped()).then_return(False, True)
+
+    result = await get_run_command_events(
+        runId="run-id",
+        cursor=None,
+        lastEventId="3",
+        engine_store=mock_engine_store,
+        protocol_engine=mock_protocol_engine,
+    )
+    events = [chunk async for chunk in result.body_iterator]
+
+    expected_running = RunCommandEvent(
+        cursor=5,
+        status=EngineStatus.RUNNING,
+        data=[
+            RunCommandSummary(
+                id="command-id",
+                key="command-key",
+                commandType="waitForResume",
+                createdAt=datetime(year=2021, month=1, day=1),
+                status=pe_commands.CommandStatus.SUCCEEDED,
+                params=pe_commands.WaitForResumeParams(message="hello world"),
+            )
+        ],
+    )
+    expected_succeeded = RunCommandEvent(
+        cursor=5, status=EngineStatus.SUCCEEDED, data=[]
+    )
+
+    assert result.media_type == "text/event-stream"
+    assert events == [
+        f"id: 5\nevent: run\ndata: {expected_running.json()}\n\n",
+        f"id: 5\nevent: run\ndata: {expected_succeeded.json()}\n\n",
+    ]
+    decoy.verify(
+        await mock_protocol_engine.wait_for_command_updates(
+            cursor=5, status=EngineStatus.RUNNING
+        ),
+        times=1,
+    )
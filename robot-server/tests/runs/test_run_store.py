@@ -145,6 +145,34 @@ def test_update_run_state(
     assert commands_result.commands == protocol_commands
 
 
+def test_update_run_state_replaces_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should replace any previously stored commands for the run."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands[1:],
+    )
+
+    result = subject.get_commands_slice(run_id="run-id", length=20, cursor=0)
+
+    assert result.total_length == 2
+    assert result.commands == protocol_commands[1:]
+
+
 def test_update_state_run_not_found(
     subject: RunStore,
     state_summary: StateSummary,
@@ -337,6 +365,27 @@ def test_remove_run(subject: RunStore) -> None:
     assert subject.get_all(length=20) == []
 
 
+def test_remove_run_with_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It can remove a run entry that has stored commands."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+    subject.remove(run_id="run-id")
+
+    assert subject.get_all(length=20) == []
+
+
 def test_remove_run_missing_id(subject: RunStore) -> None:
     """It raises if the run does not exist."""
     with pytest.raises(RunNotFoundError, match="run-id"):
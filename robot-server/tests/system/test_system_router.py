@@ -5,6 +5,13 @@ from datetime import datetime, timezone
 from starlette.testclient import TestClient
 from typing import Iterator
 
+from opentrons.util.command_timing import (
+    HISTOGRAM_BUCKET_BOUNDS,
+    CommandTimingRecorder,
+    TimingPhase,
+    get_command_timing,
+)
+
 from robot_server.service.json_api import ResourceLink, ResourceLinks, ResourceLinkKey
 from robot_server.system import errors, router
 
@@ -105,3 +112,50 @@ def test_set_system_time(
         "links": response_links,
     }
     assert response.status_code == 200
+
+
+@pytest.fixture
+def command_timing() -> Iterator[CommandTimingRecorder]:
+    """Enable command timing, and reset it afterwards."""
+    recorder = get_command_timing()
+    recorder.enable()
+    yield recorder
+    recorder.disable()
+    recorder.reset()
+
+
+def test_get_command_timing(
+    api_client: TestClient, command_timing: CommandTimingRecorder
+) -> None:
+    """It should return recorded command timing by command type and phase."""
+    with command_timing.command("aspirate"):
+        with command_timing.span(TimingPhase.HARDWARE, "API.aspirate"):
+            pass
+
+    response = api_client.get("/system/commandTiming")
+    assert response.status_code == 200
+
+    data = response.json()["data"]
+    assert data["enabled"] is True
+    assert data["bucketUpperBoundsSeconds"] == list(HISTOGRAM_BUCKET_BOUNDS)
+    assert [command_type["commandType"] for command_type in data["commandTypes"]] == [
+        "aspirate"
+    ]
+    phases = data["commandTypes"][0]["phases"]
+    assert set(phases) == {"command", "hardware"}
+    assert phases["hardware"]["count"] == 1
+    assert sum(phases["hardware"]["bucketCounts"]) == 1
+
+
+def test_reset_command_timing(
+    api_client: TestClient, command_timing: CommandTimingRecorder
+) -> None:
+    """It should forget recorded command timing."""
+    with command_timing.command("home"):
+        pass
+
+    response = api_client.delete("/system/commandTiming")
+    assert response.status_code == 200
+
+    response = api_client.get("/system/commandTiming")
+    assert response.json()["data"]["commandTypes"] == []
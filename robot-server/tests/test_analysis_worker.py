@@ -0,0 +1,14 @@
+"""Tests for robot_server.analysis_worker."""
+import subprocess
+import sys
+
+
+def test_import_does_not_set_up_app() -> None:
+    """Worker processes should be able to start without importing the server app."""
+    check = (
+        "import sys\n"
+        "import robot_server.analysis_worker\n"
+        "assert 'robot_server.app_setup' not in sys.modules\n"
+        "assert 'fastapi' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", check], check=True)
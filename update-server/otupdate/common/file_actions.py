@@ -9,7 +9,17 @@ import json
 import logging
 import os
 import subprocess
-from typing import Callable, Sequence, Mapping, Optional, Tuple, List, Dict
+from typing import (
+    IO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 import tempfile
 import zipfile
 
@@ -76,6 +86,10 @@ class InvalidRobotType(ValueError):
         return self.message
 
 
+# Large enough that per-chunk overhead is negligible next to eMMC throughput.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
 def unzip_update(
     filepath: str,
     progress_callback: Callable[[float], None],
@@ -117,6 +131,54 @@ def unzip_update(
     :return: Two dictionaries, the first mapping file names to paths and the
              second mapping file names to sizes
 
+    :raises FileMissing: If a mandatory file is missing
+    """
+    file_paths, file_sizes, _ = unzip_and_hash_update(
+        filepath,
+        progress_callback,
+        acceptable_files,
+        mandatory_files,
+        hash_files=[],
+        chunk_size=chunk_size,
+    )
+    return file_paths, file_sizes
+
+
+def unzip_and_hash_update(
+    filepath: str,
+    progress_callback: Callable[[float], None],
+    acceptable_files: Sequence[str],
+    mandatory_files: Sequence[str],
+    hash_files: Sequence[str],
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    algo: str = "sha256",
+) -> Tuple[Mapping[str, Optional[str]], Mapping[str, int], Mapping[str, bytes]]:
+    """Unzip an update file, hashing files as they're unzipped
+
+    This works like :py:func:`unzip_update`, but each chunk of the files in
+    ``hash_files`` is fed to a hasher on its way to disk, so the unzipped
+    files don't have to be read back to hash them. ``progress_callback`` is
+    called from the same loop, so its progress covers both unzipping and
+    hashing.
+
+    :param filepath: The path zipfile to unzip. The contents will be in its
+                     directory
+    :param progress_callback: A callable taking a number between 0 and 1 that
+                              will be called periodically to check progress.
+                              This is for user display; it may not reach 1.0
+                              exactly.
+    :param acceptable_files: A list of files to unzip if found. Others will be
+                             ignored.
+    :param mandatory_files: A list of files to raise an error about if they're
+                            not in the zip.
+    :param hash_files: A list of files to hash while unzipping. Files not in
+                       the zip are skipped.
+    :param chunk_size: The size of the chunk to read, hash and write.
+    :param algo: The algorithm to use. Can be anything used by
+                 :py:mod:`hashlib`
+    :return: Three dictionaries, mapping file names to paths, to sizes, and
+             to ascii hex hashes (only for files in ``hash_files``)
+
     :raises FileMissing: If a mandatory file is missing
     """
     assert chunk_size
@@ -125,6 +187,7 @@ def unzip_update(
     to_unzip: List[zipfile.ZipInfo] = []
     file_paths: Dict[str, Optional[str]] = {fn: None for fn in acceptable_files}
     file_sizes: Dict[str, int] = {fn: 0 for fn in acceptable_files}
+    file_hashes: Dict[str, bytes] = {}
     LOG.info(f"Unzipping {filepath}")
     with zipfile.ZipFile(filepath, "r") as zf:
         files = zf.infolist()
@@ -144,17 +207,19 @@ def unzip_update(
 
         for fi in to_unzip:
             uncomp_path = os.path.join(os.path.dirname(filepath), fi.filename)
+            hasher = hashlib.new(algo) if fi.filename in hash_files else None
             with zf.open(fi) as zipped, open(uncomp_path, "wb") as unzipped:
                 LOG.debug(f"Beginning unzip of {fi.filename} to {uncomp_path}")
-                while True:
-                    chunk = zipped.read(chunk_size)
+                for chunk in _read_chunks(zipped, chunk_size):
+                    if hasher:
+                        hasher.update(chunk)
                     unzipped.write(chunk)
                     written_size += len(chunk)
                     progress_callback(written_size / total_size)
-                    if len(chunk) != chunk_size:
-                        break
                 file_paths[fi.filename] = uncomp_path
                 file_sizes[fi.filename] = fi.file_size
+                if hasher:
+                    file_hashes[fi.filename] = binascii.hexlify(hasher.digest())
                 LOG.debug(f"Unzipped {fi.filename} to {uncomp_path}")
     LOG.info(
         f"Unzipped {filepath}, results: \n\t"
@@ -162,7 +227,16 @@ def unzip_update(
             [f"{k}: {file_paths[k]} ({file_sizes[k]}B)" for k in file_paths.keys()]
         )
     )
-    return file_paths, file_sizes
+    return file_paths, file_sizes, file_hashes
+
+
+def _read_chunks(source: IO[bytes], chunk_size: int) -> Iterator[bytes]:
+    """Read a file in chunks, ending with the first short (maybe empty) chunk."""
+    while True:
+        chunk = source.read(chunk_size)
+        yield chunk
+        if len(chunk) != chunk_size:
+            return
 
 
 def hash_file(
@@ -95,3 +95,18 @@ def test_verify_signature_catches_bad_sig(extracted_update_file, testing_cert):
             os.path.join(extracted_update_file, "rootfs.ext4.hash.sig"),
             testing_cert,
         )
+
+
+def test_unzip_and_hash(downloaded_update_file):
+    cb = mock.Mock()
+    paths, sizes, hashes = file_actions.unzip_and_hash_update(
+        downloaded_update_file, cb, UPDATE_FILES, UPDATE_FILES, ["rootfs.ext4"]
+    )
+    assert sorted(list(paths.keys())) == sorted(UPDATE_FILES)
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        for filename, path in paths.items():
+            assert zf.read(filename) == open(path, "rb").read()
+    assert list(hashes.keys()) == ["rootfs.ext4"]
+    assert hashes["rootfs.ext4"] == open(paths["rootfs.ext4.hash"], "rb").read()
+    cb.assert_called()
+    assert cb.call_args[0][0] == pytest.approx(1.0)